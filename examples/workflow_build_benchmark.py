@@ -0,0 +1,29 @@
+"""
+Measures how long building a large workflow definition takes with the DSL.
+Builds workflows of increasing size without task copies and prints the time per task,
+which stays about the same when building scales linearly with the number of tasks.
+No server is needed.
+"""
+import timeit
+from unittest.mock import MagicMock
+
+from conductor.client.workflow.conductor_workflow import ConductorWorkflow
+from conductor.client.workflow.executor.workflow_executor import WorkflowExecutor
+from conductor.client.workflow.task.simple_task import SimpleTask
+
+
+def build_workflow(task_count: int):
+    workflow = ConductorWorkflow(MagicMock(spec=WorkflowExecutor), 'generated_workflow').copy_tasks(False)
+    for i in range(task_count):
+        workflow.add(SimpleTask('task_def', f'task_ref_{i}').input_parameter('previous', f'${{task_ref_{i - 1}.output}}'))
+    return workflow.to_workflow_def()
+
+
+def main():
+    for task_count in (1000, 4000, 16000):
+        seconds = min(timeit.repeat(lambda: build_workflow(task_count), number=1, repeat=3))
+        print(f'{task_count:>6} tasks: {seconds:.3f}s, {seconds / task_count * 1e6:.1f}us per task')
+
+
+if __name__ == '__main__':
+    main()
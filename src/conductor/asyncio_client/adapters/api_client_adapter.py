@@ -27,6 +27,7 @@ class ApiClientAdapter(ApiClient):
         self.configuration = configuration or Configuration()
 
         self.rest_client = rest.RESTClientObject(self.configuration)
+        self.json_codec = self.rest_client.json_codec
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
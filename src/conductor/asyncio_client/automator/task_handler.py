@@ -4,16 +4,24 @@ import asyncio
 import importlib
 import logging
 import os
+import signal
 from multiprocessing import Process, Queue, freeze_support, set_start_method
 from sys import platform
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.automator.task_runner import AsyncTaskRunner
 from conductor.asyncio_client.configuration.configuration import Configuration
 from conductor.asyncio_client.telemetry.metrics_collector import AsyncMetricsCollector
 from conductor.asyncio_client.worker.worker import Worker
 from conductor.asyncio_client.worker.worker_interface import WorkerInterface
+from conductor.shared.automator.task_limiter import (
+    TaskLimiter,
+    create_task_limiters,
+    get_task_limiter_key,
+)
 from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.spool_settings import SpoolSettings
 
 logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
 
@@ -36,7 +44,16 @@ if not _mp_fork_set:
 
 
 def register_decorated_fn(
-    name: str, poll_interval: int, domain: str, worker_id: str, func, task_options=None
+    name: str,
+    poll_interval: int,
+    domain: str,
+    worker_id: str,
+    func,
+    task_options=None,
+    poll_count: Optional[int] = None,
+    poll_timeout: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    lease_extend_enabled: Optional[bool] = None,
 ):
     logger.info("Registering decorated function: %s", name)
     _decorated_functions[(name, domain)] = {
@@ -45,6 +62,10 @@ def register_decorated_fn(
         "domain": domain,
         "worker_id": worker_id,
         "task_options": task_options,
+        "poll_count": poll_count,
+        "poll_timeout": poll_timeout,
+        "max_concurrency": max_concurrency,
+        "lease_extend_enabled": lease_extend_enabled,
     }
 
 
@@ -56,6 +77,9 @@ class TaskHandler:
         metrics_settings: Optional[MetricsSettings] = None,
         scan_for_annotated_workers: bool = True,
         import_modules: Optional[List[str]] = None,
+        single_event_loop: bool = False,
+        process_count: int = 1,
+        spool_settings: Optional[SpoolSettings] = None,
     ):
         workers = workers or []
         self.logger_process, self.queue = _setup_logging_queue(configuration)
@@ -82,13 +106,24 @@ class TaskHandler:
                     worker_id=worker_id,
                     domain=domain,
                     poll_interval=poll_interval,
+                    poll_count=record.get("poll_count"),
+                    poll_timeout=record.get("poll_timeout"),
+                    max_concurrency=record.get("max_concurrency"),
+                    lease_extend_enabled=record.get("lease_extend_enabled"),
                 )
                 logger.info(
                     "Created worker with name: %s; domain: %s", task_def_name, domain
                 )
                 workers.append(worker)
 
-        self.__create_task_runner_processes(workers, configuration, metrics_settings)
+        if single_event_loop:
+            self.__create_event_loop_processes(
+                workers, configuration, metrics_settings, process_count, spool_settings
+            )
+        else:
+            self.__create_task_runner_processes(
+                workers, configuration, metrics_settings, spool_settings
+            )
         self.__create_metrics_provider_process(metrics_settings)
         logger.info("TaskHandler initialized")
 
@@ -145,18 +180,64 @@ class TaskHandler:
         workers: List[WorkerInterface],
         configuration: Configuration,
         metrics_settings: MetricsSettings,
+        spool_settings: Optional[SpoolSettings] = None,
     ) -> None:
         self.task_runner_processes = []
+        # Created before forking, so that every process shares their state
+        task_limiters = create_task_limiters(workers)
         for worker in workers:
-            self.__create_task_runner_process(worker, configuration, metrics_settings)
+            self.__create_task_runner_process(
+                worker,
+                configuration,
+                metrics_settings,
+                spool_settings,
+                task_limiters.get(get_task_limiter_key(worker)),
+            )
+
+    def __create_event_loop_processes(
+        self,
+        workers: List[WorkerInterface],
+        configuration: Configuration,
+        metrics_settings: MetricsSettings,
+        process_count: int,
+        spool_settings: Optional[SpoolSettings] = None,
+    ) -> None:
+        for worker in workers:
+            if not isinstance(worker, WorkerInterface):
+                raise Exception("Invalid worker")
+        process_count = min(max(1, process_count), len(workers))
+        self.task_runner_processes = []
+        # Created before forking, so that every process shares their state
+        task_limiters = create_task_limiters(workers)
+        for index in range(process_count):
+            process = Process(
+                target=self.coroutine_as_process_target,
+                args=(
+                    run_task_runners,
+                    workers[index::process_count],
+                    configuration,
+                    metrics_settings,
+                    spool_settings,
+                    task_limiters,
+                ),
+            )
+            self.task_runner_processes.append(process)
 
     def __create_task_runner_process(
         self,
         worker: WorkerInterface,
         configuration: Configuration,
         metrics_settings: MetricsSettings,
+        spool_settings: Optional[SpoolSettings] = None,
+        task_limiter: Optional[TaskLimiter] = None,
     ) -> None:
-        task_runner = AsyncTaskRunner(worker, configuration, metrics_settings)
+        task_runner = AsyncTaskRunner(
+            worker,
+            configuration,
+            metrics_settings,
+            spool_settings=spool_settings,
+            task_limiter=task_limiter,
+        )
         process = Process(
             target=self.coroutine_as_process_target, args=(task_runner.run,)
         )
@@ -216,6 +297,67 @@ class TaskHandler:
             logger.debug("Killed process: %s", process.pid)
 
 
+async def run_task_runners(
+    workers: List[WorkerInterface],
+    configuration: Optional[Configuration] = None,
+    metrics_settings: Optional[MetricsSettings] = None,
+    spool_settings: Optional[SpoolSettings] = None,
+    task_limiters: Optional[Dict[Tuple[str, ...], TaskLimiter]] = None,
+) -> None:
+    """
+    Run a task runner for every worker as a task on the current event loop.
+
+    All runners share one ApiClient, hence one aiohttp connection pool and
+    one auth token. The client is created here so that it is bound to the
+    loop of the process running the coroutine. ``task_limiters`` are shared
+    with runners in other processes; they are created here when omitted.
+    """
+    configuration = configuration or Configuration()
+    if task_limiters is None:
+        task_limiters = create_task_limiters(workers)
+    api_client = ApiClient(configuration=configuration)
+    task_runners = [
+        AsyncTaskRunner(
+            worker,
+            configuration,
+            metrics_settings,
+            api_client=api_client,
+            spool_settings=spool_settings,
+            task_limiter=task_limiters.get(get_task_limiter_key(worker)),
+        )
+        for worker in workers
+    ]
+    logger.info("Running %s TaskRunners on one event loop", len(task_runners))
+    runs = asyncio.gather(*(task_runner.run() for task_runner in task_runners))
+    terminated = []
+
+    def terminate() -> None:
+        terminated.append(True)
+        runs.cancel()
+
+    handles_sigterm = _add_sigterm_handler(terminate)
+    try:
+        await runs
+    except asyncio.CancelledError:
+        if not terminated:
+            raise
+        logger.info("Stopped TaskRunners on SIGTERM")
+    finally:
+        if handles_sigterm:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGTERM)
+        await api_client.close()
+
+
+def _add_sigterm_handler(callback) -> bool:
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, callback)
+    except (NotImplementedError, RuntimeError, ValueError):
+        # Not supported on Windows, where terminate() sends no signal anyway,
+        # nor outside of the main thread
+        return False
+    return True
+
+
 # Setup centralized logging queue
 def _setup_logging_queue(configuration: Configuration):
     queue = Queue()
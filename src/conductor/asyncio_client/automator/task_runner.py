@@ -6,7 +6,8 @@ import os
 import sys
 import time
 import traceback
-from typing import Optional
+from concurrent.futures import Executor
+from typing import List, Optional, Set
 
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.adapters.api.task_resource_api import (
@@ -19,11 +20,24 @@ from conductor.asyncio_client.adapters.models.task_exec_log_adapter import (
 from conductor.asyncio_client.adapters.models.task_result_adapter import (
     TaskResultAdapter,
 )
+from conductor.asyncio_client.automator.task_updater import (
+    DEFAULT_SPOOL_REPLAY_INTERVAL_SECONDS,
+    AsyncTaskUpdater,
+)
 from conductor.asyncio_client.configuration import Configuration
 from conductor.asyncio_client.http.exceptions import UnauthorizedException
 from conductor.asyncio_client.telemetry.metrics_collector import AsyncMetricsCollector
 from conductor.asyncio_client.worker.worker_interface import WorkerInterface
+from conductor.shared.automator.lease_extension import get_lease_extend_interval
+from conductor.shared.automator.poll_backoff import PollBackoff
+from conductor.shared.automator.task_limiter import (
+    TaskLimiter,
+    get_worker_task_options,
+)
+from conductor.shared.automator.task_result_spool import TaskResultSpool
 from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.spool_settings import SpoolSettings
+from conductor.shared.http.enums import TaskResultStatus
 
 logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
 
@@ -34,19 +48,46 @@ class AsyncTaskRunner:
         worker: WorkerInterface,
         configuration: Configuration = None,
         metrics_settings: MetricsSettings = None,
+        executor: Optional[Executor] = None,
+        api_client: Optional[ApiClient] = None,
+        spool_settings: Optional[SpoolSettings] = None,
+        task_limiter: Optional[TaskLimiter] = None,
     ):
         if not isinstance(worker, WorkerInterface):
             raise Exception("Invalid worker")
         self.worker = worker
         self.__set_worker_properties()
+        # TaskHandler passes limiters shared with its other worker processes
+        self.task_limiter = task_limiter or TaskLimiter.from_task_options(
+            get_worker_task_options(worker)
+        )
         if not isinstance(configuration, Configuration):
             configuration = Configuration()
         self.configuration = configuration
         self.metrics_collector = None
         if metrics_settings is not None:
             self.metrics_collector = AsyncMetricsCollector(metrics_settings)
+        # Runners hosted on one event loop share a single client so that they
+        # reuse one aiohttp connection pool and one auth token
         self.task_client = TaskResourceApiAdapter(
-            ApiClient(configuration=self.configuration)
+            api_client or ApiClient(configuration=self.configuration)
+        )
+        # Synchronous workers are offloaded to this executor, None selects
+        # the event loop's default executor
+        self.executor = executor
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._running_tasks: Set[asyncio.Task] = set()
+        self.poll_backoff = PollBackoff()
+        spool = None
+        replay_interval = DEFAULT_SPOOL_REPLAY_INTERVAL_SECONDS
+        if spool_settings is not None:
+            spool = self.__create_spool(spool_settings)
+            replay_interval = spool_settings.replay_interval
+        self.task_updater = AsyncTaskUpdater(
+            update_function=self.__send_task_result,
+            metrics_collector=self.metrics_collector,
+            spool=spool,
+            replay_interval=replay_interval,
         )
 
     async def run(self) -> None:
@@ -57,29 +98,59 @@ class AsyncTaskRunner:
 
         task_names = ",".join(self.worker.task_definition_names)
         logger.info(
-            "Polling tasks task_names: %s; domain: %s; polling_interval: %s",
+            "Polling tasks task_names: %s; domain: %s; polling_interval: %s; "
+            "poll_count: %s; max_concurrency: %s",
             task_names,
             self.worker.get_domain(),
             self.worker.get_polling_interval_in_seconds(),
+            self.worker.poll_count,
+            self.worker.max_concurrency,
         )
+        # Start right away so that results spooled by a previous run are replayed
+        self.task_updater.start()
 
-        while True:
-            # Check if worker should stop due to 401 policy
-            if (hasattr(self.task_client, 'api_client') and 
-                hasattr(self.task_client.api_client, 'auth_401_handler') and 
-                hasattr(self.task_client.api_client.auth_401_handler, 'is_worker_stopped') and 
-                self.task_client.api_client.auth_401_handler.is_worker_stopped()):
-                logger.error("Worker stopped due to persistent 401 authentication failures")
-                break
-            await self.run_once()
+        try:
+            while True:
+                # Check if worker should stop due to 401 policy
+                if (hasattr(self.task_client, 'api_client') and 
+                    hasattr(self.task_client.api_client, 'auth_401_handler') and 
+                    hasattr(self.task_client.api_client.auth_401_handler, 'is_worker_stopped') and 
+                    self.task_client.api_client.auth_401_handler.is_worker_stopped()):
+                    logger.error("Worker stopped due to persistent 401 authentication failures")
+                    break
+                await self.run_once()
+        except asyncio.CancelledError:
+            # E.g. on SIGTERM from TaskHandler.stop_processes. Spool the
+            # results that are still waiting for delivery instead of losing them
+            await self.task_updater.stop(timeout=0)
+            raise
+        if self._running_tasks:
+            await asyncio.gather(*self._running_tasks, return_exceptions=True)
+        await self.task_updater.stop()
 
     async def run_once(self) -> None:
         try:
-            task = await self.__poll_task()
-            if task is not None and task.task_id is not None:
-                task_result = await self.__execute_task(task)
-                await self.__update_task(task_result)
-            await self.__wait_for_polling_interval()
+            poll_count = self.__reserve_poll_count(await self.__get_poll_count())
+            tasks = []
+            try:
+                if poll_count > 1:
+                    tasks = await self.__batch_poll_tasks(poll_count)
+                elif poll_count == 1:
+                    tasks = [await self.__poll_task()]
+                tasks = [task for task in tasks if task is not None and task.task_id is not None]
+            finally:
+                # Give back the capacity reserved for tasks that were not received
+                if self.task_limiter is not None:
+                    self.task_limiter.cancel(poll_count - len(tasks))
+            for task in tasks:
+                if self.worker.max_concurrency > 1:
+                    self.__submit_task(task)
+                else:
+                    await self.__execute_and_update_task(task)
+            if poll_count <= 0:
+                await self.__wait_for_polling_interval()
+            else:
+                await self.__wait_for_next_poll(len(tasks))
             self.worker.clear_task_definition_name_cache()
         except Exception:
             pass
@@ -137,6 +208,149 @@ class AsyncTaskRunner:
             )
         return task
 
+    async def __get_poll_count(self) -> int:
+        if self.task_updater.is_backpressured():
+            logger.debug(
+                "Pause polling task: %s; pending task updates: %s",
+                self.worker.get_task_definition_name(),
+                self.task_updater.depth,
+            )
+            return 0
+        if self.worker.max_concurrency <= 1:
+            return self.worker.poll_count
+        # Only ask the server for as many tasks as can be put in flight
+        available_slots = self.worker.max_concurrency - len(self._running_tasks)
+        if available_slots <= 0 and self.metrics_collector is not None:
+            await self.metrics_collector.increment_task_execution_queue_full(
+                self.worker.get_task_definition_name()
+            )
+        return available_slots
+
+    def __reserve_poll_count(self, count: int) -> int:
+        if self.task_limiter is None or count <= 0:
+            return count
+        reserved = self.task_limiter.reserve(count)
+        if reserved < count:
+            logger.debug(
+                "Limit polling task: %s; to %s of %s tasks due to client side rate limit or concurrency cap",
+                self.worker.get_task_definition_name(),
+                reserved,
+                count,
+            )
+        return reserved
+
+    def __submit_task(self, task: TaskAdapter) -> None:
+        in_flight = asyncio.create_task(self.__execute_and_update_task(task))
+        self._running_tasks.add(in_flight)
+        in_flight.add_done_callback(self._running_tasks.discard)
+
+    async def __execute_and_update_task(self, task: TaskAdapter) -> None:
+        # Created on first use so it binds to the loop the runner runs on
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.worker.max_concurrency)
+        async with self._semaphore:
+            lease_extension = None
+            if self.worker.lease_extend_enabled:
+                interval = get_lease_extend_interval(task.response_timeout_seconds)
+                if interval is not None:
+                    lease_extension = asyncio.create_task(
+                        self.__extend_lease_periodically(task, interval)
+                    )
+            try:
+                task_result = await self.__execute_task(task)
+            finally:
+                if lease_extension is not None:
+                    lease_extension.cancel()
+                if self.task_limiter is not None:
+                    self.task_limiter.complete()
+            await self.__update_task(task_result)
+
+    async def __extend_lease_periodically(self, task: TaskAdapter, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            task_result = TaskResultAdapter(
+                task_id=task.task_id,
+                workflow_instance_id=task.workflow_instance_id,
+                worker_id=self.worker.get_identity(),
+                status=TaskResultStatus.IN_PROGRESS,
+                extend_lease=True,
+            )
+            try:
+                await self.__send_task_result(task_result)
+                logger.debug(
+                    "Extended lease of task task_id: %s; workflow_instance_id: %s",
+                    task.task_id,
+                    task.workflow_instance_id,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to extend lease of task task_id: %s; workflow_instance_id: %s; reason: %s",
+                    task.task_id,
+                    task.workflow_instance_id,
+                    e,
+                )
+
+    async def __batch_poll_tasks(self, count: int) -> List[TaskAdapter]:
+        task_definition_name = self.worker.get_task_definition_name()
+        if self.worker.paused():
+            logger.debug("Stop polling task: %s", task_definition_name)
+            return []
+        if self.metrics_collector is not None:
+            await self.metrics_collector.increment_task_poll(task_definition_name)
+
+        try:
+            start_time = time.time()
+            domain = self.worker.get_domain()
+            params = {
+                "workerid": self.worker.get_identity(),
+                "count": count,
+                "timeout": self.worker.poll_timeout,
+            }
+            if domain is not None:
+                params["domain"] = domain
+            tasks = await self.task_client.batch_poll(
+                tasktype=task_definition_name, **params
+            )
+            finish_time = time.time()
+            time_spent = finish_time - start_time
+            if self.metrics_collector is not None:
+                await self.metrics_collector.record_task_poll_time(
+                    task_definition_name, time_spent
+                )
+        except UnauthorizedException as auth_exception:
+            if self.metrics_collector is not None:
+                await self.metrics_collector.increment_task_poll_error(
+                    task_definition_name, auth_exception
+                )
+            logger.error(
+                "Failed to batch poll task: %s; reason: %s; status: %s",
+                task_definition_name,
+                auth_exception.reason,
+                auth_exception.status,
+            )
+            return []
+        except Exception as e:
+            if self.metrics_collector is not None:
+                await self.metrics_collector.increment_task_poll_error(
+                    task_definition_name, e
+                )
+            logger.error(
+                "Failed to batch poll task: %s, reason: %s",
+                task_definition_name,
+                traceback.format_exc(),
+            )
+            return []
+
+        tasks = tasks or []
+        logger.debug(
+            "Polled %s tasks: %s; worker_id: %s; domain: %s",
+            len(tasks),
+            task_definition_name,
+            self.worker.get_identity(),
+            self.worker.get_domain(),
+        )
+        return tasks
+
     async def __execute_task(self, task: TaskAdapter) -> Optional[TaskResultAdapter]:
         if not isinstance(task, TaskAdapter):
             return None
@@ -149,7 +363,13 @@ class AsyncTaskRunner:
         )
         try:
             start_time = time.time()
-            task_result = self.worker.execute(task)
+            if self.worker.is_coroutine():
+                task_result = await self.worker.execute(task)
+            else:
+                loop = asyncio.get_running_loop()
+                task_result = await loop.run_in_executor(
+                    self.executor, self.worker.execute, task
+                )
             finish_time = time.time()
             time_spent = finish_time - start_time
             if self.metrics_collector is not None:
@@ -194,7 +414,7 @@ class AsyncTaskRunner:
             )
         return task_result
 
-    async def __update_task(self, task_result: TaskResultAdapter):
+    async def __update_task(self, task_result: TaskResultAdapter) -> None:
         if not isinstance(task_result, TaskResultAdapter):
             return None
         task_definition_name = self.worker.get_task_definition_name()
@@ -204,38 +424,39 @@ class AsyncTaskRunner:
             task_result.workflow_instance_id,
             task_definition_name,
         )
-        for attempt in range(4):
-            if attempt > 0:
-                # Wait for [10s, 20s, 30s] before next attempt
-                await asyncio.sleep(attempt * 10)
-            try:
-                response = await self.task_client.update_task(task_result=task_result)
-                logger.debug(
-                    "Updated task task_id: %s; workflow_instance_id: %s; task_definition_name: %s; response: %s",
-                    task_result.task_id,
-                    task_result.workflow_instance_id,
-                    task_definition_name,
-                    response,
-                )
-                return response
-            except Exception as e:
-                if self.metrics_collector is not None:
-                    await self.metrics_collector.increment_task_update_error(
-                        task_definition_name, e
-                    )
-                logger.error(
-                    "Failed to update task task_id: %s; workflow_instance_id: %s; task_definition_name: %s; reason: %s",
-                    task_result.task_id,
-                    task_result.workflow_instance_id,
-                    task_definition_name,
-                    traceback.format_exc(),
-                )
+        await self.task_updater.submit(task_result, task_definition_name)
         return None
 
+    def __create_spool(self, spool_settings: SpoolSettings) -> TaskResultSpool:
+        spool_name = "_".join(self.worker.task_definition_names)
+        if self.worker.get_domain() is not None:
+            spool_name = f"{spool_name}_{self.worker.get_domain()}"
+        return TaskResultSpool(
+            directory=spool_settings.directory,
+            name=spool_name,
+            serialize=TaskResultAdapter.to_dict,
+            deserialize=TaskResultAdapter.from_dict,
+        )
+
+    async def __send_task_result(self, task_result: TaskResultAdapter):
+        return await self.task_client.update_task(task_result=task_result)
+
     async def __wait_for_polling_interval(self) -> None:
         polling_interval = self.worker.get_polling_interval_in_seconds()
         await asyncio.sleep(polling_interval)
 
+    async def __wait_for_next_poll(self, task_count: int) -> None:
+        polling_interval = self.worker.get_polling_interval_in_seconds()
+        delay = self.poll_backoff.next_delay(polling_interval, task_count)
+        if self.metrics_collector is not None:
+            task_definition_name = self.worker.get_task_definition_name()
+            if task_count == 0:
+                await self.metrics_collector.increment_task_poll_empty(task_definition_name)
+            await self.metrics_collector.record_task_poll_backoff(task_definition_name, delay)
+        # Yield to the loop even when re-polling straight away, so that tasks
+        # in flight keep making progress
+        await asyncio.sleep(delay)
+
     def __set_worker_properties(self) -> None:
         # If multiple tasks are supplied to the same worker, then only first
         # task will be considered for setting worker properties
@@ -264,6 +485,47 @@ class AsyncTaskRunner:
                     self.worker.get_polling_interval_in_seconds()
                 )
 
+        poll_count = self.__get_property_value_from_env("poll_count", task_type)
+        if poll_count:
+            try:
+                self.worker.poll_count = int(poll_count)
+            except Exception as e:
+                logger.error(
+                    "Error converting poll_count to int value: %s, exception: %s",
+                    poll_count,
+                    e,
+                )
+
+        poll_timeout = self.__get_property_value_from_env("poll_timeout", task_type)
+        if poll_timeout:
+            try:
+                self.worker.poll_timeout = int(poll_timeout)
+            except Exception as e:
+                logger.error(
+                    "Error converting poll_timeout to int value: %s, exception: %s",
+                    poll_timeout,
+                    e,
+                )
+
+        max_concurrency = self.__get_property_value_from_env(
+            "max_concurrency", task_type
+        )
+        if max_concurrency:
+            try:
+                self.worker.max_concurrency = int(max_concurrency)
+            except Exception as e:
+                logger.error(
+                    "Error converting max_concurrency to int value: %s, exception: %s",
+                    max_concurrency,
+                    e,
+                )
+
+        lease_extend_enabled = self.__get_property_value_from_env(
+            "lease_extend_enabled", task_type
+        )
+        if lease_extend_enabled:
+            self.worker.lease_extend_enabled = lease_extend_enabled.lower() == "true"
+
     def __get_property_value_from_env(self, prop, task_type):
         """
         get the property from the env variable
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+import traceback
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from conductor.asyncio_client.adapters.models.task_result_adapter import (
+    TaskResultAdapter,
+)
+from conductor.asyncio_client.configuration import Configuration
+from conductor.asyncio_client.telemetry.metrics_collector import AsyncMetricsCollector
+from conductor.shared.automator.task_result_spool import (
+    TaskResultSpool,
+    is_permanent_update_failure,
+)
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+DEFAULT_UPDATE_CONCURRENCY = 2
+DEFAULT_UPDATE_QUEUE_SIZE = 100
+DEFAULT_UPDATE_MAX_ATTEMPTS = 4
+DEFAULT_UPDATE_BASE_DELAY_SECONDS = 1.0
+DEFAULT_UPDATE_MAX_DELAY_SECONDS = 30.0
+DEFAULT_UPDATE_JITTER_PERCENT = 0.2
+DEFAULT_SPOOL_REPLAY_INTERVAL_SECONDS = 5.0
+
+# (attempt, task type, task result)
+_PendingUpdate = Tuple[int, str, TaskResultAdapter]
+
+
+class AsyncTaskUpdater:
+    """
+    Delivers task results back to the server from background coroutines.
+
+    Results are kept in a queue drained by ``concurrency`` consumer tasks;
+    at most ``queue_size`` results are accepted at a time. Failed updates
+    are put back on the queue after an exponential backoff with jitter
+    through ``loop.call_later``, so no consumer sleeps on a retry.
+    ``is_backpressured`` tells the runner to pause polling while the backlog
+    is above ``backpressure_threshold``.
+
+    With a ``spool``, results that are still undelivered after the last
+    attempt, or when the updater is stopped, are written to disk instead of
+    being dropped, and a replay task resends them every ``replay_interval``
+    seconds. Spool file access runs in the default executor.
+    """
+
+    def __init__(
+        self,
+        update_function: Callable[[TaskResultAdapter], Awaitable[Any]],
+        metrics_collector: Optional[AsyncMetricsCollector] = None,
+        concurrency: int = DEFAULT_UPDATE_CONCURRENCY,
+        queue_size: int = DEFAULT_UPDATE_QUEUE_SIZE,
+        backpressure_threshold: Optional[int] = None,
+        max_attempts: int = DEFAULT_UPDATE_MAX_ATTEMPTS,
+        base_delay_seconds: float = DEFAULT_UPDATE_BASE_DELAY_SECONDS,
+        max_delay_seconds: float = DEFAULT_UPDATE_MAX_DELAY_SECONDS,
+        jitter_percent: float = DEFAULT_UPDATE_JITTER_PERCENT,
+        spool: Optional[TaskResultSpool] = None,
+        replay_interval: float = DEFAULT_SPOOL_REPLAY_INTERVAL_SECONDS,
+    ):
+        self.update_function = update_function
+        self.metrics_collector = metrics_collector
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.backpressure_threshold = backpressure_threshold or queue_size
+        self.max_attempts = max_attempts
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.jitter_percent = jitter_percent
+        self.spool = spool
+        self.replay_interval = replay_interval
+
+        # Created in start() so that they bind to the running event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._consumers: List[asyncio.Task] = []
+        self._retries: Dict[asyncio.TimerHandle, _PendingUpdate] = {}
+        # Updates each consumer is sending, until the server answered
+        self._in_flight: Dict[asyncio.Task, _PendingUpdate] = {}
+        self._outstanding = 0
+
+    def start(self) -> None:
+        if self._consumers:
+            return
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.queue_size)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._consumers = [
+            asyncio.create_task(self.__consume()) for _ in range(self.concurrency)
+        ]
+        if self.spool is not None:
+            self._consumers.append(asyncio.create_task(self.__run_replay()))
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait up to ``timeout`` seconds for the backlog to drain, then cancel
+        the consumers. Results still queued or being sent at that point are
+        spooled if a spool is configured, and otherwise not delivered.
+        """
+        await self.join(timeout)
+        for consumer in self._consumers:
+            consumer.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self._consumers = []
+        # Cancelled before the server answered, so they may not have arrived
+        undelivered = list(self._in_flight.values())
+        self._in_flight.clear()
+        undelivered.extend(self._retries.values())
+        for retry in self._retries:
+            retry.cancel()
+        self._retries.clear()
+        while self._queue is not None and not self._queue.empty():
+            undelivered.append(self._queue.get_nowait())
+        if not undelivered:
+            return
+        if self.spool is None:
+            logger.warning(
+                "Stopped task updater with %s undelivered task results", len(undelivered)
+            )
+            return
+        for _, task_type, task_result in undelivered:
+            await self.__spool(task_type, task_result)
+
+    async def submit(self, task_result: TaskResultAdapter, task_type: str) -> None:
+        """
+        Queue a task result for delivery. Waits while the queue is full.
+        """
+        self.start()
+        await self._slots.acquire()
+        self._outstanding += 1
+        self._idle.clear()
+        self._queue.put_nowait((1, task_type, task_result))
+        await self.__record_queue_depth(task_type)
+
+    async def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued result has been delivered or given up on.
+
+        :return: False when the timeout expired first
+        """
+        if self._idle is None:
+            return True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    @property
+    def depth(self) -> int:
+        return self._outstanding
+
+    def is_backpressured(self) -> bool:
+        return self.depth >= self.backpressure_threshold
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff delay in seconds before the next attempt.
+        """
+        delay = self.base_delay_seconds * (2 ** (attempt - 1))
+        # Add jitter: ±jitter_percent of the delay, so that a server hiccup
+        # does not make every worker retry at the same instant
+        jitter_range = delay * self.jitter_percent
+        delay = delay + random.uniform(-jitter_range, jitter_range)
+        return min(max(0.0, delay), self.max_delay_seconds)
+
+    async def __consume(self) -> None:
+        while True:
+            pending_update = await self._queue.get()
+            self._in_flight[asyncio.current_task()] = pending_update
+            attempt, task_type, task_result = pending_update
+            await self.__update(attempt, task_type, task_result)
+            await self.__record_queue_depth(task_type)
+
+    async def __update(
+        self, attempt: int, task_type: str, task_result: TaskResultAdapter
+    ) -> None:
+        try:
+            start_time = time.time()
+            response = await self.update_function(task_result)
+            finish_time = time.time()
+            self._in_flight.pop(asyncio.current_task(), None)
+            if self.metrics_collector is not None:
+                await self.metrics_collector.record_task_update_time(
+                    task_type, finish_time - start_time
+                )
+            logger.debug(
+                "Updated task task_id: %s; workflow_instance_id: %s; task_definition_name: %s; response: %s",
+                task_result.task_id,
+                task_result.workflow_instance_id,
+                task_type,
+                response,
+            )
+        except Exception as e:
+            self._in_flight.pop(asyncio.current_task(), None)
+            if self.metrics_collector is not None:
+                await self.metrics_collector.increment_task_update_error(task_type, e)
+            if attempt < self.max_attempts:
+                delay = self.get_retry_delay(attempt)
+                logger.warning(
+                    "Failed to update task task_id: %s; workflow_instance_id: %s; task_definition_name: %s; "
+                    "retrying in %.2fs (attempt %s/%s); reason: %s",
+                    task_result.task_id,
+                    task_result.workflow_instance_id,
+                    task_type,
+                    delay,
+                    attempt,
+                    self.max_attempts,
+                    e,
+                )
+                self.__schedule_retry(delay, (attempt + 1, task_type, task_result))
+                return
+            if self.spool is not None:
+                logger.warning(
+                    "Failed to update task task_id: %s; workflow_instance_id: %s; task_definition_name: %s; "
+                    "spooling after %s attempts; reason: %s",
+                    task_result.task_id,
+                    task_result.workflow_instance_id,
+                    task_type,
+                    attempt,
+                    e,
+                )
+                await self.__spool(task_type, task_result)
+                self.__mark_done()
+                return
+            logger.error(
+                "Failed to update task task_id: %s; workflow_instance_id: %s; task_definition_name: %s; "
+                "giving up after %s attempts; reason: %s",
+                task_result.task_id,
+                task_result.workflow_instance_id,
+                task_type,
+                attempt,
+                traceback.format_exc(),
+            )
+        self.__mark_done()
+
+    def __schedule_retry(self, delay: float, pending_update: _PendingUpdate) -> None:
+        def retry() -> None:
+            self._retries.pop(handle, None)
+            self._queue.put_nowait(pending_update)
+
+        handle = asyncio.get_running_loop().call_later(delay, retry)
+        self._retries[handle] = pending_update
+
+    def __mark_done(self) -> None:
+        self._outstanding -= 1
+        self._slots.release()
+        if self._outstanding == 0:
+            self._idle.set()
+
+    async def __spool(self, task_type: str, task_result: TaskResultAdapter) -> None:
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.spool.append, task_result, task_type
+            )
+        except Exception:
+            logger.error(
+                "Failed to spool task task_id: %s; workflow_instance_id: %s; task_definition_name: %s; reason: %s",
+                task_result.task_id,
+                task_result.workflow_instance_id,
+                task_type,
+                traceback.format_exc(),
+            )
+
+    async def __run_replay(self) -> None:
+        # Replay straight away, so results spooled before a restart are not
+        # held back for a whole interval
+        while True:
+            try:
+                await self.replay()
+            except Exception:
+                logger.error("Failed to replay spooled task results: %s", traceback.format_exc())
+            await asyncio.sleep(self.replay_interval)
+
+    async def replay(self) -> int:
+        """
+        Resend spooled results in order, stopping at the first one the server
+        does not accept yet.
+
+        :return: the number of results removed from the spool
+        """
+        if self.spool is None:
+            return 0
+        loop = asyncio.get_running_loop()
+        processed = 0
+        try:
+            for task_type, task_result in await loop.run_in_executor(None, self.spool.peek):
+                if task_result is not None:
+                    try:
+                        await self.update_function(task_result)
+                        logger.info(
+                            "Replayed spooled task task_id: %s; workflow_instance_id: %s; task_definition_name: %s",
+                            task_result.task_id,
+                            task_result.workflow_instance_id,
+                            task_type,
+                        )
+                    except Exception as e:
+                        if not is_permanent_update_failure(e):
+                            logger.debug("Server still rejects spooled task results, reason: %s", e)
+                            break
+                        logger.error(
+                            "Dropping spooled task task_id: %s; workflow_instance_id: %s; task_definition_name: %s; "
+                            "reason: %s",
+                            task_result.task_id,
+                            task_result.workflow_instance_id,
+                            task_type,
+                            e,
+                        )
+                processed += 1
+        finally:
+            await loop.run_in_executor(None, self.spool.discard, processed)
+        return processed
+
+    async def __record_queue_depth(self, task_type: str) -> None:
+        if self.metrics_collector is not None:
+            await self.metrics_collector.record_task_update_queue_depth(
+                task_type, self.depth
+            )
@@ -97,6 +97,10 @@ class Configuration:
         auth_401_max_delay_ms: Optional[float] = None,
         auth_401_jitter_percent: Optional[float] = None,
         auth_401_stop_behavior: Optional[str] = None,
+        json_codec: Optional[str] = None,
+        metadata_cache_ttl_seconds: Optional[float] = None,
+        metadata_cache_max_size: Optional[int] = None,
+        metadata_cache_snapshot_path: Optional[str] = None,
         **kwargs: Any,
     ):
         """
@@ -118,6 +122,17 @@ class Configuration:
             Worker domain. If not provided, reads from CONDUCTOR_WORKER_DOMAIN env var.
         polling_interval_seconds : int, optional
             Polling interval in seconds. If not provided, reads from CONDUCTOR_WORKER_POLL_INTERVAL_SECONDS env var.
+        json_codec : str, optional
+            JSON library for request and response bodies: "orjson", "msgspec", "json", or "auto"
+            for the fastest one installed. If not provided, reads from CONDUCTOR_JSON_CODEC env var.
+        metadata_cache_ttl_seconds : float, optional
+            Cache workflow and task definitions, schedules and prompts read by the clients for
+            this many seconds; the cache is off when unset or 0. If not provided, reads from
+            CONDUCTOR_METADATA_CACHE_TTL_SECONDS env var.
+        metadata_cache_max_size : int, optional
+            Most definitions the metadata cache holds. Default is 1024.
+        metadata_cache_snapshot_path : str, optional
+            File the metadata cache is saved to at exit and loaded from at start.
         **kwargs : Any
             Additional parameters passed to HttpConfiguration.
 
@@ -128,6 +143,10 @@ class Configuration:
         CONDUCTOR_AUTH_SECRET: Authentication key secret
         CONDUCTOR_PROXY: Proxy URL for HTTP requests
         CONDUCTOR_PROXY_HEADERS: Proxy headers as JSON string or single header value
+        CONDUCTOR_JSON_CODEC: JSON library for request and response bodies
+        CONDUCTOR_METADATA_CACHE_TTL_SECONDS: Metadata cache time-to-live
+        CONDUCTOR_METADATA_CACHE_MAX_SIZE: Most definitions the metadata cache holds
+        CONDUCTOR_METADATA_CACHE_SNAPSHOT_PATH: Metadata cache snapshot file
         """
 
         # Resolve server URL from parameter or environment variable
@@ -170,6 +189,9 @@ class Configuration:
         if self.__ui_host is None:
             self.__ui_host = self.server_url.replace("/api", "")
 
+        # JSON library used to encode and decode bodies, see get_json_codec
+        self.json_codec = json_codec or os.getenv("CONDUCTOR_JSON_CODEC", "auto")
+
         # Proxy configuration - can be set via parameter or environment variable
         self.proxy = proxy or os.getenv("CONDUCTOR_PROXY")
         # Proxy headers - can be set via parameter or environment variable
@@ -272,6 +294,17 @@ class Configuration:
             "CONDUCTOR_AUTH_401_STOP_BEHAVIOR", "stop_worker"
         )
 
+        # Local cache of definitions read from the server, see get_metadata_cache
+        self.metadata_cache_ttl_seconds = metadata_cache_ttl_seconds or self._get_env_float(
+            "CONDUCTOR_METADATA_CACHE_TTL_SECONDS", 0
+        )
+        self.metadata_cache_max_size = metadata_cache_max_size or self._get_env_int(
+            "CONDUCTOR_METADATA_CACHE_MAX_SIZE", 1024
+        )
+        self.metadata_cache_snapshot_path = metadata_cache_snapshot_path or os.getenv(
+            "CONDUCTOR_METADATA_CACHE_SNAPSHOT_PATH"
+        )
+
     def _get_env_float(self, env_var: str, default: float) -> float:
         """Get float value from environment variable with default fallback."""
         try:
@@ -22,6 +22,7 @@ import aiohttp
 import aiohttp_retry
 
 from conductor.asyncio_client.http.exceptions import ApiException, ApiValueError
+from conductor.shared.http.json_codec import get_json_codec
 
 RESTResponseType = aiohttp.ClientResponse
 
@@ -53,6 +54,9 @@ class RESTClientObject:
 
     def __init__(self, configuration) -> None:
 
+        # JSON request bodies are encoded straight to bytes by this codec
+        self.json_codec = get_json_codec(getattr(configuration, "json_codec", None))
+
         # maxsize is number of requests to host that are allowed in parallel
         self.maxsize = configuration.connection_pool_maxsize
 
@@ -146,7 +150,7 @@ class RESTClientObject:
         if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
             if re.search('json', headers['Content-Type'], re.IGNORECASE):
                 if body is not None:
-                    body = json.dumps(body)
+                    body = self.json_codec.dumps(body)
                 args["data"] = body
             elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
                 args["data"] = aiohttp.FormData(post_params)
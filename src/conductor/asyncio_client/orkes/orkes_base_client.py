@@ -1,4 +1,5 @@
 import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 from conductor.asyncio_client.adapters.api.application_resource_api import \
     ApplicationResourceApiAdapter
@@ -27,10 +28,14 @@ from conductor.asyncio_client.adapters.api.task_resource_api import \
     TaskResourceApiAdapter
 from conductor.asyncio_client.adapters.api.user_resource_api import \
     UserResourceApiAdapter
+from conductor.asyncio_client.adapters.api.workflow_bulk_resource_api import \
+    WorkflowBulkResourceApiAdapter
 from conductor.asyncio_client.adapters.api.workflow_resource_api import \
     WorkflowResourceApiAdapter
 from conductor.asyncio_client.configuration.configuration import Configuration
 from conductor.asyncio_client.adapters import ApiClient
+from conductor.shared.http.lazy_resource_api import LazyResourceApi
+from conductor.shared.http.metadata_cache import get_metadata_cache
 
 
 class OrkesBaseClient:
@@ -39,9 +44,27 @@ class OrkesBaseClient:
 
     This class provides common functionality and API client initialization
     for all Orkes clients, including environment variable support and
-    worker properties configuration.
+    worker properties configuration. Resource API adapters are created on
+    first use.
     """
 
+    metadata_api = LazyResourceApi(MetadataResourceApiAdapter)
+    task_api = LazyResourceApi(TaskResourceApiAdapter)
+    workflow_api = LazyResourceApi(WorkflowResourceApiAdapter)
+    workflow_bulk_api = LazyResourceApi(WorkflowBulkResourceApiAdapter)
+    application_api = LazyResourceApi(ApplicationResourceApiAdapter)
+    secret_api = LazyResourceApi(SecretResourceApiAdapter)
+    user_api = LazyResourceApi(UserResourceApiAdapter)
+    group_api = LazyResourceApi(GroupResourceApiAdapter)
+    authorization_api = LazyResourceApi(AuthorizationResourceApiAdapter)
+    scheduler_api = LazyResourceApi(SchedulerResourceApiAdapter)
+    tags_api = LazyResourceApi(TagsApiAdapter)
+    integration_api = LazyResourceApi(IntegrationResourceApiAdapter)
+    prompt_api = LazyResourceApi(PromptResourceApiAdapter)
+    schema_api = LazyResourceApi(SchemaResourceApiAdapter)
+    event_api = LazyResourceApi(EventResourceApiAdapter)
+    event_execution_api = LazyResourceApi(EventExecutionResourceApiAdapter)
+
     def __init__(self, configuration: Configuration, api_client: ApiClient):
         """
         Initialize the base client with configuration.
@@ -56,20 +79,47 @@ class OrkesBaseClient:
         self.configuration = configuration
 
         self.logger = logging.getLogger(__name__)
+        # Shared by the clients of a server, None unless the configuration enables it
+        self.metadata_cache = get_metadata_cache(
+            configuration.server_url,
+            configuration.auth_key,
+            configuration.metadata_cache_ttl_seconds,
+            configuration.metadata_cache_max_size,
+            configuration.metadata_cache_snapshot_path,
+        )
+
+    async def _get_cached(
+        self, key: Tuple, klass: Any, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Read through the metadata cache, when it is enabled. ``klass`` is the
+        model ``fetch`` returns. Every hit returns a new model, which
+        callers may modify.
+        """
+        if self.metadata_cache is None:
+            return await fetch()
+        value = self.metadata_cache.get(key, klass.from_dict)
+        if value is None:
+            value = await fetch()
+            self.metadata_cache.put(key, value, _to_dict)
+        return value
+
+    def _invalidate_cached(self, namespace: str, name: Optional[str] = None) -> None:
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(namespace, name)
+
+    async def _get_search_page(
+        self, search: Callable[..., Awaitable[Any]], **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Fetch a search page with a ``*_without_preload_content`` method and
+        return it decoded, so that ``aiter_search_results`` can deserialize
+        its results one at a time.
+        """
+        response = await search(**kwargs)
+        await response.read()
+        return self.api_client.response_deserialize(response, {"200": "object"}).data
+
 
-        # Initialize all API clients
-        self.metadata_api = MetadataResourceApiAdapter(self.api_client)
-        self.task_api = TaskResourceApiAdapter(self.api_client)
-        self.workflow_api = WorkflowResourceApiAdapter(self.api_client)
-        self.application_api = ApplicationResourceApiAdapter(self.api_client)
-        self.secret_api = SecretResourceApiAdapter(self.api_client)
-        self.user_api = UserResourceApiAdapter(self.api_client)
-        self.group_api = GroupResourceApiAdapter(self.api_client)
-        self.authorization_api = AuthorizationResourceApiAdapter(self.api_client)
-        self.scheduler_api = SchedulerResourceApiAdapter(self.api_client)
-        self.tags_api = TagsApiAdapter(self.api_client)
-        self.integration_api = IntegrationResourceApiAdapter(self.api_client)
-        self.prompt_api = PromptResourceApiAdapter(self.api_client)
-        self.schema_api = SchemaResourceApiAdapter(self.api_client)
-        self.event_api = EventResourceApiAdapter(self.api_client)
-        self.event_execution_api = EventExecutionResourceApiAdapter(self.api_client)
+def _to_dict(model: Any) -> Dict[str, Any]:
+    return model.to_dict()
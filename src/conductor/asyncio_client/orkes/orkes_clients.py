@@ -34,8 +34,10 @@ class OrkesClients:
     user authorization, secret management, and more.
 
     The OrkesClients class acts as a factory that creates client instances on demand,
-    ensuring that all clients share the same configuration while providing access to
-    different aspects of the Conductor platform.
+    ensuring that all clients share the same configuration and the same ApiClient,
+    and with it one connection pool and auth token, while providing access to
+    different aspects of the Conductor platform. If no ApiClient is passed in, one
+    is created when the first client is requested and closed by ``close()``.
 
     Environment Variable Support:
     -----------------------------
@@ -82,14 +84,23 @@ class OrkesClients:
     -----------
     configuration : Configuration
         The configuration adapter with environment variable support
+    api_client : ApiClient
+        The API client shared by every client
     """
 
-    def __init__(self, api_client: ApiClient, configuration: Optional[Configuration] = None):
+    def __init__(
+        self,
+        api_client: Optional[ApiClient] = None,
+        configuration: Optional[Configuration] = None,
+    ):
         """
         Initialize the OrkesClients factory with the provided configuration.
 
         Parameters:
         -----------
+        api_client : ApiClient, optional
+            API client shared by all clients. If None, one is created from the
+            configuration on first use.
         configuration : Configuration, optional
             Configuration adapter containing server URL, authentication settings,
             worker properties, and other connection parameters. If None, a default
@@ -99,7 +110,22 @@ class OrkesClients:
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
-        self.api_client = api_client
+        self._api_client = api_client
+        self._owns_api_client = api_client is None
+
+    @property
+    def api_client(self) -> ApiClient:
+        if self._api_client is None:
+            self._api_client = ApiClient(self.configuration)
+        return self._api_client
+
+    async def close(self) -> None:
+        """
+        Close the API client if it was created by this factory.
+        """
+        if self._owns_api_client and self._api_client is not None:
+            await self._api_client.close()
+            self._api_client = None
 
     def get_workflow_client(self) -> OrkesWorkflowClient:
         """
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from functools import partial
+from typing import Iterable, List, Optional
 
 from conductor.asyncio_client.adapters.models.extended_task_def_adapter import \
     ExtendedTaskDefAdapter
@@ -15,6 +16,16 @@ from conductor.asyncio_client.adapters.models.tag_adapter import \
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.http.configuration import Configuration
 from conductor.asyncio_client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.shared.http.metadata_sync import (
+    DEFAULT_SYNC_CONCURRENCY,
+    TASK_DEF_DEFAULTS,
+    WORKFLOW_DEF_DEFAULTS,
+    MetadataSyncResult,
+    async_run_metadata_sync,
+    diff_definitions,
+    task_def_key,
+    workflow_def_key,
+)
 
 
 class OrkesMetadataClient(OrkesBaseClient):
@@ -25,18 +36,25 @@ class OrkesMetadataClient(OrkesBaseClient):
     async def register_task_def(self, task_def: ExtendedTaskDefAdapter) -> None:
         """Register a new task definition"""
         await self.metadata_api.register_task_def([task_def])
+        self._invalidate_cached("task_def", task_def.name)
 
     async def update_task_def(self, task_def: ExtendedTaskDefAdapter) -> None:
         """Update an existing task definition"""
         await self.metadata_api.update_task_def(task_def)
+        self._invalidate_cached("task_def", task_def.name)
 
     async def unregister_task_def(self, task_type: str) -> None:
         """Unregister a task definition"""
         await self.metadata_api.unregister_task_def(task_type)
+        self._invalidate_cached("task_def", task_type)
 
     async def get_task_def(self, task_type: str) -> TaskDefAdapter:
         """Get a task definition by task type"""
-        return await self.metadata_api.get_task_def(task_type)
+        return await self._get_cached(
+            ("task_def", task_type),
+            TaskDefAdapter,
+            partial(self.metadata_api.get_task_def, task_type),
+        )
 
     async def get_task_defs(
         self,
@@ -58,9 +76,11 @@ class OrkesMetadataClient(OrkesBaseClient):
         new_version: Optional[bool] = None,
     ) -> object:
         """Create a new workflow definition"""
-        return await self.metadata_api.create(
+        result = await self.metadata_api.create(
             extended_workflow_def, overwrite=overwrite, new_version=new_version
         )
+        self._invalidate_cached("workflow_def", extended_workflow_def.name)
+        return result
 
     async def update_workflow_defs(
         self,
@@ -69,15 +89,22 @@ class OrkesMetadataClient(OrkesBaseClient):
         new_version: Optional[bool] = None,
     ) -> object:
         """Create or update multiple workflow definitions"""
-        return await self.metadata_api.update(
+        result = await self.metadata_api.update(
             extended_workflow_defs, overwrite=overwrite, new_version=new_version
         )
+        for extended_workflow_def in extended_workflow_defs:
+            self._invalidate_cached("workflow_def", extended_workflow_def.name)
+        return result
 
     async def get_workflow_def(
         self, name: str, version: Optional[int] = None, metadata: Optional[bool] = None
     ) -> WorkflowDefAdapter:
         """Get a workflow definition by name and version"""
-        return await self.metadata_api.get(name, version=version, metadata=metadata)
+        return await self._get_cached(
+            ("workflow_def", name, version or None, bool(metadata)),
+            WorkflowDefAdapter,
+            partial(self.metadata_api.get, name, version=version, metadata=metadata),
+        )
 
     async def get_workflow_defs(
         self,
@@ -101,6 +128,7 @@ class OrkesMetadataClient(OrkesBaseClient):
     async def unregister_workflow_def(self, name: str, version: int) -> None:
         """Unregister a workflow definition"""
         await self.metadata_api.unregister_workflow_def(name, version)
+        self._invalidate_cached("workflow_def", name)
 
     # Bulk Operations
     async def upload_definitions_to_s3(self) -> None:
@@ -126,6 +154,58 @@ class OrkesMetadataClient(OrkesBaseClient):
         """Get all workflow definitions"""
         return await self.get_workflow_defs()
 
+    async def sync_metadata(
+        self,
+        workflow_defs: Iterable[ExtendedWorkflowDefAdapter] = (),
+        task_defs: Iterable[ExtendedTaskDefAdapter] = (),
+        max_concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+    ) -> MetadataSyncResult:
+        """
+        Register or update only the definitions that differ from the server's, see
+        diff_definitions. The task definitions are pushed first, then the workflow
+        definitions, which may use them.
+        """
+        workflow_defs, task_defs = list(workflow_defs), list(task_defs)
+        result = MetadataSyncResult()
+        if task_defs:
+            missing, changed, unchanged = diff_definitions(
+                task_defs,
+                await self.get_all_task_defs(),
+                _to_dict,
+                task_def_key,
+                TASK_DEF_DEFAULTS,
+            )
+            pushes = [
+                (task_def.name, True, partial(self.register_task_def, task_def))
+                for task_def in missing
+            ]
+            pushes += [
+                (task_def.name, False, partial(self.update_task_def, task_def))
+                for task_def in changed
+            ]
+            # Done before the workflows are pushed, as they may use the new task definitions
+            result = await async_run_metadata_sync(pushes, unchanged, max_concurrency)
+        if workflow_defs:
+            missing, changed, unchanged = diff_definitions(
+                workflow_defs,
+                await self.get_all_workflow_defs(),
+                _to_dict,
+                workflow_def_key,
+                WORKFLOW_DEF_DEFAULTS,
+            )
+            pushes = [
+                (workflow_def.name, True, partial(self.update_workflow_def, workflow_def))
+                for workflow_def in missing
+            ]
+            pushes += [
+                (workflow_def.name, False, partial(self.update_workflow_def, workflow_def))
+                for workflow_def in changed
+            ]
+            result = result.combine(
+                await async_run_metadata_sync(pushes, unchanged, max_concurrency)
+            )
+        return result
+
     async def get_task_defs_by_tag(
         self, tag_key: str, tag_value: str
     ) -> List[TaskDefAdapter]:
@@ -228,4 +308,8 @@ class OrkesMetadataClient(OrkesBaseClient):
         return await self.tags_api.get_task_tags(task_name)
 
     async def set_task_tags(self, tags: List[TagAdapter], task_name: str):
-        await self.tags_api.set_task_tags(task_name, tags)
\ No newline at end of file
+        await self.tags_api.set_task_tags(task_name, tags)
+
+
+def _to_dict(definition) -> dict:
+    return definition.to_dict()
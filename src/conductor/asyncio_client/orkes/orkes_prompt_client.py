@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import List, Optional
 
 from conductor.asyncio_client.adapters.models.message_template_adapter import (
@@ -26,10 +27,15 @@ class OrkesPromptClient(OrkesBaseClient):
         await self.prompt_api.save_message_template(
             name, description, body, models=models
         )
+        self._invalidate_cached("prompt", name)
 
     async def get_message_template(self, name: str) -> MessageTemplateAdapter:
         """Get a message template by name"""
-        return await self.prompt_api.get_message_template(name)
+        return await self._get_cached(
+            ("prompt", name),
+            MessageTemplateAdapter,
+            partial(self.prompt_api.get_message_template, name),
+        )
 
     async def get_message_templates(self) -> List[MessageTemplateAdapter]:
         """Get all message templates"""
@@ -38,12 +44,15 @@ class OrkesPromptClient(OrkesBaseClient):
     async def delete_message_template(self, name: str) -> None:
         """Delete a message template"""
         await self.prompt_api.delete_message_template(name)
+        self._invalidate_cached("prompt", name)
 
     async def create_message_templates(
         self, message_templates: List[MessageTemplateAdapter]
     ) -> None:
         """Create multiple message templates in bulk"""
         await self.prompt_api.create_message_templates(message_templates)
+        for message_template in message_templates:
+            self._invalidate_cached("prompt", message_template.name)
 
     # Template Testing
     async def test_message_template(
@@ -58,6 +67,7 @@ class OrkesPromptClient(OrkesBaseClient):
     ) -> None:
         """Add tags to a prompt template"""
         await self.prompt_api.put_tag_for_prompt_template(name, tags)
+        self._invalidate_cached("prompt", name)
 
     async def get_tags_for_prompt_template(self, name: str) -> List[TagAdapter]:
         """Get tags associated with a prompt template"""
@@ -68,6 +78,7 @@ class OrkesPromptClient(OrkesBaseClient):
     ) -> None:
         """Delete tags from a prompt template"""
         await self.prompt_api.delete_tag_for_prompt_template(name, tags)
+        self._invalidate_cached("prompt", name)
 
     # Convenience Methods
     async def create_simple_template(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from functools import partial
+from typing import AsyncIterator, Dict, List, Optional
 
 from conductor.asyncio_client.adapters.models.save_schedule_request_adapter import \
     SaveScheduleRequestAdapter
@@ -11,11 +12,17 @@ from conductor.asyncio_client.adapters.models.start_workflow_request_adapter imp
 from conductor.asyncio_client.adapters.models.tag_adapter import TagAdapter
 from conductor.asyncio_client.adapters.models.workflow_schedule_adapter import \
     WorkflowScheduleAdapter
+from conductor.asyncio_client.adapters.models.workflow_schedule_execution_model_adapter import \
+    WorkflowScheduleExecutionModelAdapter
 from conductor.asyncio_client.adapters.models.workflow_schedule_model_adapter import \
     WorkflowScheduleModelAdapter
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.http.configuration import Configuration
 from conductor.asyncio_client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.shared.http.paginated_search import (
+    DEFAULT_PAGE_SIZE,
+    aiter_search_results,
+)
 
 
 class OrkesSchedulerClient(OrkesBaseClient):
@@ -27,15 +34,23 @@ class OrkesSchedulerClient(OrkesBaseClient):
         self, save_schedule_request: SaveScheduleRequestAdapter
     ) -> object:
         """Create or update a schedule for a specified workflow"""
-        return await self.scheduler_api.save_schedule(save_schedule_request)
+        result = await self.scheduler_api.save_schedule(save_schedule_request)
+        self._invalidate_cached("schedule", save_schedule_request.name)
+        return result
 
     async def get_schedule(self, name: str) -> WorkflowScheduleAdapter:
         """Get a workflow schedule by name"""
-        return await self.scheduler_api.get_schedule(name)
+        return await self._get_cached(
+            ("schedule", name),
+            WorkflowScheduleAdapter,
+            partial(self.scheduler_api.get_schedule, name),
+        )
 
     async def delete_schedule(self, name: str) -> object:
         """Delete an existing workflow schedule by name"""
-        return await self.scheduler_api.delete_schedule(name)
+        result = await self.scheduler_api.delete_schedule(name)
+        self._invalidate_cached("schedule", name)
+        return result
 
     async def get_all_schedules(
         self, workflow_name: Optional[str] = None
@@ -46,19 +61,27 @@ class OrkesSchedulerClient(OrkesBaseClient):
     # Schedule Control Operations
     async def pause_schedule(self, name: str) -> object:
         """Pause a workflow schedule"""
-        return await self.scheduler_api.pause_schedule(name)
+        result = await self.scheduler_api.pause_schedule(name)
+        self._invalidate_cached("schedule", name)
+        return result
 
     async def resume_schedule(self, name: str) -> object:
         """Resume a paused workflow schedule"""
-        return await self.scheduler_api.resume_schedule(name)
+        result = await self.scheduler_api.resume_schedule(name)
+        self._invalidate_cached("schedule", name)
+        return result
 
     async def pause_all_schedules(self) -> Dict[str, object]:
         """Pause all workflow schedules"""
-        return await self.scheduler_api.pause_all_schedules()
+        result = await self.scheduler_api.pause_all_schedules()
+        self._invalidate_cached("schedule")
+        return result
 
     async def resume_all_schedules(self) -> Dict[str, object]:
         """Resume all paused workflow schedules"""
-        return await self.scheduler_api.resume_all_schedules()
+        result = await self.scheduler_api.resume_all_schedules()
+        self._invalidate_cached("schedule")
+        return result
 
     # Schedule Search and Discovery
     async def search_schedules(
@@ -74,6 +97,30 @@ class OrkesSchedulerClient(OrkesBaseClient):
             start=start, size=size, sort=sort, free_text=free_text, query=query
         )
 
+    def iter_search_schedules(
+        self,
+        query: Optional[str] = None,
+        free_text: str = "*",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort: Optional[str] = None,
+    ) -> AsyncIterator[WorkflowScheduleExecutionModelAdapter]:
+        """Iterate over all the schedule executions matching the search, fetching them
+        page by page. The next page is fetched while the current one is consumed"""
+
+        async def fetch_page(start: int, size: int):
+            return await self._get_search_page(
+                self.scheduler_api.search_v2_without_preload_content,
+                start=start,
+                size=size,
+                sort=sort,
+                free_text=free_text,
+                query=query,
+            )
+
+        return aiter_search_results(
+            fetch_page, WorkflowScheduleExecutionModelAdapter.from_dict, page_size
+        )
+
     async def get_schedules_by_tag(
         self, tag_key: str, tag_value: str
     ) -> List[WorkflowScheduleModelAdapter]:
@@ -100,6 +147,7 @@ class OrkesSchedulerClient(OrkesBaseClient):
     async def put_tag_for_schedule(self, name: str, tags: List[TagAdapter]) -> None:
         """Add tags to a workflow schedule"""
         await self.scheduler_api.put_tag_for_schedule(name, tags)
+        self._invalidate_cached("schedule", name)
 
     async def get_tags_for_schedule(self, name: str) -> List[TagAdapter]:
         """Get tags associated with a workflow schedule"""
@@ -108,6 +156,7 @@ class OrkesSchedulerClient(OrkesBaseClient):
     async def delete_tag_for_schedule(self, name: str, tags: List[TagAdapter]) -> None:
         """Delete specific tags from a workflow schedule"""
         await self.scheduler_api.delete_tag_for_schedule(name, tags)
+        self._invalidate_cached("schedule", name)
 
     # Schedule Execution Management
     async def requeue_all_execution_records(self) -> Dict[str, object]:
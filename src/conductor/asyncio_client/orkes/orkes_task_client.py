@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from conductor.asyncio_client.adapters.models.poll_data_adapter import \
     PollDataAdapter
@@ -11,9 +11,15 @@ from conductor.asyncio_client.adapters.models.task_exec_log_adapter import \
     TaskExecLogAdapter
 from conductor.asyncio_client.adapters.models.task_result_adapter import \
     TaskResultAdapter
+from conductor.asyncio_client.adapters.models.task_summary_adapter import \
+    TaskSummaryAdapter
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.http.configuration import Configuration
 from conductor.asyncio_client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.shared.http.paginated_search import (
+    DEFAULT_PAGE_SIZE,
+    aiter_search_results,
+)
 
 
 class OrkesTaskClient(OrkesBaseClient):
@@ -158,6 +164,28 @@ class OrkesTaskClient(OrkesBaseClient):
             start=start, size=size, sort=sort, free_text=free_text, query=query
         )
 
+    def iter_search(
+        self,
+        query: Optional[str] = None,
+        free_text: str = "*",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort: Optional[str] = None,
+    ) -> AsyncIterator[TaskSummaryAdapter]:
+        """Iterate over the summaries of all the tasks matching the search, fetching them
+        page by page. The next page is fetched while the current one is consumed"""
+
+        async def fetch_page(start: int, size: int):
+            return await self._get_search_page(
+                self.task_api.search1_without_preload_content,
+                start=start,
+                size=size,
+                sort=sort,
+                free_text=free_text,
+                query=query,
+            )
+
+        return aiter_search_results(fetch_page, TaskSummaryAdapter.from_dict, page_size)
+
     # Task Queue Management
     async def requeue_pending_tasks(self, task_type: str) -> str:
         """Requeue all pending tasks of a given task type"""
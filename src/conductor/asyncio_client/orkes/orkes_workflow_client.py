@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 
+from conductor.asyncio_client.adapters.models.bulk_response_adapter import \
+    BulkResponseAdapter
 from conductor.asyncio_client.adapters.models.correlation_ids_search_request_adapter import \
     CorrelationIdsSearchRequestAdapter
 from conductor.asyncio_client.adapters.models.rerun_workflow_request_adapter import \
@@ -21,11 +23,24 @@ from conductor.asyncio_client.adapters.models.workflow_state_update_adapter impo
     WorkflowStateUpdateAdapter
 from conductor.asyncio_client.adapters.models.workflow_status_adapter import \
     WorkflowStatusAdapter
+from conductor.asyncio_client.adapters.models.workflow_summary_adapter import \
+    WorkflowSummaryAdapter
 from conductor.asyncio_client.adapters.models.workflow_test_request_adapter import \
     WorkflowTestRequestAdapter
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.http.configuration import Configuration
 from conductor.asyncio_client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.asyncio_client.orkes.workflow_waiter import AsyncWorkflowWaiter
+from conductor.shared.http.bulk_operation import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_BULK_RETRIES,
+    async_run_bulk_operation,
+)
+from conductor.shared.http.paginated_search import (
+    DEFAULT_PAGE_SIZE,
+    aiter_search_results,
+)
 
 
 class OrkesWorkflowClient(OrkesBaseClient):
@@ -136,6 +151,117 @@ class OrkesWorkflowClient(OrkesBaseClient):
             workflow_id=workflow_id, archive_workflow=archive_workflow
         )
 
+    # Bulk Workflow Operations
+    async def bulk_pause_workflows(
+        self,
+        workflow_ids: Iterable[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        retries: int = DEFAULT_BULK_RETRIES,
+    ) -> BulkResponseAdapter:
+        """Pause any number of workflows, see async_run_bulk_operation"""
+        return await self.__run_bulk_operation(
+            self.workflow_bulk_api.pause_workflow1,
+            workflow_ids,
+            chunk_size,
+            max_concurrency,
+            retries,
+        )
+
+    async def bulk_resume_workflows(
+        self,
+        workflow_ids: Iterable[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        retries: int = DEFAULT_BULK_RETRIES,
+    ) -> BulkResponseAdapter:
+        """Resume any number of paused workflows, see async_run_bulk_operation"""
+        return await self.__run_bulk_operation(
+            self.workflow_bulk_api.resume_workflow1,
+            workflow_ids,
+            chunk_size,
+            max_concurrency,
+            retries,
+        )
+
+    async def bulk_retry_workflows(
+        self,
+        workflow_ids: Iterable[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        retries: int = DEFAULT_BULK_RETRIES,
+    ) -> BulkResponseAdapter:
+        """Retry the last failed task of any number of workflows, see async_run_bulk_operation"""
+        return await self.__run_bulk_operation(
+            self.workflow_bulk_api.retry1,
+            workflow_ids,
+            chunk_size,
+            max_concurrency,
+            retries,
+        )
+
+    async def bulk_restart_workflows(
+        self,
+        workflow_ids: Iterable[str],
+        use_latest_definitions: Optional[bool] = None,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        retries: int = DEFAULT_BULK_RETRIES,
+    ) -> BulkResponseAdapter:
+        """Restart any number of completed workflows, see async_run_bulk_operation"""
+
+        async def restart(chunk: List[str]):
+            return await self.workflow_bulk_api.restart1(
+                chunk, use_latest_definitions=use_latest_definitions
+            )
+
+        return await self.__run_bulk_operation(
+            restart, workflow_ids, chunk_size, max_concurrency, retries
+        )
+
+    async def bulk_terminate_workflows(
+        self,
+        workflow_ids: Iterable[str],
+        reason: Optional[str] = None,
+        trigger_failure_workflow: Optional[bool] = None,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        retries: int = DEFAULT_BULK_RETRIES,
+    ) -> BulkResponseAdapter:
+        """Terminate any number of workflows, see async_run_bulk_operation"""
+
+        async def terminate(chunk: List[str]):
+            return await self.workflow_bulk_api.terminate(
+                chunk, reason=reason, trigger_failure_workflow=trigger_failure_workflow
+            )
+
+        return await self.__run_bulk_operation(
+            terminate, workflow_ids, chunk_size, max_concurrency, retries
+        )
+
+    async def bulk_remove_workflows(
+        self,
+        workflow_ids: Iterable[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        retries: int = DEFAULT_BULK_RETRIES,
+    ) -> BulkResponseAdapter:
+        """Permanently remove any number of workflows, see async_run_bulk_operation"""
+        return await self.__run_bulk_operation(
+            self.workflow_bulk_api.delete,
+            workflow_ids,
+            chunk_size,
+            max_concurrency,
+            retries,
+        )
+
+    async def wait_for_workflows(
+        self, workflow_ids: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, WorkflowStatusAdapter]:
+        """Wait until the workflows reached a terminal state and return their statuses, see AsyncWorkflowWaiter"""
+        async with AsyncWorkflowWaiter(self) as waiter:
+            return await waiter.wait_for_all(workflow_ids, timeout=timeout)
+
     # Workflow Information Operations
     async def get_workflow(
         self,
@@ -223,6 +349,32 @@ class OrkesWorkflowClient(OrkesBaseClient):
             skip_cache=skip_cache,
         )
 
+    def iter_search(
+        self,
+        query: Optional[str] = None,
+        free_text: str = "*",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort: Optional[str] = None,
+        skip_cache: Optional[bool] = None,
+    ) -> AsyncIterator[WorkflowSummaryAdapter]:
+        """Iterate over all the workflows matching the search, fetching them page by page.
+        The next page is fetched while the current one is consumed"""
+
+        async def fetch_page(start: int, size: int):
+            return await self._get_search_page(
+                self.workflow_api.search_without_preload_content,
+                start=start,
+                size=size,
+                sort=sort,
+                free_text=free_text,
+                query=query,
+                skip_cache=skip_cache,
+            )
+
+        return aiter_search_results(
+            fetch_page, WorkflowSummaryAdapter.from_dict, page_size
+        )
+
     # Task Operations
     async def skip_task_from_workflow(
         self,
@@ -399,3 +551,18 @@ class OrkesWorkflowClient(OrkesBaseClient):
             include_output=include_output,
             include_variables=include_variables,
         )
+
+    async def __run_bulk_operation(
+        self,
+        operation,
+        workflow_ids: Iterable[str],
+        chunk_size: int,
+        max_concurrency: int,
+        retries: int,
+    ) -> BulkResponseAdapter:
+        successful, errors = await async_run_bulk_operation(
+            operation, workflow_ids, chunk_size, max_concurrency, retries
+        )
+        return BulkResponseAdapter(
+            bulk_error_results=errors, bulk_successful_results=successful
+        )
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+from conductor.asyncio_client.adapters.models.workflow_status_adapter import \
+    WorkflowStatusAdapter
+from conductor.asyncio_client.configuration import Configuration
+from conductor.client.adapters.models.workflow_run_adapter import terminal_status
+
+if TYPE_CHECKING:
+    from conductor.asyncio_client.orkes.orkes_workflow_client import \
+        OrkesWorkflowClient
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+DEFAULT_MIN_POLL_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 30.0
+# A workflow waited on for 50 seconds is polled every 5 seconds
+DEFAULT_POLL_INTERVAL_RATIO = 0.1
+DEFAULT_POLL_CONCURRENCY = 10
+
+
+class AsyncWorkflowWaiter:
+    """
+    Async counterpart of ``WorkflowWaiter``: one background task polls the
+    workflows waited on, and ``wait_for`` returns an ``asyncio.Future`` that
+    resolves to the status of the workflow once it reached a terminal state.
+    """
+
+    def __init__(
+        self,
+        workflow_client: OrkesWorkflowClient,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL_SECONDS,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+        poll_interval_ratio: float = DEFAULT_POLL_INTERVAL_RATIO,
+        max_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        include_output: bool = True,
+    ):
+        self.workflow_client = workflow_client
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_interval_ratio = poll_interval_ratio
+        self.max_concurrency = max_concurrency
+        self.include_output = include_output
+        # Workflow ids by the time they are due to be polled
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        # Future and time waiting started, by workflow id
+        self._waiting: Dict[str, Tuple[asyncio.Future, float]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def wait_for(self, workflow_id: str) -> asyncio.Future:
+        """
+        Return a future of the terminal status of the workflow. Waiting for
+        a workflow that is already waited on returns the same future.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncWorkflowWaiter is closed")
+        waiting = self._waiting.get(workflow_id)
+        if waiting is not None:
+            return waiting[0]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        now = time.monotonic()
+        self._waiting[workflow_id] = (future, now)
+        heapq.heappush(self._schedule, (now, next(self._sequence), workflow_id))
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self.__run())
+        self._wakeup.set()
+        return future
+
+    async def wait_for_all(
+        self, workflow_ids: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, WorkflowStatusAdapter]:
+        """
+        Wait until all the workflows reached a terminal state, and return
+        their statuses by workflow id.
+
+        :raises asyncio.TimeoutError: if they did not within ``timeout``
+            seconds; the workflows are still waited on
+        """
+        futures = {
+            workflow_id: self.wait_for(workflow_id) for workflow_id in workflow_ids
+        }
+        if not futures:
+            return {}
+        # asyncio.wait leaves the futures, which other callers may share,
+        # running on timeout
+        _, pending = await asyncio.wait(futures.values(), timeout=timeout)
+        if pending:
+            raise asyncio.TimeoutError(
+                f"{len(pending)} of {len(futures)} workflows did not complete within {timeout} seconds"
+            )
+        return {workflow_id: future.result() for workflow_id, future in futures.items()}
+
+    async def close(self) -> None:
+        """Stop polling, and cancel the futures of the workflows still waited on."""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for future, _ in self._waiting.values():
+            future.cancel()
+        self._waiting.clear()
+        self._schedule.clear()
+
+    async def __aenter__(self) -> AsyncWorkflowWaiter:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def __run(self) -> None:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def get_status(
+            workflow_id: str,
+        ) -> Union[WorkflowStatusAdapter, Exception]:
+            async with semaphore:
+                try:
+                    return await self.workflow_client.get_workflow_status(
+                        workflow_id, include_output=self.include_output
+                    )
+                except Exception as e:
+                    return e
+
+        while True:
+            delay = self.__get_seconds_until_next_poll()
+            if delay is None or delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            workflow_ids = self.__pop_due()
+            statuses = await asyncio.gather(
+                *(get_status(workflow_id) for workflow_id in workflow_ids)
+            )
+            for workflow_id, status in zip(workflow_ids, statuses):
+                self.__update(workflow_id, status)
+
+    def __get_seconds_until_next_poll(self) -> Optional[float]:
+        if not self._schedule:
+            return None
+        return self._schedule[0][0] - time.monotonic()
+
+    def __pop_due(self) -> List[str]:
+        now = time.monotonic()
+        workflow_ids = []
+        while self._schedule and self._schedule[0][0] <= now:
+            _, _, workflow_id = heapq.heappop(self._schedule)
+            waiting = self._waiting.get(workflow_id)
+            if waiting is None:
+                continue
+            if waiting[0].done():
+                # Cancelled by the caller
+                del self._waiting[workflow_id]
+                continue
+            workflow_ids.append(workflow_id)
+        return workflow_ids
+
+    def __update(
+        self, workflow_id: str, status: Union[WorkflowStatusAdapter, Exception]
+    ) -> None:
+        waiting = self._waiting.get(workflow_id)
+        if waiting is None:
+            return
+        future, started_at = waiting
+        if isinstance(status, Exception) and getattr(status, "status", None) == 404:
+            # No such workflow: it will not complete
+            del self._waiting[workflow_id]
+            if not future.done():
+                future.set_exception(status)
+            return
+        if isinstance(status, Exception):
+            logger.warning(
+                "Failed to get status of workflow %s, reason: %s", workflow_id, status
+            )
+        elif status is not None and status.status in terminal_status:
+            del self._waiting[workflow_id]
+            if not future.done():
+                future.set_result(status)
+            return
+        now = time.monotonic()
+        interval = min(
+            self.max_poll_interval,
+            max(self.min_poll_interval, (now - started_at) * self.poll_interval_ratio),
+        )
+        heapq.heappush(
+            self._schedule, (now + interval, next(self._sequence), workflow_id)
+        )
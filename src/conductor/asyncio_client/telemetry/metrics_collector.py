@@ -78,6 +78,14 @@ class AsyncMetricsCollector:
             labels={MetricLabel.TASK_TYPE: task_type},
         )
 
+    async def increment_task_poll_empty(self, task_type: str) -> None:
+        """Increment empty poll counter."""
+        await self.__increment_counter(
+            name=MetricName.TASK_POLL_EMPTY,
+            documentation=MetricDocumentation.TASK_POLL_EMPTY,
+            labels={MetricLabel.TASK_TYPE: task_type},
+        )
+
     async def increment_task_execution_queue_full(self, task_type: str) -> None:
         """Increment task execution queue full counter."""
         await self.__increment_counter(
@@ -189,6 +197,15 @@ class AsyncMetricsCollector:
             },
         )
 
+    async def record_workflow_start_throughput(self, throughput: float) -> None:
+        """Record workflows started per second by a bulk start."""
+        await self.__record_gauge(
+            name=MetricName.WORKFLOW_START_THROUGHPUT,
+            documentation=MetricDocumentation.WORKFLOW_START_THROUGHPUT,
+            labels={},
+            value=throughput,
+        )
+
     async def record_workflow_input_payload_size(
         self, workflow_type: str, version: str, payload_size: int
     ) -> None:
@@ -232,6 +249,33 @@ class AsyncMetricsCollector:
             value=time_spent,
         )
 
+    async def record_task_poll_backoff(self, task_type: str, backoff: float) -> None:
+        """Record seconds to wait before the next poll."""
+        await self.__record_gauge(
+            name=MetricName.TASK_POLL_BACKOFF,
+            documentation=MetricDocumentation.TASK_POLL_BACKOFF,
+            labels={MetricLabel.TASK_TYPE: task_type},
+            value=backoff,
+        )
+
+    async def record_task_update_queue_depth(self, task_type: str, depth: int) -> None:
+        """Record number of task results waiting to be updated."""
+        await self.__record_gauge(
+            name=MetricName.TASK_UPDATE_QUEUE_DEPTH,
+            documentation=MetricDocumentation.TASK_UPDATE_QUEUE_DEPTH,
+            labels={MetricLabel.TASK_TYPE: task_type},
+            value=depth,
+        )
+
+    async def record_task_update_time(self, task_type: str, time_spent: float) -> None:
+        """Record task update time."""
+        await self.__record_gauge(
+            name=MetricName.TASK_UPDATE_TIME,
+            documentation=MetricDocumentation.TASK_UPDATE_TIME,
+            labels={MetricLabel.TASK_TYPE: task_type},
+            value=time_spent,
+        )
+
     async def __increment_counter(
         self,
         name: MetricName,
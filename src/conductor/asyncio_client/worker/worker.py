@@ -6,7 +6,7 @@ import logging
 import time
 import traceback
 from copy import deepcopy
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 from conductor.asyncio_client.adapters.models.task_adapter import TaskAdapter
 from conductor.asyncio_client.adapters.models.task_exec_log_adapter import (
@@ -18,8 +18,7 @@ from conductor.asyncio_client.adapters.models.task_result_adapter import (
 from conductor.asyncio_client.configuration import Configuration
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.worker.worker_interface import WorkerInterface
-from conductor.shared.automator import utils
-from conductor.shared.automator.utils import convert_from_dict_or_list
+from conductor.shared.automator.utils import TaskInputBinder
 from conductor.shared.http.enums import TaskResultStatus
 from conductor.shared.worker.exception import NonRetryableException
 
@@ -58,6 +57,10 @@ class Worker(WorkerInterface):
         poll_interval: Optional[float] = None,
         domain: Optional[str] = None,
         worker_id: Optional[str] = None,
+        poll_count: Optional[int] = None,
+        poll_timeout: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        lease_extend_enabled: Optional[bool] = None,
     ):
         super().__init__(task_definition_name)
         self.api_client = ApiClient()
@@ -65,66 +68,99 @@ class Worker(WorkerInterface):
         self.poll_interval = poll_interval or self.config.get_poll_interval()
         self.domain = domain or self.config.get_domain()
         self.worker_id = worker_id or super().get_identity()
+        self.poll_count = poll_count or self.poll_count
+        self.poll_timeout = poll_timeout or self.poll_timeout
+        self.max_concurrency = max_concurrency or self.max_concurrency
+        if lease_extend_enabled is not None:
+            self.lease_extend_enabled = lease_extend_enabled
         self.execute_function = deepcopy(execute_function)
 
     def execute(self, task: TaskAdapter) -> TaskResultAdapter:
-        task_input = {}
-        task_output = None
+        if self._is_execute_function_coroutine:
+            # Coroutine workers are awaited by the runner, see is_coroutine()
+            return self.execute_async(task)
         task_result: TaskResultAdapter = self.get_task_result_from_task(task)
 
         try:
+            task_output = self.__call_execute_function(task)
+            if isinstance(task_output, TaskResultAdapter):
+                return self.__bind_task_result(task, task_output)
+            task_result.status = TaskResultStatus.COMPLETED
+            task_result.output_data = {"result": task_output}
+        except NonRetryableException as ne:
+            self.__set_terminal_error(task_result, ne)
+        except Exception as ne:
+            self.__set_execution_error(task, task_result, ne)
 
-            if self._is_execute_function_input_parameter_a_task:
-                task_output = self.execute_function(task)
-            else:
-                params = inspect.signature(self.execute_function).parameters
-                for input_name in params:
-                    typ = params[input_name].annotation
-                    default_value = params[input_name].default
-                    if input_name in task.input_data:
-                        if typ in utils.simple_types:
-                            task_input[input_name] = task.input_data[input_name]
-                        else:
-                            task_input[input_name] = convert_from_dict_or_list(
-                                typ, task.input_data[input_name]
-                            )
-                    elif default_value is not inspect.Parameter.empty:
-                        task_input[input_name] = default_value
-                    else:
-                        task_input[input_name] = None
-                task_output = self.execute_function(**task_input)
+        return self.__serialize_output_data(task_result)
 
-            if isinstance(task_output, TaskResultAdapter):
-                task_output.task_id = task.task_id
-                task_output.workflow_instance_id = task.workflow_instance_id
-                return task_output
-            else:
-                task_result.status = TaskResultStatus.COMPLETED
-                task_result.output_data = {"result": task_output}
+    async def execute_async(self, task: TaskAdapter) -> TaskResultAdapter:
+        task_result: TaskResultAdapter = self.get_task_result_from_task(task)
 
+        try:
+            task_output = await self.__call_execute_function(task)
+            if isinstance(task_output, TaskResultAdapter):
+                return self.__bind_task_result(task, task_output)
+            task_result.status = TaskResultStatus.COMPLETED
+            task_result.output_data = {"result": task_output}
         except NonRetryableException as ne:
-            task_result.status = TaskResultStatus.FAILED_WITH_TERMINAL_ERROR
-            if len(ne.args) > 0:
-                task_result.reason_for_incompletion = ne.args[0]
-
+            self.__set_terminal_error(task_result, ne)
         except Exception as ne:
-            logger.error(
-                "Error executing task task_def_name: %s; task_id: %s",
-                task.task_def_name,
-                task.task_id,
-            )
-
-            task_result.logs = [
-                TaskExecLogAdapter(
-                    log=traceback.format_exc(),
-                    task_id=task_result.task_id,
-                    created_time=int(time.time()),
-                )
-            ]
-            task_result.status = TaskResultStatus.FAILED
-            if len(ne.args) > 0:
-                task_result.reason_for_incompletion = ne.args[0]
+            self.__set_execution_error(task, task_result, ne)
+
+        return self.__serialize_output_data(task_result)
+
+    def is_coroutine(self) -> bool:
+        return self._is_execute_function_coroutine
+
+    def __call_execute_function(self, task: TaskAdapter) -> Any:
+        if self._is_execute_function_input_parameter_a_task:
+            return self.execute_function(task)
+        return self.execute_function(**self.__get_task_input(task))
+
+    def __get_task_input(self, task: TaskAdapter) -> Dict[str, Any]:
+        return self._task_input_binder.bind(task.input_data)
+
+    @staticmethod
+    def __bind_task_result(
+        task: TaskAdapter, task_output: TaskResultAdapter
+    ) -> TaskResultAdapter:
+        task_output.task_id = task.task_id
+        task_output.workflow_instance_id = task.workflow_instance_id
+        return task_output
+
+    @staticmethod
+    def __set_terminal_error(
+        task_result: TaskResultAdapter, ne: NonRetryableException
+    ) -> None:
+        task_result.status = TaskResultStatus.FAILED_WITH_TERMINAL_ERROR
+        if len(ne.args) > 0:
+            task_result.reason_for_incompletion = ne.args[0]
+
+    @staticmethod
+    def __set_execution_error(
+        task: TaskAdapter, task_result: TaskResultAdapter, ne: Exception
+    ) -> None:
+        logger.error(
+            "Error executing task task_def_name: %s; task_id: %s",
+            task.task_def_name,
+            task.task_id,
+        )
 
+        task_result.logs = [
+            TaskExecLogAdapter(
+                log=traceback.format_exc(),
+                task_id=task_result.task_id,
+                created_time=int(time.time()),
+            )
+        ]
+        task_result.status = TaskResultStatus.FAILED
+        if len(ne.args) > 0:
+            task_result.reason_for_incompletion = ne.args[0]
+
+    def __serialize_output_data(
+        self, task_result: TaskResultAdapter
+    ) -> TaskResultAdapter:
         if dataclasses.is_dataclass(type(task_result.output_data)):
             task_output = dataclasses.asdict(task_result.output_data)
             task_result.output_data = task_output
@@ -149,6 +185,10 @@ class Worker(WorkerInterface):
     @execute_function.setter
     def execute_function(self, execute_function: ExecuteTaskFunction) -> None:
         self._execute_function = execute_function
+        self._task_input_binder = TaskInputBinder(execute_function)
+        self._is_execute_function_coroutine = inspect.iscoroutinefunction(
+            execute_function
+        )
         self._is_execute_function_input_parameter_a_task = (
             is_callable_input_parameter_a_task(
                 callable_exec_task_function=execute_function,
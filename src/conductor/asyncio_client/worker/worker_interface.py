@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import inspect
 import socket
 from typing import Union
 
@@ -9,6 +10,10 @@ from conductor.asyncio_client.adapters.models.task_result_adapter import \
     TaskResultAdapter
 
 DEFAULT_POLLING_INTERVAL = 100  # ms
+DEFAULT_POLL_COUNT = 1
+DEFAULT_POLL_TIMEOUT = 100  # ms
+DEFAULT_MAX_CONCURRENCY = 1
+DEFAULT_LEASE_EXTEND_ENABLED = True
 
 
 class WorkerInterface(abc.ABC):
@@ -18,6 +23,10 @@ class WorkerInterface(abc.ABC):
         self._task_definition_name_cache = None
         self._domain = None
         self._poll_interval = DEFAULT_POLLING_INTERVAL
+        self._poll_count = DEFAULT_POLL_COUNT
+        self._poll_timeout = DEFAULT_POLL_TIMEOUT
+        self._max_concurrency = DEFAULT_MAX_CONCURRENCY
+        self._lease_extend_enabled = DEFAULT_LEASE_EXTEND_ENABLED
 
     @abc.abstractmethod
     def execute(self, task: TaskAdapter) -> TaskResultAdapter:
@@ -103,6 +112,15 @@ class WorkerInterface(abc.ABC):
         """
         return self.domain
 
+    def is_coroutine(self) -> bool:
+        """
+        Whether execute returns an awaitable. Coroutine workers are awaited
+        on the event loop, all others are offloaded to the runner's executor.
+
+        :return: bool
+        """
+        return inspect.iscoroutinefunction(self.execute)
+
     def paused(self) -> bool:
         """
         Override this method to pause the worker from polling.
@@ -124,3 +142,49 @@ class WorkerInterface(abc.ABC):
     @poll_interval.setter
     def poll_interval(self, value):
         self._poll_interval = value
+
+    @property
+    def poll_count(self):
+        """
+        Maximum number of tasks fetched per poll request.
+        Values greater than 1 switch the runner to batch polling.
+        """
+        return self._poll_count
+
+    @poll_count.setter
+    def poll_count(self, value):
+        self._poll_count = value
+
+    @property
+    def poll_timeout(self):
+        """
+        Long-poll timeout in milliseconds used when batch polling.
+        """
+        return self._poll_timeout
+
+    @poll_timeout.setter
+    def poll_timeout(self, value):
+        self._poll_timeout = value
+
+    @property
+    def max_concurrency(self):
+        """
+        Maximum number of tasks the runner keeps in flight at the same time.
+        """
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value):
+        self._max_concurrency = value
+
+    @property
+    def lease_extend_enabled(self):
+        """
+        Whether the runner sends lease-extension heartbeats while a task with
+        a response timeout is executing.
+        """
+        return self._lease_extend_enabled
+
+    @lease_extend_enabled.setter
+    def lease_extend_enabled(self, value):
+        self._lease_extend_enabled = value
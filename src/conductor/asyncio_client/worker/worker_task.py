@@ -15,6 +15,10 @@ def WorkerTask(
     domain: Optional[str] = None,
     worker_id: Optional[str] = None,
     poll_interval_seconds: int = 0,
+    poll_count: int = 1,
+    poll_timeout: int = 100,
+    max_concurrency: int = 1,
+    lease_extend_enabled: bool = True,
 ):
     config = Configuration()
 
@@ -36,6 +40,10 @@ def WorkerTask(
             worker_id=worker_id,
             func=func,
             task_options=task_opts,
+            poll_count=poll_count,
+            poll_timeout=poll_timeout,
+            max_concurrency=max_concurrency,
+            lease_extend_enabled=lease_extend_enabled,
         )
 
         @functools.wraps(func)
@@ -60,6 +68,10 @@ def worker_task(
     poll_interval_millis: int = 100,
     domain: Optional[str] = None,
     worker_id: Optional[str] = None,
+    poll_count: int = 1,
+    poll_timeout: int = 100,
+    max_concurrency: int = 1,
+    lease_extend_enabled: bool = True,
 ):
     config = Configuration()
 
@@ -76,6 +88,10 @@ def worker_task(
             worker_id=worker_id,
             func=func,
             task_options=task_opts,
+            poll_count=poll_count,
+            poll_timeout=poll_timeout,
+            max_concurrency=max_concurrency,
+            lease_extend_enabled=lease_extend_enabled,
         )
 
         @functools.wraps(func)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
@@ -33,6 +35,10 @@ from conductor.shared.http.enums import IdempotencyStrategy
 from conductor.shared.workflow.enums import TaskType, TimeoutPolicy
 
 
+# Attributes that hold what is derived from the builder, rather than the builder state
+_DERIVED_ATTRIBUTES = frozenset(("_workflow_def", "_definition_hash", "_registered_hash"))
+
+
 class AsyncConductorWorkflow:
     SCHEMA_VERSION = 2
 
@@ -59,6 +65,16 @@ class AsyncConductorWorkflow:
         self._restartable = True
         self._workflow_status_listener_enabled = False
         self._workflow_status_listener_sink = None
+        self._register_once = False
+        self._registered_hash = None
+        self._copy_tasks = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any change to the builder invalidates the compiled definition
+        if name not in _DERIVED_ATTRIBUTES:
+            object.__setattr__(self, "_workflow_def", None)
+            object.__setattr__(self, "_definition_hash", None)
+        object.__setattr__(self, name, value)
 
     @property
     def name(self) -> str:
@@ -151,6 +167,7 @@ class AsyncConductorWorkflow:
             self._output_parameters = {}
 
         self._output_parameters[key] = value
+        self.__invalidate()
         return self
 
     # InputTemplate template input to the workflow.  Can have combination of variables (e.g. ${workflow.input.abc}) and static values
@@ -197,6 +214,23 @@ class AsyncConductorWorkflow:
         self.input_template(input)
         return self
 
+    # Tasks are copied when they are added, so changing a task afterwards does not change the workflow. Disable
+    # copying to build very large workflows quickly: the tasks themselves are added, and must not be changed after.
+    def copy_tasks(self, copy_tasks: bool = True):
+        if not isinstance(copy_tasks, bool):
+            raise Exception("Invalid type")
+        self._copy_tasks = copy_tasks
+        return self
+
+    # When enabled, the definition is registered (overwriting the one on the server) the first time the workflow is
+    # started and again only after it changed, and workflows are started by name and version instead of sending the
+    # whole definition with every request.
+    def register_once(self, register_once: bool = True):
+        if not isinstance(register_once, bool):
+            raise Exception("Invalid type")
+        self._register_once = register_once
+        return self
+
     # Register the workflow definition with the server. If overwrite is set, the definition on the server will be
     # overwritten. When not set, the call fails if there is any change in the workflow definition between the server
     # and what is being registered.
@@ -219,7 +253,7 @@ class AsyncConductorWorkflow:
         -------
         Workflow Execution Id
         """
-        start_workflow_request.workflow_def = self.to_workflow_def()
+        await self.__set_workflow_def(start_workflow_request)
         start_workflow_request.name = self.name
         start_workflow_request.version = self.version
         return await self._executor.start_workflow(start_workflow_request)
@@ -238,7 +272,6 @@ class AsyncConductorWorkflow:
         """
         workflow_input = workflow_input or {}
         start_workflow_request = StartWorkflowRequestAdapter(
-            workflow_def=self.to_workflow_def(),
             name=self.name,
             version=self.version,
             input=workflow_input,
@@ -248,6 +281,7 @@ class AsyncConductorWorkflow:
             idempotency_key=idempotency_key,
             idempotency_strategy=idempotency_strategy,
         )
+        await self.__set_workflow_def(start_workflow_request)
 
         return await self._executor.start_workflow(start_workflow_request)
 
@@ -275,14 +309,13 @@ class AsyncConductorWorkflow:
         when the call completed.
         """
         workflow_input = workflow_input or {}
-        workflow_def = self.to_workflow_def()
         request = StartWorkflowRequestAdapter(
-            workflow_def=workflow_def,
             input=workflow_input,
-            name=workflow_def.name,
-            version=1,
+            name=self.name,
+            version=self.version if self._register_once else 1,
             timeout_seconds=self._timeout_seconds,
         )
+        await self.__set_workflow_def(request)
         if idempotency_key is not None:
             request.idempotency_key = idempotency_key
             request.idempotency_strategy = idempotency_strategy
@@ -298,6 +331,18 @@ class AsyncConductorWorkflow:
         return run
 
     def to_workflow_def(self) -> WorkflowDefAdapter:
+        """
+        Returns the definition of the workflow. It is built once and reused until the workflow is changed, so it
+        must not be modified. With copy_tasks(False) it is rebuilt on every call, as the added tasks may have been
+        changed in place since.
+        """
+        if not self._copy_tasks:
+            return self.__build_workflow_def()
+        if self._workflow_def is None:
+            self._workflow_def = self.__build_workflow_def()
+        return self._workflow_def
+
+    def __build_workflow_def(self) -> WorkflowDefAdapter:
         return WorkflowDefAdapter(
             name=self._name,
             description=self._description,
@@ -342,17 +387,38 @@ class AsyncConductorWorkflow:
         sub_workflow_task.input_parameters.update(self._input_template)
         return sub_workflow_task.to_workflow_task()
 
+    def __get_definition_hash(self, workflow_def: WorkflowDefAdapter) -> str:
+        # Only the hash of a cached definition can be reused; others are hashed as they are now
+        if self._definition_hash is not None and workflow_def is self._workflow_def:
+            return self._definition_hash
+        content = json.dumps(workflow_def.to_dict(), sort_keys=True, default=str)
+        definition_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if workflow_def is self._workflow_def:
+            self._definition_hash = definition_hash
+        return definition_hash
+
+    async def __set_workflow_def(self, request: StartWorkflowRequestAdapter) -> None:
+        if not self._register_once:
+            request.workflow_def = self.to_workflow_def()
+            return
+        definition_hash = self.__get_definition_hash(self.to_workflow_def())
+        if self._registered_hash != definition_hash:
+            await self.register(overwrite=True)
+            self._registered_hash = definition_hash
+
+    def __invalidate(self) -> None:
+        self._workflow_def = None
+        self._definition_hash = None
+
     def __get_workflow_task_list(self) -> List[WorkflowTaskAdapter]:
-        # Flatten tasks into workflow_task_list
-        workflow_task_list = [
-            wt
-            for task in self._tasks
-            for wt in (
-                task.to_workflow_task()
-                if isinstance(task.to_workflow_task(), list)
-                else [task.to_workflow_task()]
-            )
-        ]
+        # Flatten tasks into workflow_task_list, converting each task once
+        workflow_task_list = []
+        for task in self._tasks:
+            converted_task = task.to_workflow_task()
+            if isinstance(converted_task, list):
+                workflow_task_list.extend(converted_task)
+            else:
+                workflow_task_list.append(converted_task)
 
         updated_task_list = []
         for current, next_task in zip(
@@ -411,7 +477,8 @@ class AsyncConductorWorkflow:
                 f"Invalid task -- if using @worker_task or @WorkerTask decorator ensure task_ref_name is passed as "
                 f"argument.  task is {type(task)}"
             )
-        self._tasks.append(deepcopy(task))
+        self._tasks.append(deepcopy(task) if self._copy_tasks else task)
+        self.__invalidate()
         return self
 
     def __add_fork_join_tasks(self, forked_tasks: List[List[TaskInterface]]):
@@ -429,6 +496,7 @@ class AsyncConductorWorkflow:
             task_ref_name="forked_" + suffix, forked_tasks=forked_tasks
         )
         self._tasks.append(fork_task)
+        self.__invalidate()
         return self
 
     async def __call__(self, **kwargs) -> WorkflowRunAdapter:
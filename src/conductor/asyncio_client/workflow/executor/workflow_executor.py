@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import time
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from conductor.asyncio_client.adapters.api.metadata_resource_api import \
     MetadataResourceApiAdapter
@@ -31,13 +33,30 @@ from conductor.asyncio_client.configuration.configuration import Configuration
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.orkes.orkes_workflow_client import \
     OrkesWorkflowClient
+from conductor.asyncio_client.telemetry.metrics_collector import \
+    AsyncMetricsCollector
+from conductor.shared.configuration.settings.metrics_settings import \
+    MetricsSettings
+from conductor.shared.workflow.models.workflow_start_result import \
+    WorkflowStartResult
+
+# The connection pool of the API client keeps 20 connections alive
+DEFAULT_BULK_START_CONCURRENCY = 20
 
 
 class AsyncWorkflowExecutor:
-    def __init__(self, configuration: Configuration, api_client: ApiClient):
+    def __init__(
+        self,
+        configuration: Configuration,
+        api_client: ApiClient,
+        metrics_settings: Optional[MetricsSettings] = None,
+    ):
         self.metadata_client = MetadataResourceApiAdapter(api_client)
         self.task_client = TaskResourceApiAdapter(api_client)
         self.workflow_client = OrkesWorkflowClient(configuration, api_client)
+        self.metrics_collector = None
+        if metrics_settings is not None:
+            self.metrics_collector = AsyncMetricsCollector(metrics_settings)
 
     async def register_workflow(
         self, workflow: ExtendedWorkflowDefAdapter, overwrite: Optional[bool] = None
@@ -61,13 +80,43 @@ class AsyncWorkflowExecutor:
         """Start multiple workflow instances sequentially.
 
         Note: There is no parallelism implemented here, so providing a very large
-        number of workflows can impact latency and performance.
+        number of workflows can impact latency and performance. Use
+        start_workflows_in_bulk to start them concurrently and get the result of
+        every request, including the ones that failed.
         """
         return [
             await self.start_workflow(start_workflow_request=request)
             for request in start_workflow_requests
         ]
 
+    async def start_workflows_in_bulk(
+        self,
+        start_workflow_requests: Iterable[StartWorkflowRequestAdapter],
+        max_concurrency: int = DEFAULT_BULK_START_CONCURRENCY,
+    ) -> List[WorkflowStartResult]:
+        """Start a workflow for each request, up to max_concurrency at a time.
+
+        Returns the id or the error of each request, in the order of the requests.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        results = [WorkflowStartResult(request) for request in start_workflow_requests]
+        pending = iter(results)
+
+        async def start_pending():
+            # Workers take the next request as they become free, so that a slow
+            # start does not hold back the others, and only max_concurrency
+            # coroutines exist however many requests there are
+            for result in pending:
+                await self.__start_workflow_for_result(result)
+
+        start_time = time.time()
+        await asyncio.gather(
+            *(start_pending() for _ in range(min(max_concurrency, len(results))))
+        )
+        await self.__record_throughput(results, time.time() - start_time)
+        return results
+
     async def execute_workflow(
         self,
         request: StartWorkflowRequestAdapter,
@@ -333,3 +382,23 @@ class AsyncWorkflowExecutor:
             output_data=task_output,
             status=status,
         )
+
+    async def __start_workflow_for_result(self, result: WorkflowStartResult) -> None:
+        try:
+            result.workflow_id = await self.start_workflow(
+                start_workflow_request=result.request
+            )
+        except Exception as e:
+            result.error = e
+            if self.metrics_collector is not None:
+                await self.metrics_collector.increment_workflow_start_error(
+                    result.request.name, e
+                )
+
+    async def __record_throughput(
+        self, results: List[WorkflowStartResult], time_spent: float
+    ) -> None:
+        if self.metrics_collector is None or time_spent <= 0:
+            return
+        started = sum(1 for result in results if result.succeeded)
+        await self.metrics_collector.record_workflow_start_throughput(started / time_spent)
@@ -16,13 +16,18 @@ def get_for_loop_condition(task_ref_name: str, iterations: int) -> str:
 
 class DoWhileTask(TaskInterface):
     def __init__(
-        self, task_ref_name: str, termination_condition: str, tasks: List[TaskInterface]
+        self,
+        task_ref_name: str,
+        termination_condition: str,
+        tasks: List[TaskInterface],
+        copy_tasks: bool = True,
     ):
         super().__init__(task_reference_name=task_ref_name, task_type=TaskType.DO_WHILE)
         self._loop_condition = str(termination_condition)
-        self._loop_over: List[TaskInterface] = (
-            deepcopy(list(tasks)) if isinstance(tasks, Sequence) else [deepcopy(tasks)]
-        )
+        # The tasks are copied unless copy_tasks is False; they must then
+        # not be changed after
+        tasks = list(tasks) if isinstance(tasks, Sequence) else [tasks]
+        self._loop_over: List[TaskInterface] = deepcopy(tasks) if copy_tasks else tasks
 
     def to_workflow_task(self) -> WorkflowTaskAdapter:
         workflow_task = super().to_workflow_task()
@@ -39,11 +44,13 @@ class LoopTask(DoWhileTask):
         task_ref_name: str,
         iterations: int,
         tasks: Union[TaskInterface, Sequence[TaskInterface]],
+        copy_tasks: bool = True,
     ):
         super().__init__(
             task_ref_name=task_ref_name,
             termination_condition=get_for_loop_condition(task_ref_name, iterations),
             tasks=tasks,
+            copy_tasks=copy_tasks,
         )
 
 
@@ -54,11 +61,13 @@ class ForEachTask(DoWhileTask):
         tasks: Union[TaskInterface, Sequence[TaskInterface]],
         iterate_over: str,
         variables: Optional[Sequence[str]] = None,
+        copy_tasks: bool = True,
     ):
         super().__init__(
             task_ref_name=task_ref_name,
             termination_condition=get_for_loop_condition(task_ref_name, 0),
             tasks=tasks,
+            copy_tasks=copy_tasks,
         )
         self.input_parameter("items", iterate_over)
         if variables is not None:
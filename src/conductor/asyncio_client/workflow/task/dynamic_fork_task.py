@@ -17,6 +17,7 @@ class DynamicForkTask(TaskInterface):
         tasks_param: str = "dynamicTasks",
         tasks_input_param_name: str = "dynamicTasksInputs",
         join_task: Optional[JoinTask] = None,
+        copy_tasks: bool = True,
     ):
         super().__init__(
             task_reference_name=task_ref_name,
@@ -24,7 +25,12 @@ class DynamicForkTask(TaskInterface):
         )
         self.tasks_param = tasks_param
         self.tasks_input_param_name = tasks_input_param_name
-        self._join_task = deepcopy(join_task) if join_task else None
+        # The join task is copied unless copy_tasks is False; it must then
+        # not be changed after
+        if not join_task:
+            self._join_task = None
+        else:
+            self._join_task = deepcopy(join_task) if copy_tasks else join_task
 
     def to_workflow_task(self) -> List[WorkflowTaskAdapter]:
         wf_task = super().to_workflow_task()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from conductor.asyncio_client.adapters.models.cache_config_adapter import \
@@ -10,6 +11,9 @@ from conductor.asyncio_client.adapters.models.workflow_task_adapter import \
 from conductor.shared.workflow.enums import TaskType
 
 
+# Values a copied task can share with the original
+_IMMUTABLE_TYPES = (str, int, float, Enum, type(None))
+
 def get_task_interface_list_as_workflow_task_list(*tasks) -> List[WorkflowTaskAdapter]:
     converted_tasks = []
     for task in tasks:
@@ -52,7 +56,7 @@ class TaskInterface:
     def task_reference_name(self, task_reference_name: str) -> None:
         if not isinstance(task_reference_name, str):
             raise Exception("invalid type")
-        self._task_reference_name = deepcopy(task_reference_name)
+        self._task_reference_name = task_reference_name
 
     @property
     def task_type(self) -> TaskType:
@@ -62,7 +66,7 @@ class TaskInterface:
     def task_type(self, task_type: TaskType) -> None:
         if not isinstance(task_type, TaskType):
             raise Exception("invalid type")
-        self._task_type = deepcopy(task_type)
+        self._task_type = task_type
 
     @property
     def name(self) -> str:
@@ -102,7 +106,7 @@ class TaskInterface:
     def description(self, description: str) -> None:
         if description is not None and not isinstance(description, str):
             raise Exception("invalid type")
-        self._description = deepcopy(description)
+        self._description = description
 
     @property
     def optional(self) -> bool:
@@ -112,7 +116,7 @@ class TaskInterface:
     def optional(self, optional: bool) -> None:
         if optional is not None and not isinstance(optional, bool):
             raise Exception("invalid type")
-        self._optional = deepcopy(optional)
+        self._optional = optional
 
     @property
     def input_parameters(self) -> Dict[str, Any]:
@@ -178,11 +182,16 @@ class TaskInterface:
             else:
                 return "${" + f"{self.task_reference_name}.input.{json_path}" + "}"
 
-    def __getattribute__(self, __name: str, /) -> Any:
-        try:
-            val = super().__getattribute__(__name)
-            return val
-        except AttributeError as ae:
-            if not __name.startswith("_"):
-                return "${" + self.task_reference_name + ".output." + __name + "}"
-            raise ae
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+        # Shares the immutable attributes instead of going through deepcopy for each of them
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        for key, value in self.__dict__.items():
+            copied.__dict__[key] = value if isinstance(value, _IMMUTABLE_TYPES) else deepcopy(value, memo)
+        return copied
+
+    # Only called when the regular lookup fails, so reading the attributes of a task costs no Python-level call
+    def __getattr__(self, __name: str) -> Any:
+        if not __name.startswith("_"):
+            return "${" + self.task_reference_name + ".output." + __name + "}"
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{__name}'")
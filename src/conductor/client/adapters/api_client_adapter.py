@@ -7,27 +7,41 @@ from conductor.client.adapters.rest_adapter import RESTClientObjectAdapter
 from conductor.client.exceptions.auth_401_policy import Auth401Policy, Auth401Handler
 
 from conductor.client.codegen.rest import AuthorizationException, ApiException
+from conductor.shared.http.json_codec import get_json_codec
 
 logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
 
 
 class ApiClientAdapter(ApiClient):
     def __init__(
-        self, configuration=None, header_name=None, header_value=None, cookie=None
+        self,
+        configuration=None,
+        header_name=None,
+        header_value=None,
+        cookie=None,
+        token_broker=None,
     ):
-        """Initialize the API client adapter with httpx-based REST client."""
+        """Initialize the API client adapter with httpx-based REST client.
+
+        With a ``token_broker`` (see ``TokenBroker``) the auth token is taken
+        from, and refreshed through, the broker shared by all worker processes.
+        """
         self.configuration = configuration or Configuration()
+        self.token_broker = token_broker
+        self._token_generation = None
 
+        self.json_codec = get_json_codec(getattr(self.configuration, "json_codec", None))
         # Create httpx-compatible REST client
         self.rest_client = RESTClientObjectAdapter(
-            connection=self.configuration.http_connection
+            connection=self.configuration.http_connection, json_codec=self.json_codec
         )
 
         self.default_headers = self._ApiClient__get_default_headers(
             header_name, header_value
         )
         self.cookie = cookie
-        self._ApiClient__refresh_auth_token()
+        if self.token_broker is None:
+            self._ApiClient__refresh_auth_token()
 
         # Initialize 401 policy handler
         auth_401_policy = Auth401Policy(
@@ -39,6 +53,30 @@ class ApiClientAdapter(ApiClient):
         )
         self.auth_401_handler = Auth401Handler(auth_401_policy)
 
+    def _ApiClient__get_authentication_headers(self):
+        if self.token_broker is None:
+            return super()._ApiClient__get_authentication_headers()
+        token, generation, update_time = self.token_broker.get_token()
+        if token is None or self.token_broker.is_expired(update_time):
+            token, generation = self.token_broker.refresh(
+                self._ApiClient__get_new_token, stale_generation=generation
+            )
+        self._token_generation = generation
+        if token is None:
+            return None
+        return {"header": {"X-Authorization": token}}
+
+    def _ApiClient__force_refresh_auth_token(self):
+        if self.token_broker is None:
+            return super()._ApiClient__force_refresh_auth_token()
+        if self.configuration.authentication_settings is None:
+            return None
+        # Single-flight: only refreshes if nobody replaced the rejected token yet
+        self.token_broker.refresh(
+            self._ApiClient__get_new_token, stale_generation=self._token_generation
+        )
+        return None
+
     def call_api(
         self,
         resource_path,
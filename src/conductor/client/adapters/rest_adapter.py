@@ -12,6 +12,7 @@ from conductor.client.codegen.rest import (
     RESTClientObject,
 )
 from conductor.client.configuration.configuration import Configuration
+from conductor.shared.http.json_codec import JsonCodec, get_json_codec
 
 logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
 
@@ -70,7 +71,12 @@ class RESTResponse(io.IOBase):
 class RESTClientObjectAdapter(RESTClientObject):
     """HTTP client adapter using httpx instead of requests."""
 
-    def __init__(self, connection: Optional[httpx.Client] = None, configuration=None):
+    def __init__(
+        self,
+        connection: Optional[httpx.Client] = None,
+        configuration=None,
+        json_codec: Optional[JsonCodec] = None,
+    ):
         """
         Initialize the REST client with httpx.
         Args:
@@ -78,7 +84,12 @@ class RESTClientObjectAdapter(RESTClientObject):
                        proxy settings from configuration will be ignored.
             configuration: Configuration object containing proxy settings.
                           Expected attributes: proxy (str), proxy_headers (dict)
+            json_codec: Encoder for JSON request bodies. Defaults to the one
+                       named by configuration.json_codec
         """
+        self.json_codec = json_codec or get_json_codec(
+            getattr(configuration, "json_codec", None)
+        )
         if connection is not None:
             self.connection = connection
         else:
@@ -213,8 +224,8 @@ class RESTClientObjectAdapter(RESTClientObject):
             if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
                 if body is not None:
                     if isinstance(body, (dict, list)):
-                        # JSON body
-                        request_kwargs["json"] = body
+                        # JSON body, encoded straight to bytes
+                        request_kwargs["content"] = self.json_codec.dumps(body)
                     elif isinstance(body, str):
                         # String body
                         request_kwargs["content"] = body.encode("utf-8")
@@ -223,7 +234,7 @@ class RESTClientObjectAdapter(RESTClientObject):
                         request_kwargs["content"] = body
                     else:
                         # Try to serialize as JSON
-                        request_kwargs["json"] = body
+                        request_kwargs["content"] = self.json_codec.dumps(body)
                 elif post_params:
                     # Form data
                     request_kwargs["data"] = post_params
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_result import TaskResult
+from conductor.shared.automator.lease_extension import get_lease_extend_interval
+from conductor.shared.http.enums.task_result_status import TaskResultStatus
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+# (due time, interval, task)
+_Lease = Tuple[float, float, Task]
+
+
+class LeaseExtender:
+    """
+    Sends lease-extension updates for tasks that are still executing, so that
+    the server neither times them out nor hands them to another worker.
+
+    A single daemon thread serves every tracked task. Heartbeats are sent
+    every ``get_lease_extend_interval(task.response_timeout_seconds)``
+    seconds until the task is untracked.
+    """
+
+    def __init__(self, update_function: Callable[[TaskResult], Any], worker_id: str):
+        self.update_function = update_function
+        self.worker_id = worker_id
+        self._leases: Dict[str, _Lease] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, task: Task) -> None:
+        interval = get_lease_extend_interval(task.response_timeout_seconds)
+        if interval is None:
+            return
+        with self._condition:
+            self._leases[task.task_id] = (time.monotonic() + interval, interval, task)
+            self._condition.notify_all()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self.__run, name="lease-extender", daemon=True
+                )
+                self._thread.start()
+
+    def untrack(self, task: Task) -> None:
+        with self._condition:
+            self._leases.pop(task.task_id, None)
+
+    @property
+    def tracked_task_count(self) -> int:
+        return len(self._leases)
+
+    def __next_due_task(self) -> Task:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                timeout = None
+                for task_id, (due_time, interval, task) in self._leases.items():
+                    if due_time <= now:
+                        self._leases[task_id] = (now + interval, interval, task)
+                        return task
+                    if timeout is None or due_time - now < timeout:
+                        timeout = due_time - now
+                self._condition.wait(timeout)
+
+    def __run(self) -> None:
+        while True:
+            task = self.__next_due_task()
+            self.__extend_lease(task)
+
+    def __extend_lease(self, task: Task) -> None:
+        task_result = TaskResult(
+            task_id=task.task_id,
+            workflow_instance_id=task.workflow_instance_id,
+            worker_id=self.worker_id,
+            status=TaskResultStatus.IN_PROGRESS,
+            extend_lease=True,
+        )
+        try:
+            self.update_function(task_result)
+            logger.debug(
+                "Extended lease of task id: %s; workflow_instance_id: %s",
+                task.task_id,
+                task.workflow_instance_id,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to extend lease of task id: %s; workflow_instance_id: %s; reason: %s",
+                task.task_id,
+                task.workflow_instance_id,
+                e,
+            )
@@ -8,11 +8,18 @@ from sys import platform
 from typing import List, Optional
 
 from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.automator.token_broker import TokenBroker
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.telemetry.metrics_collector import MetricsCollector
 from conductor.client.worker.worker import Worker
 from conductor.client.worker.worker_interface import WorkerInterface
+from conductor.shared.automator.task_limiter import (
+    TaskLimiter,
+    create_task_limiters,
+    get_task_limiter_key,
+)
 from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.spool_settings import SpoolSettings
 
 logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
 
@@ -35,7 +42,16 @@ if not _mp_fork_set:
 
 
 def register_decorated_fn(
-    name: str, poll_interval: int, domain: str, worker_id: str, func, task_options=None
+    name: str,
+    poll_interval: int,
+    domain: str,
+    worker_id: str,
+    func,
+    task_options=None,
+    poll_count: Optional[int] = None,
+    poll_timeout: Optional[int] = None,
+    thread_count: Optional[int] = None,
+    lease_extend_enabled: Optional[bool] = None,
 ):
     logger.info("Registering decorated function %s", name)
     _decorated_functions[(name, domain)] = {
@@ -44,6 +60,10 @@ def register_decorated_fn(
         "domain": domain,
         "worker_id": worker_id,
         "task_options": task_options,
+        "poll_count": poll_count,
+        "poll_timeout": poll_timeout,
+        "thread_count": thread_count,
+        "lease_extend_enabled": lease_extend_enabled,
     }
 
 
@@ -55,6 +75,7 @@ class TaskHandler:
         metrics_settings: Optional[MetricsSettings] = None,
         scan_for_annotated_workers: bool = True,
         import_modules: Optional[List[str]] = None,
+        spool_settings: Optional[SpoolSettings] = None,
     ):
         workers = workers or []
         self.logger_process, self.queue = _setup_logging_queue(configuration)
@@ -81,13 +102,19 @@ class TaskHandler:
                     worker_id=worker_id,
                     domain=domain,
                     poll_interval=poll_interval,
+                    poll_count=record.get("poll_count"),
+                    poll_timeout=record.get("poll_timeout"),
+                    thread_count=record.get("thread_count"),
+                    lease_extend_enabled=record.get("lease_extend_enabled"),
                 )
                 logger.info(
                     "Created worker with name=%s and domain=%s", task_def_name, domain
                 )
                 workers.append(worker)
 
-        self.__create_task_runner_processes(workers, configuration, metrics_settings)
+        self.__create_task_runner_processes(
+            workers, configuration, metrics_settings, spool_settings
+        )
         self.__create_metrics_provider_process(metrics_settings)
         logger.info("TaskHandler initialized")
 
@@ -98,6 +125,8 @@ class TaskHandler:
         self.stop_processes()
 
     def stop_processes(self) -> None:
+        if self.token_broker is not None:
+            self.token_broker.stop()
         self.__stop_task_runner_processes()
         self.__stop_metrics_provider_process()
         logger.info("Stopped worker processes")
@@ -107,7 +136,12 @@ class TaskHandler:
     def start_processes(self) -> None:
         logger.info("Starting worker processes")
         freeze_support()
+        if self.token_broker is not None:
+            self.token_broker.start()
         self.__start_task_runner_processes()
+        if self.token_broker is not None:
+            # Only once forked, so that no worker process inherits its thread
+            self.token_broker.start_refreshing()
         self.__start_metrics_provider_process()
         logger.info("Started task_runner and metrics_provider processes")
 
@@ -138,18 +172,43 @@ class TaskHandler:
         workers: List[WorkerInterface],
         configuration: Configuration,
         metrics_settings: MetricsSettings,
+        spool_settings: Optional[SpoolSettings] = None,
     ) -> None:
         self.task_runner_processes = []
+        if configuration is None:
+            configuration = Configuration()
+        # Created before forking, so that every process shares their state
+        task_limiters = create_task_limiters(workers)
+        self.token_broker = None
+        if configuration.authentication_settings is not None:
+            self.token_broker = TokenBroker(configuration)
         for worker in workers:
-            self.__create_task_runner_process(worker, configuration, metrics_settings)
+            self.__create_task_runner_process(
+                worker,
+                configuration,
+                metrics_settings,
+                spool_settings,
+                task_limiters.get(get_task_limiter_key(worker)),
+                self.token_broker,
+            )
 
     def __create_task_runner_process(
         self,
         worker: WorkerInterface,
         configuration: Configuration,
         metrics_settings: MetricsSettings,
+        spool_settings: Optional[SpoolSettings] = None,
+        task_limiter: Optional[TaskLimiter] = None,
+        token_broker: Optional[TokenBroker] = None,
     ) -> None:
-        task_runner = TaskRunner(worker, configuration, metrics_settings)
+        task_runner = TaskRunner(
+            worker,
+            configuration,
+            metrics_settings,
+            spool_settings,
+            task_limiter,
+            token_broker,
+        )
         process = Process(target=task_runner.run)
         self.task_runner_processes.append(process)
 
@@ -1,9 +1,19 @@
 import logging
 import os
+import signal
 import sys
+import threading
 import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Set
 
+from conductor.client.automator.lease_extender import LeaseExtender
+from conductor.client.automator.task_updater import (
+    DEFAULT_SPOOL_REPLAY_INTERVAL_SECONDS,
+    TaskUpdater,
+)
+from conductor.client.automator.token_broker import TokenBroker
 from conductor.client.codegen.rest import AuthorizationException, ApiException
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api.task_resource_api import TaskResourceApi
@@ -12,8 +22,17 @@ from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
 from conductor.client.telemetry.metrics_collector import MetricsCollector
+from conductor.client.worker.worker import Worker
 from conductor.client.worker.worker_interface import WorkerInterface
+from conductor.shared.automator.poll_backoff import PollBackoff
+from conductor.shared.automator.task_limiter import (
+    TaskLimiter,
+    get_worker_task_options,
+)
+from conductor.shared.automator.task_result_spool import TaskResultSpool
 from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.spool_settings import SpoolSettings
+from conductor.shared.http.token_refresher import get_token_refresher
 
 logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
 
@@ -24,18 +43,52 @@ class TaskRunner:
         worker: WorkerInterface,
         configuration: Configuration = None,
         metrics_settings: MetricsSettings = None,
+        spool_settings: Optional[SpoolSettings] = None,
+        task_limiter: Optional[TaskLimiter] = None,
+        token_broker: Optional[TokenBroker] = None,
     ):
         if not isinstance(worker, WorkerInterface):
             raise Exception("Invalid worker")
         self.worker = worker
         self.__set_worker_properties()
+        # TaskHandler passes limiters shared with its other worker processes
+        self.task_limiter = task_limiter or TaskLimiter.from_task_options(
+            get_worker_task_options(worker)
+        )
         if not isinstance(configuration, Configuration):
             configuration = Configuration()
         self.configuration = configuration
         self.metrics_collector = None
         if metrics_settings is not None:
             self.metrics_collector = MetricsCollector(metrics_settings)
-        self.task_client = TaskResourceApi(ApiClient(configuration=self.configuration))
+            get_token_refresher(self.configuration).metrics_collector = self.metrics_collector
+        # TaskHandler passes the broker sharing its auth token between processes
+        self.task_client = TaskResourceApi(
+            ApiClient(configuration=self.configuration, token_broker=token_broker)
+        )
+        if isinstance(worker, Worker) and worker._api_client is None:
+            # Saves the worker its own ApiClient and /token call
+            worker.api_client = self.task_client.api_client
+        # Threads are only started on first use, so that they live in the
+        # process the runner is run in rather than the one that built it
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running_tasks: Set[Future] = set()
+        self.poll_backoff = PollBackoff()
+        self.lease_extender = LeaseExtender(
+            update_function=self.__send_task_result,
+            worker_id=self.worker.get_identity(),
+        )
+        spool = None
+        replay_interval = DEFAULT_SPOOL_REPLAY_INTERVAL_SECONDS
+        if spool_settings is not None:
+            spool = self.__create_spool(spool_settings)
+            replay_interval = spool_settings.replay_interval
+        self.task_updater = TaskUpdater(
+            update_function=self.__send_task_result,
+            metrics_collector=self.metrics_collector,
+            spool=spool,
+            replay_interval=replay_interval,
+        )
 
     def run(self) -> None:
         if self.configuration is not None:
@@ -45,29 +98,65 @@ class TaskRunner:
 
         task_names = ",".join(self.worker.task_definition_names)
         logger.info(
-            "Polling task %s; domain: %s; polling_interval: %s",
+            "Polling task %s; domain: %s; polling_interval: %s; poll_count: %s; thread_count: %s",
             task_names,
             self.worker.get_domain(),
             self.worker.get_polling_interval_in_seconds(),
+            self.worker.poll_count,
+            self.worker.thread_count,
         )
+        # Start right away so that results spooled by a previous run are replayed
+        self.task_updater.start()
 
-        while True:
-            # Check if worker should stop due to 401 policy
-            if (hasattr(self.task_client, 'api_client') and 
-                hasattr(self.task_client.api_client, 'auth_401_handler') and 
-                hasattr(self.task_client.api_client.auth_401_handler, 'is_worker_stopped') and 
-                self.task_client.api_client.auth_401_handler.is_worker_stopped()):
-                logger.error("Worker stopped due to persistent 401 authentication failures")
-                break
-            self.run_once()
+        previous_sigterm_handler = self.__install_sigterm_handler()
+        try:
+            while True:
+                # Check if worker should stop due to 401 policy
+                if (hasattr(self.task_client, 'api_client') and 
+                    hasattr(self.task_client.api_client, 'auth_401_handler') and 
+                    hasattr(self.task_client.api_client.auth_401_handler, 'is_worker_stopped') and 
+                    self.task_client.api_client.auth_401_handler.is_worker_stopped()):
+                    logger.error("Worker stopped due to persistent 401 authentication failures")
+                    break
+                self.run_once()
+        except _Terminated as e:
+            # E.g. by TaskHandler.stop_processes. Results waiting for a retry
+            # are spooled instead of lost; results being sent at this moment
+            # are not, as their delivery cannot be aborted. Then exit right
+            # away like the default handler would, without waiting for the
+            # worker threads
+            self.task_updater.stop(timeout=0)
+            os._exit(e.exit_code)
+        finally:
+            if previous_sigterm_handler is not None:
+                signal.signal(signal.SIGTERM, previous_sigterm_handler)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self.task_updater.stop()
 
     def run_once(self) -> None:
         try:
-            task = self.__poll_task()
-            if task is not None and task.task_id is not None:
-                task_result = self.__execute_task(task)
-                self.__update_task(task_result)
-            self.__wait_for_polling_interval()
+            poll_count = self.__reserve_poll_count(self.__get_poll_count())
+            tasks = []
+            try:
+                if poll_count > 1:
+                    tasks = self.__batch_poll_tasks(poll_count)
+                elif poll_count == 1:
+                    tasks = [self.__poll_task()]
+                tasks = [task for task in tasks if task is not None and task.task_id is not None]
+            finally:
+                # Give back the capacity reserved for tasks that were not received
+                if self.task_limiter is not None:
+                    self.task_limiter.cancel(poll_count - len(tasks))
+            for task in tasks:
+                if self.worker.thread_count > 1:
+                    self.__submit_task(task)
+                else:
+                    self.__execute_and_update_task(task)
+            if poll_count <= 0:
+                self.__wait_for_polling_interval()
+            else:
+                self.__wait_for_next_poll(len(tasks))
             self.worker.clear_task_definition_name_cache()
         except Exception:
             pass
@@ -140,6 +229,134 @@ class TaskRunner:
             )
         return task
 
+    def __get_poll_count(self) -> int:
+        if self.task_updater.is_backpressured():
+            logger.debug(
+                "Pause polling task: %s; pending task updates: %s",
+                self.worker.get_task_definition_name(),
+                self.task_updater.depth,
+            )
+            return 0
+        if self.worker.thread_count <= 1:
+            return self.worker.poll_count
+        # Only ask the server for as many tasks as there are free threads
+        available_slots = self.worker.thread_count - len(self._running_tasks)
+        if available_slots <= 0 and self.metrics_collector is not None:
+            self.metrics_collector.increment_task_execution_queue_full(
+                self.worker.get_task_definition_name()
+            )
+        return available_slots
+
+    def __reserve_poll_count(self, count: int) -> int:
+        if self.task_limiter is None or count <= 0:
+            return count
+        reserved = self.task_limiter.reserve(count)
+        if reserved < count:
+            logger.debug(
+                "Limit polling task: %s; to %s of %s tasks due to client side rate limit or concurrency cap",
+                self.worker.get_task_definition_name(),
+                reserved,
+                count,
+            )
+        return reserved
+
+    def __submit_task(self, task: Task) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.worker.thread_count,
+                thread_name_prefix=f"{self.worker.get_task_definition_name()}-worker",
+            )
+        future = self._executor.submit(self.__execute_and_update_task, task)
+        self._running_tasks.add(future)
+        # Invoked right away when the future is already done
+        future.add_done_callback(self._running_tasks.discard)
+
+    def __execute_and_update_task(self, task: Task) -> None:
+        if self.worker.lease_extend_enabled:
+            self.lease_extender.track(task)
+        try:
+            task_result = self.__execute_task(task)
+        finally:
+            self.lease_extender.untrack(task)
+            if self.task_limiter is not None:
+                self.task_limiter.complete()
+        self.__update_task(task_result)
+
+    def __batch_poll_tasks(self, count: int) -> List[Task]:
+        task_definition_name = self.worker.get_task_definition_name()
+        if self.worker.paused():
+            logger.debug("Stop polling task for: %s", task_definition_name)
+            return []
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_task_poll(task_definition_name)
+
+        try:
+            start_time = time.time()
+            domain = self.worker.get_domain()
+            params = {
+                "workerid": self.worker.get_identity(),
+                "count": count,
+                "timeout": self.worker.poll_timeout,
+            }
+            if domain is not None:
+                params["domain"] = domain
+            tasks = self.task_client.batch_poll(tasktype=task_definition_name, **params)
+            finish_time = time.time()
+            time_spent = finish_time - start_time
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_poll_time(
+                    task_definition_name, time_spent
+                )
+        except AuthorizationException as auth_exception:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(
+                    task_definition_name, type(auth_exception)
+                )
+            if auth_exception.invalid_token:
+                logger.error(
+                    "Failed to batch poll task: %s; reason: invalid auth token",
+                    task_definition_name,
+                )
+            else:
+                logger.error(
+                    "Failed to batch poll task: %s; status: %s - %s",
+                    task_definition_name,
+                    auth_exception.status,
+                    auth_exception.error_code,
+                )
+            return []
+        except ApiException as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(
+                    task_definition_name, type(e)
+                )
+            logger.error(
+                "Failed to batch poll task: %s, reason: %s, code: %s",
+                task_definition_name,
+                e.reason,
+                e.code,
+            )
+            return []
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(
+                    task_definition_name, type(e)
+                )
+            logger.error(
+                "Failed to batch poll task: %s; reason: %s", task_definition_name, e
+            )
+            return []
+
+        tasks = tasks or []
+        logger.debug(
+            "Polled %s tasks: %s; worker_id: %s; domain: %s",
+            len(tasks),
+            task_definition_name,
+            self.worker.get_identity(),
+            self.worker.get_domain(),
+        )
+        return tasks
+
     def __execute_task(self, task: Task) -> TaskResult:
         if not isinstance(task, Task):
             return None
@@ -195,7 +412,7 @@ class TaskRunner:
             )
         return task_result
 
-    def __update_task(self, task_result: TaskResult):
+    def __update_task(self, task_result: TaskResult) -> None:
         if not isinstance(task_result, TaskResult):
             return None
         task_definition_name = self.worker.get_task_definition_name()
@@ -205,38 +422,46 @@ class TaskRunner:
             task_result.workflow_instance_id,
             task_definition_name,
         )
-        for attempt in range(4):
-            if attempt > 0:
-                # Wait for [10s, 20s, 30s] before next attempt
-                time.sleep(attempt * 10)
-            try:
-                response = self.task_client.update_task(body=task_result)
-                logger.debug(
-                    "Updated task id: %s; workflow_instance_id: %s; task_definition_name: %s; response: %s",
-                    task_result.task_id,
-                    task_result.workflow_instance_id,
-                    task_definition_name,
-                    response,
-                )
-                return response
-            except Exception as e:
-                if self.metrics_collector is not None:
-                    self.metrics_collector.increment_task_update_error(
-                        task_definition_name, type(e)
-                    )
-                logger.error(
-                    "Failed to update task id: %s; workflow_instance_id: %s; task_definition_name: %s; reason: %s",
-                    task_result.task_id,
-                    task_result.workflow_instance_id,
-                    task_definition_name,
-                    traceback.format_exc(),
-                )
+        self.task_updater.start()
+        self.task_updater.submit(task_result, task_definition_name)
         return None
 
+    def __install_sigterm_handler(self):
+        # Signal handlers can only be set from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        return signal.signal(signal.SIGTERM, _exit_on_sigterm)
+
+    def __create_spool(self, spool_settings: SpoolSettings) -> TaskResultSpool:
+        api_client = self.task_client.api_client
+        spool_name = "_".join(self.worker.task_definition_names)
+        if self.worker.get_domain() is not None:
+            spool_name = f"{spool_name}_{self.worker.get_domain()}"
+        return TaskResultSpool(
+            directory=spool_settings.directory,
+            name=spool_name,
+            serialize=api_client.sanitize_for_serialization,
+            deserialize=lambda data: api_client.deserialize_class(data, "TaskResult"),
+        )
+
+    def __send_task_result(self, task_result: TaskResult):
+        return self.task_client.update_task(body=task_result)
+
     def __wait_for_polling_interval(self) -> None:
         polling_interval = self.worker.get_polling_interval_in_seconds()
         time.sleep(polling_interval)
 
+    def __wait_for_next_poll(self, task_count: int) -> None:
+        polling_interval = self.worker.get_polling_interval_in_seconds()
+        delay = self.poll_backoff.next_delay(polling_interval, task_count)
+        if self.metrics_collector is not None:
+            task_definition_name = self.worker.get_task_definition_name()
+            if task_count == 0:
+                self.metrics_collector.increment_task_poll_empty(task_definition_name)
+            self.metrics_collector.record_task_poll_backoff(task_definition_name, delay)
+        if delay > 0:
+            time.sleep(delay)
+
     def __set_worker_properties(self) -> None:
         # If multiple tasks are supplied to the same worker, then only first
         # task will be considered for setting worker properties
@@ -265,6 +490,45 @@ class TaskRunner:
                     self.worker.get_polling_interval_in_seconds()
                 )
 
+        poll_count = self.__get_property_value_from_env("poll_count", task_type)
+        if poll_count:
+            try:
+                self.worker.poll_count = int(poll_count)
+            except Exception as e:
+                logger.error(
+                    "Error converting poll_count to int value: %s, exception: %s",
+                    poll_count,
+                    e,
+                )
+
+        poll_timeout = self.__get_property_value_from_env("poll_timeout", task_type)
+        if poll_timeout:
+            try:
+                self.worker.poll_timeout = int(poll_timeout)
+            except Exception as e:
+                logger.error(
+                    "Error converting poll_timeout to int value: %s, exception: %s",
+                    poll_timeout,
+                    e,
+                )
+
+        thread_count = self.__get_property_value_from_env("thread_count", task_type)
+        if thread_count:
+            try:
+                self.worker.thread_count = int(thread_count)
+            except Exception as e:
+                logger.error(
+                    "Error converting thread_count to int value: %s, exception: %s",
+                    thread_count,
+                    e,
+                )
+
+        lease_extend_enabled = self.__get_property_value_from_env(
+            "lease_extend_enabled", task_type
+        )
+        if lease_extend_enabled:
+            self.worker.lease_extend_enabled = lease_extend_enabled.lower() == "true"
+
     def __get_property_value_from_env(self, prop, task_type):
         """
         get the property from the env variable
@@ -280,3 +544,13 @@ class TaskRunner:
         key_upper = prefix.upper() + "_" + task_type + "_" + prop.upper()
         value = os.getenv(key_small, os.getenv(key_upper, value_all))
         return value
+
+
+class _Terminated(BaseException):
+    def __init__(self, signum: int):
+        super().__init__(signum)
+        self.exit_code = 128 + signum
+
+
+def _exit_on_sigterm(signum, frame) -> None:
+    raise _Terminated(signum)
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+import traceback
+from typing import Any, Callable, List, Optional, Tuple
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.telemetry.metrics_collector import MetricsCollector
+from conductor.shared.automator.task_result_spool import (
+    TaskResultSpool,
+    is_permanent_update_failure,
+)
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+DEFAULT_UPDATE_THREAD_COUNT = 2
+DEFAULT_UPDATE_QUEUE_SIZE = 100
+DEFAULT_UPDATE_MAX_ATTEMPTS = 4
+DEFAULT_UPDATE_BASE_DELAY_SECONDS = 1.0
+DEFAULT_UPDATE_MAX_DELAY_SECONDS = 30.0
+DEFAULT_UPDATE_JITTER_PERCENT = 0.2
+DEFAULT_SPOOL_REPLAY_INTERVAL_SECONDS = 5.0
+
+# (due time, sequence, attempt, task type, task result)
+_PendingUpdate = Tuple[float, int, int, str, TaskResult]
+
+
+class TaskUpdater:
+    """
+    Delivers task results back to the server from background threads.
+
+    Results are kept in a bounded queue drained by ``thread_count`` threads.
+    Failed updates are rescheduled with exponential backoff and jitter
+    instead of sleeping, so neither polling nor the other queued updates
+    wait on a retry. ``is_backpressured`` tells the runner to pause polling
+    while the backlog is above ``backpressure_threshold``.
+
+    With a ``spool``, results that are still undelivered after the last
+    attempt, or when the updater is stopped, are written to disk instead of
+    being dropped, and a replay thread resends them every
+    ``replay_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        update_function: Callable[[TaskResult], Any],
+        metrics_collector: Optional[MetricsCollector] = None,
+        thread_count: int = DEFAULT_UPDATE_THREAD_COUNT,
+        queue_size: int = DEFAULT_UPDATE_QUEUE_SIZE,
+        backpressure_threshold: Optional[int] = None,
+        max_attempts: int = DEFAULT_UPDATE_MAX_ATTEMPTS,
+        base_delay_seconds: float = DEFAULT_UPDATE_BASE_DELAY_SECONDS,
+        max_delay_seconds: float = DEFAULT_UPDATE_MAX_DELAY_SECONDS,
+        jitter_percent: float = DEFAULT_UPDATE_JITTER_PERCENT,
+        spool: Optional[TaskResultSpool] = None,
+        replay_interval: float = DEFAULT_SPOOL_REPLAY_INTERVAL_SECONDS,
+    ):
+        self.update_function = update_function
+        self.metrics_collector = metrics_collector
+        self.thread_count = thread_count
+        self.queue_size = queue_size
+        self.backpressure_threshold = backpressure_threshold or queue_size
+        self.max_attempts = max_attempts
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.jitter_percent = jitter_percent
+        self.spool = spool
+        self.replay_interval = replay_interval
+
+        self._pending: List[_PendingUpdate] = []
+        self._sequence = itertools.count()
+        self._in_progress = 0
+        self._condition = threading.Condition()
+        self._running = False
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        for index in range(self.thread_count):
+            thread = threading.Thread(
+                target=self.__run, name=f"task-updater-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        if self.spool is not None:
+            thread = threading.Thread(
+                target=self.__run_replay, name="task-updater-replay", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait up to ``timeout`` seconds for the backlog to drain, then stop the
+        updater threads. Results still queued at that point are spooled if a
+        spool is configured, and otherwise not delivered.
+        """
+        self.join(timeout)
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+            undelivered = self._pending
+            self._pending = []
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        if not undelivered:
+            return
+        if self.spool is None:
+            logger.warning(
+                "Stopped task updater with %s undelivered task results", len(undelivered)
+            )
+            return
+        for _, _, _, task_type, task_result in undelivered:
+            self.__spool(task_type, task_result)
+
+    def submit(self, task_result: TaskResult, task_type: str) -> None:
+        """
+        Queue a task result for delivery. Blocks while the queue is full.
+        """
+        with self._condition:
+            while self._running and len(self._pending) >= self.queue_size:
+                self._condition.wait()
+            self.__schedule(time.monotonic(), 1, task_type, task_result)
+        self.__record_queue_depth(task_type)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued result has been delivered or given up on.
+
+        :return: False when the timeout expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and self._in_progress == 0, timeout
+            )
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending) + self._in_progress
+
+    def is_backpressured(self) -> bool:
+        return self.depth >= self.backpressure_threshold
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff delay in seconds before the next attempt.
+        """
+        delay = self.base_delay_seconds * (2 ** (attempt - 1))
+        # Add jitter: ±jitter_percent of the delay, so that a server hiccup
+        # does not make every worker retry at the same instant
+        jitter_range = delay * self.jitter_percent
+        delay = delay + random.uniform(-jitter_range, jitter_range)
+        return min(max(0.0, delay), self.max_delay_seconds)
+
+    def __schedule(
+        self, due_time: float, attempt: int, task_type: str, task_result: TaskResult
+    ) -> None:
+        # Caller must hold self._condition
+        heapq.heappush(
+            self._pending,
+            (due_time, next(self._sequence), attempt, task_type, task_result),
+        )
+        self._condition.notify_all()
+
+    def __next_update(self) -> Optional[_PendingUpdate]:
+        with self._condition:
+            while self._running:
+                now = time.monotonic()
+                if self._pending and self._pending[0][0] <= now:
+                    pending_update = heapq.heappop(self._pending)
+                    self._in_progress += 1
+                    # Wake up producers waiting for room in the queue
+                    self._condition.notify_all()
+                    return pending_update
+                timeout = self._pending[0][0] - now if self._pending else None
+                self._condition.wait(timeout)
+        return None
+
+    def __run(self) -> None:
+        while True:
+            pending_update = self.__next_update()
+            if pending_update is None:
+                return
+            _, _, attempt, task_type, task_result = pending_update
+            try:
+                self.__update(attempt, task_type, task_result)
+            finally:
+                with self._condition:
+                    self._in_progress -= 1
+                    self._condition.notify_all()
+                self.__record_queue_depth(task_type)
+
+    def __update(self, attempt: int, task_type: str, task_result: TaskResult) -> None:
+        try:
+            start_time = time.time()
+            response = self.update_function(task_result)
+            finish_time = time.time()
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_update_time(
+                    task_type, finish_time - start_time
+                )
+            logger.debug(
+                "Updated task id: %s; workflow_instance_id: %s; task_definition_name: %s; response: %s",
+                task_result.task_id,
+                task_result.workflow_instance_id,
+                task_type,
+                response,
+            )
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_update_error(task_type, type(e))
+            if attempt >= self.max_attempts:
+                if self.spool is not None:
+                    logger.warning(
+                        "Failed to update task id: %s; workflow_instance_id: %s; task_definition_name: %s; "
+                        "spooling after %s attempts; reason: %s",
+                        task_result.task_id,
+                        task_result.workflow_instance_id,
+                        task_type,
+                        attempt,
+                        e,
+                    )
+                    self.__spool(task_type, task_result)
+                    return
+                logger.error(
+                    "Failed to update task id: %s; workflow_instance_id: %s; task_definition_name: %s; "
+                    "giving up after %s attempts; reason: %s",
+                    task_result.task_id,
+                    task_result.workflow_instance_id,
+                    task_type,
+                    attempt,
+                    traceback.format_exc(),
+                )
+                return
+            delay = self.get_retry_delay(attempt)
+            logger.warning(
+                "Failed to update task id: %s; workflow_instance_id: %s; task_definition_name: %s; "
+                "retrying in %.2fs (attempt %s/%s); reason: %s",
+                task_result.task_id,
+                task_result.workflow_instance_id,
+                task_type,
+                delay,
+                attempt,
+                self.max_attempts,
+                e,
+            )
+            with self._condition:
+                self.__schedule(time.monotonic() + delay, attempt + 1, task_type, task_result)
+
+    def __spool(self, task_type: str, task_result: TaskResult) -> None:
+        try:
+            self.spool.append(task_result, task_type)
+        except Exception:
+            logger.error(
+                "Failed to spool task id: %s; workflow_instance_id: %s; task_definition_name: %s; reason: %s",
+                task_result.task_id,
+                task_result.workflow_instance_id,
+                task_type,
+                traceback.format_exc(),
+            )
+
+    def __run_replay(self) -> None:
+        # Replay straight away, so results spooled before a restart are not
+        # held back for a whole interval
+        while True:
+            try:
+                self.replay()
+            except Exception:
+                logger.error("Failed to replay spooled task results: %s", traceback.format_exc())
+            with self._condition:
+                if self._condition.wait_for(lambda: not self._running, self.replay_interval):
+                    return
+
+    def replay(self) -> int:
+        """
+        Resend spooled results in order, stopping at the first one the server
+        does not accept yet.
+
+        :return: the number of results removed from the spool
+        """
+        if self.spool is None:
+            return 0
+        processed = 0
+        try:
+            for task_type, task_result in self.spool.peek():
+                if task_result is not None:
+                    try:
+                        self.update_function(task_result)
+                        logger.info(
+                            "Replayed spooled task id: %s; workflow_instance_id: %s; task_definition_name: %s",
+                            task_result.task_id,
+                            task_result.workflow_instance_id,
+                            task_type,
+                        )
+                    except Exception as e:
+                        if not is_permanent_update_failure(e):
+                            logger.debug("Server still rejects spooled task results, reason: %s", e)
+                            break
+                        logger.error(
+                            "Dropping spooled task id: %s; workflow_instance_id: %s; task_definition_name: %s; "
+                            "reason: %s",
+                            task_result.task_id,
+                            task_result.workflow_instance_id,
+                            task_type,
+                            e,
+                        )
+                processed += 1
+        finally:
+            self.spool.discard(processed)
+        return processed
+
+    def __record_queue_depth(self, task_type: str) -> None:
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_task_update_queue_depth(task_type, self.depth)
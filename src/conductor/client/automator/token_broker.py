@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+DEFAULT_REFRESH_AHEAD_RATIO = 0.8
+DEFAULT_RETRY_INTERVAL_SECONDS = 5.0
+MAX_TOKEN_SIZE = 16 * 1024
+
+_UPDATE_TIME = 0
+_GENERATION = 1
+
+
+class TokenBroker:
+    """
+    Shares one auth token between all worker processes of a ``TaskHandler``.
+
+    The token lives in shared memory. ``TaskHandler`` fetches it once before
+    starting its worker processes, and a background thread in the parent
+    process replaces it when ``refresh_ahead_ratio`` of its TTL has passed.
+    Worker processes read it from the broker instead of calling ``/token``
+    themselves.
+
+    Refreshes are single-flight across processes. Every token has a
+    generation. A caller that saw a token rejected passes that generation to
+    ``refresh``, and if another process already replaced the token the caller
+    gets the new one without a second ``/token`` call.
+    """
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        refresh_ahead_ratio: float = DEFAULT_REFRESH_AHEAD_RATIO,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL_SECONDS,
+    ):
+        self.configuration = configuration
+        self.refresh_ahead_ratio = refresh_ahead_ratio
+        self.retry_interval = retry_interval
+        self._token = multiprocessing.Array("c", MAX_TOKEN_SIZE, lock=False)
+        self._state = multiprocessing.Array("d", [0.0, 0.0])
+        self._refresh_lock = multiprocessing.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._api_client = None
+
+    def get_token(self) -> Tuple[Optional[str], int, float]:
+        """
+        :return: the current token, its generation and when it was fetched,
+                 in milliseconds since the epoch
+        """
+        with self._state.get_lock():
+            token = self._token.value.decode("utf-8") or None
+            return token, int(self._state[_GENERATION]), self._state[_UPDATE_TIME]
+
+    def is_expired(self, update_time: float) -> bool:
+        now = round(time.time() * 1000)
+        return now - update_time > self.configuration.auth_token_ttl_msec
+
+    def refresh(
+        self,
+        fetch_token: Callable[[], Optional[str]],
+        stale_generation: Optional[int] = None,
+    ) -> Tuple[Optional[str], int]:
+        """
+        Replace the token with one from ``fetch_token``, unless it is no
+        longer the ``stale_generation`` one the caller wants replaced.
+
+        :return: the current token and its generation
+        """
+        with self._refresh_lock:
+            token, generation, _ = self.get_token()
+            if token is not None and stale_generation is not None and generation != stale_generation:
+                return token, generation
+            new_token = fetch_token()
+            if new_token is None:
+                # The failure was already logged by the API client
+                return token, generation
+            encoded = new_token.encode("utf-8")
+            if len(encoded) >= MAX_TOKEN_SIZE:
+                logger.error(
+                    "Auth token of %s bytes does not fit the token broker, which holds up to %s",
+                    len(encoded),
+                    MAX_TOKEN_SIZE - 1,
+                )
+                return token, generation
+            with self._state.get_lock():
+                self._token.value = encoded
+                self._state[_UPDATE_TIME] = round(time.time() * 1000)
+                self._state[_GENERATION] = generation + 1
+            logger.debug("Refreshed shared authentication token")
+            return new_token, generation + 1
+
+    def start(self) -> None:
+        """
+        Fetch the first token. Call before starting the worker processes,
+        then call ``start_refreshing`` once they were started.
+        """
+        if self.configuration.authentication_settings is None:
+            return
+        self.__refresh_ahead()
+
+    def start_refreshing(self) -> None:
+        if self.configuration.authentication_settings is None:
+            return
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.__run, name="conductor-token-broker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __getstate__(self) -> dict:
+        # Worker processes only read and refresh the shared token
+        state = self.__dict__.copy()
+        state.update(_stop_event=None, _thread=None, _api_client=None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._stop_event = threading.Event()
+
+    def __run(self) -> None:
+        while not self._stop_event.wait(self.__get_seconds_until_refresh()):
+            try:
+                self.__refresh_ahead()
+            except Exception as e:
+                logger.error("Failed to refresh shared authentication token, reason: %s", e)
+
+    def __refresh_ahead(self) -> None:
+        _, generation, _ = self.get_token()
+        self.refresh(self.__fetch_token, stale_generation=generation)
+
+    def __get_seconds_until_refresh(self) -> float:
+        token, _, update_time = self.get_token()
+        if token is None:
+            return self.retry_interval
+        refresh_at = update_time + self.configuration.auth_token_ttl_msec * self.refresh_ahead_ratio
+        return max(self.retry_interval, (refresh_at - time.time() * 1000) / 1000)
+
+    def __fetch_token(self) -> Optional[str]:
+        if self._api_client is None:
+            self._api_client = ApiClient(self.configuration, token_broker=self)
+        return self._api_client._ApiClient__get_new_token()
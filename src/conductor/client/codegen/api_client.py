@@ -4,20 +4,20 @@ import mimetypes
 import os
 import re
 import tempfile
-import time
 from typing import Dict
-import uuid
 
 import six
 import urllib3
-from requests.structures import CaseInsensitiveDict
 from six.moves.urllib.parse import quote
 
-import conductor.client.http.models as http_models
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.codegen import rest
 from conductor.client.codegen.rest import AuthorizationException
 from conductor.client.codegen.thread import AwaitableThread
+from conductor.client.helpers.model_deserializer import get_deserializer
+from conductor.client.helpers.model_serializer import serialize
+from conductor.shared.http.json_codec import get_json_codec
+from conductor.shared.http.token_refresher import get_token_refresher
 
 logger = logging.getLogger(
     Configuration.get_logging_formatted_name(
@@ -51,6 +51,7 @@ class ApiClient(object):
         self.configuration = configuration
 
         self.rest_client = rest.RESTClientObject(connection=configuration.http_connection)
+        self.json_codec = get_json_codec(configuration.json_codec)
 
         self.default_headers = self.__get_default_headers(
             header_name, header_value
@@ -185,47 +186,12 @@ class ApiClient(object):
         If obj is dict, return the dict.
         If obj is swagger model, return the properties dict.
 
+        The conversion is compiled once per type, see ``serialize``.
+
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
-        if obj is None:
-            return None
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
-            return obj
-        elif isinstance(obj, list):
-            return [self.sanitize_for_serialization(sub_obj)
-                    for sub_obj in obj]
-        elif isinstance(obj, tuple):
-            return tuple(self.sanitize_for_serialization(sub_obj)
-                         for sub_obj in obj)
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-        elif isinstance(obj, uuid.UUID): # needed for compatibility with Python 3.7
-            return str(obj) # Convert UUID to string
-
-        if isinstance(obj, dict) or isinstance(obj, CaseInsensitiveDict):
-            obj_dict = obj
-        else:
-            # Convert model obj to dict except
-            # attributes `swagger_types`, `attribute_map`
-            # and attributes which value is not None.
-            # Convert attribute name to json key in
-            # model definition for request.
-            if hasattr(obj, 'attribute_map') and hasattr(obj, 'swagger_types'):
-                obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                            for attr, _ in six.iteritems(obj.swagger_types)
-                            if getattr(obj, attr) is not None}
-            else:
-                try:
-                    obj_dict = {name: getattr(obj, name)
-                                for name in vars(obj)
-                                if getattr(obj, name) is not None}
-                except TypeError:
-                    # Fallback to string representation.
-                    return str(obj)
-
-        return {key: self.sanitize_for_serialization(val)
-                for key, val in six.iteritems(obj_dict)}
+        return serialize(obj)
 
     def deserialize(self, response, response_type):
         """Deserializes response into an object.
@@ -243,7 +209,7 @@ class ApiClient(object):
 
         # fetch data from response object
         try:
-            data = response.resp.json()
+            data = self.json_codec.loads(response.resp.content)
         except Exception:
             data = response.resp.text
 
@@ -259,46 +225,14 @@ class ApiClient(object):
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
 
+        Uses the deserializer compiled for ``klass``, see ``get_deserializer``.
+
         :param data: dict, list or str.
         :param klass: class literal, or string of class name.
 
         :return: object.
         """
-        if data is None:
-            return None
-
-        if isinstance(klass, str):
-            if klass.startswith('list['):
-                sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('set['):
-                sub_kls = re.match(r'set\[(.*)\]', klass).group(1)
-                return set(self.__deserialize(sub_data, sub_kls)
-                           for sub_data in data)
-
-            if klass.startswith('dict('):
-                sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                klass = getattr(http_models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
-        elif klass is object:
-            return self.__deserialize_object(data)
-        elif klass == datetime.date:
-            return self.__deserialize_date(data)
-        elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
-        else:
-            return self.__deserialize_model(data, klass)
+        return get_deserializer(klass)(data)
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
@@ -559,124 +493,15 @@ class ApiClient(object):
                     f.write(response_data)
         return path
 
-    def __deserialize_primitive(self, data, klass):
-        """Deserializes string to primitive type.
-
-        :param data: str.
-        :param klass: class literal.
-
-        :return: int, long, float, str, bool.
-        """
-        try:
-            if klass is str and isinstance(data, bytes):
-                return self.__deserialize_bytes_to_str(data)
-            return klass(data)
-        except UnicodeEncodeError:
-            return six.text_type(data)
-        except TypeError:
-            return data
-
-    def __deserialize_bytes_to_str(self, data):
-        return data.decode('utf-8')
-
-    def __deserialize_object(self, value):
-        """Return a original value.
-
-        :return: object.
-        """
-        return value
-
-    def __deserialize_date(self, string):
-        """Deserializes string to date.
-
-        :param string: str.
-        :return: date.
-        """
-        try:
-            from dateutil.parser import parse
-            return parse(string).date()
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason="Failed to parse `{0}` as date object".format(string)
-            )
-
-    def __deserialize_datatime(self, string):
-        """Deserializes string to datetime.
-
-        The string should be in iso8601 datetime format.
-
-        :param string: str.
-        :return: datetime.
-        """
-        try:
-            from dateutil.parser import parse
-            return parse(string)
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason=(
-                    "Failed to parse `{0}` as datetime object"
-                    .format(string)
-                )
-            )
-
-    def __hasattr(self, object, name):
-        return name in object.__class__.__dict__
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-        if not klass.swagger_types and not self.__hasattr(klass, 'get_real_child_model'):
-            return data
-
-        kwargs = {}
-        if klass.swagger_types is not None:
-            for attr, attr_type in six.iteritems(klass.swagger_types):
-                if (data is not None and
-                        klass.attribute_map[attr] in data and
-                        isinstance(data, (list, dict))):
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if (isinstance(instance, dict) and
-                klass.swagger_types is not None and
-                isinstance(data, dict)):
-            for key, value in data.items():
-                if key not in klass.swagger_types:
-                    instance[key] = value
-        if self.__hasattr(instance, 'get_real_child_model'):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
-
     def __get_authentication_headers(self):
-        if self.configuration.AUTH_TOKEN is None:
+        # Renewed in the background before it expires, see TokenRefresher
+        token = get_token_refresher(self.configuration).get_token(self.__get_new_token)
+        if token is None:
             return None
 
-        now = round(time.time() * 1000)
-        time_since_last_update = now - self.configuration.token_update_time
-
-        if time_since_last_update > self.configuration.auth_token_ttl_msec:
-            # time to refresh the token
-            logger.debug('refreshing authentication token')
-            token = self.__get_new_token()
-            self.configuration.update_token(token)
-
         return {
             'header': {
-                'X-Authorization': self.configuration.AUTH_TOKEN
+                'X-Authorization': token
             }
         }
 
@@ -685,8 +510,8 @@ class ApiClient(object):
             return
         if self.configuration.authentication_settings is None:
             return
-        token = self.__get_new_token()
-        self.configuration.update_token(token)
+        # Clients created at the same time share the first token
+        get_token_refresher(self.configuration).refresh(self.__get_new_token)
 
     def __force_refresh_auth_token(self) -> None:
         """
@@ -694,8 +519,7 @@ class ApiClient(object):
         """
         if self.configuration.authentication_settings is None:
             return
-        token = self.__get_new_token()
-        self.configuration.update_token(token)
+        get_token_refresher(self.configuration).force_refresh(self.__get_new_token)
 
     def __get_new_token(self) -> str:
         try:
@@ -92,6 +92,11 @@ class Configuration:
         auth_401_max_delay_ms: Optional[float] = None,
         auth_401_jitter_percent: Optional[float] = None,
         auth_401_stop_behavior: Optional[str] = None,
+        json_codec: Optional[str] = None,
+        metadata_cache_ttl_seconds: Optional[float] = None,
+        metadata_cache_max_size: Optional[int] = None,
+        metadata_cache_snapshot_path: Optional[str] = None,
+        secret_cache_ttl_seconds: Optional[float] = None,
     ):
         """
         Initialize Conductor client configuration.
@@ -104,6 +109,17 @@ class Configuration:
             auth_token_ttl_min: Authentication token time-to-live in minutes
             proxy: Proxy URL for HTTP requests (supports http, https, socks4, socks5)
             proxy_headers: Headers to send with proxy requests (e.g., authentication)
+            json_codec: JSON library for request and response bodies: "orjson",
+                "msgspec", "json", or "auto" for the fastest one installed
+            metadata_cache_ttl_seconds: Cache workflow and task definitions,
+                schedules and prompts read by the clients for this many seconds;
+                the cache is off when unset or 0
+            metadata_cache_max_size: Most definitions the metadata cache holds
+            metadata_cache_snapshot_path: File the metadata cache is saved to at
+                exit and loaded from at start
+            secret_cache_ttl_seconds: Cache the secrets read by OrkesSecretClient
+                for this many seconds, and for as long again while the server
+                cannot be reached; the cache is off when unset or 0
 
         Environment Variables:
             CONDUCTOR_SERVER_URL: Server URL (e.g., http://localhost:8080/api)
@@ -111,6 +127,11 @@ class Configuration:
             CONDUCTOR_AUTH_SECRET: Authentication key secret
             CONDUCTOR_PROXY: Proxy URL for HTTP requests
             CONDUCTOR_PROXY_HEADERS: Proxy headers as JSON string or single header value
+            CONDUCTOR_JSON_CODEC: JSON library for request and response bodies
+            CONDUCTOR_METADATA_CACHE_TTL_SECONDS: Metadata cache time-to-live
+            CONDUCTOR_METADATA_CACHE_MAX_SIZE: Most definitions the metadata cache holds
+            CONDUCTOR_METADATA_CACHE_SNAPSHOT_PATH: Metadata cache snapshot file
+            CONDUCTOR_SECRET_CACHE_TTL_SECONDS: Secret cache time-to-live
         """
         if server_api_url is not None:
             self.host = server_api_url
@@ -184,6 +205,22 @@ class Configuration:
 
         # Provide an alterative to requests.Session() for HTTP connection.
         self.http_connection = None
+        # JSON library used to encode and decode bodies, see get_json_codec
+        self.json_codec = json_codec or os.getenv("CONDUCTOR_JSON_CODEC", "auto")
+        # Local cache of definitions read from the server, see get_metadata_cache
+        self.metadata_cache_ttl_seconds = metadata_cache_ttl_seconds or self._get_env_float(
+            "CONDUCTOR_METADATA_CACHE_TTL_SECONDS", 0
+        )
+        self.metadata_cache_max_size = metadata_cache_max_size or self._get_env_int(
+            "CONDUCTOR_METADATA_CACHE_MAX_SIZE", 1024
+        )
+        self.metadata_cache_snapshot_path = metadata_cache_snapshot_path or os.getenv(
+            "CONDUCTOR_METADATA_CACHE_SNAPSHOT_PATH"
+        )
+        # Local cache of secret values, see SecretCache
+        self.secret_cache_ttl_seconds = secret_cache_ttl_seconds or self._get_env_float(
+            "CONDUCTOR_SECRET_CACHE_TTL_SECONDS", 0
+        )
 
         # not updated yet
         self.token_update_time = 0
@@ -5,10 +5,10 @@ from dateutil.parser import parse
 from typing import ClassVar, Dict, Tuple
 
 import six
-from requests.structures import CaseInsensitiveDict
 
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.codegen import rest
+from conductor.client.helpers.model_serializer import serialize
 
 logger = logging.getLogger(
     Configuration.get_logging_formatted_name(
@@ -31,34 +31,7 @@ class ObjectMapper(object):
     }
 
     def to_json(self, obj):
-        if obj is None:
-            return None
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
-            return obj
-        elif isinstance(obj, list):
-            return [self.to_json(sub_obj) for sub_obj in obj]
-        elif isinstance(obj, tuple):
-            return tuple(self.to_json(sub_obj) for sub_obj in obj)
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-        elif isinstance(obj, dict) or isinstance(obj, CaseInsensitiveDict):
-            obj_dict = obj
-        # Convert model obj to dict except
-        # attributes `swagger_types`, `attribute_map`
-        # and attributes which value is not None.
-        # Convert attribute name to json key in
-        # model definition for request.
-        elif hasattr(obj, "attribute_map") and hasattr(obj, "swagger_types"):
-            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                        for attr, _ in six.iteritems(obj.swagger_types)
-                        if getattr(obj, attr) is not None}
-        else:
-            obj_dict = {name: getattr(obj, name)
-                        for name in vars(obj)
-                        if getattr(obj, name) is not None}
-
-        return {key: self.to_json(val)
-            for key, val in six.iteritems(obj_dict)}
+        return serialize(obj)
 
     def from_json(self, data, klass):
         return self.__deserialize(data, klass)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import datetime
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import six
+
+import conductor.client.http.models as http_models
+from conductor.client.codegen import rest
+
+PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+NATIVE_TYPES_MAPPING = {
+    "int": int,
+    "long": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+    "date": datetime.date,
+    "datetime": datetime.datetime,
+    "object": object,
+}
+
+# Formats that datetime parses exactly like dateutil does. Anything else,
+# time zones included, still goes through dateutil
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+_NAIVE_ISO_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3}|\.\d{6})?$")
+
+_deserializers: Dict[Any, Callable[[Any], Any]] = {}
+
+
+def get_deserializer(klass: Any) -> Callable[[Any], Any]:
+    """
+    Return a function that deserializes JSON data into ``klass``, a class or
+    a swagger type string such as ``"list[Task]"`` or ``"dict(str, object)"``.
+
+    The function is built once per type: type strings are parsed and model
+    classes are resolved up front rather than for every value. It returns
+    what ``ApiClient`` always returned for the same data.
+    """
+    try:
+        return _deserializers[klass]
+    except KeyError:
+        pass
+    deserializer = _compile(klass)
+    _deserializers[klass] = deserializer
+    return deserializer
+
+
+def _compile(klass: Any) -> Callable[[Any], Any]:
+    if isinstance(klass, str):
+        if klass.startswith("list["):
+            return _compile_list(re.match(r"list\[(.*)\]", klass).group(1))
+        if klass.startswith("set["):
+            return _compile_set(re.match(r"set\[(.*)\]", klass).group(1))
+        if klass.startswith("dict("):
+            return _compile_dict(re.match(r"dict\(([^,]*), (.*)\)", klass).group(2))
+        if klass in NATIVE_TYPES_MAPPING:
+            klass = NATIVE_TYPES_MAPPING[klass]
+        else:
+            klass = getattr(http_models, klass)
+        # E.g. "Task" and Task share one deserializer
+        return get_deserializer(klass)
+
+    if klass in PRIMITIVE_TYPES:
+        return _compile_primitive(klass)
+    if klass is object:
+        return _identity
+    if klass == datetime.date:
+        return _deserialize_date
+    if klass == datetime.datetime:
+        return _deserialize_datetime
+    return _ModelDeserializer(klass)
+
+
+def _get_deserializer_or_defer(klass: Any) -> Callable[[Any], Any]:
+    try:
+        return get_deserializer(klass)
+    except Exception:
+        pass
+
+    # E.g. an unknown model name: fail only once there is a value to
+    # deserialize, as ApiClient always did
+    def deserialize(data):
+        if data is None:
+            return None
+        return get_deserializer(klass)(data)
+
+    return deserialize
+
+
+def _compile_list(item_type: str) -> Callable[[Any], Any]:
+    def deserialize(data):
+        if data is None:
+            return None
+        return [deserialize_item(item) for item in data]
+
+    deserialize_item = _get_deserializer_or_defer(item_type)
+    return deserialize
+
+
+def _compile_set(item_type: str) -> Callable[[Any], Any]:
+    def deserialize(data):
+        if data is None:
+            return None
+        return set(deserialize_item(item) for item in data)
+
+    deserialize_item = _get_deserializer_or_defer(item_type)
+    return deserialize
+
+
+def _compile_dict(value_type: str) -> Callable[[Any], Any]:
+    def deserialize(data):
+        if data is None:
+            return None
+        return {key: deserialize_value(value) for key, value in six.iteritems(data)}
+
+    deserialize_value = _get_deserializer_or_defer(value_type)
+    return deserialize
+
+
+def _compile_primitive(klass: type) -> Callable[[Any], Any]:
+    def deserialize(data):
+        if data is None:
+            return None
+        if type(data) is klass:
+            return data
+        try:
+            if klass is str and isinstance(data, bytes):
+                return data.decode("utf-8")
+            return klass(data)
+        except UnicodeEncodeError:
+            return six.text_type(data)
+        except TypeError:
+            return data
+
+    return deserialize
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+def _deserialize_date(string: Any) -> Any:
+    if string is None:
+        return None
+    if isinstance(string, str) and _ISO_DATE.match(string):
+        return datetime.date.fromisoformat(string)
+    try:
+        from dateutil.parser import parse
+        return parse(string).date()
+    except ImportError:
+        return string
+    except ValueError:
+        raise rest.ApiException(
+            status=0,
+            reason="Failed to parse `{0}` as date object".format(string)
+        )
+
+
+def _deserialize_datetime(string: Any) -> Any:
+    if string is None:
+        return None
+    if isinstance(string, str) and _NAIVE_ISO_DATETIME.match(string):
+        return datetime.datetime.fromisoformat(string)
+    try:
+        from dateutil.parser import parse
+        return parse(string)
+    except ImportError:
+        return string
+    except ValueError:
+        raise rest.ApiException(
+            status=0,
+            reason="Failed to parse `{0}` as datetime object".format(string)
+        )
+
+
+class _ModelDeserializer:
+    def __init__(self, klass: type):
+        self.klass = klass
+        # The original check looks the method up on the metaclass, so it
+        # never matches; kept as is to return the same results
+        self.returns_data = (
+            not klass.swagger_types
+            and "get_real_child_model" not in type(klass).__dict__
+        )
+        self.has_real_child_model = "get_real_child_model" in klass.__dict__
+        self.is_dict = isinstance(klass, type) and issubclass(klass, dict)
+        # Built on first use, as models may refer to themselves
+        self._fields: Optional[List[Tuple[str, str, Callable[[Any], Any]]]] = None
+
+    def __call__(self, data: Any) -> Any:
+        if data is None:
+            return None
+        if self.returns_data:
+            return data
+        klass = self.klass
+        kwargs = {}
+        if klass.swagger_types is not None and isinstance(data, (list, dict)):
+            for attr, key, deserialize in self.__get_fields():
+                if key in data:
+                    kwargs[attr] = deserialize(data[key])
+
+        instance = klass(**kwargs)
+
+        if self.is_dict and klass.swagger_types is not None and isinstance(data, dict):
+            for key, value in data.items():
+                if key not in klass.swagger_types:
+                    instance[key] = value
+        if self.has_real_child_model:
+            klass_name = instance.get_real_child_model(data)
+            if klass_name:
+                instance = get_deserializer(klass_name)(data)
+        return instance
+
+    def __get_fields(self) -> List[Tuple[str, str, Callable[[Any], Any]]]:
+        if self._fields is None:
+            self._fields = [
+                (attr, self.klass.attribute_map[attr], _get_deserializer_or_defer(attr_type))
+                for attr, attr_type in six.iteritems(self.klass.swagger_types)
+            ]
+        return self._fields
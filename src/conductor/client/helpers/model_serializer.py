@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import uuid
+from typing import Any, Callable, Dict, List, Tuple
+
+import six
+from requests.structures import CaseInsensitiveDict
+
+PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+
+_serializers: Dict[type, Callable[[Any], Any]] = {}
+
+
+def serialize(obj: Any) -> Any:
+    """
+    Convert ``obj`` into data that can be encoded as JSON.
+
+    Swagger models become dicts keyed by their JSON attribute names with
+    None values left out, dates become ISO 8601 strings and dataclasses and
+    other objects become dicts of their non-None fields. The conversion is
+    chosen once per type and cached, and models are read through a field
+    list compiled from ``swagger_types`` and ``attribute_map``.
+    """
+    if obj is None:
+        return None
+    try:
+        serializer = _serializers[type(obj)]
+    except KeyError:
+        serializer = _serializers[type(obj)] = _compile(type(obj))
+    return serializer(obj)
+
+
+def _compile(klass: type) -> Callable[[Any], Any]:
+    if issubclass(klass, PRIMITIVE_TYPES):
+        return _identity
+    if issubclass(klass, list):
+        return _serialize_list
+    if issubclass(klass, tuple):
+        return _serialize_tuple
+    if issubclass(klass, (datetime.datetime, datetime.date)):
+        return _serialize_date
+    if issubclass(klass, uuid.UUID):
+        return str
+    if issubclass(klass, (dict, CaseInsensitiveDict)):
+        return _serialize_dict
+    if isinstance(getattr(klass, "swagger_types", None), dict) and isinstance(
+        getattr(klass, "attribute_map", None), dict
+    ):
+        return _compile_model(klass)
+    if dataclasses.is_dataclass(klass):
+        return _compile_dataclass(klass)
+    return _serialize_object
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+def _serialize_list(obj: list) -> list:
+    return [serialize(item) for item in obj]
+
+
+def _serialize_tuple(obj: tuple) -> tuple:
+    return tuple(serialize(item) for item in obj)
+
+
+def _serialize_date(obj: Any) -> str:
+    return obj.isoformat()
+
+
+def _serialize_dict(obj: Any) -> dict:
+    return {key: serialize(value) for key, value in six.iteritems(obj)}
+
+
+def _compile_model(klass: type) -> Callable[[Any], dict]:
+    fields = [(attr, klass.attribute_map[attr]) for attr in klass.swagger_types]
+    return _compile_fields(fields)
+
+
+def _compile_dataclass(klass: type) -> Callable[[Any], dict]:
+    return _compile_fields([(field.name, field.name) for field in dataclasses.fields(klass)])
+
+
+def _compile_fields(fields: List[Tuple[str, str]]) -> Callable[[Any], dict]:
+    def serialize_fields(obj):
+        data = {}
+        for attr, key in fields:
+            value = getattr(obj, attr)
+            if value is not None:
+                data[key] = serialize(value)
+        return data
+
+    return serialize_fields
+
+
+def _serialize_object(obj: Any) -> Any:
+    # Models with instance-level swagger_types, and plain objects
+    if hasattr(obj, "attribute_map") and hasattr(obj, "swagger_types"):
+        return _compile_fields(
+            [(attr, obj.attribute_map[attr]) for attr in obj.swagger_types]
+        )(obj)
+    try:
+        attributes = vars(obj)
+    except TypeError:
+        # Fallback to string representation.
+        return str(obj)
+    return _compile_fields([(name, name) for name in list(attributes)])(obj)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from conductor.client.http.models.workflow_def import WorkflowDef
 from conductor.client.http.models.task_def import TaskDef
 from conductor.client.orkes.models.metadata_tag import MetadataTag
+from conductor.shared.http.metadata_sync import DEFAULT_SYNC_CONCURRENCY, MetadataSyncResult
 
 
 class MetadataClient(ABC):
@@ -53,6 +54,10 @@ class MetadataClient(ABC):
     def get_all_task_defs(self) -> List[TaskDef]:
         pass
 
+    def sync_metadata(self, workflow_defs: Iterable[WorkflowDef] = (), task_defs: Iterable[TaskDef] = (),
+                      max_concurrency: int = DEFAULT_SYNC_CONCURRENCY) -> MetadataSyncResult:
+        raise NotImplementedError(f"{type(self).__name__} does not implement sync_metadata")
+
     @abstractmethod
     def add_workflow_tag(self, tag: MetadataTag, workflow_name: str):
         pass
@@ -1,6 +1,9 @@
 import logging
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.model_deserializer import get_deserializer
+from conductor.client.helpers.model_serializer import serialize
 from conductor.client.http.api.application_resource_api import ApplicationResourceApi
 from conductor.client.http.api.authorization_resource_api import AuthorizationResourceApi
 from conductor.client.http.api.group_resource_api import GroupResourceApi
@@ -13,30 +16,69 @@ from conductor.client.http.api.secret_resource_api import SecretResourceApi
 from conductor.client.http.api.service_registry_resource_api import ServiceRegistryResourceApi
 from conductor.client.http.api.task_resource_api import TaskResourceApi
 from conductor.client.http.api.user_resource_api import UserResourceApi
+from conductor.client.http.api.workflow_bulk_resource_api import WorkflowBulkResourceApi
 from conductor.client.http.api.workflow_resource_api import WorkflowResourceApi
 from conductor.client.http.api_client import ApiClient
 from conductor.client.http.api.tags_api import TagsApi
 from conductor.client.http.api.event_resource_api import EventResourceApi
+from conductor.shared.http.lazy_resource_api import LazyResourceApi
+from conductor.shared.http.metadata_cache import get_metadata_cache
 
 
 class OrkesBaseClient(object):
-    def __init__(self, configuration: Configuration):
-        self.api_client = ApiClient(configuration)
+    # Resource APIs are created on first use
+    metadataResourceApi = LazyResourceApi(MetadataResourceApi)
+    taskResourceApi = LazyResourceApi(TaskResourceApi)
+    workflowResourceApi = LazyResourceApi(WorkflowResourceApi)
+    workflowBulkResourceApi = LazyResourceApi(WorkflowBulkResourceApi)
+    applicationResourceApi = LazyResourceApi(ApplicationResourceApi)
+    secretResourceApi = LazyResourceApi(SecretResourceApi)
+    userResourceApi = LazyResourceApi(UserResourceApi)
+    groupResourceApi = LazyResourceApi(GroupResourceApi)
+    authorizationResourceApi = LazyResourceApi(AuthorizationResourceApi)
+    schedulerResourceApi = LazyResourceApi(SchedulerResourceApi)
+    tagsApi = LazyResourceApi(TagsApi)
+    integrationApi = LazyResourceApi(IntegrationResourceApi)
+    promptApi = LazyResourceApi(PromptResourceApi)
+    schemaApi = LazyResourceApi(SchemaResourceApi)
+    serviceRegistryResourceApi = LazyResourceApi(ServiceRegistryResourceApi)
+    eventResourceApi = LazyResourceApi(EventResourceApi)
+
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        if api_client is None:
+            api_client = ApiClient(configuration)
+        self.api_client = api_client
         self.logger = logging.getLogger(
             Configuration.get_logging_formatted_name(__name__)
         )
-        self.metadataResourceApi = MetadataResourceApi(self.api_client)
-        self.taskResourceApi = TaskResourceApi(self.api_client)
-        self.workflowResourceApi = WorkflowResourceApi(self.api_client)
-        self.applicationResourceApi = ApplicationResourceApi(self.api_client)
-        self.secretResourceApi = SecretResourceApi(self.api_client)
-        self.userResourceApi = UserResourceApi(self.api_client)
-        self.groupResourceApi = GroupResourceApi(self.api_client)
-        self.authorizationResourceApi = AuthorizationResourceApi(self.api_client)
-        self.schedulerResourceApi = SchedulerResourceApi(self.api_client)
-        self.tagsApi = TagsApi(self.api_client)
-        self.integrationApi = IntegrationResourceApi(self.api_client)
-        self.promptApi = PromptResourceApi(self.api_client)
-        self.schemaApi = SchemaResourceApi(self.api_client)
-        self.serviceRegistryResourceApi = ServiceRegistryResourceApi(self.api_client)
-        self.eventResourceApi = EventResourceApi(self.api_client)
+        # Shared by the clients of a server, None unless the configuration enables it
+        auth_settings = configuration.authentication_settings
+        self.metadata_cache = get_metadata_cache(
+            configuration.host,
+            auth_settings.key_id if auth_settings is not None else None,
+            configuration.metadata_cache_ttl_seconds,
+            configuration.metadata_cache_max_size,
+            configuration.metadata_cache_snapshot_path,
+        )
+
+    def _get_cached(self, key: Tuple, klass: str, fetch: Callable[[], Any]) -> Any:
+        # Read through the metadata cache; klass is the response type of fetch.
+        # Every hit returns a new object, which callers may modify
+        if self.metadata_cache is None:
+            return fetch()
+        value = self.metadata_cache.get(key, get_deserializer(klass))
+        if value is None:
+            value = fetch()
+            self.metadata_cache.put(key, value, serialize)
+        return value
+
+    def _invalidate_cached(self, namespace: str, name: Optional[str] = None) -> None:
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(namespace, name)
+
+    def _get_search_page(self, search: Callable[..., Any], **kwargs) -> Dict[str, Any]:
+        # The page is only decoded, so that iter_search_results can
+        # deserialize its results one at a time
+        kwargs = {key: value for key, value in kwargs.items() if value is not None}
+        response = search(_preload_content=False, **kwargs)
+        return self.api_client.json_codec.loads(response.resp.content)
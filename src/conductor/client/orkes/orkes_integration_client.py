@@ -3,6 +3,7 @@ from __future__ import absolute_import
 from typing import List, Optional, Dict
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.integration import (
     Integration
 )
@@ -28,8 +29,8 @@ from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 
 class OrkesIntegrationClient(OrkesBaseClient, IntegrationClient):
 
-    def __init__(self, configuration: Configuration):
-        super(OrkesIntegrationClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesIntegrationClient, self).__init__(configuration, api_client)
 
     def associate_prompt_with_integration(
         self, ai_integration: str, model_name: str, prompt_name: str
@@ -1,7 +1,10 @@
 from __future__ import annotations
-from typing import Optional, List
+from functools import partial
+from typing import Iterable, Optional, List
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.model_serializer import serialize
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.tag_string import TagString
 from conductor.client.http.models.task_def import TaskDef
 from conductor.client.http.models.workflow_def import WorkflowDef
@@ -9,22 +12,39 @@ from conductor.client.metadata_client import MetadataClient
 from conductor.client.orkes.models.metadata_tag import MetadataTag
 from conductor.client.orkes.models.ratelimit_tag import RateLimitTag
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.shared.http.metadata_sync import (
+    DEFAULT_SYNC_CONCURRENCY,
+    TASK_DEF_DEFAULTS,
+    WORKFLOW_DEF_DEFAULTS,
+    MetadataSyncResult,
+    diff_definitions,
+    run_metadata_sync,
+    task_def_key,
+    workflow_def_key,
+)
 
 
 class OrkesMetadataClient(OrkesBaseClient, MetadataClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesMetadataClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesMetadataClient, self).__init__(configuration, api_client)
 
     def register_workflow_def(self, workflow_def: WorkflowDef, overwrite: Optional[bool] = True):
         self.metadataResourceApi.create(workflow_def, overwrite=overwrite)
+        self._invalidate_cached("workflow_def", workflow_def.name)
 
     def update_workflow_def(self, workflow_def: WorkflowDef, overwrite: Optional[bool] = True):
         self.metadataResourceApi.update([workflow_def], overwrite=overwrite)
+        self._invalidate_cached("workflow_def", workflow_def.name)
 
     def unregister_workflow_def(self, name: str, version: int):
         self.metadataResourceApi.unregister_workflow_def(name, version)
+        self._invalidate_cached("workflow_def", name)
 
     def get_workflow_def(self, name: str, version: Optional[int] = None) -> WorkflowDef:
+        return self._get_cached(("workflow_def", name, version or None), "WorkflowDef",
+                                partial(self.__get_workflow_def, name, version))
+
+    def __get_workflow_def(self, name: str, version: Optional[int]) -> WorkflowDef:
         workflow = None
         if version:
             workflow = self.metadataResourceApi.get1(name, version=version)
@@ -38,19 +58,51 @@ class OrkesMetadataClient(OrkesBaseClient, MetadataClient):
 
     def register_task_def(self, task_def: TaskDef):
         self.metadataResourceApi.register_task_def([task_def])
+        self._invalidate_cached("task_def", task_def.name)
 
     def update_task_def(self, task_def: TaskDef):
         self.metadataResourceApi.update_task_def(task_def)
+        self._invalidate_cached("task_def", task_def.name)
 
     def unregister_task_def(self, task_type: str):
         self.metadataResourceApi.unregister_task_def(task_type)
+        self._invalidate_cached("task_def", task_type)
 
     def get_task_def(self, task_type: str) -> TaskDef:
-        return self.metadataResourceApi.get_task_def(task_type)
+        return self._get_cached(("task_def", task_type), "object",
+                                partial(self.metadataResourceApi.get_task_def, task_type))
 
     def get_all_task_defs(self) -> List[TaskDef]:
         return self.metadataResourceApi.get_task_defs()
 
+    def sync_metadata(self, workflow_defs: Iterable[WorkflowDef] = (), task_defs: Iterable[TaskDef] = (),
+                      max_concurrency: int = DEFAULT_SYNC_CONCURRENCY) -> MetadataSyncResult:
+        """
+        Register the definitions the server does not have and update the ones that differ from its own, see
+        diff_definitions. The server's definitions are fetched once, and only the changes are pushed, concurrently: the
+        task definitions first, then the workflow definitions, which may use them.
+        """
+        workflow_defs, task_defs = list(workflow_defs), list(task_defs)
+        result = MetadataSyncResult()
+        if task_defs:
+            missing, changed, unchanged = diff_definitions(
+                task_defs, self.get_all_task_defs(), serialize, task_def_key, TASK_DEF_DEFAULTS
+            )
+            pushes = [(task_def.name, True, partial(self.register_task_def, task_def)) for task_def in missing]
+            pushes += [(task_def.name, False, partial(self.update_task_def, task_def)) for task_def in changed]
+            # Done before the workflows are pushed, as they may use the new task definitions
+            result = run_metadata_sync(pushes, unchanged, max_concurrency)
+        if workflow_defs:
+            missing, changed, unchanged = diff_definitions(
+                workflow_defs, self.get_all_workflow_defs(), serialize, workflow_def_key, WORKFLOW_DEF_DEFAULTS
+            )
+            pushes = [(workflow_def.name, True, partial(self.update_workflow_def, workflow_def))
+                      for workflow_def in missing]
+            pushes += [(workflow_def.name, False, partial(self.update_workflow_def, workflow_def))
+                       for workflow_def in changed]
+            result = result.combine(run_metadata_sync(pushes, unchanged, max_concurrency))
+        return result
+
     def add_workflow_tag(self, tag: MetadataTag, workflow_name: str):
         self.tagsApi.add_workflow_tag(tag, workflow_name)
 
@@ -1,8 +1,10 @@
 from __future__ import absolute_import, annotations
 
+from functools import partial
 from typing import List, Optional
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.prompt_template import PromptTemplate
 from conductor.client.http.models.prompt_template_test_request import PromptTemplateTestRequest
 from conductor.client.codegen.rest import ApiException
@@ -13,15 +15,17 @@ from conductor.client.prompt_client import PromptClient
 
 class OrkesPromptClient(OrkesBaseClient, PromptClient):
 
-    def __init__(self, configuration: Configuration):
-        super(OrkesPromptClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesPromptClient, self).__init__(configuration, api_client)
 
     def save_prompt(self, prompt_name: str, description: str, prompt_template: str):
         self.promptApi.save_message_template(prompt_template, description, prompt_name)
+        self._invalidate_cached("prompt", prompt_name)
 
     def get_prompt(self, prompt_name: str) -> PromptTemplate:
         try:
-            return self.promptApi.get_message_template(prompt_name)
+            return self._get_cached(("prompt", prompt_name), "MessageTemplate",
+                                    partial(self.promptApi.get_message_template, prompt_name))
         except ApiException as e:
             if e.is_not_found():
                 return None
@@ -32,15 +36,18 @@ class OrkesPromptClient(OrkesBaseClient, PromptClient):
 
     def delete_prompt(self, prompt_name: str):
         self.promptApi.delete_message_template(prompt_name)
+        self._invalidate_cached("prompt", prompt_name)
 
     def get_tags_for_prompt_template(self, prompt_name: str) -> List[MetadataTag]:
         return self.promptApi.get_tags_for_prompt_template(prompt_name)
 
     def update_tag_for_prompt_template(self, prompt_name: str, tags: List[MetadataTag]):
         self.promptApi.put_tag_for_prompt_template(tags, prompt_name)
+        self._invalidate_cached("prompt", prompt_name)
 
     def delete_tag_for_prompt_template(self, prompt_name: str, tags: List[MetadataTag]):
         self.promptApi.delete_tag_for_prompt_template(tags, prompt_name)
+        self._invalidate_cached("prompt", prompt_name)
 
     def test_prompt(self, prompt_text: str, variables: dict, ai_integration: str, text_complete_model: str,
                     temperature: float = 0.1, top_p: float = 0.9, stop_words: Optional[List[str]] = None) -> str:
@@ -1,25 +1,32 @@
 from __future__ import annotations
-from typing import Optional, List
+from functools import partial
+from typing import Optional, List, Iterator
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.model_deserializer import get_deserializer
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.save_schedule_request import SaveScheduleRequest
 from conductor.client.http.models.search_result_workflow_schedule_execution_model import \
     SearchResultWorkflowScheduleExecutionModel
 from conductor.client.http.models.workflow_schedule import WorkflowSchedule
+from conductor.client.http.models.workflow_schedule_execution_model import WorkflowScheduleExecutionModel
 from conductor.client.orkes.models.metadata_tag import MetadataTag
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 from conductor.client.scheduler_client import SchedulerClient
+from conductor.shared.http.paginated_search import DEFAULT_PAGE_SIZE, iter_search_results
 
 
 class OrkesSchedulerClient(OrkesBaseClient, SchedulerClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesSchedulerClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesSchedulerClient, self).__init__(configuration, api_client)
 
     def save_schedule(self, save_schedule_request: SaveScheduleRequest):
         self.schedulerResourceApi.save_schedule(save_schedule_request)
+        self._invalidate_cached("schedule", save_schedule_request.name)
 
     def get_schedule(self, name: str) -> WorkflowSchedule:
-        return self.schedulerResourceApi.get_schedule(name)
+        return self._get_cached(("schedule", name), "WorkflowSchedule",
+                                partial(self.schedulerResourceApi.get_schedule, name))
 
     def get_all_schedules(self, workflow_name: Optional[str] = None) -> List[WorkflowSchedule]:
         kwargs = {}
@@ -45,18 +52,23 @@ class OrkesSchedulerClient(OrkesBaseClient, SchedulerClient):
 
     def delete_schedule(self, name: str):
         self.schedulerResourceApi.delete_schedule(name)
+        self._invalidate_cached("schedule", name)
 
     def pause_schedule(self, name: str):
         self.schedulerResourceApi.pause_schedule(name)
+        self._invalidate_cached("schedule", name)
 
     def pause_all_schedules(self):
         self.schedulerResourceApi.pause_all_schedules()
+        self._invalidate_cached("schedule")
 
     def resume_schedule(self, name: str):
         self.schedulerResourceApi.resume_schedule(name)
+        self._invalidate_cached("schedule", name)
 
     def resume_all_schedules(self):
         self.schedulerResourceApi.resume_all_schedules()
+        self._invalidate_cached("schedule")
 
     def search_schedule_executions(self,
                                    start: Optional[int] = None,
@@ -78,14 +90,32 @@ class OrkesSchedulerClient(OrkesBaseClient, SchedulerClient):
             kwargs.update({"query": query})
         return self.schedulerResourceApi.search_v2(**kwargs)
 
+    def iter_search_schedule_executions(self,
+                                        query: Optional[str] = None,
+                                        free_text: str = "*",
+                                        page_size: int = DEFAULT_PAGE_SIZE,
+                                        sort: Optional[str] = None,
+                                        ) -> Iterator[WorkflowScheduleExecutionModel]:
+        """Iterate over all the schedule executions matching the search, fetching them page by page.
+        The next page is fetched while the current one is consumed"""
+        def fetch_page(start: int, size: int):
+            return self._get_search_page(
+                self.schedulerResourceApi.search_v2,
+                start=start, size=size, sort=sort, free_text=free_text, query=query
+            )
+
+        return iter_search_results(fetch_page, get_deserializer(WorkflowScheduleExecutionModel), page_size)
+
     def requeue_all_execution_records(self):
         self.schedulerResourceApi.requeue_all_execution_records()
 
     def set_scheduler_tags(self, tags: List[MetadataTag], name: str):
         self.schedulerResourceApi.put_tag_for_schedule(tags, name)
+        self._invalidate_cached("schedule", name)
 
     def get_scheduler_tags(self, name: str) -> List[MetadataTag]:
         return self.schedulerResourceApi.get_tags_for_schedule(name)
 
     def delete_scheduler_tags(self, tags: List[MetadataTag], name: str) -> List[MetadataTag]:
         self.schedulerResourceApi.delete_tag_for_schedule(tags, name)
+        self._invalidate_cached("schedule", name)
@@ -1,14 +1,15 @@
-from typing import List
+from typing import List, Optional
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.schema_def import SchemaDef
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 from conductor.client.schema_client import SchemaClient
 
 
 class OrkesSchemaClient(OrkesBaseClient, SchemaClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesSchemaClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesSchemaClient, self).__init__(configuration, api_client)
 
     def register_schema(self, schema: SchemaDef) -> None:
         self.schemaApi.save(schema)
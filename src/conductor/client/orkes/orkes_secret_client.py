@@ -1,19 +1,32 @@
-from typing import List, Set
+from typing import List, Set, Optional
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.orkes.models.metadata_tag import MetadataTag
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.client.orkes.secret_cache import SecretCache
 from conductor.client.secret_client import SecretClient
 
 
 class OrkesSecretClient(OrkesBaseClient, SecretClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesSecretClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesSecretClient, self).__init__(configuration, api_client)
+        # Shared by the threads using this client, None unless the configuration enables it
+        self.secret_cache = None
+        if configuration.secret_cache_ttl_seconds > 0:
+            self.secret_cache = SecretCache(
+                self.__load_secret,
+                configuration.secret_cache_ttl_seconds,
+                stale_if_error_seconds=configuration.secret_cache_ttl_seconds,
+            )
 
     def put_secret(self, key: str, value: str):
         self.secretResourceApi.put_secret(value, key)
+        self.__evict_secret(key)
 
     def get_secret(self, key: str) -> str:
+        if self.secret_cache is not None:
+            return self.secret_cache.get(key)
         return self.secretResourceApi.get_secret(key)
 
     def list_all_secret_names(self) -> Set[str]:
@@ -24,6 +37,7 @@ class OrkesSecretClient(OrkesBaseClient, SecretClient):
 
     def delete_secret(self, key: str):
         self.secretResourceApi.delete_secret(key)
+        self.__evict_secret(key)
 
     def secret_exists(self, key: str) -> bool:
         return self.secretResourceApi.secret_exists(key)
@@ -36,3 +50,10 @@ class OrkesSecretClient(OrkesBaseClient, SecretClient):
 
     def delete_secret_tags(self, tags: List[MetadataTag], key: str) -> List[MetadataTag]:
         self.secretResourceApi.delete_tag_for_secret(tags, key)
+
+    def __load_secret(self, key: str) -> str:
+        return self.secretResourceApi.get_secret(key)
+
+    def __evict_secret(self, key: str):
+        if self.secret_cache is not None:
+            self.secret_cache.invalidate(key)
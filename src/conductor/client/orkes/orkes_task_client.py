@@ -1,19 +1,23 @@
 from __future__ import annotations
-from typing import Optional, List
+from typing import Optional, List, Iterator
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.model_deserializer import get_deserializer
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.poll_data import PollData
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_summary import TaskSummary
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 from conductor.client.task_client import TaskClient
+from conductor.shared.http.paginated_search import DEFAULT_PAGE_SIZE, iter_search_results
 
 
 class OrkesTaskClient(OrkesBaseClient, TaskClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesTaskClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesTaskClient, self).__init__(configuration, api_client)
 
     def poll_task(self, task_type: str, worker_id: Optional[str] = None, domain: Optional[str] = None) -> Optional[
         Task]:
@@ -94,3 +98,24 @@ class OrkesTaskClient(OrkesBaseClient, TaskClient):
 
     def get_task_poll_data(self, task_type: str) -> List[PollData]:
         return self.taskResourceApi.get_poll_data(task_type=task_type)
+
+    def iter_search(self, query: Optional[str] = None, free_text: str = "*", page_size: int = DEFAULT_PAGE_SIZE,
+                    sort: Optional[str] = None) -> Iterator[TaskSummary]:
+        """Iterate over the summaries of all the tasks matching the search, fetching them page by page.
+        The next page is fetched while the current one is consumed"""
+        def fetch_page(start: int, size: int):
+            return self._get_search_page(
+                self.taskResourceApi.search1, start=start, size=size, sort=sort, free_text=free_text, query=query
+            )
+
+        return iter_search_results(fetch_page, get_deserializer(TaskSummary), page_size)
+
+    def iter_search_v2(self, query: Optional[str] = None, free_text: str = "*", page_size: int = DEFAULT_PAGE_SIZE,
+                       sort: Optional[str] = None) -> Iterator[Task]:
+        """Like iter_search, but iterates over the full tasks"""
+        def fetch_page(start: int, size: int):
+            return self._get_search_page(
+                self.taskResourceApi.search_v21, start=start, size=size, sort=sort, free_text=free_text, query=query
+            )
+
+        return iter_search_results(fetch_page, get_deserializer(Task), page_size)
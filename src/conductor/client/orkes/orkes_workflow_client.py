@@ -1,8 +1,11 @@
 from __future__ import annotations
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator
 import uuid
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.model_deserializer import get_deserializer
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.bulk_response import BulkResponse
 from conductor.client.http.models.skip_task_request import SkipTaskRequest
 from conductor.client.http.models.workflow_status import WorkflowStatus
 from conductor.client.http.models.scrollable_search_result_workflow_summary import ScrollableSearchResultWorkflowSummary
@@ -13,17 +16,22 @@ from conductor.client.http.models.start_workflow_request import StartWorkflowReq
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.http.models.workflow_run import WorkflowRun
 from conductor.client.http.models.workflow_state_update import WorkflowStateUpdate
+from conductor.client.http.models.workflow_summary import WorkflowSummary
 from conductor.client.http.models.workflow_test_request import WorkflowTestRequest
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 from conductor.client.workflow_client import WorkflowClient
+from conductor.shared.http.bulk_operation import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_BULK_RETRIES,
+    run_bulk_operation,
+)
+from conductor.shared.http.paginated_search import DEFAULT_PAGE_SIZE, iter_search_results
 
 
 class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
-    def __init__(
-            self,
-            configuration: Configuration
-    ):
-        super(OrkesWorkflowClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesWorkflowClient, self).__init__(configuration, api_client)
 
     def start_workflow_by_name(
             self,
@@ -164,6 +172,18 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
         }
         return self.workflowResourceApi.search(**args)
 
+    def iter_search(self, query: Optional[str] = None, free_text: str = "*", page_size: int = DEFAULT_PAGE_SIZE,
+                    sort: Optional[str] = None, skip_cache: bool = False) -> Iterator[WorkflowSummary]:
+        """Iterate over all the workflows matching the search, fetching them page by page.
+        The next page is fetched while the current one is consumed"""
+        def fetch_page(start: int, size: int):
+            return self._get_search_page(
+                self.workflowResourceApi.search,
+                start=start, size=size, sort=sort, free_text=free_text, query=query, skip_cache=skip_cache
+            )
+
+        return iter_search_results(fetch_page, get_deserializer(WorkflowSummary), page_size)
+
     def get_by_correlation_ids_in_batch(
             self,
             batch_request: CorrelationIdsSearchRequest,
@@ -205,6 +225,67 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
     def remove_workflow(self, workflow_id: str):
         self.workflowResourceApi.delete1(workflow_id)
 
+    def bulk_pause_workflows(self, workflow_ids: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                             max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                             retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        """Pause any number of workflows, see run_bulk_operation"""
+        return self.__run_bulk_operation(
+            self.workflowBulkResourceApi.pause_workflow1, workflow_ids, chunk_size, max_concurrency, retries
+        )
+
+    def bulk_resume_workflows(self, workflow_ids: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                              max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                              retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        """Resume any number of paused workflows, see run_bulk_operation"""
+        return self.__run_bulk_operation(
+            self.workflowBulkResourceApi.resume_workflow1, workflow_ids, chunk_size, max_concurrency, retries
+        )
+
+    def bulk_retry_workflows(self, workflow_ids: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                             max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                             retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        """Retry the last failed task of any number of workflows, see run_bulk_operation"""
+        return self.__run_bulk_operation(
+            self.workflowBulkResourceApi.retry1, workflow_ids, chunk_size, max_concurrency, retries
+        )
+
+    def bulk_restart_workflows(self, workflow_ids: Iterable[str], use_latest_definitions: bool = False,
+                               chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                               max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                               retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        """Restart any number of completed workflows, see run_bulk_operation"""
+        kwargs = {}
+        if use_latest_definitions:
+            kwargs["use_latest_definitions"] = use_latest_definitions
+        return self.__run_bulk_operation(
+            lambda chunk: self.workflowBulkResourceApi.restart1(chunk, **kwargs),
+            workflow_ids, chunk_size, max_concurrency, retries
+        )
+
+    def bulk_terminate_workflows(self, workflow_ids: Iterable[str], reason: Optional[str] = None,
+                                 trigger_failure_workflow: bool = False,
+                                 chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                                 max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                                 retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        """Terminate any number of workflows, see run_bulk_operation"""
+        kwargs = {}
+        if reason:
+            kwargs["reason"] = reason
+        if trigger_failure_workflow:
+            kwargs["trigger_failure_workflow"] = trigger_failure_workflow
+        return self.__run_bulk_operation(
+            lambda chunk: self.workflowBulkResourceApi.terminate(chunk, **kwargs),
+            workflow_ids, chunk_size, max_concurrency, retries
+        )
+
+    def bulk_remove_workflows(self, workflow_ids: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                              max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                              retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        """Permanently remove any number of workflows, see run_bulk_operation"""
+        return self.__run_bulk_operation(
+            self.workflowBulkResourceApi.delete, workflow_ids, chunk_size, max_concurrency, retries
+        )
+
     def update_variables(self, workflow_id: str, variables: Optional[Dict[str, object]] = None) -> None:
         variables = variables or {}
         self.workflowResourceApi.update_workflow_state(variables, workflow_id)
@@ -219,3 +300,8 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
             kwargs["wait_for_seconds"] = wait_for_seconds
 
         return self.workflowResourceApi.update_workflow_and_task_state(body=update_request, workflow_id=workflow_id, request_id=request_id, **kwargs)
+
+    def __run_bulk_operation(self, operation, workflow_ids: Iterable[str], chunk_size: int,
+                             max_concurrency: int, retries: int) -> BulkResponse:
+        successful, errors = run_bulk_operation(operation, workflow_ids, chunk_size, max_concurrency, retries)
+        return BulkResponse(bulk_error_results=errors, bulk_successful_results=successful)
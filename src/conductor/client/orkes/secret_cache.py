@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+from conductor.client.configuration.configuration import Configuration
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+DEFAULT_SECRET_CACHE_SIZE = 256
+# A secret read after 80% of its time-to-live is refreshed in the background
+DEFAULT_REFRESH_RATIO = 0.8
+# A failed background refresh is not retried sooner than this
+REFRESH_BACKOFF_SECONDS = 5.0
+
+
+class _Entry:
+    __slots__ = ("value", "loaded_at", "ttl_seconds", "refresh_after")
+
+    def __init__(self, value: str, loaded_at: float, ttl_seconds: float):
+        self.value = value
+        self.loaded_at = loaded_at
+        self.ttl_seconds = ttl_seconds
+        # time.monotonic() before which no background refresh starts
+        self.refresh_after = 0.0
+
+    def __repr__(self) -> str:
+        # Never show the value
+        return f"_Entry(loaded_at={self.loaded_at}, ttl_seconds={self.ttl_seconds})"
+
+
+class SecretCache:
+    """
+    Thread safe cache of secret values, meant to be shared by the threads
+    of a worker process.
+
+    A value is kept for ``ttl_seconds``, or the time-to-live given for its
+    key. Reading it after ``refresh_ratio`` of that time starts a background
+    refresh while the cached value is returned, so secrets in use are
+    reloaded before they expire. Each key is loaded by one thread at a time;
+    the others wait for its result. When a load fails because the server
+    could not be reached or answered with a 5xx or 429 status, a value that
+    expired less than ``stale_if_error_seconds`` ago is returned instead, so
+    that a short server outage does not fail the tasks that need it. Any
+    other error, such as the secret being deleted or access to it revoked,
+    drops the cached value.
+
+    Values are never logged. ``invalidate`` and ``clear`` drop them, and the
+    least recently used one is dropped once ``max_size`` are cached.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[str], str],
+        ttl_seconds: float,
+        refresh_ratio: float = DEFAULT_REFRESH_RATIO,
+        stale_if_error_seconds: float = 0,
+        max_size: int = DEFAULT_SECRET_CACHE_SIZE,
+    ):
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if not 0 < refresh_ratio <= 1:
+            raise ValueError(f"refresh_ratio must be in (0, 1], got {refresh_ratio}")
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self._load = load
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ratio = refresh_ratio
+        self.stale_if_error_seconds = stale_if_error_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # Loads in progress, by key
+        self._loading: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> str:
+        """
+        Return the value of the secret, loading it when it is not cached.
+        ``ttl_seconds`` sets how long the value loaded for the key is kept.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            age = None if entry is None else now - entry.loaded_at
+            if entry is not None and age < entry.ttl_seconds:
+                self._entries.move_to_end(key)
+                refresh = None
+                if (
+                    age >= entry.ttl_seconds * self.refresh_ratio
+                    and now >= entry.refresh_after
+                    and key not in self._loading
+                ):
+                    refresh = self._loading[key] = Future()
+                value, ttl_seconds = entry.value, entry.ttl_seconds
+            else:
+                if entry is not None and age >= entry.ttl_seconds + self.stale_if_error_seconds:
+                    # Too old to be of use, even when loading fails
+                    del self._entries[key]
+                future = self._loading.get(key)
+                if future is not None:
+                    loading = False
+                else:
+                    future = self._loading[key] = Future()
+                    loading = True
+        if entry is not None and age < entry.ttl_seconds:
+            if refresh is not None:
+                threading.Thread(
+                    target=self.__refresh,
+                    args=(key, ttl_seconds, refresh),
+                    name="conductor-secret-refresh",
+                    daemon=True,
+                ).start()
+            return value
+        if not loading:
+            return future.result()
+        return self.__load(key, ttl_seconds or self.ttl_seconds, future)
+
+    def invalidate(self, key: str) -> None:
+        """Drop the value of the secret; a load in progress is not cached."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._loading.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._loading.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __load(self, key: str, ttl_seconds: float, future: Future) -> str:
+        try:
+            value = self._load(key)
+        except BaseException as e:
+            # The future is always resolved and released, or the threads
+            # waiting on it and every later read of the key would hang
+            transient = _is_transient(e)
+            with self._lock:
+                if self._loading.get(key) is future:
+                    del self._loading[key]
+                entry = self._entries.get(key)
+                if entry is not None and isinstance(e, Exception) and not transient:
+                    del self._entries[key]
+                    entry = None
+                elif entry is not None:
+                    entry.refresh_after = time.monotonic() + REFRESH_BACKOFF_SECONDS
+            if (
+                transient
+                and entry is not None
+                and time.monotonic() - entry.loaded_at < entry.ttl_seconds + self.stale_if_error_seconds
+            ):
+                logger.warning("Failed to load secret %s, using the cached value, reason: %s", key, e)
+                future.set_result(entry.value)
+                return entry.value
+            future.set_exception(e)
+            raise
+        with self._lock:
+            # Not cached when the secret was invalidated during the load
+            if self._loading.get(key) is future:
+                del self._loading[key]
+                self._entries[key] = _Entry(value, time.monotonic(), ttl_seconds)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def __refresh(self, key: str, ttl_seconds: float, future: Future) -> None:
+        try:
+            self.__load(key, ttl_seconds, future)
+        except Exception as e:
+            # The cached value is used until it expires
+            logger.warning("Failed to refresh secret %s, reason: %s", key, e)
+
+
+def _is_transient(error: BaseException) -> bool:
+    # The server could not be reached, or failed to answer. API errors
+    # without a response have status 0
+    status = getattr(error, "status", None)
+    if isinstance(status, int):
+        return status == 0 or status == 429 or status >= 500
+    return isinstance(error, OSError)
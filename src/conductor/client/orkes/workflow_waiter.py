@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+from conductor.client.adapters.models.workflow_run_adapter import terminal_status
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models.workflow_status import WorkflowStatus
+
+if TYPE_CHECKING:
+    from conductor.client.workflow_client import WorkflowClient
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+DEFAULT_MIN_POLL_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 30.0
+# A workflow waited on for 50 seconds is polled every 5 seconds
+DEFAULT_POLL_INTERVAL_RATIO = 0.1
+DEFAULT_POLL_CONCURRENCY = 10
+
+
+class WorkflowWaiter:
+    """
+    Waits for any number of workflows to reach a terminal state with one
+    background thread, instead of a polling loop per workflow.
+
+    ``wait_for`` returns a ``Future`` that resolves to the ``WorkflowStatus``
+    of the workflow once it completed, failed, timed out or was terminated.
+    The status summaries of the workflows that are due are fetched up to
+    ``max_concurrency`` at a time. How often a workflow is polled adapts to
+    how long it has been waited on: ``poll_interval_ratio`` of that time,
+    between ``min_poll_interval`` and ``max_poll_interval`` seconds, so
+    short workflows resolve quickly and long ones cost few requests.
+    """
+
+    def __init__(
+        self,
+        workflow_client: WorkflowClient,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL_SECONDS,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+        poll_interval_ratio: float = DEFAULT_POLL_INTERVAL_RATIO,
+        max_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        include_output: bool = True,
+    ):
+        self.workflow_client = workflow_client
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_interval_ratio = poll_interval_ratio
+        self.max_concurrency = max_concurrency
+        self.include_output = include_output
+        self._condition = threading.Condition()
+        # Workflow ids by the time they are due to be polled
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        # Future and time waiting started, by workflow id
+        self._waiting: Dict[str, Tuple[Future, float]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def wait_for(self, workflow_id: str) -> Future:
+        """
+        Return a future of the terminal status of the workflow. Waiting for
+        a workflow that is already waited on returns the same future.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("WorkflowWaiter is closed")
+            waiting = self._waiting.get(workflow_id)
+            if waiting is not None:
+                return waiting[0]
+            future = Future()
+            now = time.monotonic()
+            self._waiting[workflow_id] = (future, now)
+            heapq.heappush(self._schedule, (now, next(self._sequence), workflow_id))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self.__run, name="conductor-workflow-waiter", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def wait_for_all(
+        self, workflow_ids: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, WorkflowStatus]:
+        """
+        Wait until all the workflows reached a terminal state, and return
+        their statuses by workflow id.
+
+        :raises concurrent.futures.TimeoutError: if they did not within
+            ``timeout`` seconds
+        """
+        futures = {workflow_id: self.wait_for(workflow_id) for workflow_id in workflow_ids}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        statuses = {}
+        for workflow_id, future in futures.items():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            statuses[workflow_id] = future.result(timeout=remaining)
+        return statuses
+
+    def close(self) -> None:
+        """Stop polling, and cancel the futures of the workflows still waited on."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._condition:
+            for future, _ in self._waiting.values():
+                future.cancel()
+            self._waiting.clear()
+            self._schedule.clear()
+
+    def __enter__(self) -> WorkflowWaiter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __run(self) -> None:
+        try:
+            self.__poll()
+        except BaseException as e:
+            # Fail the workflows waited on rather than leave them waiting
+            # forever; the next wait_for starts a new thread
+            logger.exception("Workflow waiter stopped unexpectedly")
+            with self._condition:
+                waiting = list(self._waiting.values())
+                self._waiting.clear()
+                self._schedule.clear()
+                self._thread = None
+            for future, _ in waiting:
+                _resolve(future, exception=e)
+
+    def __poll(self) -> None:
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="conductor-workflow-waiter"
+        ) as executor:
+            while True:
+                with self._condition:
+                    while not self._closed:
+                        delay = self.__get_seconds_until_next_poll()
+                        if delay is not None and delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    if self._closed:
+                        return
+                    workflow_ids = self.__pop_due()
+                statuses = list(executor.map(self.__get_status, workflow_ids))
+                with self._condition:
+                    for workflow_id, status in zip(workflow_ids, statuses):
+                        try:
+                            self.__update(workflow_id, status)
+                        except Exception as e:
+                            logger.exception("Failed to update the status of workflow %s", workflow_id)
+                            waiting = self._waiting.pop(workflow_id, None)
+                            if waiting is not None:
+                                _resolve(waiting[0], exception=e)
+
+    def __get_seconds_until_next_poll(self) -> Optional[float]:
+        if not self._schedule:
+            return None
+        return self._schedule[0][0] - time.monotonic()
+
+    def __pop_due(self) -> List[str]:
+        now = time.monotonic()
+        workflow_ids = []
+        while self._schedule and self._schedule[0][0] <= now:
+            _, _, workflow_id = heapq.heappop(self._schedule)
+            waiting = self._waiting.get(workflow_id)
+            if waiting is None:
+                continue
+            if waiting[0].done():
+                # Cancelled by the caller
+                del self._waiting[workflow_id]
+                continue
+            workflow_ids.append(workflow_id)
+        return workflow_ids
+
+    def __get_status(self, workflow_id: str) -> Union[WorkflowStatus, Exception]:
+        try:
+            return self.workflow_client.get_workflow_status(
+                workflow_id, include_output=self.include_output
+            )
+        except Exception as e:
+            return e
+
+    def __update(self, workflow_id: str, status: Union[WorkflowStatus, Exception]) -> None:
+        waiting = self._waiting.get(workflow_id)
+        if waiting is None:
+            return
+        future, started_at = waiting
+        if isinstance(status, Exception) and getattr(status, "status", None) == 404:
+            # No such workflow: it will not complete
+            del self._waiting[workflow_id]
+            _resolve(future, exception=status)
+            return
+        if isinstance(status, Exception):
+            logger.warning("Failed to get status of workflow %s, reason: %s", workflow_id, status)
+        elif status is not None and status.status in terminal_status:
+            del self._waiting[workflow_id]
+            _resolve(future, result=status)
+            return
+        now = time.monotonic()
+        interval = min(
+            self.max_poll_interval,
+            max(self.min_poll_interval, (now - started_at) * self.poll_interval_ratio),
+        )
+        heapq.heappush(self._schedule, (now + interval, next(self._sequence), workflow_id))
+
+
+def _resolve(future: Future, result: object = None, exception: Optional[BaseException] = None) -> None:
+    # The caller may cancel the future at any time, including between a
+    # check of future.done() and setting its outcome
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
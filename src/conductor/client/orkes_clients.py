@@ -1,5 +1,9 @@
+import threading
+from typing import Optional
+
 from conductor.client.authorization_client import AuthorizationClient
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.integration_client import IntegrationClient
 from conductor.client.metadata_client import MetadataClient
 from conductor.client.orkes.orkes_integration_client import OrkesIntegrationClient
@@ -22,40 +26,56 @@ from conductor.client.workflow_client import WorkflowClient
 
 
 class OrkesClients:
-    def __init__(self, configuration: Configuration = None):
+    """
+    Creates the Orkes clients. Every client shares one ``ApiClient``, and so
+    one connection pool and auth token; it is created when the first client
+    is requested, unless passed in.
+    """
+
+    def __init__(self, configuration: Configuration = None, api_client: Optional[ApiClient] = None):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
+        self._api_client = api_client
+        self._api_client_lock = threading.Lock()
+
+    @property
+    def api_client(self) -> ApiClient:
+        if self._api_client is None:
+            with self._api_client_lock:
+                if self._api_client is None:
+                    self._api_client = ApiClient(self.configuration)
+        return self._api_client
 
     def get_workflow_client(self) -> WorkflowClient:
-        return OrkesWorkflowClient(self.configuration)
+        return OrkesWorkflowClient(self.configuration, self.api_client)
 
     def get_authorization_client(self) -> AuthorizationClient:
-        return OrkesAuthorizationClient(self.configuration)
+        return OrkesAuthorizationClient(self.configuration, self.api_client)
 
     def get_metadata_client(self) -> MetadataClient:
-        return OrkesMetadataClient(self.configuration)
+        return OrkesMetadataClient(self.configuration, self.api_client)
 
     def get_scheduler_client(self) -> SchedulerClient:
-        return OrkesSchedulerClient(self.configuration)
+        return OrkesSchedulerClient(self.configuration, self.api_client)
 
     def get_secret_client(self) -> SecretClient:
-        return OrkesSecretClient(self.configuration)
+        return OrkesSecretClient(self.configuration, self.api_client)
 
     def get_task_client(self) -> TaskClient:
-        return OrkesTaskClient(self.configuration)
+        return OrkesTaskClient(self.configuration, self.api_client)
 
     def get_integration_client(self) -> IntegrationClient:
-        return OrkesIntegrationClient(self.configuration)
+        return OrkesIntegrationClient(self.configuration, self.api_client)
 
     def get_workflow_executor(self) -> WorkflowExecutor:
-        return WorkflowExecutor(self.configuration)
+        return WorkflowExecutor(self.configuration, self.api_client)
 
     def get_prompt_client(self) -> PromptClient:
-        return OrkesPromptClient(self.configuration)
+        return OrkesPromptClient(self.configuration, self.api_client)
 
     def get_schema_client(self) -> SchemaClient:
-        return OrkesSchemaClient(self.configuration)
+        return OrkesSchemaClient(self.configuration, self.api_client)
 
     def get_event_client(self) -> OrkesEventClient:
-        return OrkesEventClient(self.configuration)
+        return OrkesEventClient(self.configuration, self.api_client)
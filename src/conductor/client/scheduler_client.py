@@ -1,11 +1,13 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from conductor.client.http.models.workflow_schedule import WorkflowSchedule
+from conductor.client.http.models.workflow_schedule_execution_model import WorkflowScheduleExecutionModel
 from conductor.client.http.models.save_schedule_request import SaveScheduleRequest
 from conductor.client.http.models.search_result_workflow_schedule_execution_model import \
     SearchResultWorkflowScheduleExecutionModel
 from conductor.client.orkes.models.metadata_tag import MetadataTag
+from conductor.shared.http.paginated_search import DEFAULT_PAGE_SIZE
 
 
 class SchedulerClient(ABC):
@@ -60,6 +62,14 @@ class SchedulerClient(ABC):
                                    ) -> SearchResultWorkflowScheduleExecutionModel:
         pass
 
+    def iter_search_schedule_executions(self,
+                                        query: Optional[str] = None,
+                                        free_text: str = "*",
+                                        page_size: int = DEFAULT_PAGE_SIZE,
+                                        sort: Optional[str] = None,
+                                        ) -> Iterator[WorkflowScheduleExecutionModel]:
+        raise NotImplementedError(f"{type(self).__name__} does not implement iter_search_schedule_executions")
+
     @abstractmethod
     def requeue_all_execution_records(self):
         pass
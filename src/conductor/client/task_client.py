@@ -1,13 +1,15 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator
 
 from conductor.client.http.models.poll_data import PollData
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_summary import TaskSummary
 from conductor.shared.http.enums import TaskResultStatus
 from conductor.client.http.models.task_exec_log import TaskExecLog
+from conductor.shared.http.paginated_search import DEFAULT_PAGE_SIZE
 
 
 class TaskClient(ABC):
@@ -71,3 +73,11 @@ class TaskClient(ABC):
     @abstractmethod
     def get_task_poll_data(self, task_type: str) -> List[PollData]:
         pass
+
+    def iter_search(self, query: Optional[str] = None, free_text: str = "*", page_size: int = DEFAULT_PAGE_SIZE,
+                    sort: Optional[str] = None) -> Iterator[TaskSummary]:
+        raise NotImplementedError(f"{type(self).__name__} does not implement iter_search")
+
+    def iter_search_v2(self, query: Optional[str] = None, free_text: str = "*", page_size: int = DEFAULT_PAGE_SIZE,
+                       sort: Optional[str] = None) -> Iterator[Task]:
+        raise NotImplementedError(f"{type(self).__name__} does not implement iter_search_v2")
@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 import time
 from typing import Any, ClassVar, Dict, List
 
@@ -27,6 +28,9 @@ class MetricsCollector:
     gauges: ClassVar[Dict[str, Gauge]] = {}
     registry = CollectorRegistry()
     must_collect_metrics = False
+    # Guards lazy metric creation so that runner threads sharing the
+    # registry never register the same metric twice
+    _metrics_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, settings: MetricsSettings):
         if settings is not None:
@@ -60,6 +64,15 @@ class MetricsCollector:
             }
         )
 
+    def increment_task_poll_empty(self, task_type: str) -> None:
+        self.__increment_counter(
+            name=MetricName.TASK_POLL_EMPTY,
+            documentation=MetricDocumentation.TASK_POLL_EMPTY,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            }
+        )
+
     def increment_task_execution_queue_full(self, task_type: str) -> None:
         self.__increment_counter(
             name=MetricName.TASK_EXECUTION_QUEUE_FULL,
@@ -155,6 +168,14 @@ class MetricsCollector:
             }
         )
 
+    def record_workflow_start_throughput(self, throughput: float) -> None:
+        self.__record_gauge(
+            name=MetricName.WORKFLOW_START_THROUGHPUT,
+            documentation=MetricDocumentation.WORKFLOW_START_THROUGHPUT,
+            labels={},
+            value=throughput
+        )
+
     def record_workflow_input_payload_size(self, workflow_type: str, version: str, payload_size: int) -> None:
         self.__record_gauge(
             name=MetricName.WORKFLOW_INPUT_SIZE,
@@ -196,6 +217,53 @@ class MetricsCollector:
             value=time_spent
         )
 
+    def record_task_poll_backoff(self, task_type: str, backoff: float) -> None:
+        self.__record_gauge(
+            name=MetricName.TASK_POLL_BACKOFF,
+            documentation=MetricDocumentation.TASK_POLL_BACKOFF,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=backoff
+        )
+
+    def record_task_update_queue_depth(self, task_type: str, depth: int) -> None:
+        self.__record_gauge(
+            name=MetricName.TASK_UPDATE_QUEUE_DEPTH,
+            documentation=MetricDocumentation.TASK_UPDATE_QUEUE_DEPTH,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=depth
+        )
+
+    def record_task_update_time(self, task_type: str, time_spent: float) -> None:
+        self.__record_gauge(
+            name=MetricName.TASK_UPDATE_TIME,
+            documentation=MetricDocumentation.TASK_UPDATE_TIME,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=time_spent
+        )
+
+    def increment_token_refresh_error(self, exception: Exception) -> None:
+        self.__increment_counter(
+            name=MetricName.TOKEN_REFRESH_ERROR,
+            documentation=MetricDocumentation.TOKEN_REFRESH_ERROR,
+            labels={
+                MetricLabel.EXCEPTION: str(exception)
+            }
+        )
+
+    def record_token_refresh_time(self, time_spent: float) -> None:
+        self.__record_gauge(
+            name=MetricName.TOKEN_REFRESH_TIME,
+            documentation=MetricDocumentation.TOKEN_REFRESH_TIME,
+            labels={},
+            value=time_spent
+        )
+
     def __increment_counter(
             self,
             name: MetricName,
@@ -234,9 +302,11 @@ class MetricsCollector:
             labelnames: List[MetricLabel]
     ) -> Counter:
         if name not in self.counters:
-            self.counters[name] = self.__generate_counter(
-                name, documentation, labelnames
-            )
+            with self._metrics_lock:
+                if name not in self.counters:
+                    self.counters[name] = self.__generate_counter(
+                        name, documentation, labelnames
+                    )
         return self.counters[name]
 
     def __get_gauge(
@@ -246,9 +316,11 @@ class MetricsCollector:
             labelnames: List[MetricLabel]
     ) -> Gauge:
         if name not in self.gauges:
-            self.gauges[name] = self.__generate_gauge(
-                name, documentation, labelnames
-            )
+            with self._metrics_lock:
+                if name not in self.gauges:
+                    self.gauges[name] = self.__generate_gauge(
+                        name, documentation, labelnames
+                    )
         return self.gauges[name]
 
     def __generate_counter(
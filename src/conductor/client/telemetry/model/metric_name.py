@@ -10,10 +10,17 @@ class MetricName(str, Enum):
     TASK_EXECUTION_QUEUE_FULL = "task_execution_queue_full"
     TASK_PAUSED = "task_paused"
     TASK_POLL = "task_poll"
+    TASK_POLL_BACKOFF = "task_poll_backoff"
+    TASK_POLL_EMPTY = "task_poll_empty"
     TASK_POLL_ERROR = "task_poll_error"
     TASK_POLL_TIME = "task_poll_time"
     TASK_RESULT_SIZE = "task_result_size"
     TASK_UPDATE_ERROR = "task_update_error"
+    TASK_UPDATE_QUEUE_DEPTH = "task_update_queue_depth"
+    TASK_UPDATE_TIME = "task_update_time"
     THREAD_UNCAUGHT_EXCEPTION = "thread_uncaught_exceptions"
+    TOKEN_REFRESH_ERROR = "token_refresh_error"
+    TOKEN_REFRESH_TIME = "token_refresh_time"
     WORKFLOW_INPUT_SIZE = "workflow_input_size"
     WORKFLOW_START_ERROR = "workflow_start_error"
+    WORKFLOW_START_THROUGHPUT = "workflow_start_throughput"
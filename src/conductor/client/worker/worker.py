@@ -9,8 +9,7 @@ from typing import Any, Callable, Union, Optional
 
 from typing_extensions import Self
 
-from conductor.shared.automator import utils
-from conductor.shared.automator.utils import convert_from_dict_or_list
+from conductor.shared.automator.utils import TaskInputBinder
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.task_exec_log import TaskExecLog
@@ -54,9 +53,13 @@ class Worker(WorkerInterface):
         poll_interval: Optional[float] = None,
         domain: Optional[str] = None,
         worker_id: Optional[str] = None,
+        poll_count: Optional[int] = None,
+        poll_timeout: Optional[int] = None,
+        thread_count: Optional[int] = None,
+        lease_extend_enabled: Optional[bool] = None,
     ) -> Self:
         super().__init__(task_definition_name)
-        self.api_client = ApiClient()
+        self._api_client: Optional[ApiClient] = None
         self.config = Configuration()
 
         if poll_interval is None:
@@ -71,10 +74,17 @@ class Worker(WorkerInterface):
             self.worker_id = deepcopy(super().get_identity())
         else:
             self.worker_id = deepcopy(worker_id)
+        if poll_count is not None:
+            self.poll_count = poll_count
+        if poll_timeout is not None:
+            self.poll_timeout = poll_timeout
+        if thread_count is not None:
+            self.thread_count = thread_count
+        if lease_extend_enabled is not None:
+            self.lease_extend_enabled = lease_extend_enabled
         self.execute_function = deepcopy(execute_function)
 
     def execute(self, task: Task) -> TaskResult:
-        task_input = {}
         task_output = None
         task_result: TaskResult = self.get_task_result_from_task(task)
 
@@ -83,21 +93,7 @@ class Worker(WorkerInterface):
             if self._is_execute_function_input_parameter_a_task:
                 task_output = self.execute_function(task)
             else:
-                params = inspect.signature(self.execute_function).parameters
-                for input_name in params:
-                    typ = params[input_name].annotation
-                    default_value = params[input_name].default
-                    if input_name in task.input_data:
-                        if typ in utils.simple_types:
-                            task_input[input_name] = task.input_data[input_name]
-                        else:
-                            task_input[input_name] = convert_from_dict_or_list(
-                                typ, task.input_data[input_name]
-                            )
-                    elif default_value is not inspect.Parameter.empty:
-                        task_input[input_name] = default_value
-                    else:
-                        task_input[input_name] = None
+                task_input = self._task_input_binder.bind(task.input_data)
                 task_output = self.execute_function(**task_input)
 
             if isinstance(task_output, TaskResult):
@@ -146,6 +142,18 @@ class Worker(WorkerInterface):
     def get_identity(self) -> str:
         return self.worker_id
 
+    @property
+    def api_client(self) -> ApiClient:
+        # Only used to serialize output. Created on first use, as creating an
+        # ApiClient fetches an auth token; TaskRunner passes its own instead
+        if self._api_client is None:
+            self._api_client = ApiClient()
+        return self._api_client
+
+    @api_client.setter
+    def api_client(self, api_client: ApiClient) -> None:
+        self._api_client = api_client
+
     @property
     def execute_function(self) -> ExecuteTaskFunction:
         return self._execute_function
@@ -153,6 +161,7 @@ class Worker(WorkerInterface):
     @execute_function.setter
     def execute_function(self, execute_function: ExecuteTaskFunction) -> None:
         self._execute_function = execute_function
+        self._task_input_binder = TaskInputBinder(execute_function)
         self._is_execute_function_input_parameter_a_task = (
             is_callable_input_parameter_a_task(
                 callable=execute_function,
@@ -8,6 +8,10 @@ from conductor.client.http.models.task_result import TaskResult
 from conductor.client.configuration.configuration import Configuration
 
 DEFAULT_POLLING_INTERVAL = 100  # ms
+DEFAULT_POLL_COUNT = 1
+DEFAULT_POLL_TIMEOUT = 100  # ms
+DEFAULT_THREAD_COUNT = 1
+DEFAULT_LEASE_EXTEND_ENABLED = True
 
 
 class WorkerInterface(abc.ABC):
@@ -17,6 +21,10 @@ class WorkerInterface(abc.ABC):
         self._task_definition_name_cache = None
         self._domain = None
         self._poll_interval = Configuration().get_poll_interval()
+        self._poll_count = DEFAULT_POLL_COUNT
+        self._poll_timeout = DEFAULT_POLL_TIMEOUT
+        self._thread_count = DEFAULT_THREAD_COUNT
+        self._lease_extend_enabled = DEFAULT_LEASE_EXTEND_ENABLED
 
     @abc.abstractmethod
     def execute(self, task: Task) -> TaskResult:
@@ -125,3 +133,49 @@ class WorkerInterface(abc.ABC):
     @poll_interval.setter
     def poll_interval(self, value):
         self._poll_interval = value
+
+    @property
+    def poll_count(self):
+        """
+        Maximum number of tasks fetched per poll request.
+        Values greater than 1 switch the runner to batch polling.
+        """
+        return self._poll_count
+
+    @poll_count.setter
+    def poll_count(self, value):
+        self._poll_count = value
+
+    @property
+    def poll_timeout(self):
+        """
+        Long-poll timeout in milliseconds used when batch polling.
+        """
+        return self._poll_timeout
+
+    @poll_timeout.setter
+    def poll_timeout(self, value):
+        self._poll_timeout = value
+
+    @property
+    def thread_count(self):
+        """
+        Number of tasks the runner executes concurrently on its thread pool.
+        """
+        return self._thread_count
+
+    @thread_count.setter
+    def thread_count(self, value):
+        self._thread_count = value
+
+    @property
+    def lease_extend_enabled(self):
+        """
+        Whether the runner sends lease-extension heartbeats while a task with
+        a response timeout is executing.
+        """
+        return self._lease_extend_enabled
+
+    @lease_extend_enabled.setter
+    def lease_extend_enabled(self, value):
+        self._lease_extend_enabled = value
@@ -13,6 +13,10 @@ def WorkerTask(
     domain: Optional[str] = None,
     worker_id: Optional[str] = None,
     poll_interval_seconds: int = 0,
+    poll_count: int = 1,
+    poll_timeout: int = 100,
+    thread_count: int = 1,
+    lease_extend_enabled: bool = True,
 ):
     config = Configuration()
 
@@ -34,6 +38,10 @@ def WorkerTask(
             worker_id=worker_id,
             func=func,
             task_options=task_opts,
+            poll_count=poll_count,
+            poll_timeout=poll_timeout,
+            thread_count=thread_count,
+            lease_extend_enabled=lease_extend_enabled,
         )
 
         @functools.wraps(func)
@@ -58,6 +66,10 @@ def worker_task(
     poll_interval_millis: int = 100,
     domain: Optional[str] = None,
     worker_id: Optional[str] = None,
+    poll_count: int = 1,
+    poll_timeout: int = 100,
+    thread_count: int = 1,
+    lease_extend_enabled: bool = True,
 ):
     config = Configuration()
 
@@ -74,6 +86,10 @@ def worker_task(
             worker_id=worker_id,
             func=func,
             task_options=task_opts,
+            poll_count=poll_count,
+            poll_timeout=poll_timeout,
+            thread_count=thread_count,
+            lease_extend_enabled=lease_extend_enabled,
         )
 
         @functools.wraps(func)
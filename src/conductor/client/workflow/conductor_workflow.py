@@ -1,4 +1,6 @@
 from __future__ import annotations
+import hashlib
+import json
 from copy import deepcopy
 from typing import Any, Dict, List, Union, Optional
 
@@ -19,6 +21,10 @@ from conductor.client.workflow.task.task_type import TaskType
 from conductor.client.workflow.task.timeout_policy import TimeoutPolicy
 
 
+# Attributes that hold what is derived from the builder, rather than the builder state
+_DERIVED_ATTRIBUTES = frozenset(("_workflow_def", "_definition_hash", "_registered_hash"))
+
+
 class ConductorWorkflow:
     SCHEMA_VERSION = 2
 
@@ -43,6 +49,16 @@ class ConductorWorkflow:
         self._restartable = True
         self._workflow_status_listener_enabled = False
         self._workflow_status_listener_sink = None
+        self._register_once = False
+        self._registered_hash = None
+        self._copy_tasks = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any change to the builder invalidates the compiled definition
+        if name not in _DERIVED_ATTRIBUTES:
+            object.__setattr__(self, "_workflow_def", None)
+            object.__setattr__(self, "_definition_hash", None)
+        object.__setattr__(self, name, value)
 
     @property
     def name(self) -> str:
@@ -135,6 +151,7 @@ class ConductorWorkflow:
             self._output_parameters = {}
 
         self._output_parameters[key] = value
+        self.__invalidate()
         return self
 
     # InputTemplate template input to the workflow.  Can have combination of variables (e.g. ${workflow.input.abc}) and static values
@@ -181,6 +198,23 @@ class ConductorWorkflow:
         self.input_template(input)
         return self
 
+    # Tasks are copied when they are added, so changing a task afterwards does not change the workflow. Disable
+    # copying to build very large workflows quickly: the tasks themselves are added, and must not be changed after.
+    def copy_tasks(self, copy_tasks: bool = True) -> Self:
+        if not isinstance(copy_tasks, bool):
+            raise Exception("invalid type")
+        self._copy_tasks = copy_tasks
+        return self
+
+    # When enabled, the definition is registered (overwriting the one on the server) the first time the workflow is
+    # started and again only after it changed, and workflows are started by name and version instead of sending the
+    # whole definition with every request.
+    def register_once(self, register_once: bool = True) -> Self:
+        if not isinstance(register_once, bool):
+            raise Exception("invalid type")
+        self._register_once = register_once
+        return self
+
     # Register the workflow definition with the server. If overwrite is set, the definition on the server will be
     # overwritten. When not set, the call fails if there is any change in the workflow definition between the server
     # and what is being registered.
@@ -201,7 +235,7 @@ class ConductorWorkflow:
         -------
         Workflow Execution Id
         """
-        start_workflow_request.workflow_def = self.to_workflow_def()
+        self.__set_workflow_def(start_workflow_request)
         start_workflow_request.name = self.name
         start_workflow_request.version = self.version
         return self._executor.start_workflow(start_workflow_request)
@@ -213,7 +247,7 @@ class ConductorWorkflow:
         """
         workflow_input = workflow_input or {}
         start_workflow_request = StartWorkflowRequest()
-        start_workflow_request.workflow_def = self.to_workflow_def()
+        self.__set_workflow_def(start_workflow_request)
         start_workflow_request.name = self.name
         start_workflow_request.version = self.version
         start_workflow_request.input = workflow_input
@@ -243,10 +277,10 @@ class ConductorWorkflow:
         """
         workflow_input = workflow_input or {}
         request = StartWorkflowRequest()
-        request.workflow_def = self.to_workflow_def()
+        self.__set_workflow_def(request)
         request.input = workflow_input
-        request.name = request.workflow_def.name
-        request.version = 1
+        request.name = self.name
+        request.version = self.version if self._register_once else 1
         if idempotency_key is not None:
             request.idempotency_key = idempotency_key
             request.idempotency_strategy = idempotency_strategy
@@ -258,6 +292,18 @@ class ConductorWorkflow:
         return run
 
     def to_workflow_def(self) -> WorkflowDef:
+        """
+        Returns the definition of the workflow. It is built once and reused until the workflow is changed, so it
+        must not be modified. With copy_tasks(False) it is rebuilt on every call, as the added tasks may have been
+        changed in place since.
+        """
+        if not self._copy_tasks:
+            return self.__build_workflow_def()
+        if self._workflow_def is None:
+            self._workflow_def = self.__build_workflow_def()
+        return self._workflow_def
+
+    def __build_workflow_def(self) -> WorkflowDef:
         return WorkflowDef(
             name=self._name,
             description=self._description,
@@ -281,6 +327,30 @@ class ConductorWorkflow:
         sub_workflow_task.input_parameters.update(self._input_template)
         return sub_workflow_task.to_workflow_task()
 
+    def __get_definition_hash(self, workflow_def: WorkflowDef) -> str:
+        # Only the hash of a cached definition can be reused; others are hashed as they are now
+        if self._definition_hash is not None and workflow_def is self._workflow_def:
+            return self._definition_hash
+        content = json.dumps(workflow_def.to_dict(), sort_keys=True, default=str)
+        definition_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if workflow_def is self._workflow_def:
+            self._definition_hash = definition_hash
+        return definition_hash
+
+    def __set_workflow_def(self, request: StartWorkflowRequest) -> None:
+        if not self._register_once:
+            request.workflow_def = self.to_workflow_def()
+            return
+        workflow_def = self.to_workflow_def()
+        definition_hash = self.__get_definition_hash(workflow_def)
+        if self._registered_hash != definition_hash:
+            self._executor.register_workflow(overwrite=True, workflow=workflow_def)
+            self._registered_hash = definition_hash
+
+    def __invalidate(self) -> None:
+        self._workflow_def = None
+        self._definition_hash = None
+
     def __get_workflow_task_list(self) -> List[WorkflowTask]:
         workflow_task_list = []
         for task in self._tasks:
@@ -331,7 +401,8 @@ class ConductorWorkflow:
             raise Exception(
                 f"invalid task -- if using @worker_task or @WorkerTask decorator ensure task_ref_name is passed as "
                 f"argument.  task is {type(task)}")
-        self._tasks.append(deepcopy(task))
+        self._tasks.append(deepcopy(task) if self._copy_tasks else task)
+        self.__invalidate()
         return self
 
     def __add_fork_join_tasks(self, forked_tasks: List[List[TaskInterface]]) -> Self:
@@ -344,9 +415,11 @@ class ConductorWorkflow:
 
         fork_task = ForkTask(
             task_ref_name="forked_" + suffix,
-            forked_tasks=forked_tasks
+            forked_tasks=forked_tasks,
+            copy_tasks=self._copy_tasks,
         )
         self._tasks.append(fork_task)
+        self.__invalidate()
         return self
 
     def __call__(self, **kwargs) -> WorkflowRun:
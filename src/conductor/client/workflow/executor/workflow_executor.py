@@ -1,6 +1,8 @@
 from __future__ import annotations
+import time
 import uuid
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
 
 from typing_extensions import Self
 
@@ -20,14 +22,25 @@ from conductor.client.http.models.rerun_workflow_request import RerunWorkflowReq
 from conductor.client.http.models.signal_response import SignalResponse
 from conductor.client.http.models.correlation_ids_search_request import CorrelationIdsSearchRequest
 from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
+from conductor.client.telemetry.metrics_collector import MetricsCollector
+from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.workflow.models.workflow_start_result import WorkflowStartResult
+
+# The connection pool of the API client keeps 20 connections alive
+DEFAULT_BULK_START_CONCURRENCY = 20
 
 
 class WorkflowExecutor:
-    def __init__(self, configuration: Configuration) -> Self:
-        api_client = ApiClient(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None,
+                 metrics_settings: Optional[MetricsSettings] = None) -> Self:
+        if api_client is None:
+            api_client = ApiClient(configuration)
         self.metadata_client = MetadataResourceApi(api_client)
         self.task_client = TaskResourceApi(api_client)
-        self.workflow_client = OrkesWorkflowClient(configuration)
+        self.workflow_client = OrkesWorkflowClient(configuration, api_client)
+        self.metrics_collector = None
+        if metrics_settings is not None:
+            self.metrics_collector = MetricsCollector(metrics_settings)
 
     def register_workflow(self, workflow: WorkflowDef, overwrite: Optional[bool] = None) -> object:
         """Create a new workflow definition"""
@@ -46,7 +59,8 @@ class WorkflowExecutor:
 
     def start_workflows(self, *start_workflow_request: StartWorkflowRequest) -> List[str]:
         """Start multiple instances of workflows.  Note, there is no parallelism implemented in starting so giving a
-        very large number can impact the latencies and performance
+        very large number can impact the latencies and performance. Use start_workflows_in_bulk to start them
+        concurrently and get the result of every request, including the ones that failed
         """
         workflow_id_list = [""] * len(start_workflow_request)
         for i in range(len(start_workflow_request)):
@@ -55,6 +69,32 @@ class WorkflowExecutor:
             )
         return workflow_id_list
 
+    def start_workflows_in_bulk(self, start_workflow_requests: Iterable[StartWorkflowRequest],
+                                max_concurrency: int = DEFAULT_BULK_START_CONCURRENCY) -> List[WorkflowStartResult]:
+        """Start a workflow for each request, up to max_concurrency at a time over the connection pool
+        of the API client. Returns the id or the error of each request, in the order of the requests
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        results = [WorkflowStartResult(request) for request in start_workflow_requests]
+        if not results:
+            return results
+        pending = iter(results)
+
+        def start_pending():
+            # Workers take the next request as they become free, so that a slow
+            # start does not hold back the others
+            for result in pending:
+                self.__start_workflow_for_result(result)
+
+        workers = min(max_concurrency, len(results))
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="conductor-workflow-start") as executor:
+            for _ in range(workers):
+                executor.submit(start_pending)
+        self.__record_throughput(results, time.time() - start_time)
+        return results
+
     def execute_workflow(self, request: StartWorkflowRequest, wait_until_task_ref: Optional[str] = None, wait_for_seconds: int = 10,
                          request_id: Optional[str] = None) -> WorkflowRun:
         """Executes a workflow with StartWorkflowRequest and waits for the completion of the workflow or until a
@@ -286,3 +326,17 @@ class WorkflowExecutor:
             output_data=task_output,
             status=status
         )
+
+    def __start_workflow_for_result(self, result: WorkflowStartResult) -> None:
+        try:
+            result.workflow_id = self.start_workflow(start_workflow_request=result.request)
+        except Exception as e:
+            result.error = e
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_workflow_start_error(result.request.name, e)
+
+    def __record_throughput(self, results: List[WorkflowStartResult], time_spent: float) -> None:
+        if self.metrics_collector is None or time_spent <= 0:
+            return
+        started = sum(1 for result in results if result.succeeded)
+        self.metrics_collector.record_workflow_start_throughput(started / time_spent)
@@ -15,17 +15,18 @@ def get_for_loop_condition(task_ref_name: str, iterations: int) -> str:
 
 
 class DoWhileTask(TaskInterface):
-    # termination_condition is a Javascript expression that evaluates to True or False
-    def __init__(self, task_ref_name: str, termination_condition: str, tasks: List[TaskInterface]) -> Self:
+    # termination_condition is a Javascript expression that evaluates to True or False.
+    # The tasks are copied unless copy_tasks is False; they must then not be changed after.
+    def __init__(self, task_ref_name: str, termination_condition: str, tasks: List[TaskInterface],
+                 copy_tasks: bool = True) -> Self:
         super().__init__(
             task_reference_name=task_ref_name,
             task_type=TaskType.DO_WHILE,
         )
-        self._loop_condition = deepcopy(termination_condition)
-        if isinstance(tasks, List):
-            self._loop_over = deepcopy(tasks)
-        else:
-            self._loop_over = [deepcopy(tasks)]
+        self._loop_condition = termination_condition
+        if not isinstance(tasks, List):
+            tasks = [tasks]
+        self._loop_over = deepcopy(tasks) if copy_tasks else list(tasks)
 
     def to_workflow_task(self) -> WorkflowTask:
         workflow = super().to_workflow_task()
@@ -37,23 +38,26 @@ class DoWhileTask(TaskInterface):
 
 
 class LoopTask(DoWhileTask):
-    def __init__(self, task_ref_name: str, iterations: int, tasks: List[TaskInterface]) -> Self:
+    def __init__(self, task_ref_name: str, iterations: int, tasks: List[TaskInterface], copy_tasks: bool = True) -> Self:
         super().__init__(
             task_ref_name=task_ref_name,
             termination_condition=get_for_loop_condition(
                 task_ref_name, iterations,
             ),
             tasks=tasks,
+            copy_tasks=copy_tasks,
         )
 
 
 class ForEachTask(DoWhileTask):
-    def __init__(self, task_ref_name: str, tasks: List[TaskInterface], iterate_over:str, variables: Optional[List[str]] = None) -> Self:
+    def __init__(self, task_ref_name: str, tasks: List[TaskInterface], iterate_over:str, variables: Optional[List[str]] = None,
+                 copy_tasks: bool = True) -> Self:
         super().__init__(
             task_ref_name=task_ref_name,
             termination_condition=get_for_loop_condition(
                 task_ref_name, 0,
             ),
             tasks=tasks,
+            copy_tasks=copy_tasks,
         )
         super().input_parameter("items", iterate_over)
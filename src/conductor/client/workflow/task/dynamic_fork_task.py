@@ -9,14 +9,16 @@ from conductor.client.workflow.task.task_type import TaskType
 
 
 class DynamicForkTask(TaskInterface):
-    def __init__(self, task_ref_name: str, tasks_param: str = "dynamicTasks", tasks_input_param_name: str = "dynamicTasksInputs", join_task: JoinTask = None) -> Self:
+    # The join task is copied unless copy_tasks is False; it must then not be changed after
+    def __init__(self, task_ref_name: str, tasks_param: str = "dynamicTasks", tasks_input_param_name: str = "dynamicTasksInputs", join_task: JoinTask = None,
+                 copy_tasks: bool = True) -> Self:
         super().__init__(
             task_reference_name=task_ref_name,
             task_type=TaskType.FORK_JOIN_DYNAMIC
         )
         self.tasks_param = tasks_param
         self.tasks_input_param_name = tasks_input_param_name
-        self._join_task = deepcopy(join_task)
+        self._join_task = deepcopy(join_task) if copy_tasks else join_task
 
     def to_workflow_task(self) -> WorkflowTask:
         wf_task = super().to_workflow_task()
@@ -15,12 +15,17 @@ def get_join_task(task_reference_name: str) -> str:
 
 
 class ForkTask(TaskInterface):
-    def __init__(self, task_ref_name: str, forked_tasks: List[List[TaskInterface]], join_on: Optional[List[str]] = None) -> Self:
+    # The forked tasks are copied unless copy_tasks is False; they must then not be changed after
+    def __init__(self, task_ref_name: str, forked_tasks: List[List[TaskInterface]], join_on: Optional[List[str]] = None,
+                 copy_tasks: bool = True) -> Self:
         super().__init__(
             task_reference_name=task_ref_name,
             task_type=TaskType.FORK_JOIN
         )
-        self._forked_tasks = deepcopy(forked_tasks)
+        if copy_tasks:
+            self._forked_tasks = deepcopy(forked_tasks)
+        else:
+            self._forked_tasks = [list(inner_forked_tasks) for inner_forked_tasks in forked_tasks]
         self._join_on = join_on
 
     def to_workflow_task(self) -> [WorkflowTask]:
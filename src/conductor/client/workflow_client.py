@@ -1,7 +1,8 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator
 
+from conductor.client.http.models.bulk_response import BulkResponse
 from conductor.client.http.models.workflow_run import WorkflowRun
 from conductor.client.http.models.skip_task_request import SkipTaskRequest
 from conductor.client.http.models.workflow_status import WorkflowStatus
@@ -12,7 +13,15 @@ from conductor.client.http.models.rerun_workflow_request import RerunWorkflowReq
 from conductor.client.http.models.start_workflow_request import StartWorkflowRequest
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.http.models.workflow_state_update import WorkflowStateUpdate
+from conductor.client.http.models.workflow_summary import WorkflowSummary
 from conductor.client.http.models.workflow_test_request import WorkflowTestRequest
+from conductor.client.orkes.workflow_waiter import WorkflowWaiter
+from conductor.shared.http.bulk_operation import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_BULK_RETRIES,
+)
+from conductor.shared.http.paginated_search import DEFAULT_PAGE_SIZE
 
 
 class WorkflowClient(ABC):
@@ -93,6 +102,10 @@ class WorkflowClient(ABC):
                query: Optional[str] = None) -> ScrollableSearchResultWorkflowSummary:
         pass
 
+    def iter_search(self, query: Optional[str] = None, free_text: str = "*", page_size: int = DEFAULT_PAGE_SIZE,
+                    sort: Optional[str] = None, skip_cache: bool = False) -> Iterator[WorkflowSummary]:
+        raise NotImplementedError(f"{type(self).__name__} does not implement iter_search")
+
     @abstractmethod
     def get_by_correlation_ids_in_batch(
             self,
@@ -115,6 +128,45 @@ class WorkflowClient(ABC):
     def remove_workflow(self, workflow_id: str):
         pass
 
+    def bulk_pause_workflows(self, workflow_ids: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                             max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                             retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        raise NotImplementedError(f"{type(self).__name__} does not implement bulk_pause_workflows")
+
+    def bulk_resume_workflows(self, workflow_ids: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                              max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                              retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        raise NotImplementedError(f"{type(self).__name__} does not implement bulk_resume_workflows")
+
+    def bulk_retry_workflows(self, workflow_ids: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                             max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                             retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        raise NotImplementedError(f"{type(self).__name__} does not implement bulk_retry_workflows")
+
+    def bulk_restart_workflows(self, workflow_ids: Iterable[str], use_latest_definitions: bool = False,
+                               chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                               max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                               retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        raise NotImplementedError(f"{type(self).__name__} does not implement bulk_restart_workflows")
+
+    def bulk_terminate_workflows(self, workflow_ids: Iterable[str], reason: Optional[str] = None,
+                                 trigger_failure_workflow: bool = False,
+                                 chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                                 max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                                 retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        raise NotImplementedError(f"{type(self).__name__} does not implement bulk_terminate_workflows")
+
+    def bulk_remove_workflows(self, workflow_ids: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                              max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+                              retries: int = DEFAULT_BULK_RETRIES) -> BulkResponse:
+        raise NotImplementedError(f"{type(self).__name__} does not implement bulk_remove_workflows")
+
+    def wait_for_workflows(self, workflow_ids: Iterable[str],
+                           timeout: Optional[float] = None) -> Dict[str, WorkflowStatus]:
+        """Wait until the workflows reached a terminal state and return their statuses, see WorkflowWaiter"""
+        with WorkflowWaiter(self) as waiter:
+            return waiter.wait_for_all(workflow_ids, timeout=timeout)
+
     @abstractmethod
     def update_variables(self, workflow_id: str, variables: Optional[Dict[str, object]] = None) -> None:
         pass
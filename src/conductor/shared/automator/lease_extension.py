@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Optional
+
+# Heartbeat at half the response timeout, so that one lost or slow
+# heartbeat does not let the lease expire
+LEASE_EXTEND_RATIO = 0.5
+MIN_LEASE_EXTEND_INTERVAL_SECONDS = 1.0
+
+
+def get_lease_extend_interval(response_timeout_seconds: Optional[int]) -> Optional[float]:
+    """
+    Seconds between lease-extension heartbeats for a task, or None when the
+    task has no response timeout to extend.
+    """
+    if not response_timeout_seconds or response_timeout_seconds <= 0:
+        return None
+    return max(
+        MIN_LEASE_EXTEND_INTERVAL_SECONDS, response_timeout_seconds * LEASE_EXTEND_RATIO
+    )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+DEFAULT_MAX_POLL_BACKOFF_SECONDS = 2.0
+
+
+class PollBackoff:
+    """
+    Decides how long a task runner waits before its next poll.
+
+    A poll that returned tasks is followed by an immediate re-poll. Each
+    consecutive empty poll doubles the wait, starting from the polling
+    interval and capped at ``max_backoff_seconds``, and the next task resets
+    it back to zero.
+    """
+
+    def __init__(self, max_backoff_seconds: float = DEFAULT_MAX_POLL_BACKOFF_SECONDS):
+        self.max_backoff_seconds = max_backoff_seconds
+        self.empty_polls = 0
+
+    def next_delay(self, polling_interval: float, task_count: int) -> float:
+        if task_count > 0:
+            self.empty_polls = 0
+            return 0.0
+        # Bounded so that the exponent cannot overflow on a long idle period
+        self.empty_polls = min(self.empty_polls + 1, 32)
+        # Never back off to less than the configured polling interval
+        max_backoff_seconds = max(polling_interval, self.max_backoff_seconds)
+        return min(polling_interval * (2 ** (self.empty_polls - 1)), max_backoff_seconds)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.shared.worker.task_options import TaskOptions, get_task_options
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+DEFAULT_RATE_LIMIT_FREQUENCY_IN_SECONDS = 1
+
+_TOKENS = 0
+_LAST_REFILL = 1
+_IN_FLIGHT = 2
+
+
+class TaskLimiter:
+    """
+    Enforces the rate limit and concurrency cap of a task type on the client.
+
+    Runners reserve capacity before polling, so they never ask the server for
+    tasks they are not allowed to run yet. Rate limiting is a token bucket
+    holding up to ``rate_limit_per_frequency`` tokens, refilled over
+    ``rate_limit_frequency_in_seconds``. The concurrency cap counts tasks in
+    flight. Both live in shared memory, so a limiter created before
+    ``TaskHandler`` forks its worker processes is enforced across all of them.
+    A limit of 0 or None means unlimited, as on the server.
+    """
+
+    def __init__(
+        self,
+        rate_limit_per_frequency: Optional[int] = None,
+        rate_limit_frequency_in_seconds: Optional[int] = None,
+        concurrent_exec_limit: Optional[int] = None,
+    ):
+        self.rate_limit_per_frequency = rate_limit_per_frequency or 0
+        self.rate_limit_frequency_in_seconds = (
+            rate_limit_frequency_in_seconds or DEFAULT_RATE_LIMIT_FREQUENCY_IN_SECONDS
+        )
+        self.concurrent_exec_limit = concurrent_exec_limit or 0
+        self._state = multiprocessing.Array(
+            "d", [float(self.rate_limit_per_frequency), time.monotonic(), 0.0]
+        )
+
+    @staticmethod
+    def from_task_options(task_options: Optional[TaskOptions]) -> Optional[TaskLimiter]:
+        if task_options is None:
+            return None
+        if not task_options.rate_limit_per_frequency and not task_options.concurrent_exec_limit:
+            return None
+        return TaskLimiter(
+            rate_limit_per_frequency=task_options.rate_limit_per_frequency,
+            rate_limit_frequency_in_seconds=task_options.rate_limit_frequency_in_seconds,
+            concurrent_exec_limit=task_options.concurrent_exec_limit,
+        )
+
+    def reserve(self, count: int) -> int:
+        """
+        Reserve capacity for up to ``count`` tasks.
+
+        :return: the number of tasks that may be polled now; each must later
+                 be returned with ``cancel`` if it was not received, or with
+                 ``complete`` once it finished executing
+        """
+        if count <= 0:
+            return 0
+        with self._state.get_lock():
+            if self.concurrent_exec_limit > 0:
+                in_flight = int(self._state[_IN_FLIGHT])
+                count = min(count, self.concurrent_exec_limit - in_flight)
+            if self.rate_limit_per_frequency > 0:
+                self.__refill()
+                count = min(count, math.floor(self._state[_TOKENS]))
+            count = max(count, 0)
+            self._state[_TOKENS] -= count
+            self._state[_IN_FLIGHT] += count
+        return count
+
+    def cancel(self, count: int) -> None:
+        """
+        Give back reservations that were not used because fewer tasks were
+        polled than reserved.
+        """
+        if count <= 0:
+            return
+        with self._state.get_lock():
+            if self.rate_limit_per_frequency > 0:
+                self._state[_TOKENS] = min(
+                    self._state[_TOKENS] + count, float(self.rate_limit_per_frequency)
+                )
+            self._state[_IN_FLIGHT] = max(0.0, self._state[_IN_FLIGHT] - count)
+
+    def complete(self, count: int = 1) -> None:
+        """
+        Release the concurrency slots of tasks that finished executing.
+        """
+        with self._state.get_lock():
+            self._state[_IN_FLIGHT] = max(0.0, self._state[_IN_FLIGHT] - count)
+
+    @property
+    def in_flight(self) -> int:
+        return int(self._state[_IN_FLIGHT])
+
+    def __refill(self) -> None:
+        # Caller must hold the state lock
+        now = time.monotonic()
+        elapsed = now - self._state[_LAST_REFILL]
+        refill_rate = self.rate_limit_per_frequency / self.rate_limit_frequency_in_seconds
+        self._state[_TOKENS] = min(
+            float(self.rate_limit_per_frequency),
+            self._state[_TOKENS] + elapsed * refill_rate,
+        )
+        self._state[_LAST_REFILL] = now
+
+
+def get_worker_task_options(worker: Any) -> Optional[TaskOptions]:
+    """
+    TaskOptions set with ``@task_options`` on a worker's execute function, or
+    on the ``execute`` method of a class based worker.
+    """
+    return get_task_options(getattr(worker, "execute_function", worker.execute))
+
+
+def get_task_limiter_key(worker: Any) -> Optional[Tuple[str, ...]]:
+    task_definition_names = getattr(worker, "task_definition_names", None)
+    if task_definition_names is None:
+        return None
+    return tuple(task_definition_names)
+
+
+def create_task_limiters(workers: Iterable[Any]) -> Dict[Tuple[str, ...], TaskLimiter]:
+    """
+    Create one limiter per task type, shared by every worker polling it.
+    """
+    task_limiters = {}
+    for worker in workers:
+        key = get_task_limiter_key(worker)
+        if key is None or key in task_limiters:
+            continue
+        task_limiter = TaskLimiter.from_task_options(get_worker_task_options(worker))
+        if task_limiter is not None:
+            logger.debug("Created client side task limiter for %s", ",".join(key))
+            task_limiters[key] = task_limiter
+    return task_limiters
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from conductor.client.configuration.configuration import Configuration
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+SPOOL_FILE_EXTENSION = ".spool"
+LOCK_FILE_EXTENSION = ".lock"
+
+# Client errors other than these mean the server will never accept the result
+# (e.g. the task already timed out or was removed), so replaying it is pointless
+_RETRYABLE_CLIENT_ERROR_STATUSES = {401, 403, 408, 429}
+
+
+def is_permanent_update_failure(exception: Exception) -> bool:
+    status = getattr(exception, "status", None)
+    if not isinstance(status, int):
+        return False
+    return 400 <= status < 500 and status not in _RETRYABLE_CLIENT_ERROR_STATUSES
+
+
+def _try_lock(lock_file: IO) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+class TaskResultSpool:
+    """
+    Append-only on-disk log of task results that could not be delivered.
+
+    Every entry is written as one JSON line and flushed to disk before
+    ``append`` returns, so spooled results survive a crash or restart of the
+    worker process. Delivered entries are removed from the head of the log by
+    atomically rewriting the file.
+
+    Every spool owns a slot: ``<name>.spool`` or, while that one is taken,
+    ``<name>~1.spool``, ``<name>~2.spool`` and so on. The slot is claimed on
+    first use with an exclusive lock on its ``.lock`` file, which is held
+    until ``close`` or until the process exits. Processes running the same
+    task type therefore never share a spool file, and a restarted process
+    claims the first free slot and replays what was left in it.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        name: str,
+        serialize: Callable[[Any], Dict[str, Any]],
+        deserialize: Callable[[Dict[str, Any]], Any],
+    ):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self._lock = threading.Lock()
+        self._path: Optional[str] = None
+        self._lock_file: Optional[IO] = None
+
+    @property
+    def path(self) -> str:
+        with self._lock:
+            return self.__claim_slot()
+
+    def close(self) -> None:
+        """
+        Release the slot, so another spool can claim it.
+        """
+        with self._lock:
+            if self._lock_file is not None:
+                self._lock_file.close()
+            self._lock_file = None
+            self._path = None
+
+    def append(self, task_result: Any, task_type: str) -> None:
+        line = json.dumps(
+            {"task_type": task_type, "task_result": self.serialize(task_result)}
+        )
+        with self._lock:
+            with open(self.__claim_slot(), "a", encoding="utf-8") as spool_file:
+                spool_file.write(line + "\n")
+                spool_file.flush()
+                os.fsync(spool_file.fileno())
+
+    def peek(self, limit: Optional[int] = None) -> List[Tuple[str, Any]]:
+        """
+        Return up to ``limit`` of the oldest spooled ``(task_type, task_result)``
+        entries without removing them.
+        """
+        with self._lock:
+            lines = self.__read_lines()
+        entries = []
+        for line in lines[:limit]:
+            try:
+                entry = json.loads(line)
+                entries.append(
+                    (entry["task_type"], self.deserialize(entry["task_result"]))
+                )
+            except Exception as e:
+                # E.g. a torn last line after a crash mid-write. Keep the
+                # position so that discard() stays aligned with the file
+                logger.warning("Skipping unreadable entry in %s, reason: %s", self.path, e)
+                entries.append((None, None))
+        return entries
+
+    def discard(self, count: int) -> None:
+        """
+        Remove the ``count`` oldest entries from the spool.
+        """
+        if count <= 0:
+            return
+        with self._lock:
+            path = self.__claim_slot()
+            remaining = self.__read_lines()[count:]
+            if not remaining:
+                if os.path.exists(path):
+                    os.remove(path)
+                return
+            temporary_path = path + ".tmp"
+            with open(temporary_path, "w", encoding="utf-8") as spool_file:
+                spool_file.writelines(line + "\n" for line in remaining)
+                spool_file.flush()
+                os.fsync(spool_file.fileno())
+            os.replace(temporary_path, path)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.__read_lines())
+
+    def __claim_slot(self) -> str:
+        # Called with self._lock held. Claimed lazily, so that the slot is
+        # held by the worker process using the spool and not by its parent
+        if self._path is not None:
+            return self._path
+        slot = 0
+        while True:
+            base_name = self.name if slot == 0 else f"{self.name}~{slot}"
+            lock_file = open(
+                os.path.join(self.directory, base_name + LOCK_FILE_EXTENSION), "a"
+            )
+            if _try_lock(lock_file):
+                self._lock_file = lock_file
+                self._path = os.path.join(self.directory, base_name + SPOOL_FILE_EXTENSION)
+                return self._path
+            lock_file.close()
+            slot += 1
+
+    def __read_lines(self) -> List[str]:
+        path = self.__claim_slot()
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding="utf-8") as spool_file:
+            return [line.rstrip("\n") for line in spool_file if line.strip()]
@@ -133,3 +133,240 @@ def get_value(typ: type, val: object) -> object:
         return values
     else:
         return convert_from_dict(typ, val)
+
+
+# Compiled converters. They produce exactly what convert_from_dict_or_list,
+# convert_from_dict and get_value produce, but inspect each type only once
+# instead of on every task, and are cached per type.
+
+_input_converters: typing.Dict[typing.Any, typing.Callable[[typing.Any], object]] = {}
+_class_converters: typing.Dict[typing.Any, typing.Callable[[typing.Any], object]] = {}
+_value_converters: typing.Dict[typing.Any, typing.Callable[[typing.Any], object]] = {}
+
+
+def get_input_converter(cls: type) -> typing.Callable[[typing.Any], object]:
+    """
+    Cached equivalent of ``lambda data: convert_from_dict_or_list(cls, data)``.
+    """
+    return _get_cached_converter(_input_converters, cls, _compile_input_converter)
+
+
+def get_class_converter(cls: type) -> typing.Callable[[typing.Any], object]:
+    """
+    Cached equivalent of ``lambda data: convert_from_dict(cls, data)``.
+    """
+    return _get_cached_converter(_class_converters, cls, _compile_class_converter)
+
+
+def get_value_converter(typ: type) -> typing.Callable[[typing.Any], object]:
+    """
+    Cached equivalent of ``lambda val: get_value(typ, val)``.
+    """
+    return _get_cached_converter(_value_converters, typ, _compile_value_converter)
+
+
+class TaskInputBinder:
+    """
+    Binds task input data to the keyword arguments of an execute function.
+
+    The signature of the function is inspected once, when the binder is
+    created, and turned into a list of ``(name, converter, default)``
+    bindings, so executing a task only runs the precompiled converters.
+    """
+
+    def __init__(self, execute_function: typing.Callable) -> None:
+        self.execute_function = execute_function
+        self.__compile()
+
+    def bind(self, input_data: dict) -> typing.Dict[str, object]:
+        task_input = {}
+        for name, converter, default_value in self._bindings:
+            if name in input_data:
+                value = input_data[name]
+                task_input[name] = value if converter is None else converter(value)
+            else:
+                task_input[name] = default_value
+        return task_input
+
+    def __compile(self) -> None:
+        bindings = []
+        for name, parameter in inspect.signature(self.execute_function).parameters.items():
+            converter = None
+            if not _is_simple_type(parameter.annotation):
+                converter = get_input_converter(parameter.annotation)
+            default_value = None
+            if parameter.default is not inspect.Parameter.empty:
+                default_value = parameter.default
+            bindings.append((name, converter, default_value))
+        self._bindings = bindings
+
+    def __getstate__(self) -> dict:
+        # Converters are closures; rebuild them after unpickling (spawn start method)
+        return {"execute_function": self.execute_function}
+
+    def __setstate__(self, state: dict) -> None:
+        self.execute_function = state["execute_function"]
+        self.__compile()
+
+
+def _get_cached_converter(
+    cache: dict, typ: typing.Any, compile_converter: typing.Callable
+) -> typing.Callable:
+    try:
+        converter = cache.get(typ)
+    except TypeError:
+        # Unhashable annotation, nothing to cache it by
+        return compile_converter(typ)
+    if converter is None:
+        converter = compile_converter(typ)
+        cache[typ] = converter
+    return converter
+
+
+def _is_simple_type(typ: typing.Any) -> bool:
+    try:
+        return typ in simple_types
+    except TypeError:
+        return False
+
+
+def _is_list_type(typ: typing.Any) -> bool:
+    return (
+        str(typ).startswith("typing.List[")
+        or str(typ).startswith("typing.Set[")
+        or str(typ).startswith("list[")
+    )
+
+
+def _is_dict_type(typ: typing.Any) -> bool:
+    return (
+        str(typ).startswith("dict[")
+        or str(typ).startswith("typing.Dict[")
+        or str(typ).startswith("requests.structures.CaseInsensitiveDict[")
+        or typ is dict
+    )
+
+
+def _compile_input_converter(cls: type) -> typing.Callable[[typing.Any], object]:
+    generic_types = typing.get_args(cls)
+    class_converter = get_class_converter(cls)
+    if not generic_types:
+        # A list input without an item type fails the same way as before
+        def convert(data):
+            if type(data) in collection_types:
+                return convert_from_dict_or_list(cls, data)
+            return class_converter(data)
+
+        return convert
+
+    item_converter = get_class_converter(generic_types[0])
+
+    def convert(data):
+        if type(data) in collection_types:
+            return [item_converter(val) for val in data]
+        return class_converter(data)
+
+    return convert
+
+
+def _compile_class_converter(cls: type) -> typing.Callable[[typing.Any], object]:
+    is_dataclass = dataclasses.is_dataclass(cls)
+    member_binders = None
+
+    def convert(data):
+        nonlocal member_binders
+        if data is None:
+            return data
+        if isinstance(data, cls):
+            return data
+        if is_dataclass:
+            return from_dict(data_class=cls, data=data)
+        if type(data) is not dict:
+            data = {}
+        # Compiled on first use, as convert_from_dict only inspects the class here
+        if member_binders is None:
+            member_binders = _compile_member_binders(cls)
+        kwargs = {}
+        for bind in member_binders:
+            bind(data, kwargs)
+        return cls(**kwargs)
+
+    return convert
+
+
+def _compile_member_binders(
+    cls: type,
+) -> typing.List[typing.Callable[[dict, dict], None]]:
+    members = inspect.signature(cls.__init__).parameters
+    return [
+        _compile_member_binder(member, members[member])
+        for member in members
+        if member != "self"
+    ]
+
+
+def _compile_member_binder(
+    member: str, parameter: inspect.Parameter
+) -> typing.Callable[[dict, dict], None]:
+    typ = parameter.annotation
+    generic_types = typing.get_args(typ)
+
+    if _is_simple_type(typ):
+        default_value = parameter.default
+
+        def bind(data, kwargs):
+            kwargs[member] = data[member] if member in data else default_value
+
+    elif _is_list_type(typ):
+        value_converter = get_value_converter(
+            generic_types[0] if len(generic_types) > 0 else object
+        )
+
+        def bind(data, kwargs):
+            kwargs[member] = [value_converter(item) for item in data[member]]
+
+    elif _is_dict_type(typ) or str(typ).startswith("OrderedDict["):
+        value_converter = get_value_converter(
+            generic_types[1] if len(generic_types) > 1 else object
+        )
+
+        def bind(data, kwargs):
+            values = data[member]
+            kwargs[member] = {k: value_converter(values[k]) for k in values}
+
+    elif typ is inspect.Parameter.empty:
+        # data is always a plain dict at this point, so both **kwargs and
+        # unannotated members take all of it
+        def bind(data, kwargs):
+            kwargs.update(data)
+
+    else:
+        class_converter = get_class_converter(typ)
+
+        def bind(data, kwargs):
+            kwargs[member] = class_converter(data[member])
+
+    return bind
+
+
+def _compile_value_converter(typ: type) -> typing.Callable[[typing.Any], object]:
+    if _is_simple_type(typ):
+        return _identity
+    if _is_list_type(typ):
+        return _copy_list
+    if _is_dict_type(typ):
+        return _copy_dict
+    return get_class_converter(typ)
+
+
+def _identity(val: object) -> object:
+    return val
+
+
+def _copy_list(val: typing.Iterable) -> list:
+    # get_value(type(item), item) copies dict items and returns anything else as is
+    return [_copy_dict(item) if type(item) is dict else item for item in val]
+
+
+def _copy_dict(val: typing.Mapping) -> dict:
+    return {k: val[k] for k in val}
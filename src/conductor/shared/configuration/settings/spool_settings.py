@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from conductor.shared.configuration.settings.metrics_settings import (
+    get_default_temporary_folder,
+)
+
+
+class SpoolSettings:
+    """
+    Enables the on-disk spool for task results that could not be delivered
+    to the server. Spooled results are replayed every ``replay_interval``
+    seconds, including after the worker is restarted.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        replay_interval: float = 5.0,
+    ):
+        if directory is None:
+            directory = f"{get_default_temporary_folder()}spool/"
+        self.directory = directory
+        self.replay_interval = replay_interval
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Tuple
+
+from conductor.client.configuration.configuration import Configuration
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+# The server rejects bulk requests for more than 1000 workflows
+DEFAULT_BULK_CHUNK_SIZE = 1000
+DEFAULT_BULK_CONCURRENCY = 4
+DEFAULT_BULK_RETRIES = 2
+RETRY_DELAY_SECONDS = 1.0
+
+# Successful results and errors by workflow id, as in a BulkResponse
+BulkResults = Tuple[List[Any], Dict[str, str]]
+
+
+def run_bulk_operation(
+    operation: Callable[[List[str]], Any],
+    workflow_ids: Iterable[str],
+    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    retries: int = DEFAULT_BULK_RETRIES,
+) -> BulkResults:
+    """
+    Apply a bulk ``operation`` to any number of workflows. The ids are sent
+    in chunks of ``chunk_size``, up to ``max_concurrency`` chunks at a time,
+    and the ``BulkResponse`` of every chunk are merged. A chunk whose
+    request failed counts as failed for each of its ids, and is sent again
+    up to ``retries`` times unless the server rejected it with a 4xx status.
+    The errors the server reports per workflow are final and not retried.
+    """
+    _check_arguments(chunk_size, max_concurrency)
+    successful: List[Any] = []
+    pending = list(dict.fromkeys(workflow_ids))
+    errors: Dict[str, str] = {}
+    for attempt in range(retries + 1):
+        if attempt > 0:
+            logger.debug("Retrying bulk operation for %s workflows", len(pending))
+            time.sleep(RETRY_DELAY_SECONDS)
+        chunks = _split(pending, chunk_size)
+        if not chunks:
+            break
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(chunks)), thread_name_prefix="conductor-bulk"
+        ) as executor:
+            responses = list(executor.map(lambda chunk: _call(operation, chunk), chunks))
+        pending = _merge(chunks, responses, successful, errors)
+    return successful, errors
+
+
+async def async_run_bulk_operation(
+    operation: Callable[[List[str]], Awaitable[Any]],
+    workflow_ids: Iterable[str],
+    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    retries: int = DEFAULT_BULK_RETRIES,
+) -> BulkResults:
+    """Async counterpart of ``run_bulk_operation``."""
+    _check_arguments(chunk_size, max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(chunk: List[str]) -> Any:
+        async with semaphore:
+            try:
+                return await operation(chunk)
+            except Exception as e:
+                return e
+
+    successful: List[Any] = []
+    pending = list(dict.fromkeys(workflow_ids))
+    errors: Dict[str, str] = {}
+    for attempt in range(retries + 1):
+        if attempt > 0:
+            logger.debug("Retrying bulk operation for %s workflows", len(pending))
+            await asyncio.sleep(RETRY_DELAY_SECONDS)
+        chunks = _split(pending, chunk_size)
+        if not chunks:
+            break
+        responses = await asyncio.gather(*(call(chunk) for chunk in chunks))
+        pending = _merge(chunks, responses, successful, errors)
+    return successful, errors
+
+
+def _call(operation: Callable[[List[str]], Any], chunk: List[str]) -> Any:
+    try:
+        return operation(chunk)
+    except Exception as e:
+        return e
+
+
+def _split(workflow_ids: List[str], chunk_size: int) -> List[List[str]]:
+    return [workflow_ids[i:i + chunk_size] for i in range(0, len(workflow_ids), chunk_size)]
+
+
+def _merge(
+    chunks: List[List[str]], responses: List[Any], successful: List[Any], errors: Dict[str, str]
+) -> List[str]:
+    # Adds the results to successful and errors, and returns the ids to retry
+    retry: List[str] = []
+    for chunk, response in zip(chunks, responses):
+        for workflow_id in chunk:
+            errors.pop(workflow_id, None)
+        if isinstance(response, Exception):
+            logger.warning("Bulk request for %s workflows failed, reason: %s", len(chunk), response)
+            errors.update((workflow_id, str(response)) for workflow_id in chunk)
+            if _is_retryable(response):
+                retry.extend(chunk)
+            continue
+        if response is None:
+            continue
+        successful.extend(response.bulk_successful_results or [])
+        errors.update(response.bulk_error_results or {})
+    return retry
+
+
+def _is_retryable(error: Exception) -> bool:
+    # A request rejected with a 4xx status fails again; too many requests
+    # (429) and API errors without a response (status 0) may not
+    status = getattr(error, "status", None)
+    return not isinstance(status, int) or not 400 <= status < 500 or status == 429
+
+
+def _check_arguments(chunk_size: int, max_concurrency: int) -> None:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+from conductor.client.configuration.configuration import Configuration
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+AUTO = "auto"
+ORJSON = "orjson"
+MSGSPEC = "msgspec"
+STDLIB = "json"
+
+# Tried in this order by "auto"
+_PREFERRED_CODECS = (ORJSON, MSGSPEC, STDLIB)
+
+
+class JsonCodec:
+    """
+    Encodes request bodies to UTF-8 JSON bytes and decodes response bodies,
+    with orjson or msgspec when installed and the ``json`` module otherwise.
+
+    Data the fast library refuses to encode (e.g. dicts with keys that are
+    neither strings nor numbers, or integers beyond 64 bits) is encoded with
+    the ``json`` module instead, so every codec accepts the same input.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[Union[bytes, str]], Any],
+    ):
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._dumps(obj)
+        except _ENCODE_ERRORS:
+            if self._dumps is _stdlib_dumps:
+                raise
+            return _stdlib_dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+_ENCODE_ERRORS = (TypeError, ValueError, OverflowError)
+if msgspec is not None:
+    _ENCODE_ERRORS += (msgspec.EncodeError,)
+
+
+def _msgspec_loads(data: Union[bytes, str]) -> Any:
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError as e:
+        # Callers handle invalid JSON as the json module reports it
+        raise ValueError(str(e)) from e
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+def _create_codec(name: str) -> Optional[JsonCodec]:
+    if name == ORJSON and orjson is not None:
+        return JsonCodec(
+            ORJSON,
+            lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            orjson.loads,
+        )
+    if name == MSGSPEC and msgspec is not None:
+        return JsonCodec(MSGSPEC, msgspec.json.encode, _msgspec_loads)
+    if name == STDLIB:
+        return JsonCodec(STDLIB, _stdlib_dumps, json.loads)
+    return None
+
+
+_codecs: Dict[str, JsonCodec] = {}
+
+
+def get_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Return the codec called ``name``: "orjson", "msgspec", "json", or
+    "auto" (the default) for the fastest one installed. A library that is
+    not installed falls back to "auto" with a warning.
+    """
+    name = (name or AUTO).lower()
+    codec = _codecs.get(name)
+    if codec is not None:
+        return codec
+    codec = _create_codec(name)
+    if codec is None:
+        if name != AUTO:
+            logger.warning("JSON codec %s is not available, using the fastest installed one", name)
+        for preferred in _PREFERRED_CODECS:
+            codec = _create_codec(preferred)
+            if codec is not None:
+                break
+    _codecs[name] = codec
+    return codec
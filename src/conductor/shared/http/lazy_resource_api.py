@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any, Optional, Type
+
+
+class LazyResourceApi:
+    """
+    Class attribute that creates a resource API for the ``api_client`` of the
+    instance on first access.
+
+    The API object is then stored on the instance under the same name, so
+    later lookups are plain attribute reads and the attribute can still be
+    reassigned (e.g. with a mock in tests).
+    """
+
+    def __init__(self, api_class: Type[Any]):
+        self.api_class = api_class
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        api = self.api_class(instance.api_client)
+        instance.__dict__[self.name] = api
+        return api
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.shared.http.json_codec import get_json_codec
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+T = TypeVar("T")
+
+DEFAULT_METADATA_CACHE_SIZE = 1024
+
+SNAPSHOT_FORMAT_VERSION = 2
+
+
+class _Entry:
+    __slots__ = ("expires_at", "data")
+
+    def __init__(self, expires_at: float, data: bytes):
+        # time.monotonic() after which the entry is stale
+        self.expires_at = expires_at
+        # JSON of the value; every hit builds a new value from it
+        self.data = data
+
+
+class MetadataCache:
+    """
+    In-memory LRU cache of definitions read from the server. Entries expire
+    ``ttl_seconds`` after they were fetched, and the least recently used
+    entry is evicted once the cache holds ``max_size`` of them. Clients
+    invalidate the entries of the definitions they change.
+
+    Values are kept as JSON, and every hit returns a new value built from
+    it, so callers may modify what they get without affecting the cache.
+
+    With a ``snapshot_path``, the fresh entries are written to that file at
+    exit (or by ``save_snapshot``) and read back when the cache is created,
+    so a new process starts warm. A snapshot is only read back by a cache
+    with the same ``scope``, which identifies the server and credentials the
+    entries were read with. Cached keys are tuples of a namespace and a
+    definition name, followed by anything else that identifies the value,
+    e.g. ``("workflow_def", "order", 2)``.
+
+    ``hits``, ``misses`` and ``evictions`` count lookups that found a fresh
+    entry, lookups that did not, and entries dropped to make room.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int = DEFAULT_METADATA_CACHE_SIZE,
+        snapshot_path: Optional[str] = None,
+        scope: Optional[str] = None,
+    ):
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.snapshot_path = snapshot_path
+        self.scope = scope
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._codec = get_json_codec()
+        if snapshot_path is not None:
+            self.__load_snapshot()
+            atexit.register(self.save_snapshot)
+
+    def get(self, key: Tuple, from_data: Callable[[Any], T]) -> Optional[T]:
+        """
+        Return a new value built by ``from_data`` from the cached data of
+        ``key``, or None when there is no fresh entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        try:
+            return from_data(self._codec.loads(entry.data))
+        except Exception as e:
+            logger.warning("Failed to read cached %s, reason: %s", key, e)
+            self.invalidate(*key)
+            return None
+
+    def put(self, key: Tuple, value: Any, to_data: Callable[[Any], Any]) -> None:
+        """Cache ``value``, which ``to_data`` converts to JSON data."""
+        if value is None:
+            return
+        try:
+            data = self._codec.dumps(to_data(value))
+        except Exception as e:
+            logger.debug("Not caching %s, reason: %s", key, e)
+            return
+        entry = _Entry(time.monotonic() + self.ttl_seconds, data)
+        with self._lock:
+            self.__set(key, entry)
+
+    def invalidate(self, namespace: str, name: Optional[str] = None, *rest: Any) -> None:
+        """
+        Drop the entries of a namespace, of one definition in it, or the
+        single entry whose key is given in full.
+        """
+        prefix = (namespace,) if name is None else (namespace, name, *rest)
+        with self._lock:
+            for key in [key for key in self._entries if key[:len(prefix)] == prefix]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def save_snapshot(self) -> None:
+        """Write the fresh entries to ``snapshot_path``, replacing the file atomically."""
+        if self.snapshot_path is None:
+            return
+        now_monotonic, now = time.monotonic(), time.time()
+        with self._lock:
+            entries = [(key, entry) for key, entry in self._entries.items() if entry.expires_at > now_monotonic]
+        # Expiry is stored as wall clock time, which outlives the process
+        records = [
+            [list(key), now + entry.expires_at - now_monotonic, self._codec.loads(entry.data)]
+            for key, entry in entries
+        ]
+        snapshot = {"version": SNAPSHOT_FORMAT_VERSION, "scope": self.scope, "entries": records}
+        directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(prefix=".conductor-metadata-", dir=directory)
+            with os.fdopen(fd, "wb") as file:
+                file.write(self._codec.dumps(snapshot))
+            os.replace(temp_path, self.snapshot_path)
+        except Exception as e:
+            logger.warning("Failed to save metadata cache snapshot to %s, reason: %s", self.snapshot_path, e)
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    def __load_snapshot(self) -> None:
+        try:
+            with open(self.snapshot_path, "rb") as file:
+                snapshot = self._codec.loads(file.read())
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("Ignoring metadata cache snapshot %s, reason: %s", self.snapshot_path, e)
+            return
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_FORMAT_VERSION:
+            logger.warning("Ignoring metadata cache snapshot %s with an unknown format", self.snapshot_path)
+            return
+        if snapshot.get("scope") != self.scope:
+            logger.warning("Ignoring metadata cache snapshot %s saved for another server or key", self.snapshot_path)
+            return
+        now_monotonic, now = time.monotonic(), time.time()
+        loaded = 0
+        for key, expires_at, data in snapshot.get("entries", []):
+            if expires_at <= now:
+                continue
+            expires_in = min(expires_at - now, self.ttl_seconds)
+            self.__set(tuple(key), _Entry(now_monotonic + expires_in, self._codec.dumps(data)))
+            loaded += 1
+        logger.debug("Loaded %s entries from metadata cache snapshot %s", loaded, self.snapshot_path)
+
+    def __set(self, key: Tuple, entry: _Entry) -> None:
+        # Called with the lock held
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+_caches: Dict[Tuple, MetadataCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_metadata_cache(
+    server_url: str,
+    auth_key_id: Optional[str],
+    ttl_seconds: Optional[float],
+    max_size: int = DEFAULT_METADATA_CACHE_SIZE,
+    snapshot_path: Optional[str] = None,
+) -> Optional[MetadataCache]:
+    """
+    Return the cache shared by the clients of a server that use the same
+    key id and settings, or None when caching is disabled, i.e.
+    ``ttl_seconds`` is not positive. Clients with different keys never
+    share cached definitions, which they may not be authorized to read.
+    """
+    if not ttl_seconds or ttl_seconds <= 0:
+        return None
+    key = (server_url, auth_key_id, ttl_seconds, max_size, snapshot_path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            scope = f"{server_url} {auth_key_id or ''}".rstrip()
+            cache = _caches[key] = MetadataCache(ttl_seconds, max_size, snapshot_path, scope)
+        return cache
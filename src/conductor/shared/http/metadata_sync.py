@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+)
+
+from conductor.client.configuration.configuration import Configuration
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+T = TypeVar("T")
+
+DEFAULT_SYNC_CONCURRENCY = 8
+
+# Set by the server, they do not change what a definition does
+_SERVER_MANAGED_KEYS = frozenset(("createTime", "updateTime", "createdBy", "updatedBy", "ownerApp"))
+# Filled in from the caller when a definition leaves them unset, so they
+# are only compared when the local definition sets them
+_CALLER_KEYS = frozenset(("ownerEmail",))
+
+# The values the server gives the fields a definition leaves unset
+TASK_DEF_DEFAULTS = {
+    "retryCount": 3,
+    "retryLogic": "FIXED",
+    "retryDelaySeconds": 60,
+    "timeoutPolicy": "TIME_OUT_WF",
+    "responseTimeoutSeconds": 3600,
+    "totalTimeoutSeconds": 0,
+    "rateLimitPerFrequency": 0,
+    "rateLimitFrequencyInSeconds": 1,
+    "backoffScaleFactor": 1,
+    "enforceSchema": False,
+}
+WORKFLOW_DEF_DEFAULTS = {
+    "version": 1,
+    "schemaVersion": 2,
+    "restartable": True,
+    "workflowStatusListenerEnabled": False,
+    "timeoutPolicy": "ALERT_ONLY",
+    "timeoutSeconds": 0,
+    "enforceSchema": True,
+}
+WORKFLOW_TASK_DEFAULTS = {
+    "type": "SIMPLE",
+    "startDelay": 0,
+    "optional": False,
+    "asyncComplete": False,
+    "permissive": False,
+}
+
+# A definition to push: its name, whether the server does not have it yet,
+# and the call that pushes it
+MetadataPush = Tuple[str, bool, Callable[[], Any]]
+
+
+@dataclass
+class MetadataSyncResult:
+    """
+    What a metadata sync did: the names of the definitions it created and
+    updated, how many were already up to date, and why pushes failed, by
+    definition name.
+    """
+
+    created: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def combine(self, other: MetadataSyncResult) -> MetadataSyncResult:
+        return MetadataSyncResult(
+            self.created + other.created,
+            self.updated + other.updated,
+            self.unchanged + other.unchanged,
+            {**self.errors, **other.errors},
+        )
+
+
+def canonicalize(data: Any) -> Any:
+    """
+    Return the JSON data of a definition without the fields the server
+    manages and without empty values, so definitions that mean the same
+    have the same canonical form.
+    """
+    if isinstance(data, dict):
+        canonical = {}
+        for key, value in data.items():
+            if key in _SERVER_MANAGED_KEYS:
+                continue
+            value = canonicalize(value)
+            if value is None or value == "" or value == [] or value == {}:
+                continue
+            canonical[key] = value
+        return canonical
+    if isinstance(data, (list, tuple)):
+        return [canonicalize(item) for item in data]
+    if isinstance(data, Enum):
+        return data.value
+    return data
+
+
+def definition_hash(data: Any) -> str:
+    """Return the SHA-256 of the canonical JSON of a definition."""
+    content = json.dumps(canonicalize(data), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def workflow_def_key(data: Dict[str, Any]) -> Hashable:
+    # The server stores a workflow definition without a version as version 1
+    return data.get("name"), data.get("version") or 1
+
+
+def task_def_key(data: Dict[str, Any]) -> Hashable:
+    return data.get("name")
+
+
+def diff_definitions(
+    local_defs: Iterable[T],
+    remote_defs: Iterable[Any],
+    to_dict: Callable[[Any], Dict[str, Any]],
+    key: Callable[[Dict[str, Any]], Hashable],
+    defaults: Dict[str, Any],
+) -> Tuple[List[T], List[T], int]:
+    """
+    Compare definitions with the server's, and return the ones it does not
+    have, the ones that differ from its own, and how many are the same.
+
+    The server fills in ``defaults`` (and ``WORKFLOW_TASK_DEFAULTS`` for the
+    tasks of a workflow) for the fields a definition leaves unset, so fields
+    with their default value are left out of both sides before their
+    canonical forms are compared. Every other field counts, so a field
+    removed or emptied locally makes the definition differ.
+    """
+    remote_by_key = {}
+    for remote_def in remote_defs:
+        remote = canonicalize(to_dict(remote_def))
+        remote_by_key[key(remote)] = _without_defaults(remote, defaults)
+    local_by_key = {}
+    for local_def in local_defs:
+        local = canonicalize(to_dict(local_def))
+        # The last definition with a key wins, as it would on the server
+        local_by_key[key(local)] = (local_def, _without_defaults(local, defaults))
+    missing, changed, unchanged = [], [], 0
+    for def_key, (local_def, local) in local_by_key.items():
+        remote = remote_by_key.get(def_key)
+        if remote is None:
+            missing.append(local_def)
+            continue
+        remote = {field: value for field, value in remote.items() if field not in _CALLER_KEYS or field in local}
+        if definition_hash(local) != definition_hash(remote):
+            changed.append(local_def)
+        else:
+            unchanged += 1
+    return missing, changed, unchanged
+
+
+def run_metadata_sync(
+    pushes: List[MetadataPush],
+    unchanged: int,
+    max_concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+) -> MetadataSyncResult:
+    """Make the pushes, up to ``max_concurrency`` at a time."""
+    _check_concurrency(max_concurrency)
+    if not pushes:
+        return MetadataSyncResult(unchanged=unchanged)
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(pushes)), thread_name_prefix="conductor-metadata-sync"
+    ) as executor:
+        errors = list(executor.map(lambda push: _call(push[2]), pushes))
+    return _get_result(pushes, errors, unchanged)
+
+
+async def async_run_metadata_sync(
+    pushes: List[Tuple[str, bool, Callable[[], Awaitable[Any]]]],
+    unchanged: int,
+    max_concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+) -> MetadataSyncResult:
+    """Async counterpart of ``run_metadata_sync``."""
+    _check_concurrency(max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(push: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            try:
+                await push()
+            except Exception as e:
+                return e
+            return None
+
+    errors = await asyncio.gather(*(call(push) for _, _, push in pushes))
+    return _get_result(pushes, errors, unchanged)
+
+
+def _without_defaults(data: Any, defaults: Dict[str, Any]) -> Any:
+    # The canonical data without the fields that have their default value
+    if isinstance(data, dict):
+        if "taskReferenceName" in data:
+            defaults = WORKFLOW_TASK_DEFAULTS
+        return {
+            key: _without_defaults(value, {})
+            for key, value in data.items()
+            if key not in defaults or defaults[key] != value
+        }
+    if isinstance(data, list):
+        return [_without_defaults(item, {}) for item in data]
+    return data
+
+
+def _call(push: Callable[[], Any]) -> Any:
+    try:
+        push()
+    except Exception as e:
+        return e
+    return None
+
+
+def _get_result(pushes: List[Tuple[str, bool, Any]], errors: List[Any], unchanged: int) -> MetadataSyncResult:
+    result = MetadataSyncResult(unchanged=unchanged)
+    for (name, missing, _), error in zip(pushes, errors):
+        if error is not None:
+            logger.warning("Failed to push definition %s, reason: %s", name, error)
+            result.errors[name] = str(error)
+        elif missing:
+            result.created.append(name)
+        else:
+            result.updated.append(name)
+    return result
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
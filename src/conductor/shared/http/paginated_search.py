@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+
+# A search page as the server sends it, e.g. {"totalHits": 2, "results": [...]}
+SearchPage = Dict[str, Any]
+
+
+def iter_search_results(
+    fetch_page: Callable[[int, int], SearchPage],
+    deserialize: Callable[[Any], T],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[T]:
+    """
+    Yield every result of a search, one page of ``page_size`` results at a
+    time. ``fetch_page(start, size)`` returns the decoded JSON of a page.
+
+    The next page is fetched in a background thread while the caller
+    consumes the current one, and results are deserialized with
+    ``deserialize`` only as they are yielded, so at most two pages of raw
+    results are held at once however many the search matches.
+    """
+    _check_page_size(page_size)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conductor-search")
+    try:
+        start = 0
+        next_page = executor.submit(fetch_page, start, page_size)
+        while next_page is not None:
+            page = next_page.result()
+            results = _get_results(page)
+            start += len(results)
+            next_page = None
+            if _has_more(page, results, start, page_size):
+                next_page = executor.submit(fetch_page, start, page_size)
+            del page
+            for result in _drain(results):
+                yield deserialize(result)
+    finally:
+        # The caller may stop early; do not wait for a page nobody reads
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_search_results(
+    fetch_page: Callable[[int, int], Awaitable[SearchPage]],
+    deserialize: Callable[[Any], T],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[T]:
+    """
+    Async counterpart of ``iter_search_results``: the next page is fetched
+    in a task while the caller consumes the current one.
+    """
+    _check_page_size(page_size)
+    start = 0
+    next_page: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(start, page_size))
+    try:
+        while next_page is not None:
+            page = await next_page
+            results = _get_results(page)
+            start += len(results)
+            next_page = None
+            if _has_more(page, results, start, page_size):
+                next_page = asyncio.ensure_future(fetch_page(start, page_size))
+            del page
+            for result in _drain(results):
+                yield deserialize(result)
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+def _get_results(page: Optional[SearchPage]) -> List[Any]:
+    if not page:
+        return []
+    return page.get("results") or []
+
+
+def _has_more(page: SearchPage, results: List[Any], start: int, page_size: int) -> bool:
+    if not results:
+        return False
+    total_hits = page.get("totalHits")
+    if total_hits is not None:
+        return start < total_hits
+    return len(results) == page_size
+
+
+def _drain(results: List[Any]) -> Iterator[Any]:
+    # Drops every raw result once it is yielded, so consumed results of the
+    # page can be freed before the rest of it is
+    results.reverse()
+    while results:
+        yield results.pop()
+
+
+def _check_page_size(page_size: int) -> None:
+    if page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Optional
+
+from conductor.client.configuration.configuration import Configuration
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+DEFAULT_REFRESH_AHEAD_RATIO = 0.8
+DEFAULT_RETRY_INTERVAL_SECONDS = 5.0
+
+_refreshers: "weakref.WeakKeyDictionary[Configuration, TokenRefresher]" = weakref.WeakKeyDictionary()
+_refreshers_lock = threading.Lock()
+
+
+def get_token_refresher(configuration: Configuration) -> TokenRefresher:
+    """
+    Return the refresher of ``configuration``, which is shared by every API
+    client of the process using that configuration.
+    """
+    refresher = _refreshers.get(configuration)
+    if refresher is None:
+        with _refreshers_lock:
+            refresher = _refreshers.get(configuration)
+            if refresher is None:
+                refresher = TokenRefresher(configuration)
+                _refreshers[configuration] = refresher
+    return refresher
+
+
+class TokenRefresher:
+    """
+    Keeps the auth token of a ``Configuration`` valid without making requests
+    wait for ``/token``.
+
+    A background thread replaces the token once ``refresh_ahead_ratio`` of
+    ``auth_token_ttl_msec`` has passed. Requests only refresh inline when the
+    token did expire anyway, e.g. because the background refresh failed.
+    Refreshes are single-flight: threads that need a new token while another
+    one is fetching it wait for that token instead of fetching their own.
+
+    With a ``metrics_collector``, the time spent on every refresh and every
+    failed refresh are recorded.
+    """
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        refresh_ahead_ratio: float = DEFAULT_REFRESH_AHEAD_RATIO,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL_SECONDS,
+    ):
+        self.configuration = configuration
+        self.refresh_ahead_ratio = refresh_ahead_ratio
+        self.retry_interval = retry_interval
+        self.metrics_collector: Optional[Any] = None
+        self._refresh_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._fetch_token: Optional[Callable[[], Optional[Callable[[], Optional[str]]]]] = None
+        self._local = threading.local()
+
+    def get_token(self, fetch_token: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Return the token to send with a request, refreshing it first if it
+        expired. ``fetch_token`` requests a new token from the server.
+        """
+        token = self.configuration.AUTH_TOKEN
+        if token is None:
+            return None
+        self.start(fetch_token)
+        if self.is_expired():
+            logger.debug("Authentication token expired, refreshing it inline")
+            token = self.refresh(fetch_token, stale_token=token)
+        self._local.token = token
+        return token
+
+    def force_refresh(self, fetch_token: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Replace the token the calling thread last sent, which the server
+        rejected. Does not fetch again if another thread already replaced it.
+        """
+        stale_token = getattr(self._local, "token", self.configuration.AUTH_TOKEN)
+        return self.refresh(fetch_token, stale_token=stale_token)
+
+    def refresh(
+        self,
+        fetch_token: Callable[[], Optional[str]],
+        stale_token: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Replace the token with one from ``fetch_token``, unless it is no
+        longer ``stale_token``. A failed fetch keeps the current token.
+
+        :return: the current token
+        """
+        with self._refresh_lock:
+            token = self.configuration.AUTH_TOKEN
+            if token is not None and token != stale_token:
+                return token
+            start_time = time.time()
+            try:
+                new_token = fetch_token()
+            except Exception as e:
+                self.__record_failure(e)
+                logger.error("Failed to refresh authentication token, reason: %s", e)
+                return token
+            if new_token is None:
+                # The failure was already logged by the API client
+                self.__record_failure(Exception("no token received"))
+                return token
+            self.__record_time(time.time() - start_time)
+            self.configuration.update_token(new_token)
+            logger.debug("Refreshed authentication token")
+            return new_token
+
+    def is_expired(self) -> bool:
+        now = round(time.time() * 1000)
+        return now - self.configuration.token_update_time > self.configuration.auth_token_ttl_msec
+
+    def start(self, fetch_token: Callable[[], Optional[str]]) -> None:
+        """
+        Start the background refresh unless it is running. ``fetch_token`` is
+        only weakly referenced, so the refresher does not keep the API client
+        it belongs to alive; a later call replaces it once it is gone.
+        """
+        if self.configuration.authentication_settings is None:
+            return
+        if self._thread is not None and self._thread.is_alive() and self.__get_fetch_token() is not None:
+            return
+        with self._thread_lock:
+            if self.__get_fetch_token() is None:
+                self._fetch_token = _weak_callable(fetch_token)
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self.__run, name="conductor-token-refresher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def __run(self) -> None:
+        while True:
+            delay = self.__get_seconds_until_refresh()
+            if delay > 0:
+                # Requests may have refreshed the token meanwhile, so check again
+                if self._stop_event.wait(delay):
+                    return
+                continue
+            fetch_token = self.__get_fetch_token()
+            if fetch_token is None:
+                # The API client is gone; the next one to send a request
+                # starts the refresh again
+                return
+            try:
+                self.refresh(fetch_token, stale_token=self.configuration.AUTH_TOKEN)
+            except Exception as e:
+                logger.error("Failed to refresh authentication token, reason: %s", e)
+            del fetch_token
+            if self.__get_seconds_until_refresh() <= 0 and self._stop_event.wait(self.retry_interval):
+                return
+
+    def __get_seconds_until_refresh(self) -> float:
+        if self.configuration.AUTH_TOKEN is None:
+            return 0
+        refresh_at = (
+            self.configuration.token_update_time
+            + self.configuration.auth_token_ttl_msec * self.refresh_ahead_ratio
+        )
+        return (refresh_at - time.time() * 1000) / 1000
+
+    def __get_fetch_token(self) -> Optional[Callable[[], Optional[str]]]:
+        if self._fetch_token is None:
+            return None
+        return self._fetch_token()
+
+    def __record_time(self, time_spent: float) -> None:
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_token_refresh_time(time_spent)
+
+    def __record_failure(self, exception: Exception) -> None:
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_token_refresh_error(exception)
+
+
+def _weak_callable(function: Callable) -> Callable[[], Optional[Callable]]:
+    try:
+        return weakref.WeakMethod(function)
+    except TypeError:
+        # Not a bound method
+        return lambda: function
+
+
+def _reset_after_fork() -> None:
+    # Threads do not survive a fork, and a lock may have been held by one
+    global _refreshers, _refreshers_lock
+    _refreshers = weakref.WeakKeyDictionary()
+    _refreshers_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -10,10 +10,17 @@ class MetricDocumentation(str, Enum):
     TASK_EXECUTION_QUEUE_FULL = "Counter to record execution queue has saturated"
     TASK_PAUSED = "Counter for number of times the task has been polled, when the worker has been paused"
     TASK_POLL = "Incremented each time polling is done"
+    TASK_POLL_BACKOFF = "Seconds the worker waits before its next poll"
+    TASK_POLL_EMPTY = "Incremented each time polling returns no task"
     TASK_POLL_ERROR = "Client error when polling for a task queue"
     TASK_POLL_TIME = "Time to poll for a batch of tasks"
     TASK_RESULT_SIZE = "Records output payload size of a task"
     TASK_UPDATE_ERROR = "Task status cannot be updated back to server"
+    TASK_UPDATE_QUEUE_DEPTH = "Number of task results waiting to be updated back to server"
+    TASK_UPDATE_TIME = "Time to update a task result back to server"
     THREAD_UNCAUGHT_EXCEPTION = "thread_uncaught_exceptions"
+    TOKEN_REFRESH_ERROR = "Counter for failed authentication token refreshes"
+    TOKEN_REFRESH_TIME = "Time to obtain a new authentication token"
     WORKFLOW_START_ERROR = "Counter for workflow start errors"
+    WORKFLOW_START_THROUGHPUT = "Workflows started per second by a bulk start"
     WORKFLOW_INPUT_SIZE = "Records input payload size of a workflow"
@@ -5,6 +5,8 @@ from conductor.shared.workflow.models.http_poll_input import HttpPollInput
 from conductor.shared.workflow.models.kafka_publish_input import \
     KafkaPublishInput
 from conductor.shared.workflow.models.prompt import Prompt
+from conductor.shared.workflow.models.workflow_start_result import \
+    WorkflowStartResult
 
 __all__ = [
     "ChatMessage",
@@ -13,4 +15,5 @@ __all__ = [
     "HttpPollInput",
     "KafkaPublishInput",
     "Prompt",
+    "WorkflowStartResult",
 ]
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class WorkflowStartResult:
+    """
+    Outcome of starting one workflow of a bulk start: the id of the started
+    workflow, or the error that prevented starting it.
+    """
+
+    request: Any
+    workflow_id: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.workflow_id is not None
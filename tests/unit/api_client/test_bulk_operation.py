@@ -0,0 +1,112 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from conductor.client.codegen.rest import ApiException
+from conductor.client.http.models.bulk_response import BulkResponse
+from conductor.shared.http import bulk_operation
+from conductor.shared.http.bulk_operation import (
+    async_run_bulk_operation,
+    run_bulk_operation,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(bulk_operation, "RETRY_DELAY_SECONDS", 0)
+
+
+def test_ids_are_sent_in_chunks_and_responses_merged():
+    chunks = []
+    lock = threading.Lock()
+
+    def operation(chunk):
+        with lock:
+            chunks.append(chunk)
+        return BulkResponse(bulk_successful_results=list(chunk))
+
+    workflow_ids = [f"wf_{i}" for i in range(25)]
+    successful, errors = run_bulk_operation(operation, iter(workflow_ids), chunk_size=10)
+
+    assert sorted(len(chunk) for chunk in chunks) == [5, 10, 10]
+    assert sorted(successful) == sorted(workflow_ids)
+    assert errors == {}
+
+
+def test_duplicate_ids_are_sent_once():
+    operation = MagicMock(return_value=BulkResponse(bulk_successful_results=["wf_1", "wf_2"]))
+
+    run_bulk_operation(operation, ["wf_1", "wf_2", "wf_1"])
+
+    operation.assert_called_once_with(["wf_1", "wf_2"])
+
+
+def test_only_chunks_whose_request_failed_are_retried():
+    operation = MagicMock(side_effect=[
+        BulkResponse(bulk_successful_results=["wf_1"], bulk_error_results={"wf_2": "not found"}),
+        Exception("gateway timeout"),
+        BulkResponse(bulk_successful_results=["wf_3"]),
+    ])
+
+    successful, errors = run_bulk_operation(operation, ["wf_1", "wf_2", "wf_3"], chunk_size=2, max_concurrency=1)
+
+    assert [call.args[0] for call in operation.call_args_list] == [["wf_1", "wf_2"], ["wf_3"], ["wf_3"]]
+    assert successful == ["wf_1", "wf_3"]
+    assert errors == {"wf_2": "not found"}
+
+
+def test_failed_request_fails_each_id_of_its_chunk():
+    operation = MagicMock(side_effect=[
+        Exception("gateway timeout"),
+        BulkResponse(bulk_successful_results=["wf_1", "wf_2"]),
+    ])
+
+    assert run_bulk_operation(operation, ["wf_1", "wf_2"], retries=0) == ([], {
+        "wf_1": "gateway timeout", "wf_2": "gateway timeout"
+    })
+    assert run_bulk_operation(operation, ["wf_1", "wf_2"], retries=0) == (["wf_1", "wf_2"], {})
+
+
+def test_request_rejected_by_server_is_not_retried():
+    operation = MagicMock(side_effect=ApiException(status=400, reason="Bad Request"))
+
+    successful, errors = run_bulk_operation(operation, ["wf_1", "wf_2"], retries=2)
+
+    operation.assert_called_once()
+    assert successful == []
+    assert list(errors) == ["wf_1", "wf_2"]
+
+
+def test_invalid_chunk_size_is_rejected():
+    with pytest.raises(ValueError):
+        run_bulk_operation(MagicMock(), ["wf_1"], chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_async_failed_chunks_are_retried_with_bounded_concurrency():
+    in_flight = []
+    max_in_flight = []
+    attempts = {}
+
+    async def operation(chunk):
+        in_flight.append(chunk)
+        max_in_flight.append(len(in_flight))
+        await bulk_operation.asyncio.sleep(0)
+        in_flight.remove(chunk)
+        for workflow_id in chunk:
+            attempts[workflow_id] = attempts.get(workflow_id, 0) + 1
+        if "wf_0" in chunk and attempts["wf_0"] == 1:
+            raise ApiException(status=503, reason="Service Unavailable")
+        return BulkResponse(bulk_successful_results=list(chunk))
+
+    workflow_ids = [f"wf_{i}" for i in range(10)]
+    successful, errors = await async_run_bulk_operation(
+        operation, workflow_ids, chunk_size=2, max_concurrency=2
+    )
+
+    assert sorted(successful) == sorted(workflow_ids)
+    assert errors == {}
+    assert attempts["wf_0"] == attempts["wf_1"] == 2
+    assert attempts["wf_2"] == 1
+    assert max(max_in_flight) == 2
@@ -0,0 +1,87 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from conductor.asyncio_client.configuration.configuration import (
+    Configuration as AsyncConfiguration,
+)
+from conductor.asyncio_client.http.rest import RESTClientObject as AsyncRESTClientObject
+from conductor.client.adapters.rest_adapter import RESTClientObjectAdapter
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.shared.http import json_codec
+from conductor.shared.http.json_codec import JsonCodec, get_json_codec
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec", "json", "auto"])
+def test_codecs_round_trip(name):
+    codec = get_json_codec(name)
+    data = {"text": "żółw", "number": 1.5, "items": [1, None, True], "nested": {"a": "b"}}
+
+    encoded = codec.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == data
+    assert codec.loads(encoded) == data
+    assert codec.loads(encoded.decode("utf-8")) == data
+
+
+def test_auto_prefers_fastest_installed_codec():
+    if json_codec.orjson is not None:
+        assert get_json_codec().name == "orjson"
+    elif json_codec.msgspec is not None:
+        assert get_json_codec().name == "msgspec"
+    else:
+        assert get_json_codec().name == "json"
+
+
+def test_unknown_codec_falls_back_to_auto():
+    assert get_json_codec("no-such-codec").name == get_json_codec("auto").name
+
+
+def test_data_refused_by_fast_codec_is_encoded_with_json_module():
+    def refuse(obj):
+        raise TypeError("unsupported")
+
+    codec = JsonCodec("fast", refuse, json.loads)
+
+    assert json.loads(codec.dumps({1: 2 ** 70})) == {"1": 2 ** 70}
+
+
+def test_invalid_json_raises_value_error():
+    for name in ["orjson", "msgspec", "json"]:
+        with pytest.raises(ValueError):
+            get_json_codec(name).loads(b"not json")
+
+
+def test_rest_client_sends_encoded_bytes():
+    connection = MagicMock()
+    connection.request.return_value.status_code = 200
+    rest_client = RESTClientObjectAdapter(
+        connection=connection, json_codec=get_json_codec("json")
+    )
+
+    rest_client.POST("http://localhost/api/workflow", body={"name": "workflow"})
+
+    kwargs = connection.request.call_args.kwargs
+    assert kwargs["content"] == b'{"name": "workflow"}'
+    assert "json" not in kwargs
+
+
+def test_api_client_uses_configured_codec():
+    api_client = ApiClient(configuration=Configuration(json_codec="json"))
+    response = MagicMock()
+    response.resp.content = b'{"taskId": "task-id"}'
+
+    task = api_client.deserialize(response, "Task")
+
+    assert api_client.json_codec.name == "json"
+    assert api_client.rest_client.json_codec is api_client.json_codec
+    assert task.task_id == "task-id"
+
+
+def test_async_rest_client_uses_configured_codec():
+    rest_client = AsyncRESTClientObject(AsyncConfiguration(json_codec="json"))
+
+    assert rest_client.json_codec.name == "json"
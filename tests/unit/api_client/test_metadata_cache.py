@@ -0,0 +1,129 @@
+import json
+
+import pytest
+
+from conductor.client.helpers.model_deserializer import get_deserializer
+from conductor.client.helpers.model_serializer import serialize
+from conductor.client.http.models.workflow_def import WorkflowDefAdapter as WorkflowDef
+from conductor.shared.http import metadata_cache
+from conductor.shared.http.metadata_cache import MetadataCache, get_metadata_cache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(mocker):
+    clock = Clock()
+    mocker.patch.object(metadata_cache.time, "monotonic", clock)
+    return clock
+
+
+def identity(data):
+    return data
+
+
+def test_get_returns_copies(clock):
+    cache = MetadataCache(ttl_seconds=10)
+    cache.put(("task_def", "task"), {"name": "task", "inputKeys": ["a"]}, identity)
+    value = cache.get(("task_def", "task"), identity)
+    value["inputKeys"].append("b")
+    assert cache.get(("task_def", "task"), identity) == {"name": "task", "inputKeys": ["a"]}
+
+
+def test_get_returns_put_value_until_it_expires(clock):
+    cache = MetadataCache(ttl_seconds=10)
+    cache.put(("workflow_def", "wf", 1), "definition", identity)
+    clock.now += 9
+    assert cache.get(("workflow_def", "wf", 1), identity) == "definition"
+    clock.now += 1
+    assert cache.get(("workflow_def", "wf", 1), identity) is None
+    assert cache.stats() == {"size": 0, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_put_ignores_none():
+    cache = MetadataCache(ttl_seconds=10)
+    cache.put(("task_def", "task"), None, identity)
+    assert cache.get(("task_def", "task"), identity) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = MetadataCache(ttl_seconds=10, max_size=2)
+    cache.put(("task_def", "a"), "a", identity)
+    cache.put(("task_def", "b"), "b", identity)
+    cache.get(("task_def", "a"), identity)
+    cache.put(("task_def", "c"), "c", identity)
+    assert cache.get(("task_def", "b"), identity) is None
+    assert cache.get(("task_def", "a"), identity) == "a"
+    assert cache.get(("task_def", "c"), identity) == "c"
+    assert cache.evictions == 1
+
+
+def test_invalidate_drops_all_versions_of_a_definition():
+    cache = MetadataCache(ttl_seconds=10)
+    cache.put(("workflow_def", "wf", 1), "v1", identity)
+    cache.put(("workflow_def", "wf", None), "latest", identity)
+    cache.put(("workflow_def", "other", 1), "other", identity)
+    cache.put(("task_def", "wf"), "task", identity)
+    cache.invalidate("workflow_def", "wf")
+    assert cache.get(("workflow_def", "wf", 1), identity) is None
+    assert cache.get(("workflow_def", "wf", None), identity) is None
+    assert cache.get(("workflow_def", "other", 1), identity) == "other"
+    assert cache.get(("task_def", "wf"), identity) == "task"
+    cache.invalidate("workflow_def")
+    assert cache.get(("workflow_def", "other", 1), identity) is None
+
+
+def test_snapshot_warms_a_new_cache(tmp_path):
+    path = str(tmp_path / "metadata.json")
+    cache = MetadataCache(ttl_seconds=60, snapshot_path=path, scope="server key")
+    cache.put(("workflow_def", "wf", 2), WorkflowDef(name="wf", version=2), serialize)
+    cache.save_snapshot()
+
+    assert MetadataCache(ttl_seconds=60, snapshot_path=path, scope="server other").stats()["size"] == 0
+    warm = MetadataCache(ttl_seconds=60, snapshot_path=path, scope="server key")
+    workflow_def = warm.get(("workflow_def", "wf", 2), get_deserializer("WorkflowDef"))
+    assert isinstance(workflow_def, WorkflowDef)
+    assert (workflow_def.name, workflow_def.version) == ("wf", 2)
+    assert warm.hits == 1
+
+
+def test_snapshot_skips_expired_entries(tmp_path):
+    path = tmp_path / "metadata.json"
+    path.write_text(json.dumps({
+        "version": metadata_cache.SNAPSHOT_FORMAT_VERSION,
+        "scope": None,
+        "entries": [[["task_def", "old"], 1.0, {"name": "old"}]],
+    }))
+    cache = MetadataCache(ttl_seconds=60, snapshot_path=str(path))
+    assert cache.get(("task_def", "old"), identity) is None
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "metadata.json"
+    path.write_text("not json")
+    cache = MetadataCache(ttl_seconds=60, snapshot_path=str(path))
+    assert cache.stats()["size"] == 0
+
+
+def test_failed_snapshot_leaves_no_temp_file(mocker, tmp_path):
+    cache = MetadataCache(ttl_seconds=60, snapshot_path=str(tmp_path / "metadata.json"))
+    cache.put(("task_def", "task"), {"name": "task"}, identity)
+    mocker.patch.object(metadata_cache.os, "replace", side_effect=OSError("read-only"))
+    cache.save_snapshot()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_get_metadata_cache_is_shared_per_server_and_key():
+    assert get_metadata_cache("http://cache-test/api", None, 0) is None
+    assert get_metadata_cache("http://cache-test/api", None, None) is None
+    cache = get_metadata_cache("http://cache-test/api", "key", 30)
+    assert get_metadata_cache("http://cache-test/api", "key", 30) is cache
+    assert get_metadata_cache("http://cache-test/api", "other-key", 30) is not cache
+    assert get_metadata_cache("http://other-cache-test/api", "key", 30) is not cache
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from conductor.shared.http.metadata_sync import (
+    async_run_metadata_sync,
+    canonicalize,
+    definition_hash,
+    diff_definitions,
+    run_metadata_sync,
+    TASK_DEF_DEFAULTS,
+    WORKFLOW_DEF_DEFAULTS,
+    task_def_key,
+    workflow_def_key,
+)
+from conductor.shared.workflow.enums import TimeoutPolicy
+
+
+def identity(definition):
+    return definition
+
+
+def test_canonicalize_drops_server_managed_fields_and_empty_values():
+    data = {
+        "name": "wf",
+        "description": "",
+        "createTime": 1,
+        "updatedBy": "someone",
+        "inputParameters": [],
+        "outputParameters": {},
+        "timeoutPolicy": TimeoutPolicy.TIME_OUT_WORKFLOW,
+        "tasks": [{"name": "task", "inputParameters": {"a": None}}],
+    }
+    assert canonicalize(data) == {
+        "name": "wf",
+        "timeoutPolicy": "TIME_OUT_WF",
+        "tasks": [{"name": "task"}],
+    }
+
+
+def test_definition_hash_ignores_key_order():
+    assert definition_hash({"name": "task", "retryCount": 3}) == definition_hash({"retryCount": 3, "name": "task"})
+    assert definition_hash({"name": "task", "retryCount": 3}) != definition_hash({"name": "task", "retryCount": 2})
+
+
+def test_diff_definitions_ignores_server_defaults():
+    local = [
+        {"name": "same", "retryCount": 3, "inputKeys": []},
+        {"name": "changed", "retryCount": 3},
+        {"name": "missing"},
+    ]
+    remote = [
+        {"name": "same", "retryCount": 3, "responseTimeoutSeconds": 3600, "createTime": 1, "ownerEmail": "a@b.c"},
+        {"name": "changed", "retryCount": 2},
+        {"name": "unknown"},
+    ]
+    missing, changed, unchanged = diff_definitions(local, remote, identity, task_def_key, TASK_DEF_DEFAULTS)
+    assert missing == [{"name": "missing"}]
+    assert changed == [{"name": "changed", "retryCount": 3}]
+    assert unchanged == 1
+
+
+def test_diff_definitions_compares_nested_tasks_and_versions():
+    local_task = {"name": "task", "taskReferenceName": "ref", "type": "SIMPLE"}
+    remote_task = dict(local_task, startDelay=0, optional=False)
+    local = [
+        {"name": "wf", "tasks": [local_task]},
+        {"name": "wf", "version": 2, "tasks": [local_task, local_task]},
+    ]
+    remote = [
+        {"name": "wf", "version": 1, "tasks": [remote_task]},
+        {"name": "wf", "version": 2, "tasks": [remote_task]},
+    ]
+    missing, changed, unchanged = diff_definitions(local, remote, identity, workflow_def_key, WORKFLOW_DEF_DEFAULTS)
+    assert missing == []
+    assert changed == [local[1]]
+    assert unchanged == 1
+
+
+def test_diff_definitions_detects_removed_and_cleared_fields():
+    local = [
+        {"name": "removed", "inputKeys": []},
+        {"name": "cleared", "description": ""},
+        {"name": "reset", "retryCount": 3},
+    ]
+    remote = [
+        {"name": "removed", "inputKeys": ["a"]},
+        {"name": "cleared", "description": "old"},
+        {"name": "reset", "retryCount": 5},
+    ]
+    missing, changed, unchanged = diff_definitions(local, remote, identity, task_def_key, TASK_DEF_DEFAULTS)
+    assert changed == local
+    assert unchanged == 0
+
+
+def test_run_metadata_sync_reports_pushes():
+    def fail():
+        raise Exception("rejected")
+
+    pushes = [("created", True, lambda: None), ("updated", False, lambda: None), ("failed", False, fail)]
+    result = run_metadata_sync(pushes, unchanged=5, max_concurrency=2)
+    assert result.created == ["created"]
+    assert result.updated == ["updated"]
+    assert result.unchanged == 5
+    assert result.errors == {"failed": "rejected"}
+
+
+def test_run_metadata_sync_rejects_invalid_concurrency():
+    with pytest.raises(ValueError):
+        run_metadata_sync([], unchanged=0, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_async_run_metadata_sync_limits_concurrency():
+    running, max_running = 0, 0
+
+    async def push():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    pushes = [(f"task_{i}", True, push) for i in range(10)]
+    result = await async_run_metadata_sync(pushes, unchanged=0, max_concurrency=3)
+    assert len(result.created) == 10
+    assert max_running == 3
@@ -0,0 +1,113 @@
+import datetime
+
+import pytest
+
+from conductor.client.codegen.rest import ApiException
+from conductor.client.helpers.model_deserializer import get_deserializer
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.workflow import Workflow
+from conductor.client.http.models.workflow_def import WorkflowDef
+
+
+class Animal:
+    swagger_types = {"kind": "str"}
+    attribute_map = {"kind": "kind"}
+
+    def __init__(self, kind=None):
+        self.kind = kind
+
+    def get_real_child_model(self, data):
+        return "Task" if self.kind == "task" else None
+
+
+def get_workflow_data(task_count):
+    return {
+        "workflowId": "workflow-id",
+        "status": "RUNNING",
+        "input": {"key": [1, 2, {"nested": True}]},
+        "tasks": [
+            {
+                "taskId": f"task-{index}",
+                "taskType": "SIMPLE",
+                "status": "COMPLETED",
+                "pollCount": index,
+                "inputData": {"index": index},
+                "workflowTask": {"name": "task", "taskReferenceName": f"ref-{index}"},
+            }
+            for index in range(task_count)
+        ],
+    }
+
+
+def test_workflow_is_deserialized_with_nested_models():
+    workflow = ApiClient().deserialize_class(get_workflow_data(3), "Workflow")
+
+    assert isinstance(workflow, Workflow)
+    assert workflow.workflow_id == "workflow-id"
+    assert workflow.input == {"key": [1, 2, {"nested": True}]}
+    assert [task.task_id for task in workflow.tasks] == ["task-0", "task-1", "task-2"]
+    assert isinstance(workflow.tasks[2], Task)
+    assert workflow.tasks[2].poll_count == 2
+    assert workflow.tasks[2].workflow_task.task_reference_name == "ref-2"
+
+
+def test_type_strings_and_classes_share_deserializer():
+    assert get_deserializer("Task") is get_deserializer(Task)
+    assert get_deserializer("list[Task]") is get_deserializer("list[Task]")
+
+
+def test_containers_and_primitives():
+    api_client = ApiClient()
+
+    assert api_client.deserialize_class(["1", None], "list[int]") == [1, None]
+    assert api_client.deserialize_class(["a", "a"], "set[str]") == {"a"}
+    assert api_client.deserialize_class({"a": "1.5"}, "dict(str, float)") == {"a": 1.5}
+    assert api_client.deserialize_class(b"bytes", "str") == "bytes"
+    assert api_client.deserialize_class({"a": 1}, "int") == {"a": 1}
+    assert api_client.deserialize_class(None, "Workflow") is None
+
+
+def test_recursive_model_definitions():
+    data = {
+        "name": "workflow",
+        "tasks": [
+            {
+                "name": "fork",
+                "taskReferenceName": "fork",
+                "forkTasks": [[{"name": "inner", "taskReferenceName": "inner"}]],
+            }
+        ],
+    }
+
+    workflow_def = ApiClient().deserialize_class(data, WorkflowDef)
+
+    assert workflow_def.tasks[0].fork_tasks[0][0].task_reference_name == "inner"
+
+
+def test_unknown_type_fails_only_with_a_value():
+    api_client = ApiClient()
+
+    assert api_client.deserialize_class([], "list[NoSuchModel]") == []
+    assert api_client.deserialize_class([None], "list[NoSuchModel]") == [None]
+    with pytest.raises(AttributeError):
+        api_client.deserialize_class([{}], "list[NoSuchModel]")
+
+
+def test_dates_match_dateutil():
+    from dateutil.parser import parse
+
+    api_client = ApiClient()
+    for value in ["2024-02-03T04:05:06", "2024-02-03T04:05:06.123", "2024-02-03T04:05:06.123456",
+                  "2024-02-03T04:05:06Z", "2024-02-03 04:05"]:
+        assert api_client.deserialize_class(value, "datetime") == parse(value)
+    assert api_client.deserialize_class("2024-02-03", "date") == datetime.date(2024, 2, 3)
+    with pytest.raises(ApiException):
+        api_client.deserialize_class("not a date", "datetime")
+
+
+def test_real_child_model_is_deserialized():
+    assert isinstance(get_deserializer(Animal)({"kind": "task", "taskId": "id"}), Task)
+    animal = get_deserializer(Animal)({"kind": "dog"})
+    assert isinstance(animal, Animal)
+    assert animal.kind == "dog"
@@ -0,0 +1,72 @@
+import dataclasses
+import datetime
+import uuid
+
+from requests.structures import CaseInsensitiveDict
+
+from conductor.client.helpers.helper import ObjectMapper
+from conductor.client.helpers.model_serializer import serialize
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task_result import TaskResult
+from conductor.shared.http.enums.task_result_status import TaskResultStatus
+
+
+@dataclasses.dataclass
+class Order:
+    order_id: str
+    placed_at: datetime.date
+    note: str = None
+
+
+@dataclasses.dataclass(frozen=True)
+class Point:
+    __slots__ = ("x", "y")
+    x: int
+    y: int
+
+
+class Plain:
+    def __init__(self):
+        self.name = "plain"
+        self.missing = None
+
+
+def test_task_result_skips_none_fields():
+    task_result = TaskResult(
+        task_id="task-id",
+        workflow_instance_id="workflow-id",
+        status=TaskResultStatus.COMPLETED,
+        output_data={"values": (1, 2), "when": datetime.date(2024, 1, 2)},
+    )
+
+    data = ApiClient().sanitize_for_serialization(task_result)
+
+    assert data == {
+        "taskId": "task-id",
+        "workflowInstanceId": "workflow-id",
+        "status": "COMPLETED",
+        "outputData": {"values": (1, 2), "when": "2024-01-02"},
+    }
+
+
+def test_dataclasses_are_serialized_by_field():
+    assert serialize(Order("id", datetime.date(2024, 1, 2))) == {
+        "order_id": "id",
+        "placed_at": "2024-01-02",
+    }
+    assert serialize(Point(1, 2)) == {"x": 1, "y": 2}
+
+
+def test_other_values():
+    assert serialize(None) is None
+    assert serialize(Plain()) == {"name": "plain"}
+    assert serialize(CaseInsensitiveDict({"Key": [Plain()]})) == {"Key": [{"name": "plain"}]}
+    value = uuid.uuid4()
+    assert serialize(value) == str(value)
+    assert serialize(object()).startswith("<object object")
+
+
+def test_object_mapper_shares_serializer():
+    assert ObjectMapper().to_json([Order("id", datetime.date(2024, 1, 2), "note")]) == [
+        {"order_id": "id", "placed_at": "2024-01-02", "note": "note"}
+    ]
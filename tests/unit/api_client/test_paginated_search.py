@@ -0,0 +1,110 @@
+import asyncio
+import threading
+
+import pytest
+
+from conductor.shared.http.paginated_search import (
+    aiter_search_results,
+    iter_search_results,
+)
+
+
+def make_pages(total, include_total_hits=True):
+    requests = []
+
+    def get_page(start, size):
+        requests.append((start, size))
+        page = {"results": list(range(start, min(start + size, total)))}
+        if include_total_hits:
+            page["totalHits"] = total
+        return page
+
+    return requests, get_page
+
+
+def test_all_results_are_yielded_page_by_page():
+    requests, fetch_page = make_pages(7)
+
+    assert list(iter_search_results(fetch_page, str, page_size=3)) == [str(i) for i in range(7)]
+    assert requests == [(0, 3), (3, 3), (6, 3)]
+
+
+def test_short_page_ends_search_without_total_hits():
+    requests, fetch_page = make_pages(6, include_total_hits=False)
+
+    assert list(iter_search_results(fetch_page, int, page_size=3)) == list(range(6))
+    assert requests == [(0, 3), (3, 3), (6, 3)]
+
+
+def test_empty_search_yields_nothing():
+    assert list(iter_search_results(lambda start, size: {"totalHits": 0, "results": []}, int)) == []
+
+
+def test_next_page_is_fetched_while_current_one_is_consumed():
+    second_page_requested = threading.Event()
+
+    def fetch_page(start, size):
+        if start > 0:
+            second_page_requested.set()
+        return {"totalHits": 4, "results": list(range(start, start + size))}
+
+    results = iter_search_results(fetch_page, int, page_size=2)
+
+    assert next(results) == 0
+    assert second_page_requested.wait(5)
+    assert list(results) == [1, 2, 3]
+
+
+def test_results_are_deserialized_as_they_are_consumed():
+    deserialized = []
+
+    def deserialize(data):
+        deserialized.append(data)
+        return data
+
+    results = iter_search_results(lambda start, size: {"totalHits": 3, "results": [0, 1, 2]}, deserialize, 3)
+
+    assert next(results) == 0
+    assert deserialized == [0]
+    results.close()
+
+
+def test_invalid_page_size_is_rejected():
+    with pytest.raises(ValueError):
+        list(iter_search_results(lambda start, size: {}, int, page_size=0))
+
+
+@pytest.mark.asyncio
+async def test_async_results_are_yielded_page_by_page():
+    requests, get_page = make_pages(5)
+
+    async def fetch_page(start, size):
+        return get_page(start, size)
+
+    results = [result async for result in aiter_search_results(fetch_page, str, page_size=2)]
+
+    assert results == [str(i) for i in range(5)]
+    assert requests == [(0, 2), (2, 2), (4, 2)]
+
+
+@pytest.mark.asyncio
+async def test_async_pending_page_is_cancelled_when_iteration_stops():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch_page(start, size):
+        if start > 0:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return {"totalHits": 4, "results": list(range(start, start + size))}
+
+    results = aiter_search_results(fetch_page, int, page_size=2)
+
+    assert await results.__anext__() == 0
+    await asyncio.wait_for(started.wait(), 5)
+    await results.aclose()
+    await asyncio.wait_for(cancelled.wait(), 5)
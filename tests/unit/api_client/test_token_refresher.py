@@ -0,0 +1,127 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.shared.configuration.settings.authentication_settings import (
+    AuthenticationSettings,
+)
+from conductor.shared.http.token_refresher import TokenRefresher, get_token_refresher
+
+
+def get_configuration():
+    return Configuration(
+        server_api_url="http://localhost:8080/api",
+        authentication_settings=AuthenticationSettings(key_id="id", key_secret="secret"),
+    )
+
+
+def expire(configuration):
+    configuration.token_update_time = round(time.time() * 1000) - configuration.auth_token_ttl_msec - 1
+
+
+def test_valid_token_is_returned_without_fetching():
+    configuration = get_configuration()
+    configuration.update_token("token")
+    refresher = TokenRefresher(configuration)
+    fetch_token = MagicMock(return_value="new-token")
+
+    assert refresher.get_token(fetch_token) == "token"
+    fetch_token.assert_not_called()
+    refresher.stop()
+
+
+def test_expired_token_is_refreshed_once_by_concurrent_requests():
+    configuration = get_configuration()
+    configuration.update_token("token")
+    expire(configuration)
+    refresher = TokenRefresher(configuration)
+    fetch_started = threading.Event()
+    release_fetch = threading.Event()
+    calls = []
+
+    def fetch_token():
+        calls.append(1)
+        fetch_started.set()
+        release_fetch.wait(5)
+        return "new-token"
+
+    tokens = []
+    threads = [
+        threading.Thread(target=lambda: tokens.append(refresher.get_token(fetch_token)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    assert fetch_started.wait(5)
+    release_fetch.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert tokens == ["new-token"] * 5
+    refresher.stop()
+
+
+def test_force_refresh_skips_token_already_replaced_by_another_thread():
+    configuration = get_configuration()
+    configuration.update_token("token")
+    refresher = TokenRefresher(configuration)
+    assert refresher.get_token(MagicMock()) == "token"
+    configuration.update_token("replaced")
+    fetch_token = MagicMock(return_value="new-token")
+
+    assert refresher.force_refresh(fetch_token) == "replaced"
+    fetch_token.assert_not_called()
+    refresher.stop()
+
+
+def test_token_is_refreshed_in_background_before_it_expires():
+    configuration = get_configuration()
+    configuration.auth_token_ttl_msec = 200
+    configuration.update_token("token")
+    refresher = TokenRefresher(configuration, refresh_ahead_ratio=0.5)
+    refreshed = threading.Event()
+
+    def fetch_token():
+        refreshed.set()
+        return "new-token"
+
+    refresher.start(fetch_token)
+
+    assert refreshed.wait(5)
+    refresher.stop()
+    assert configuration.AUTH_TOKEN == "new-token"
+    assert not refresher.is_expired()
+
+
+def test_refresh_records_metrics():
+    configuration = get_configuration()
+    refresher = TokenRefresher(configuration)
+    refresher.metrics_collector = MagicMock()
+
+    refresher.refresh(MagicMock(return_value="token"))
+    refresher.refresh(MagicMock(side_effect=Exception("server down")), stale_token="token")
+
+    refresher.metrics_collector.record_token_refresh_time.assert_called_once()
+    refresher.metrics_collector.increment_token_refresh_error.assert_called_once()
+    assert configuration.AUTH_TOKEN == "token"
+
+
+def test_api_clients_share_refresher_of_their_configuration(mocker):
+    configuration = get_configuration()
+    get_new_token = mocker.patch.object(
+        ApiClient, "_ApiClient__get_new_token", return_value="token"
+    )
+    first = ApiClient(configuration=configuration)
+    second = ApiClient(configuration=configuration)
+
+    assert first._ApiClient__get_authentication_headers() == {
+        "header": {"X-Authorization": "token"}
+    }
+    assert second._ApiClient__get_authentication_headers() == {
+        "header": {"X-Authorization": "token"}
+    }
+    get_new_token.assert_called_once()
+    get_token_refresher(configuration).stop()
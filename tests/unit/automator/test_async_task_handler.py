@@ -1,8 +1,15 @@
+import asyncio
 import multiprocessing
+import os
+import signal
+import sys
 
 import pytest
 
-from conductor.asyncio_client.automator.task_handler import TaskHandler
+from conductor.asyncio_client.automator.task_handler import (
+    TaskHandler,
+    run_task_runners,
+)
 from conductor.asyncio_client.automator.task_runner import AsyncTaskRunner
 from conductor.asyncio_client.configuration.configuration import Configuration
 from tests.unit.resources.workers import ClassWorker2
@@ -29,6 +36,64 @@ def test_start_processes(mocker, valid_task_handler):
             assert isinstance(process, multiprocessing.Process)
 
 
+def test_single_event_loop_shards_workers_over_processes(mocker):
+    mocker.patch(
+        "conductor.asyncio_client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    workers = [ClassWorker2(f"task{i}") for i in range(5)]
+    task_handler = TaskHandler(
+        configuration=Configuration(),
+        workers=workers,
+        scan_for_annotated_workers=False,
+        single_event_loop=True,
+        process_count=2,
+    )
+
+    assert len(task_handler.task_runner_processes) == 2
+    shards = [process._args[1] for process in task_handler.task_runner_processes]
+    assert shards == [workers[0::2], workers[1::2]]
+
+
+@pytest.mark.asyncio
+async def test_run_task_runners_shares_api_client(mocker):
+    api_clients = []
+
+    async def run(self):
+        api_clients.append(self.task_client.api_client)
+
+    mocker.patch.object(AsyncTaskRunner, "run", run)
+    await run_task_runners(
+        [ClassWorker2("task1"), ClassWorker2("task2")], Configuration()
+    )
+
+    assert len(api_clients) == 2
+    assert api_clients[0] is api_clients[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="no SIGTERM handlers on Windows")
+async def test_run_task_runners_cancels_runners_on_sigterm(mocker):
+    cancelled = []
+
+    async def run(self):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(self.worker.get_task_definition_name())
+            raise
+
+    mocker.patch.object(AsyncTaskRunner, "run", run)
+    asyncio.get_running_loop().call_later(0.1, os.kill, os.getpid(), signal.SIGTERM)
+
+    await asyncio.wait_for(
+        run_task_runners([ClassWorker2("task1"), ClassWorker2("task2")], Configuration()),
+        timeout=10,
+    )
+
+    assert sorted(cancelled) == ["task1", "task2"]
+
+
 @pytest.fixture
 def valid_task_handler():
     return TaskHandler(configuration=Configuration(), workers=[ClassWorker2("task")])
@@ -1,6 +1,9 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import time
+from unittest import mock
 
 import pytest
 from requests.structures import CaseInsensitiveDict
@@ -11,7 +14,9 @@ from conductor.asyncio_client.configuration.configuration import Configuration
 from conductor.asyncio_client.adapters.api.task_resource_api import TaskResourceApiAdapter
 from conductor.asyncio_client.adapters.models.task_adapter import TaskAdapter
 from conductor.asyncio_client.adapters.models.task_result_adapter import TaskResultAdapter
+from conductor.shared.automator.task_limiter import TaskLimiter
 from conductor.shared.http.enums import TaskResultStatus
+from conductor.asyncio_client.worker.worker import Worker
 from conductor.asyncio_client.worker.worker_interface import DEFAULT_POLLING_INTERVAL
 from tests.unit.resources.workers import ClassWorker2, FaultyExecutionWorker
 
@@ -192,7 +197,26 @@ async def test_run_once(mocker):
     await task_runner.run_once()
     finish_time = time.time()
     spent_time = finish_time - start_time
-    assert spent_time > expected_time
+    # A poll that returned a task is followed by an immediate re-poll
+    assert spent_time < expected_time
+
+
+@pytest.mark.asyncio
+async def test_run_once_backs_off_while_polls_are_empty(mocker):
+    mocker.patch.object(TaskResourceApiAdapter, "poll", return_value=None)
+    mock_sleep = mocker.patch("asyncio.sleep")
+    task_runner = get_valid_task_runner_with_worker_config_and_poll_interval(100)
+    for _ in range(6):
+        await task_runner.run_once()
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays == [0.1, 0.2, 0.4, 0.8, 1.6, 2.0]
+
+    mocker.patch.object(TaskResourceApiAdapter, "poll", return_value=get_valid_task())
+    mocker.patch.object(TaskResourceApiAdapter, "update_task")
+    await task_runner.run_once()
+    assert task_runner.poll_backoff.empty_polls == 0
+    assert mock_sleep.call_args.args[0] == 0
+    await task_runner.task_updater.stop(timeout=0)
 
 
 @pytest.mark.asyncio
@@ -279,23 +303,70 @@ async def test_update_task_with_invalid_task_result():
 
 @pytest.mark.asyncio
 async def test_update_task_with_faulty_task_api(mocker):
-    mocker.patch("asyncio.sleep", return_value=None)
-    mocker.patch.object(TaskResourceApiAdapter, "update_task", side_effect=Exception())
+    mock_update = mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", side_effect=Exception()
+    )
     task_runner = get_valid_task_runner()
+    task_runner.task_updater.base_delay_seconds = 0
     task_result = get_valid_task_result()
     response = await task_runner._AsyncTaskRunner__update_task(task_result)
     assert response is None
+    assert await task_runner.task_updater.join(timeout=5)
+    assert mock_update.call_count == task_runner.task_updater.max_attempts
+    await task_runner.task_updater.stop()
 
 
 @pytest.mark.asyncio
 async def test_update_task(mocker):
-    mocker.patch.object(
+    mock_update = mocker.patch.object(
         TaskResourceApiAdapter, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
     )
     task_runner = get_valid_task_runner()
     task_result = get_valid_task_result()
-    response = await task_runner._AsyncTaskRunner__update_task(task_result)
-    assert response == "VALID_UPDATE_TASK_RESPONSE"
+    await task_runner._AsyncTaskRunner__update_task(task_result)
+    assert await task_runner.task_updater.join(timeout=5)
+    mock_update.assert_called_once_with(task_result=task_result)
+    await task_runner.task_updater.stop()
+
+
+@pytest.mark.asyncio
+async def test_update_task_does_not_block_polling(mocker):
+    mocker.patch.object(TaskResourceApiAdapter, "update_task", side_effect=Exception())
+    task_runner = get_valid_task_runner()
+    task_runner.task_updater.base_delay_seconds = 60
+    await task_runner._AsyncTaskRunner__update_task(get_valid_task_result())
+    assert not await task_runner.task_updater.join(timeout=0.1)
+    assert task_runner.task_updater.depth == 1
+    await task_runner.task_updater.stop(timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_stops_task_updater_without_waiting(mocker):
+    async def run_once():
+        await asyncio.sleep(60)
+
+    task_runner = get_valid_task_runner()
+    mocker.patch.object(task_runner, "run_once", run_once)
+    mock_stop = mocker.patch.object(task_runner.task_updater, "stop")
+    run = asyncio.create_task(task_runner.run())
+    await asyncio.sleep(0.1)
+
+    run.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    mock_stop.assert_awaited_once_with(timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_poll_paused_while_update_backlog_is_full(mocker):
+    mock_poll = mocker.patch.object(TaskResourceApiAdapter, "poll")
+    task_runner = get_valid_task_runner()
+    mocker.patch.object(
+        task_runner.task_updater, "is_backpressured", return_value=True
+    )
+    await task_runner.run_once()
+    mock_poll.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -318,3 +389,193 @@ async def test_wait_for_polling_interval():
     finish_time = time.time()
     spent_time = finish_time - start_time
     assert spent_time > expected_time
+
+
+def test_initialization_with_poll_count_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_poll_count", "10")
+    monkeypatch.setenv("conductor_worker_task_poll_timeout", "500")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.poll_count == 10
+    assert task_runner.worker.poll_timeout == 500
+
+
+@pytest.mark.asyncio
+async def test_batch_poll_tasks(mocker):
+    worker = get_valid_worker()
+    worker.poll_count = 5
+    worker.poll_timeout = 200
+    mocker.patch.object(worker, "get_domain", return_value=None)
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    mock_batch_poll = mocker.patch.object(
+        TaskResourceApiAdapter, "batch_poll", return_value=[get_valid_task()]
+    )
+
+    tasks = await task_runner._AsyncTaskRunner__batch_poll_tasks(5)
+
+    assert tasks == [get_valid_task()]
+    mock_batch_poll.assert_called_once_with(
+        tasktype="task", workerid=worker.get_identity(), count=5, timeout=200
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_once_with_batch_poll(mocker):
+    worker = get_valid_worker()
+    worker.poll_count = 3
+    tasks = [
+        TaskAdapter(task_id=f"TASK_{i}", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+        for i in range(3)
+    ]
+    mock_poll = mocker.patch.object(TaskResourceApiAdapter, "poll")
+    mocker.patch.object(TaskResourceApiAdapter, "batch_poll", return_value=tasks)
+    mock_update_task = mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+
+    await task_runner.run_once()
+    assert await task_runner.task_updater.join(timeout=5)
+
+    mock_poll.assert_not_called()
+    assert mock_update_task.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_task_awaits_coroutine_worker():
+    async def execute(name: str) -> str:
+        return f"hello {name}"
+
+    worker = Worker(task_definition_name="task", execute_function=execute)
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    task = TaskAdapter(
+        task_id="VALID_TASK_ID",
+        workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID",
+        input_data={"name": "conductor"},
+    )
+
+    task_result = await task_runner._AsyncTaskRunner__execute_task(task)
+
+    assert task_result.status == TaskResultStatus.COMPLETED
+    assert task_result.output_data == {"result": "hello conductor"}
+
+
+@pytest.mark.asyncio
+async def test_execute_task_offloads_sync_worker_to_executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+    task_runner = AsyncTaskRunner(
+        configuration=Configuration(), worker=get_valid_worker(), executor=executor
+    )
+    executor_spy = mock.MagicMock(wraps=executor)
+    task_runner.executor = executor_spy
+
+    task_result = await task_runner._AsyncTaskRunner__execute_task(get_valid_task())
+
+    assert task_result == get_valid_task_result()
+    executor_spy.submit.assert_called_once()
+    executor.shutdown()
+
+
+def test_initialization_with_max_concurrency_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_max_concurrency", "16")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.max_concurrency == 16
+
+
+@pytest.mark.asyncio
+async def test_run_once_keeps_tasks_in_flight(mocker):
+    release = asyncio.Event()
+    started = []
+
+    async def execute(task: TaskAdapter):
+        started.append(task.task_id)
+        await release.wait()
+        return {"done": True}
+
+    worker = Worker(task_definition_name="task", execute_function=execute)
+    worker.max_concurrency = 3
+    tasks = [
+        TaskAdapter(task_id=f"TASK_{i}", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+        for i in range(3)
+    ]
+    mock_batch_poll = mocker.patch.object(
+        TaskResourceApiAdapter, "batch_poll", return_value=tasks
+    )
+    mock_update_task = mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+
+    await task_runner.run_once()
+    assert mock_batch_poll.call_args.kwargs["count"] == 3
+    assert sorted(started) == ["TASK_0", "TASK_1", "TASK_2"]
+    assert len(task_runner._running_tasks) == 3
+
+    mock_poll = mocker.patch.object(TaskResourceApiAdapter, "poll")
+    mock_batch_poll.reset_mock()
+    await task_runner.run_once()
+    mock_poll.assert_not_called()
+    mock_batch_poll.assert_not_called()
+
+    release.set()
+    await asyncio.gather(*task_runner._running_tasks)
+    assert await task_runner.task_updater.join(timeout=5)
+    assert mock_update_task.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_lease_is_extended_while_task_executes(mocker):
+    heartbeat_sent = asyncio.Event()
+
+    async def update_task(task_result):
+        if task_result.extend_lease:
+            heartbeat_sent.set()
+
+    async def execute(task: TaskAdapter):
+        await asyncio.wait_for(heartbeat_sent.wait(), timeout=5)
+        return {"heartbeat_sent": True}
+
+    mock_update_task = mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", side_effect=update_task
+    )
+    mocker.patch(
+        "conductor.asyncio_client.automator.task_runner.get_lease_extend_interval",
+        return_value=0.05,
+    )
+    worker = Worker(task_definition_name="task", execute_function=execute)
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    task = TaskAdapter(
+        task_id="VALID_TASK_ID",
+        workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID",
+        response_timeout_seconds=1,
+    )
+
+    await task_runner._AsyncTaskRunner__execute_and_update_task(task)
+    assert await task_runner.task_updater.join(timeout=5)
+
+    final_result = mock_update_task.call_args.kwargs["task_result"]
+    assert final_result.status == TaskResultStatus.COMPLETED
+    assert final_result.output_data == {"result": {"heartbeat_sent": True}}
+    await task_runner.task_updater.stop()
+
+
+def test_initialization_with_lease_extend_disabled_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_lease_extend_enabled", "false")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.lease_extend_enabled is False
+
+
+@pytest.mark.asyncio
+async def test_run_once_completes_task_limiter_reservation(mocker):
+    mocker.patch.object(TaskResourceApiAdapter, "poll", return_value=get_valid_task())
+    mocker.patch.object(TaskResourceApiAdapter, "update_task")
+    task_limiter = TaskLimiter(concurrent_exec_limit=1)
+    task_runner = AsyncTaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        task_limiter=task_limiter,
+    )
+
+    await task_runner.run_once()
+
+    assert task_limiter.in_flight == 0
+    await task_runner.task_updater.stop()
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+
+import pytest
+
+from conductor.asyncio_client.adapters.models.task_result_adapter import (
+    TaskResultAdapter,
+)
+from conductor.asyncio_client.automator.task_updater import AsyncTaskUpdater
+from conductor.shared.automator.task_result_spool import TaskResultSpool
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def get_task_result(task_id="VALID_TASK_ID"):
+    return TaskResultAdapter(
+        task_id=task_id, workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID"
+    )
+
+
+@pytest.mark.asyncio
+async def test_submit_delivers_task_result(mocker):
+    update_function = mocker.AsyncMock(return_value="OK")
+    task_updater = AsyncTaskUpdater(update_function=update_function)
+
+    task_result = get_task_result()
+    await task_updater.submit(task_result, "task")
+
+    assert await task_updater.join(timeout=5)
+    update_function.assert_awaited_once_with(task_result)
+    await task_updater.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_update_is_retried_until_max_attempts(mocker):
+    update_function = mocker.AsyncMock(side_effect=Exception("server down"))
+    task_updater = AsyncTaskUpdater(
+        update_function=update_function, max_attempts=3, base_delay_seconds=0
+    )
+
+    await task_updater.submit(get_task_result(), "task")
+
+    assert await task_updater.join(timeout=5)
+    assert update_function.await_count == 3
+    await task_updater.stop()
+
+
+@pytest.mark.asyncio
+async def test_retry_does_not_delay_other_updates():
+    delivered = []
+    failing_task_result = get_task_result("FAILING")
+
+    async def update_function(task_result):
+        if task_result is failing_task_result:
+            raise Exception("server hiccup")
+        delivered.append(task_result.task_id)
+
+    task_updater = AsyncTaskUpdater(
+        update_function=update_function, concurrency=1, base_delay_seconds=60
+    )
+
+    await task_updater.submit(failing_task_result, "task")
+    await task_updater.submit(get_task_result("OTHER"), "task")
+
+    assert not await task_updater.join(timeout=0.5)
+    assert delivered == ["OTHER"]
+    await task_updater.stop(timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_is_backpressured_when_backlog_reaches_threshold():
+    release = asyncio.Event()
+
+    async def update_function(task_result):
+        await release.wait()
+
+    task_updater = AsyncTaskUpdater(
+        update_function=update_function, concurrency=1, backpressure_threshold=2
+    )
+
+    await task_updater.submit(get_task_result("1"), "task")
+    assert not task_updater.is_backpressured()
+    await task_updater.submit(get_task_result("2"), "task")
+    assert task_updater.is_backpressured()
+
+    release.set()
+    assert await task_updater.join(timeout=5)
+    assert not task_updater.is_backpressured()
+    await task_updater.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_waits_while_queue_is_full():
+    release = asyncio.Event()
+
+    async def update_function(task_result):
+        await release.wait()
+
+    task_updater = AsyncTaskUpdater(
+        update_function=update_function, concurrency=1, queue_size=1
+    )
+
+    await task_updater.submit(get_task_result("1"), "task")
+    pending_submit = asyncio.create_task(
+        task_updater.submit(get_task_result("2"), "task")
+    )
+    await asyncio.sleep(0.1)
+    assert not pending_submit.done()
+
+    release.set()
+    await asyncio.wait_for(pending_submit, timeout=5)
+    assert await task_updater.join(timeout=5)
+    await task_updater.stop()
+
+
+def get_spool(tmp_path):
+    return TaskResultSpool(
+        directory=str(tmp_path),
+        name="task",
+        serialize=TaskResultAdapter.to_dict,
+        deserialize=TaskResultAdapter.from_dict,
+    )
+
+
+@pytest.mark.asyncio
+async def test_result_is_spooled_after_max_attempts_and_replayed(mocker, tmp_path):
+    update_function = mocker.AsyncMock(side_effect=Exception("server down"))
+    spool = get_spool(tmp_path)
+    task_updater = AsyncTaskUpdater(
+        update_function=update_function,
+        max_attempts=2,
+        base_delay_seconds=0,
+        spool=spool,
+        replay_interval=60,
+    )
+
+    task_result = get_task_result()
+    await task_updater.submit(task_result, "task")
+    assert await task_updater.join(timeout=5)
+    assert spool.peek() == [("task", task_result)]
+
+    update_function.side_effect = None
+    update_function.reset_mock()
+    assert await task_updater.replay() == 1
+    update_function.assert_awaited_once_with(task_result)
+    assert len(spool) == 0
+    await task_updater.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_spools_update_cancelled_in_flight(tmp_path):
+    spool = get_spool(tmp_path)
+    started = asyncio.Event()
+
+    async def update_function(task_result):
+        started.set()
+        await asyncio.sleep(60)
+
+    task_updater = AsyncTaskUpdater(
+        update_function=update_function, spool=spool, replay_interval=60
+    )
+    task_result = get_task_result()
+    await task_updater.submit(task_result, "task")
+    await asyncio.wait_for(started.wait(), timeout=5)
+
+    await task_updater.stop(timeout=0)
+
+    assert spool.peek() == [("task", task_result)]
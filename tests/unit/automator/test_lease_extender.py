@@ -0,0 +1,73 @@
+import logging
+import threading
+
+import pytest
+
+from conductor.client.automator.lease_extender import LeaseExtender
+from conductor.client.http.models.task import Task
+from conductor.shared.automator.lease_extension import get_lease_extend_interval
+from conductor.shared.http.enums.task_result_status import TaskResultStatus
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def get_task(response_timeout_seconds):
+    return Task(
+        task_id="VALID_TASK_ID",
+        workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID",
+        response_timeout_seconds=response_timeout_seconds,
+    )
+
+
+def test_get_lease_extend_interval():
+    assert get_lease_extend_interval(None) is None
+    assert get_lease_extend_interval(0) is None
+    assert get_lease_extend_interval(1) == 1.0
+    assert get_lease_extend_interval(60) == 30.0
+
+
+def test_heartbeats_are_sent_until_task_is_untracked(mocker):
+    heartbeats = []
+    heartbeat_sent = threading.Event()
+
+    def update_function(task_result):
+        heartbeats.append(task_result)
+        heartbeat_sent.set()
+
+    lease_extender = LeaseExtender(update_function=update_function, worker_id="worker")
+    mocker.patch(
+        "conductor.client.automator.lease_extender.get_lease_extend_interval",
+        return_value=0.05,
+    )
+    task = get_task(response_timeout_seconds=1)
+
+    lease_extender.track(task)
+    assert heartbeat_sent.wait(timeout=5)
+    lease_extender.untrack(task)
+    sent = len(heartbeats)
+
+    assert lease_extender.tracked_task_count == 0
+    heartbeat = heartbeats[0]
+    assert heartbeat.task_id == "VALID_TASK_ID"
+    assert heartbeat.workflow_instance_id == "VALID_WORKFLOW_INSTANCE_ID"
+    assert heartbeat.worker_id == "worker"
+    assert heartbeat.status == TaskResultStatus.IN_PROGRESS
+    assert heartbeat.extend_lease is True
+    threading.Event().wait(0.2)
+    # At most one heartbeat may have been in flight while untracking
+    assert len(heartbeats) <= sent + 1
+
+
+def test_task_without_response_timeout_is_not_tracked(mocker):
+    update_function = mocker.Mock()
+    lease_extender = LeaseExtender(update_function=update_function, worker_id="worker")
+
+    lease_extender.track(get_task(response_timeout_seconds=None))
+
+    assert lease_extender.tracked_task_count == 0
+    update_function.assert_not_called()
@@ -0,0 +1,98 @@
+import multiprocessing
+from sys import platform
+
+import pytest
+
+from conductor.client.worker.worker import Worker
+from conductor.shared.automator.task_limiter import (
+    TaskLimiter,
+    create_task_limiters,
+    get_task_limiter_key,
+)
+from conductor.shared.worker.task_options import TaskOptions, task_options
+
+
+def test_concurrency_cap_limits_reservations():
+    task_limiter = TaskLimiter(concurrent_exec_limit=2)
+
+    assert task_limiter.reserve(5) == 2
+    assert task_limiter.reserve(1) == 0
+
+    task_limiter.complete()
+    assert task_limiter.reserve(5) == 1
+
+
+def test_cancel_returns_unused_reservations():
+    task_limiter = TaskLimiter(rate_limit_per_frequency=3, concurrent_exec_limit=3)
+
+    assert task_limiter.reserve(3) == 3
+    task_limiter.cancel(2)
+
+    assert task_limiter.in_flight == 1
+    assert task_limiter.reserve(5) == 2
+
+
+def test_rate_limit_refills_over_frequency(mocker):
+    mock_monotonic = mocker.patch(
+        "conductor.shared.automator.task_limiter.time.monotonic", return_value=100.0
+    )
+    task_limiter = TaskLimiter(rate_limit_per_frequency=4, rate_limit_frequency_in_seconds=2)
+
+    assert task_limiter.reserve(10) == 4
+    task_limiter.complete(4)
+    assert task_limiter.reserve(1) == 0
+
+    mock_monotonic.return_value = 101.0
+    assert task_limiter.reserve(10) == 2
+
+    mock_monotonic.return_value = 120.0
+    assert task_limiter.reserve(10) == 4
+
+
+def test_from_task_options_without_limits():
+    assert TaskLimiter.from_task_options(None) is None
+    assert TaskLimiter.from_task_options(TaskOptions(timeout_seconds=10)) is None
+
+    task_limiter = TaskLimiter.from_task_options(
+        TaskOptions(rate_limit_per_frequency=10, concurrent_exec_limit=2)
+    )
+    assert task_limiter.rate_limit_per_frequency == 10
+    assert task_limiter.rate_limit_frequency_in_seconds == 1
+    assert task_limiter.concurrent_exec_limit == 2
+
+
+def test_create_task_limiters_shares_one_limiter_per_task_type():
+    @task_options(concurrent_exec_limit=3)
+    def limited(name: str) -> str:
+        return name
+
+    def unlimited(name: str) -> str:
+        return name
+
+    workers = [
+        Worker("limited", limited, domain="a"),
+        Worker("limited", limited, domain="b"),
+        Worker("unlimited", unlimited),
+    ]
+
+    task_limiters = create_task_limiters(workers)
+
+    assert list(task_limiters) == [("limited",)]
+    assert task_limiters[get_task_limiter_key(workers[0])].concurrent_exec_limit == 3
+
+
+def _reserve_in_child(task_limiter):
+    task_limiter.reserve(2)
+
+
+@pytest.mark.skipif(platform == "win32", reason="relies on fork")
+def test_reservations_are_shared_across_processes():
+    task_limiter = TaskLimiter(concurrent_exec_limit=3)
+    process = multiprocessing.get_context("fork").Process(
+        target=_reserve_in_child, args=(task_limiter,)
+    )
+    process.start()
+    process.join(timeout=10)
+
+    assert task_limiter.in_flight == 2
+    assert task_limiter.reserve(3) == 1
@@ -0,0 +1,96 @@
+import os
+
+from conductor.client.codegen.rest import ApiException
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_result_status import TaskResultStatus
+from conductor.shared.automator.task_result_spool import (
+    TaskResultSpool,
+    is_permanent_update_failure,
+)
+
+
+def get_spool(directory):
+    api_client = ApiClient(configuration=Configuration())
+    return TaskResultSpool(
+        directory=str(directory),
+        name="task/with:odd chars",
+        serialize=api_client.sanitize_for_serialization,
+        deserialize=lambda data: api_client.deserialize_class(data, "TaskResult"),
+    )
+
+
+def get_task_result(task_id="VALID_TASK_ID"):
+    return TaskResult(
+        task_id=task_id,
+        workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID",
+        worker_id="worker",
+        status=TaskResultStatus.COMPLETED,
+        output_data={"result": 42},
+    )
+
+
+def test_appended_results_survive_reopening(tmp_path):
+    get_spool(tmp_path).append(get_task_result("1"), "task")
+    get_spool(tmp_path).append(get_task_result("2"), "task")
+
+    entries = get_spool(tmp_path).peek()
+
+    assert entries == [("task", get_task_result("1")), ("task", get_task_result("2"))]
+
+
+def test_discard_removes_oldest_entries(tmp_path):
+    spool = get_spool(tmp_path)
+    for task_id in ["1", "2", "3"]:
+        spool.append(get_task_result(task_id), "task")
+
+    spool.discard(2)
+
+    assert len(spool) == 1
+    assert spool.peek() == [("task", get_task_result("3"))]
+    spool.discard(1)
+    assert len(spool) == 0
+    assert not os.path.exists(spool.path)
+
+
+def test_torn_entry_keeps_its_position(tmp_path):
+    spool = get_spool(tmp_path)
+    spool.append(get_task_result("1"), "task")
+    with open(spool.path, "a", encoding="utf-8") as spool_file:
+        spool_file.write('{"task_type": "task", "task_res')
+
+    entries = spool.peek()
+
+    assert entries == [("task", get_task_result("1")), (None, None)]
+
+
+def test_concurrent_spools_use_separate_files(tmp_path):
+    first = get_spool(tmp_path)
+    second = get_spool(tmp_path)
+    first.append(get_task_result("1"), "task")
+    second.append(get_task_result("2"), "task")
+
+    assert first.path != second.path
+    assert first.peek() == [("task", get_task_result("1"))]
+    assert second.peek() == [("task", get_task_result("2"))]
+
+
+def test_closed_slot_is_claimed_again(tmp_path):
+    first = get_spool(tmp_path)
+    second = get_spool(tmp_path)
+    first.append(get_task_result("1"), "task")
+    second.append(get_task_result("2"), "task")
+    first.close()
+
+    assert get_spool(tmp_path).peek() == [("task", get_task_result("1"))]
+    assert get_spool(tmp_path).peek() == [("task", get_task_result("1"))]
+    second.close()
+
+
+def test_is_permanent_update_failure():
+    assert is_permanent_update_failure(ApiException(status=404))
+    assert is_permanent_update_failure(ApiException(status=400))
+    assert not is_permanent_update_failure(ApiException(status=429))
+    assert not is_permanent_update_failure(ApiException(status=503))
+    assert not is_permanent_update_failure(ConnectionError())
@@ -1,4 +1,8 @@
 import logging
+import multiprocessing
+import signal
+import sys
+import threading
 import time
 
 import pytest
@@ -8,12 +12,18 @@ from conductor.client.automator.task_runner import TaskRunner
 from conductor.client.codegen.rest import AuthorizationException, ApiException
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
 from conductor.client.telemetry.metrics_collector import MetricsCollector
+from conductor.shared.automator.task_limiter import TaskLimiter
+from conductor.shared.automator.task_result_spool import TaskResultSpool
 from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.spool_settings import SpoolSettings
 from conductor.shared.http.enums.task_result_status import TaskResultStatus
+from conductor.shared.worker.task_options import task_options
+from conductor.client.worker.worker import Worker
 from conductor.client.worker.worker_interface import DEFAULT_POLLING_INTERVAL
 from tests.unit.resources.workers import ClassWorker, OldFaultyExecutionWorker
 
@@ -193,7 +203,39 @@ def test_run_once(mocker):
     task_runner.run_once()
     finish_time = time.time()
     spent_time = finish_time - start_time
-    assert spent_time > expected_time
+    # A poll that returned a task is followed by an immediate re-poll
+    assert spent_time < expected_time
+
+
+def test_run_once_backs_off_while_polls_are_empty(mocker):
+    mocker.patch.object(TaskResourceApi, "poll", return_value=None)
+    mock_sleep = mocker.patch("time.sleep")
+    task_runner = get_valid_task_runner_with_worker_config_and_poll_interval(100)
+    for _ in range(6):
+        task_runner.run_once()
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays == [0.1, 0.2, 0.4, 0.8, 1.6, 2.0]
+
+    mocker.patch.object(TaskResourceApi, "poll", return_value=get_valid_task())
+    mocker.patch.object(TaskResourceApi, "update_task")
+    task_runner.run_once()
+    assert task_runner.poll_backoff.empty_polls == 0
+    assert mock_sleep.call_count == 6
+
+
+def test_run_once_records_poll_backoff_metrics(mocker):
+    mocker.patch.object(TaskResourceApi, "poll", return_value=None)
+    mocker.patch("time.sleep")
+    mock_poll_empty = mocker.patch.object(MetricsCollector, "increment_task_poll_empty")
+    mock_poll_backoff = mocker.patch.object(MetricsCollector, "record_task_poll_backoff")
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        metrics_settings=MetricsSettings(),
+    )
+    task_runner.run_once()
+    mock_poll_empty.assert_called_once_with("task")
+    mock_poll_backoff.assert_called_once_with("task", 0.1)
 
 
 def test_run_once_roundrobin(mocker):
@@ -266,22 +308,47 @@ def test_update_task_with_invalid_task_result():
 
 
 def test_update_task_with_faulty_task_api(mocker):
-    mocker.patch("time.sleep", return_value=None)
-    mocker.patch.object(TaskResourceApi, "update_task", side_effect=Exception())
+    mock_update = mocker.patch.object(
+        TaskResourceApi, "update_task", side_effect=Exception()
+    )
     task_runner = get_valid_task_runner()
+    task_runner.task_updater.base_delay_seconds = 0
     task_result = get_valid_task_result()
     response = task_runner._TaskRunner__update_task(task_result)
     assert response is None
+    assert task_runner.task_updater.join(timeout=5)
+    assert mock_update.call_count == task_runner.task_updater.max_attempts
 
 
 def test_update_task(mocker):
-    mocker.patch.object(
+    mock_update = mocker.patch.object(
         TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
     )
     task_runner = get_valid_task_runner()
     task_result = get_valid_task_result()
-    response = task_runner._TaskRunner__update_task(task_result)
-    assert response == "VALID_UPDATE_TASK_RESPONSE"
+    task_runner._TaskRunner__update_task(task_result)
+    assert task_runner.task_updater.join(timeout=5)
+    mock_update.assert_called_once_with(body=task_result)
+
+
+def test_update_task_does_not_block_polling(mocker):
+    mock_sleep = mocker.patch("time.sleep")
+    mocker.patch.object(TaskResourceApi, "update_task", side_effect=Exception())
+    task_runner = get_valid_task_runner()
+    task_runner.task_updater.base_delay_seconds = 60
+    task_runner._TaskRunner__update_task(get_valid_task_result())
+    mock_sleep.assert_not_called()
+    task_runner.task_updater.stop(timeout=0)
+
+
+def test_poll_paused_while_update_backlog_is_full(mocker):
+    mock_poll = mocker.patch.object(TaskResourceApi, "poll")
+    task_runner = get_valid_task_runner()
+    mocker.patch.object(
+        task_runner.task_updater, "is_backpressured", return_value=True
+    )
+    task_runner.run_once()
+    mock_poll.assert_not_called()
 
 
 def test_wait_for_polling_interval_with_faulty_worker(mocker):
@@ -343,7 +410,7 @@ def test_run_once_with_exception_handling(mocker):
     mock_clear_cache = mocker.patch.object(worker, "clear_task_definition_name_cache")
     mocker.patch.object(
         TaskRunner,
-        "_TaskRunner__wait_for_polling_interval",
+        "_TaskRunner__wait_for_next_poll",
         side_effect=Exception("Test exception"),
     )
 
@@ -523,12 +590,18 @@ def test_update_task_with_metrics_collector(mocker):
     mock_increment_error = mocker.patch.object(
         MetricsCollector, "increment_task_update_error"
     )
+    mock_record_time = mocker.patch.object(MetricsCollector, "record_task_update_time")
+    mock_record_depth = mocker.patch.object(
+        MetricsCollector, "record_task_update_queue_depth"
+    )
 
     task_result = get_valid_task_result()
-    response = task_runner._TaskRunner__update_task(task_result)
+    task_runner._TaskRunner__update_task(task_result)
 
-    assert response == "SUCCESS"
+    assert task_runner.task_updater.join(timeout=5)
     mock_increment_error.assert_not_called()
+    mock_record_time.assert_called_once()
+    mock_record_depth.assert_called()
 
 
 def test_update_task_retry_logic_with_metrics(mocker):
@@ -539,7 +612,7 @@ def test_update_task_retry_logic_with_metrics(mocker):
         metrics_settings=metrics_settings,
     )
 
-    mock_sleep = mocker.patch("time.sleep")
+    task_runner.task_updater.base_delay_seconds = 0
     mock_update = mocker.patch.object(TaskResourceApi, "update_task")
     mock_update.side_effect = [
         Exception("First attempt"),
@@ -551,10 +624,10 @@ def test_update_task_retry_logic_with_metrics(mocker):
     )
 
     task_result = get_valid_task_result()
-    response = task_runner._TaskRunner__update_task(task_result)
+    task_runner._TaskRunner__update_task(task_result)
 
-    assert response == "SUCCESS"
-    assert mock_sleep.call_count == 2
+    assert task_runner.task_updater.join(timeout=5)
+    assert mock_update.call_count == 3
     assert mock_increment_error.call_count == 2
 
 
@@ -566,7 +639,7 @@ def test_update_task_all_retries_fail_with_metrics(mocker):
         metrics_settings=metrics_settings,
     )
 
-    mock_sleep = mocker.patch("time.sleep")
+    task_runner.task_updater.base_delay_seconds = 0
     mock_update = mocker.patch.object(TaskResourceApi, "update_task")
     mock_update.side_effect = Exception("All attempts fail")
     mock_increment_error = mocker.patch.object(
@@ -574,10 +647,10 @@ def test_update_task_all_retries_fail_with_metrics(mocker):
     )
 
     task_result = get_valid_task_result()
-    response = task_runner._TaskRunner__update_task(task_result)
+    task_runner._TaskRunner__update_task(task_result)
 
-    assert response is None
-    assert mock_sleep.call_count == 3
+    assert task_runner.task_updater.join(timeout=5)
+    assert mock_update.call_count == 4
     assert mock_increment_error.call_count == 4
 
 
@@ -731,3 +804,224 @@ def test_run_once_with_task_no_id(mocker):
     task_runner.run_once()
 
     mock_clear_cache.assert_called_once()
+
+
+def test_initialization_with_poll_count_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_poll_count", "10")
+    monkeypatch.setenv("conductor_worker_task_poll_timeout", "500")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.poll_count == 10
+    assert task_runner.worker.poll_timeout == 500
+
+
+def test_batch_poll_tasks(mocker):
+    worker = get_valid_worker()
+    worker.poll_count = 5
+    worker.poll_timeout = 200
+    mocker.patch.object(worker, "get_domain", return_value=None)
+    task_runner = TaskRunner(worker=worker)
+    mock_batch_poll = mocker.patch.object(
+        TaskResourceApi, "batch_poll", return_value=[get_valid_task()]
+    )
+
+    tasks = task_runner._TaskRunner__batch_poll_tasks(5)
+
+    assert tasks == [get_valid_task()]
+    mock_batch_poll.assert_called_once_with(
+        tasktype="task", workerid=worker.get_identity(), count=5, timeout=200
+    )
+
+
+def test_batch_poll_tasks_with_faulty_task_api(mocker):
+    worker = get_valid_worker()
+    worker.poll_count = 5
+    mocker.patch.object(TaskResourceApi, "batch_poll", side_effect=Exception())
+    task_runner = TaskRunner(worker=worker)
+    assert task_runner._TaskRunner__batch_poll_tasks(5) == []
+
+
+def test_run_once_with_batch_poll(mocker):
+    worker = get_valid_worker()
+    worker.poll_count = 3
+    tasks = [
+        Task(task_id=f"TASK_{i}", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+        for i in range(3)
+    ]
+    mock_poll = mocker.patch.object(TaskResourceApi, "poll")
+    mocker.patch.object(TaskResourceApi, "batch_poll", return_value=tasks)
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    task_runner = TaskRunner(worker=worker)
+
+    task_runner.run_once()
+    assert task_runner.task_updater.join(timeout=5)
+
+    mock_poll.assert_not_called()
+    assert mock_update_task.call_count == 3
+    updated_ids = [c.kwargs["body"].task_id for c in mock_update_task.call_args_list]
+    assert updated_ids == ["TASK_0", "TASK_1", "TASK_2"]
+
+
+def test_initialization_with_thread_count_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_thread_count", "8")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.thread_count == 8
+
+
+def test_run_once_with_thread_pool_polls_for_free_slots(mocker):
+    worker = get_valid_worker()
+    worker.thread_count = 4
+    tasks = [
+        Task(task_id=f"TASK_{i}", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+        for i in range(2)
+    ]
+    mock_batch_poll = mocker.patch.object(
+        TaskResourceApi, "batch_poll", return_value=tasks
+    )
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    task_runner = TaskRunner(worker=worker)
+
+    task_runner.run_once()
+    task_runner._executor.shutdown(wait=True)
+    assert task_runner.task_updater.join(timeout=5)
+
+    assert mock_batch_poll.call_args.kwargs["count"] == 4
+    assert mock_update_task.call_count == 2
+    assert len(task_runner._running_tasks) == 0
+
+
+def test_run_once_with_thread_pool_saturated_skips_poll(mocker):
+    worker = get_valid_worker()
+    worker.thread_count = 2
+    mock_poll = mocker.patch.object(TaskResourceApi, "poll")
+    mock_batch_poll = mocker.patch.object(TaskResourceApi, "batch_poll")
+    task_runner = TaskRunner(worker=worker)
+    task_runner._running_tasks.update({mocker.Mock(), mocker.Mock()})
+
+    task_runner.run_once()
+
+    mock_poll.assert_not_called()
+    mock_batch_poll.assert_not_called()
+
+
+def test_lease_is_extended_while_task_executes(mocker):
+    heartbeat_sent = threading.Event()
+
+    def update_task(body):
+        if body.extend_lease:
+            heartbeat_sent.set()
+
+    def execute(task: Task) -> TaskResult:
+        task_result = worker.get_task_result_from_task(task)
+        task_result.status = TaskResultStatus.COMPLETED
+        task_result.output_data = {"heartbeat_sent": heartbeat_sent.wait(5)}
+        return task_result
+
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", side_effect=update_task
+    )
+    mocker.patch(
+        "conductor.client.automator.lease_extender.get_lease_extend_interval",
+        return_value=0.05,
+    )
+    worker = Worker(task_definition_name="task", execute_function=execute)
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    task = Task(
+        task_id="VALID_TASK_ID",
+        workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID",
+        response_timeout_seconds=1,
+    )
+
+    task_runner._TaskRunner__execute_and_update_task(task)
+    assert task_runner.task_updater.join(timeout=5)
+
+    assert task_runner.lease_extender.tracked_task_count == 0
+    final_result = mock_update_task.call_args.kwargs["body"]
+    assert final_result.status == TaskResultStatus.COMPLETED
+    assert final_result.output_data == {"heartbeat_sent": True}
+
+
+def test_initialization_with_lease_extend_disabled_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_lease_extend_enabled", "false")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.lease_extend_enabled is False
+
+
+def test_run_once_skips_poll_while_task_limiter_is_exhausted(mocker):
+    mock_poll = mocker.patch.object(TaskResourceApi, "poll", return_value=None)
+    task_limiter = TaskLimiter(concurrent_exec_limit=1)
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        task_limiter=task_limiter,
+    )
+
+    task_runner.run_once()
+    mock_poll.assert_called_once()
+    # The reservation for the empty poll was given back
+    assert task_limiter.in_flight == 0
+
+    task_limiter.reserve(1)
+    mock_poll.reset_mock()
+    task_runner.run_once()
+    mock_poll.assert_not_called()
+
+
+def test_task_limiter_is_created_from_task_options():
+    @task_options(rate_limit_per_frequency=5, rate_limit_frequency_in_seconds=10)
+    def execute(name: str) -> str:
+        return name
+
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=Worker(task_definition_name="task", execute_function=execute),
+    )
+
+    assert task_runner.task_limiter.rate_limit_per_frequency == 5
+    assert task_runner.task_limiter.rate_limit_frequency_in_seconds == 10
+
+
+def run_task_runner_with_failing_updates(spool_directory, update_attempted):
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        spool_settings=SpoolSettings(directory=spool_directory, replay_interval=60),
+    )
+
+    def update_task(body):
+        update_attempted.set()
+        raise ApiException(status=503)
+
+    task_runner.task_client.update_task = update_task
+    task_runner.run_once = lambda: time.sleep(0.01)
+    task_runner._TaskRunner__update_task(get_valid_task_result())
+    task_runner.run()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="terminate() does not send SIGTERM on Windows")
+def test_results_waiting_for_retry_are_spooled_on_sigterm(tmp_path):
+    context = multiprocessing.get_context("fork")
+    update_attempted = context.Event()
+    process = context.Process(
+        target=run_task_runner_with_failing_updates,
+        args=(str(tmp_path), update_attempted),
+    )
+    process.start()
+    assert update_attempted.wait(timeout=10)
+    time.sleep(0.2)
+
+    process.terminate()
+    process.join(timeout=10)
+
+    assert process.exitcode == 128 + signal.SIGTERM
+    api_client = ApiClient(configuration=Configuration())
+    spool = TaskResultSpool(
+        directory=str(tmp_path),
+        name="task",
+        serialize=api_client.sanitize_for_serialization,
+        deserialize=lambda data: api_client.deserialize_class(data, "TaskResult"),
+    )
+    assert [task_result.task_id for _, task_result in spool.peek()] == ["VALID_TASK_ID"]
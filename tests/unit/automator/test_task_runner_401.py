@@ -35,7 +35,7 @@ class TestTaskRunner401Policy:
                 task_runner = TaskRunner(worker, config)
                 
                 # Should use ApiClient
-                mock_api_client.assert_called_once_with(configuration=config)
+                mock_api_client.assert_called_once_with(configuration=config, token_broker=None)
                 mock_task_api.assert_called_once()
 
     def test_task_runner_checks_401_stop_condition(self):
@@ -178,4 +178,4 @@ class TestTaskRunner401Policy:
                 except KeyboardInterrupt:
                     pass
                 
-                mock_api_client.assert_called_once_with(configuration=config)
+                mock_api_client.assert_called_once_with(configuration=config, token_broker=None)
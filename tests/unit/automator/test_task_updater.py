@@ -0,0 +1,176 @@
+import logging
+import threading
+
+import pytest
+
+from conductor.client.automator.task_updater import TaskUpdater
+from conductor.client.codegen.rest import ApiException
+from conductor.client.http.models.task_result import TaskResult
+from conductor.shared.automator.task_result_spool import TaskResultSpool
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def get_task_result(task_id="VALID_TASK_ID"):
+    return TaskResult(task_id=task_id, workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+
+
+def test_submit_delivers_task_result(mocker):
+    update_function = mocker.Mock(return_value="OK")
+    task_updater = TaskUpdater(update_function=update_function)
+    task_updater.start()
+
+    task_result = get_task_result()
+    task_updater.submit(task_result, "task")
+
+    assert task_updater.join(timeout=5)
+    update_function.assert_called_once_with(task_result)
+    task_updater.stop()
+
+
+def test_failed_update_is_retried_until_max_attempts(mocker):
+    update_function = mocker.Mock(side_effect=Exception("server down"))
+    task_updater = TaskUpdater(
+        update_function=update_function, max_attempts=3, base_delay_seconds=0
+    )
+    task_updater.start()
+
+    task_updater.submit(get_task_result(), "task")
+
+    assert task_updater.join(timeout=5)
+    assert update_function.call_count == 3
+    task_updater.stop()
+
+
+def test_retry_does_not_delay_other_updates(mocker):
+    delivered = []
+    failing_task_result = get_task_result("FAILING")
+
+    def update_function(task_result):
+        if task_result is failing_task_result:
+            raise Exception("server hiccup")
+        delivered.append(task_result.task_id)
+
+    task_updater = TaskUpdater(
+        update_function=update_function, thread_count=1, base_delay_seconds=60
+    )
+    task_updater.start()
+
+    task_updater.submit(failing_task_result, "task")
+    task_updater.submit(get_task_result("OTHER"), "task")
+
+    assert not task_updater.join(timeout=0.5)
+    assert delivered == ["OTHER"]
+    task_updater.stop(timeout=0)
+
+
+def test_is_backpressured_when_backlog_reaches_threshold(mocker):
+    release = threading.Event()
+    task_updater = TaskUpdater(
+        update_function=lambda task_result: release.wait(5),
+        thread_count=1,
+        backpressure_threshold=2,
+    )
+    task_updater.start()
+
+    task_updater.submit(get_task_result("1"), "task")
+    assert not task_updater.is_backpressured()
+    task_updater.submit(get_task_result("2"), "task")
+    assert task_updater.is_backpressured()
+
+    release.set()
+    assert task_updater.join(timeout=5)
+    assert not task_updater.is_backpressured()
+    task_updater.stop()
+
+
+def test_get_retry_delay_is_exponential_and_capped():
+    task_updater = TaskUpdater(
+        update_function=None,
+        base_delay_seconds=1.0,
+        max_delay_seconds=5.0,
+        jitter_percent=0,
+    )
+    assert task_updater.get_retry_delay(1) == 1.0
+    assert task_updater.get_retry_delay(2) == 2.0
+    assert task_updater.get_retry_delay(3) == 4.0
+    assert task_updater.get_retry_delay(4) == 5.0
+
+
+def get_spool(tmp_path):
+    return TaskResultSpool(
+        directory=str(tmp_path),
+        name="task",
+        serialize=lambda task_result: {"taskId": task_result.task_id},
+        deserialize=lambda data: get_task_result(data["taskId"]),
+    )
+
+
+def test_result_is_spooled_after_max_attempts(mocker, tmp_path):
+    update_function = mocker.Mock(side_effect=Exception("server down"))
+    spool = get_spool(tmp_path)
+    task_updater = TaskUpdater(
+        update_function=update_function,
+        max_attempts=2,
+        base_delay_seconds=0,
+        spool=spool,
+        replay_interval=60,
+    )
+    task_updater.start()
+
+    task_updater.submit(get_task_result(), "task")
+
+    assert task_updater.join(timeout=5)
+    assert [task_type for task_type, _ in spool.peek()] == ["task"]
+    task_updater.stop()
+
+
+def test_replay_resends_spooled_results_in_order(mocker, tmp_path):
+    spool = get_spool(tmp_path)
+    for task_id in ["1", "2", "3"]:
+        spool.append(get_task_result(task_id), "task")
+    delivered = []
+
+    def update_function(task_result):
+        if task_result.task_id == "3":
+            raise Exception("server down")
+        delivered.append(task_result.task_id)
+
+    task_updater = TaskUpdater(update_function=update_function, spool=spool)
+
+    assert task_updater.replay() == 2
+    assert delivered == ["1", "2"]
+    assert [task_result.task_id for _, task_result in spool.peek()] == ["3"]
+
+
+def test_replay_drops_results_the_server_refuses(mocker, tmp_path):
+    spool = get_spool(tmp_path)
+    spool.append(get_task_result("1"), "task")
+    update_function = mocker.Mock(side_effect=ApiException(status=404))
+    task_updater = TaskUpdater(update_function=update_function, spool=spool)
+
+    assert task_updater.replay() == 1
+    assert len(spool) == 0
+
+
+def test_stop_spools_pending_results(mocker, tmp_path):
+    spool = get_spool(tmp_path)
+    update_function = mocker.Mock(side_effect=Exception("server down"))
+    task_updater = TaskUpdater(
+        update_function=update_function,
+        base_delay_seconds=60,
+        spool=spool,
+        replay_interval=60,
+    )
+    task_updater.start()
+    task_updater.submit(get_task_result(), "task")
+    assert not task_updater.join(timeout=0.5)
+
+    task_updater.stop(timeout=0)
+
+    assert len(spool) == 1
@@ -0,0 +1,160 @@
+import logging
+import multiprocessing
+from sys import platform
+
+import pytest
+
+from conductor.client.automator.task_handler import TaskHandler
+from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.automator.token_broker import TokenBroker
+from conductor.client.configuration.configuration import Configuration
+from conductor.shared.configuration.settings.authentication_settings import (
+    AuthenticationSettings,
+)
+from conductor.client.http.api_client import ApiClient
+from conductor.client.worker.worker import Worker
+from tests.unit.resources.workers import ClassWorker
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def configuration():
+    return Configuration(
+        server_api_url="http://localhost:8080/api",
+        authentication_settings=AuthenticationSettings(key_id="id", key_secret="secret"),
+    )
+
+
+def test_refresh_shares_token(configuration):
+    token_broker = TokenBroker(configuration)
+    assert token_broker.get_token()[:2] == (None, 0)
+
+    assert token_broker.refresh(lambda: "token") == ("token", 1)
+
+    token, generation, update_time = token_broker.get_token()
+    assert (token, generation) == ("token", 1)
+    assert not token_broker.is_expired(update_time)
+
+
+def test_refresh_is_skipped_when_stale_token_was_already_replaced(mocker, configuration):
+    token_broker = TokenBroker(configuration)
+    token_broker.refresh(lambda: "first")
+    token_broker.refresh(lambda: "second", stale_generation=1)
+    fetch_token = mocker.Mock(return_value="third")
+
+    assert token_broker.refresh(fetch_token, stale_generation=1) == ("second", 2)
+    fetch_token.assert_not_called()
+
+
+def test_failed_refresh_keeps_current_token(configuration):
+    token_broker = TokenBroker(configuration)
+    token_broker.refresh(lambda: "token")
+
+    assert token_broker.refresh(lambda: None, stale_generation=1) == ("token", 1)
+
+
+def _refresh_in_child(token_broker):
+    token_broker.refresh(lambda: "from child")
+
+
+@pytest.mark.skipif(platform == "win32", reason="relies on fork")
+def test_token_is_shared_across_processes(configuration):
+    token_broker = TokenBroker(configuration)
+    process = multiprocessing.get_context("fork").Process(
+        target=_refresh_in_child, args=(token_broker,)
+    )
+    process.start()
+    process.join(timeout=10)
+
+    assert token_broker.get_token()[:2] == ("from child", 1)
+
+
+def test_api_client_takes_token_from_broker(mocker, configuration):
+    get_new_token = mocker.patch.object(
+        ApiClient, "_ApiClient__get_new_token", return_value="fetched"
+    )
+    token_broker = TokenBroker(configuration)
+    api_client = ApiClient(configuration, token_broker=token_broker)
+    get_new_token.assert_not_called()
+
+    token_broker.refresh(lambda: "shared")
+
+    assert api_client._ApiClient__get_authentication_headers() == {
+        "header": {"X-Authorization": "shared"}
+    }
+    get_new_token.assert_not_called()
+
+
+def test_api_client_fetches_through_broker_when_token_is_missing(mocker, configuration):
+    mocker.patch.object(ApiClient, "_ApiClient__get_new_token", return_value="fetched")
+    token_broker = TokenBroker(configuration)
+    api_client = ApiClient(configuration, token_broker=token_broker)
+
+    assert api_client._ApiClient__get_authentication_headers() == {
+        "header": {"X-Authorization": "fetched"}
+    }
+    assert token_broker.get_token()[:2] == ("fetched", 1)
+
+
+def test_api_client_force_refresh_is_single_flight(mocker, configuration):
+    get_new_token = mocker.patch.object(
+        ApiClient, "_ApiClient__get_new_token", return_value="fetched"
+    )
+    token_broker = TokenBroker(configuration)
+    token_broker.refresh(lambda: "expired")
+    api_client = ApiClient(configuration, token_broker=token_broker)
+    api_client._ApiClient__get_authentication_headers()
+
+    # Another process already replaced the token this client saw rejected
+    token_broker.refresh(lambda: "replaced", stale_generation=1)
+    api_client._ApiClient__force_refresh_auth_token()
+
+    get_new_token.assert_not_called()
+    assert api_client._ApiClient__get_authentication_headers() == {
+        "header": {"X-Authorization": "replaced"}
+    }
+
+    api_client._ApiClient__force_refresh_auth_token()
+    get_new_token.assert_called_once()
+    assert token_broker.get_token()[:2] == ("fetched", 3)
+
+
+def test_task_handler_creates_broker_when_authentication_is_configured(
+    mocker, configuration
+):
+    mocker.patch(
+        "conductor.client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    task_handler = TaskHandler(
+        configuration=configuration, workers=[ClassWorker("task")]
+    )
+    assert isinstance(task_handler.token_broker, TokenBroker)
+
+
+def test_task_handler_without_authentication_has_no_broker(mocker):
+    mocker.patch(
+        "conductor.client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    task_handler = TaskHandler(
+        configuration=Configuration("http://localhost:8080/api"),
+        workers=[ClassWorker("task")],
+    )
+    assert task_handler.token_broker is None
+
+
+def test_task_runner_shares_its_api_client_with_worker(mocker, configuration):
+    mocker.patch.object(ApiClient, "_ApiClient__get_new_token", return_value="token")
+    worker = Worker("task", lambda param: param)
+    assert worker._api_client is None
+
+    task_runner = TaskRunner(worker, configuration, token_broker=TokenBroker(configuration))
+
+    assert worker.api_client is task_runner.task_client.api_client
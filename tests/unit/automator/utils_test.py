@@ -1,11 +1,19 @@
 import logging
+import pickle
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
 
 import pytest
 from requests.structures import CaseInsensitiveDict
 
-from conductor.shared.automator.utils import convert_from_dict
+from conductor.shared.automator import utils
+from conductor.shared.automator.utils import (
+    TaskInputBinder,
+    convert_from_dict,
+    convert_from_dict_or_list,
+    get_class_converter,
+    get_input_converter,
+)
 from tests.unit.resources.workers import UserInfo
 
 
@@ -83,3 +91,121 @@ def test_convert_dataclass():
     }
     value = convert_from_dict(UserDetails, dictionary)
     assert type(value) is UserDetails, f"expected UserInfo, found {type(value)}"
+
+
+class Node:
+    def __init__(self, name: str = None, children: List[UserInfo] = None) -> None:  # noqa: RUF013
+        self.name = name
+        self.children = children
+
+
+class Tree:
+    def __init__(self, root: Node, labels: Dict[str, UserInfo], tags: list) -> None:
+        self.root = root
+        self.labels = labels
+        self.tags = tags
+
+
+def test_compiled_converter_matches_convert_from_dict():
+    dictionary = {
+        "a": 123,
+        "b": [{"ba": 2}, {"ba": 21}],
+        "d": [{"name": "conductor", "id": 123}, {"F": 3}],
+        "g": {
+            "userA": {"name": "userA", "id": 100},
+            "userB": {"name": "userB", "id": 101},
+        },
+    }
+    expected = convert_from_dict(Test, dictionary)
+    value = get_class_converter(Test)(dictionary)
+    assert type(value) is Test
+    assert value.a == expected.a
+    assert [vars(b) for b in value.b] == [vars(b) for b in expected.b]
+    assert [vars(d) for d in value.d] == [vars(d) for d in expected.d]
+    assert {k: vars(v) for k, v in value.g.items()} == {
+        k: vars(v) for k, v in expected.g.items()
+    }
+
+
+def test_compiled_converter_matches_convert_from_dict_for_dataclass():
+    dictionary = {
+        "name": "user_a",
+        "id": 123,
+        "address": [{"street": "21 jump street", "zip": "10101", "country": "USA"}],
+    }
+    assert get_class_converter(UserDetails)(dictionary) == convert_from_dict(
+        UserDetails, dictionary
+    )
+
+
+def test_compiled_converter_handles_nested_classes():
+    dictionary = {
+        "root": {"name": "root", "children": [{"name": "leaf"}]},
+        "labels": {"owner": {"name": "userA", "id": 100}},
+        "tags": ["a", {"b": 1}],
+    }
+    expected = convert_from_dict(Tree, dictionary)
+    value = get_class_converter(Tree)(dictionary)
+    assert value.root.name == expected.root.name == "root"
+    assert [vars(c) for c in value.root.children] == [
+        vars(c) for c in expected.root.children
+    ]
+    assert vars(value.labels["owner"]) == vars(expected.labels["owner"])
+    assert value.tags == expected.tags
+
+
+def test_input_converter_matches_convert_from_dict_or_list():
+    data = [{"street": "21 jump street", "zip": "10101", "country": "USA"}, None]
+    assert get_input_converter(List[Address])(data) == convert_from_dict_or_list(
+        List[Address], data
+    )
+    assert get_input_converter(Address)(data[0]) == convert_from_dict_or_list(
+        Address, data[0]
+    )
+
+
+def test_converters_are_cached_per_type():
+    assert get_class_converter(UserDetails) is get_class_converter(UserDetails)
+    assert get_input_converter(List[Address]) is get_input_converter(List[Address])
+
+
+def test_task_input_binder_binds_and_converts_input():
+    def execute(user: UserDetails, count: int, comment: str = "none", missing: str = None):  # noqa: RUF013
+        pass
+
+    binder = TaskInputBinder(execute)
+    task_input = binder.bind(
+        {
+            "user": {"name": "user_a", "id": 1, "address": []},
+            "count": 3,
+        }
+    )
+    assert task_input == {
+        "user": UserDetails(name="user_a", id=1, address=[]),
+        "count": 3,
+        "comment": "none",
+        "missing": None,
+    }
+
+
+def test_task_input_binder_inspects_signature_once(mocker):
+    def execute(user: UserDetails, count: int):
+        pass
+
+    binder = TaskInputBinder(execute)
+    signature = mocker.spy(utils.inspect, "signature")
+    for _ in range(3):
+        binder.bind({"user": {"name": "user_a", "id": 1, "address": []}, "count": 3})
+    signature.assert_not_called()
+
+
+def execute_with_address(address: Address, count: int = 1):
+    return address
+
+
+def test_task_input_binder_is_picklable():
+    binder = pickle.loads(pickle.dumps(TaskInputBinder(execute_with_address)))
+    assert binder.bind({"address": {"street": "s", "zip": "z", "country": "c"}}) == {
+        "address": Address(street="s", zip="z", country="c"),
+        "count": 1,
+    }
@@ -499,3 +499,30 @@ async def test_get_workflow_def_by_name(mocker, metadata_client, workflow_def):
         tag_value=None,
     )
     assert len(workflows) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_metadata_pushes_only_changes(mocker, metadata_client, extended_workflow_def):
+    async def get_task_defs(**kwargs):
+        return [TaskDefAdapter(name=TASK_NAME, timeout_seconds=60, retry_count=3, owner_app="app")]
+
+    async def get_workflow_defs(**kwargs):
+        remote_task = WorkflowTaskAdapter(
+            name=TASK_NAME, task_reference_name=WORKFLOW_TASK_REF, type="SIMPLE", optional=False
+        )
+        return [WorkflowDefAdapter(name=WORKFLOW_NAME, version=1, timeout_seconds=1, schema_version=2, tasks=[remote_task])]
+
+    mocker.patch.object(MetadataResourceApiAdapter, "get_task_defs", side_effect=get_task_defs)
+    mocker.patch.object(MetadataResourceApiAdapter, "get_workflow_defs", side_effect=get_workflow_defs)
+    register_task_def = mocker.patch.object(MetadataResourceApiAdapter, "register_task_def")
+    update_task_def = mocker.patch.object(MetadataResourceApiAdapter, "update_task_def")
+    create = mocker.patch.object(MetadataResourceApiAdapter, "create")
+    changed_task_def = ExtendedTaskDefAdapter(name=TASK_NAME, timeout_seconds=60, retry_count=5)
+
+    result = await metadata_client.sync_metadata([extended_workflow_def], [changed_task_def])
+
+    register_task_def.assert_not_called()
+    update_task_def.assert_called_once_with(changed_task_def)
+    create.assert_not_called()
+    assert result.updated == [TASK_NAME]
+    assert result.unchanged == 1
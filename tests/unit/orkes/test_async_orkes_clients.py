@@ -0,0 +1,66 @@
+import logging
+
+import pytest
+
+from conductor.asyncio_client.adapters import ApiClient
+from conductor.asyncio_client.adapters.api.metadata_resource_api import (
+    MetadataResourceApiAdapter,
+)
+from conductor.asyncio_client.configuration.configuration import Configuration
+from conductor.asyncio_client.orkes.orkes_clients import OrkesClients
+from conductor.asyncio_client.orkes.orkes_metadata_client import OrkesMetadataClient
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def configuration():
+    return Configuration("http://localhost:8080/api")
+
+
+def test_clients_share_one_lazily_created_api_client(mocker, configuration):
+    api_client_class = mocker.patch(
+        "conductor.asyncio_client.orkes.orkes_clients.ApiClient", wraps=ApiClient
+    )
+    orkes_clients = OrkesClients(configuration=configuration)
+    api_client_class.assert_not_called()
+
+    clients = [
+        orkes_clients.get_workflow_client(),
+        orkes_clients.get_task_client(),
+        orkes_clients.get_metadata_client(),
+        orkes_clients.get_secret_client(),
+    ]
+
+    api_client_class.assert_called_once_with(configuration)
+    assert all(client.api_client is orkes_clients.api_client for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_close_only_closes_created_api_client(mocker, configuration):
+    api_client = ApiClient(configuration)
+    close = mocker.patch.object(api_client, "close", mocker.AsyncMock())
+    await OrkesClients(api_client, configuration).close()
+    close.assert_not_called()
+
+    orkes_clients = OrkesClients(configuration=configuration)
+    created_api_client = orkes_clients.api_client
+    close = mocker.patch.object(created_api_client, "close", mocker.AsyncMock())
+    await orkes_clients.close()
+    close.assert_awaited_once()
+
+
+def test_resource_apis_are_created_on_first_use(configuration):
+    client = OrkesMetadataClient(configuration, ApiClient(configuration))
+    assert "metadata_api" not in vars(client)
+
+    metadata_api = client.metadata_api
+
+    assert isinstance(metadata_api, MetadataResourceApiAdapter)
+    assert client.metadata_api is metadata_api
+    assert "task_api" not in vars(client)
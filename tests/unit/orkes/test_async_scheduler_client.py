@@ -76,6 +76,24 @@ async def test_get_schedule(mocker, scheduler_client, workflow_schedule):
     mock.assert_called_with(SCHEDULE_NAME)
 
 
+@pytest.mark.asyncio
+async def test_get_schedule_with_metadata_cache(mocker, workflow_schedule):
+    configuration = Configuration(
+        "http://schedule-cache:8080/api", metadata_cache_ttl_seconds=60
+    )
+    scheduler_client = OrkesSchedulerClient(configuration, ApiClient(configuration))
+    get_schedule = mocker.patch.object(
+        SchedulerResourceApiAdapter, "get_schedule", return_value=workflow_schedule
+    )
+    mocker.patch.object(SchedulerResourceApiAdapter, "pause_schedule")
+    assert await scheduler_client.get_schedule(SCHEDULE_NAME) == workflow_schedule
+    assert await scheduler_client.get_schedule(SCHEDULE_NAME) == workflow_schedule
+    assert get_schedule.call_count == 1
+    await scheduler_client.pause_schedule(SCHEDULE_NAME)
+    await scheduler_client.get_schedule(SCHEDULE_NAME)
+    assert get_schedule.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_schedule_non_existing(mocker, scheduler_client):
     mock = mocker.patch.object(SchedulerResourceApiAdapter, "get_schedule")
@@ -1,16 +1,21 @@
 import json
 import logging
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from conductor.asyncio_client.configuration.configuration import Configuration
+from conductor.asyncio_client.adapters.api.workflow_bulk_resource_api import WorkflowBulkResourceApiAdapter
 from conductor.asyncio_client.adapters.api.workflow_resource_api import WorkflowResourceApiAdapter
+from conductor.asyncio_client.adapters.models.bulk_response_adapter import BulkResponseAdapter
 from conductor.asyncio_client.adapters.models.skip_task_request_adapter import SkipTaskRequestAdapter
 from conductor.asyncio_client.adapters.models.rerun_workflow_request_adapter import RerunWorkflowRequestAdapter
+from conductor.asyncio_client.adapters.models.workflow_status_adapter import WorkflowStatusAdapter
 from conductor.asyncio_client.adapters.models.start_workflow_request_adapter import StartWorkflowRequestAdapter
 from conductor.asyncio_client.adapters.models.workflow_adapter import WorkflowAdapter
 from conductor.asyncio_client.adapters.models.workflow_def_adapter import WorkflowDefAdapter
 from conductor.asyncio_client.adapters.models.workflow_run_adapter import WorkflowRunAdapter
+from conductor.asyncio_client.adapters.models.workflow_summary_adapter import WorkflowSummaryAdapter
 from conductor.asyncio_client.adapters.models.workflow_test_request_adapter import WorkflowTestRequestAdapter
 from conductor.asyncio_client.http.rest import ApiException
 from conductor.asyncio_client.orkes.orkes_workflow_client import OrkesWorkflowClient
@@ -308,3 +313,56 @@ async def test_test_workflow(mocker, workflow_client):
     wf = await workflow_client.test_workflow(test_request)
     mock.assert_called_with(workflow_test_request=test_request)
     assert wf == expected_wf
+
+
+@pytest.mark.asyncio
+async def test_iter_search(mocker, workflow_client):
+    def get_search_page(results):
+        response = MagicMock(status=200, data=json.dumps({"totalHits": 3, "results": results}).encode())
+        response.read = AsyncMock(return_value=response.data)
+        response.getheader.return_value = "application/json"
+        response.getheaders.return_value = {}
+        return response
+
+    mock = mocker.patch.object(WorkflowResourceApiAdapter, "search_without_preload_content")
+    mock.side_effect = [
+        get_search_page([{"workflowId": "wf_0"}, {"workflowId": "wf_1"}]),
+        get_search_page([{"workflowId": "wf_2"}]),
+    ]
+    workflows = [
+        workflow async for workflow in workflow_client.iter_search(query="status IN (RUNNING)", page_size=2)
+    ]
+    assert [workflow.workflow_id for workflow in workflows] == ["wf_0", "wf_1", "wf_2"]
+    assert all(isinstance(workflow, WorkflowSummaryAdapter) for workflow in workflows)
+    mock.assert_called_with(
+        start=2, size=2, sort=None, free_text="*", query="status IN (RUNNING)", skip_cache=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_terminate_workflows(mocker, workflow_client):
+    async def terminate(chunk, **kwargs):
+        return BulkResponseAdapter(bulk_successful_results=[], bulk_error_results={})
+
+    mock = mocker.patch.object(WorkflowBulkResourceApiAdapter, "terminate", side_effect=terminate)
+    workflow_ids = [f"wf_{i}" for i in range(5)]
+    response = await workflow_client.bulk_terminate_workflows(workflow_ids, reason="cleanup", chunk_size=2)
+    assert mock.call_count == 3
+    mock.assert_any_call(["wf_4"], reason="cleanup", trigger_failure_workflow=None)
+    assert isinstance(response, BulkResponseAdapter)
+    assert response.bulk_error_results == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_workflows(mocker, workflow_client):
+    async def get_workflow_status_summary(workflow_id, include_output, include_variables):
+        return WorkflowStatusAdapter(workflow_id=workflow_id, status="COMPLETED")
+
+    mocker.patch.object(
+        WorkflowResourceApiAdapter, "get_workflow_status_summary", side_effect=get_workflow_status_summary
+    )
+    statuses = await workflow_client.wait_for_workflows(["wf1", "wf2"], timeout=5)
+    assert {workflow_id: status.status for workflow_id, status in statuses.items()} == {
+        "wf1": "COMPLETED",
+        "wf2": "COMPLETED",
+    }
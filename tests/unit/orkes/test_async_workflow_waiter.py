@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from conductor.asyncio_client.adapters.models.workflow_status_adapter import WorkflowStatusAdapter
+from conductor.asyncio_client.http.exceptions import ApiException
+from conductor.asyncio_client.orkes.workflow_waiter import AsyncWorkflowWaiter
+
+WORKFLOW_UUID = "ut_wf_uuid"
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def create_waiter(get_workflow_status):
+    workflow_client = MagicMock()
+    workflow_client.get_workflow_status.side_effect = get_workflow_status
+    return AsyncWorkflowWaiter(workflow_client, min_poll_interval=0.01, max_poll_interval=0.05)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_resolves_when_workflow_is_terminal():
+    statuses = iter(["RUNNING", "RUNNING", "COMPLETED"])
+
+    async def get_workflow_status(workflow_id, include_output):
+        return WorkflowStatusAdapter(workflow_id=workflow_id, status=next(statuses))
+
+    async with create_waiter(get_workflow_status) as waiter:
+        status = await asyncio.wait_for(waiter.wait_for(WORKFLOW_UUID), 5)
+    assert status.workflow_id == WORKFLOW_UUID
+    assert status.status == "COMPLETED"
+    assert waiter.workflow_client.get_workflow_status.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_for_all():
+    polls = {}
+
+    async def get_workflow_status(workflow_id, include_output):
+        polls[workflow_id] = polls.get(workflow_id, 0) + 1
+        # Workflow i completes on its i-th poll
+        done = polls[workflow_id] >= int(workflow_id)
+        return WorkflowStatusAdapter(workflow_id=workflow_id, status="TIMED_OUT" if done else "RUNNING")
+
+    workflow_ids = [str(i) for i in range(1, 6)]
+    async with create_waiter(get_workflow_status) as waiter:
+        statuses = await waiter.wait_for_all(workflow_ids, timeout=5)
+    assert list(statuses) == workflow_ids
+    assert all(status.status == "TIMED_OUT" for status in statuses.values())
+    assert polls == {workflow_id: int(workflow_id) for workflow_id in workflow_ids}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_all_times_out_without_cancelling():
+    async def get_workflow_status(workflow_id, include_output):
+        return WorkflowStatusAdapter(workflow_id=workflow_id, status="RUNNING")
+
+    waiter = create_waiter(get_workflow_status)
+    with pytest.raises(asyncio.TimeoutError):
+        await waiter.wait_for_all([WORKFLOW_UUID], timeout=0.1)
+    future = waiter.wait_for(WORKFLOW_UUID)
+    assert not future.done()
+    await waiter.close()
+    assert future.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_fails_missing_workflows():
+    async def get_workflow_status(workflow_id, include_output):
+        raise ApiException(status=404, reason="Not Found")
+
+    async with create_waiter(get_workflow_status) as waiter:
+        with pytest.raises(ApiException):
+            await asyncio.wait_for(waiter.wait_for(WORKFLOW_UUID), 5)
@@ -9,10 +9,12 @@ from conductor.client.http.models.tag_string import TagStringAdapter as TagStrin
 from conductor.client.http.models.task_def import TaskDefAdapter as TaskDef
 from conductor.client.http.models.workflow_def import WorkflowDefAdapter as WorkflowDef
 from conductor.client.codegen.rest import ApiException
+from conductor.client.metadata_client import MetadataClient
 from conductor.client.orkes.api.tags_api import TagsApi
 from conductor.client.orkes.models.metadata_tag import MetadataTag
 from conductor.client.orkes.models.ratelimit_tag import RateLimitTag
 from conductor.client.orkes.orkes_metadata_client import OrkesMetadataClient
+from conductor.shared.worker import TaskOptions, apply_task_options_to_task_def
 
 WORKFLOW_NAME = "ut_wf"
 TASK_NAME = "ut_task"
@@ -152,6 +154,20 @@ def test_get_task_def(mocker, metadata_client, task_def):
     mock.assert_called_with(TASK_NAME)
 
 
+def test_get_workflow_def_with_metadata_cache(mocker, workflow_def):
+    configuration = Configuration("http://metadata-cache:8080/api", metadata_cache_ttl_seconds=60)
+    metadata_client = OrkesMetadataClient(configuration)
+    get1 = mocker.patch.object(MetadataResourceApi, "get1", return_value=workflow_def)
+    mocker.patch.object(MetadataResourceApi, "update")
+    assert metadata_client.get_workflow_def(WORKFLOW_NAME, 1) == workflow_def
+    assert metadata_client.get_workflow_def(WORKFLOW_NAME, 1) == workflow_def
+    assert get1.call_count == 1
+    metadata_client.update_workflow_def(workflow_def)
+    metadata_client.get_workflow_def(WORKFLOW_NAME, 1)
+    assert get1.call_count == 2
+    assert metadata_client.metadata_cache.hits == 1
+
+
 def test_get_all_task_defs(mocker, metadata_client, task_def):
     mock = mocker.patch.object(MetadataResourceApi, "get_task_defs")
     expected_tasks_defs_len = 2
@@ -264,3 +280,60 @@ def test_remove_workflow_rate_limit(mocker, metadata_client):
     metadata_client.removeWorkflowRateLimit(WORKFLOW_NAME)
     rate_limit_tag = RateLimitTag(WORKFLOW_NAME, 5)
     patched_tags_api.assert_called_with(rate_limit_tag, WORKFLOW_NAME)
+
+
+def test_sync_metadata_pushes_only_changes(mocker, metadata_client):
+    task_def = TaskDef(name=TASK_NAME)
+    apply_task_options_to_task_def(task_def, TaskOptions(timeout_seconds=60, retry_count=2))
+    new_task_def = TaskDef(name="new_task")
+    workflow_def = WorkflowDef(name=WORKFLOW_NAME, version=1, timeout_seconds=60)
+    changed_workflow_def = WorkflowDef(name="changed_wf", version=2, timeout_seconds=30)
+    mocker.patch.object(MetadataResourceApi, "get_task_defs", return_value=[
+        TaskDef(name=TASK_NAME, timeout_seconds=60, retry_count=2, response_timeout_seconds=3600, owner_app="app"),
+    ])
+    mocker.patch.object(MetadataResourceApi, "get_workflow_defs", return_value=[
+        WorkflowDef(name=WORKFLOW_NAME, version=1, timeout_seconds=60, schema_version=2),
+        WorkflowDef(name="changed_wf", version=2, timeout_seconds=60),
+    ])
+    register_task_def = mocker.patch.object(MetadataResourceApi, "register_task_def")
+    update_task_def = mocker.patch.object(MetadataResourceApi, "update_task_def")
+    update = mocker.patch.object(MetadataResourceApi, "update")
+
+    result = metadata_client.sync_metadata([workflow_def, changed_workflow_def], [task_def, new_task_def])
+
+    register_task_def.assert_called_once_with([new_task_def])
+    update_task_def.assert_not_called()
+    update.assert_called_once_with([changed_workflow_def], overwrite=True)
+    assert result.created == ["new_task"]
+    assert result.updated == ["changed_wf"]
+    assert result.unchanged == 2
+    assert result.errors == {}
+
+
+def test_sync_metadata_pushes_task_defs_before_workflow_defs(mocker, metadata_client):
+    calls = []
+    mocker.patch.object(MetadataResourceApi, "get_task_defs", return_value=[])
+    mocker.patch.object(MetadataResourceApi, "get_workflow_defs", return_value=[])
+    mocker.patch.object(MetadataResourceApi, "register_task_def",
+                        side_effect=lambda task_defs: calls.append(task_defs[0].name))
+    mocker.patch.object(MetadataResourceApi, "update",
+                        side_effect=lambda workflow_defs, overwrite: calls.append(workflow_defs[0].name))
+    task_defs = [TaskDef(name=f"task_{i}") for i in range(4)]
+    result = metadata_client.sync_metadata([WorkflowDef(name=WORKFLOW_NAME)], task_defs, max_concurrency=4)
+    assert sorted(calls[:4]) == [task_def.name for task_def in task_defs]
+    assert calls[4] == WORKFLOW_NAME
+    assert result.created == [task_def.name for task_def in task_defs] + [WORKFLOW_NAME]
+
+
+def test_sync_metadata_without_changes_only_reads(mocker, metadata_client, workflow_def):
+    get_task_defs = mocker.patch.object(MetadataResourceApi, "get_task_defs")
+    mocker.patch.object(MetadataResourceApi, "get_workflow_defs", return_value=[workflow_def])
+    update = mocker.patch.object(MetadataResourceApi, "update")
+    result = metadata_client.sync_metadata(workflow_defs=[WorkflowDef(name=WORKFLOW_NAME, version=1)])
+    get_task_defs.assert_not_called()
+    update.assert_not_called()
+    assert result.unchanged == 1
+
+
+def test_sync_metadata_is_optional_for_metadata_clients():
+    assert "sync_metadata" not in MetadataClient.__abstractmethods__
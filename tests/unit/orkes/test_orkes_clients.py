@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.metadata_resource_api import MetadataResourceApi
+from conductor.client.http.api_client import ApiClient
+from conductor.client.orkes.orkes_metadata_client import OrkesMetadataClient
+from conductor.client.orkes_clients import OrkesClients
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def configuration():
+    return Configuration("http://localhost:8080/api")
+
+
+def test_api_client_is_created_on_first_use(mocker, configuration):
+    api_client_class = mocker.patch(
+        "conductor.client.orkes_clients.ApiClient", wraps=ApiClient
+    )
+    orkes_clients = OrkesClients(configuration)
+    api_client_class.assert_not_called()
+
+    orkes_clients.get_workflow_client()
+    orkes_clients.get_task_client()
+    orkes_clients.get_metadata_client()
+
+    api_client_class.assert_called_once_with(configuration)
+
+
+def test_clients_share_one_api_client(configuration):
+    orkes_clients = OrkesClients(configuration)
+    clients = [
+        orkes_clients.get_workflow_client(),
+        orkes_clients.get_authorization_client(),
+        orkes_clients.get_metadata_client(),
+        orkes_clients.get_scheduler_client(),
+        orkes_clients.get_secret_client(),
+        orkes_clients.get_task_client(),
+        orkes_clients.get_integration_client(),
+        orkes_clients.get_prompt_client(),
+        orkes_clients.get_schema_client(),
+        orkes_clients.get_event_client(),
+    ]
+    assert all(client.api_client is orkes_clients.api_client for client in clients)
+    executor = orkes_clients.get_workflow_executor()
+    assert executor.workflow_client.api_client is orkes_clients.api_client
+
+
+def test_api_client_can_be_passed_in(configuration):
+    api_client = ApiClient(configuration)
+    orkes_clients = OrkesClients(configuration, api_client=api_client)
+    assert orkes_clients.get_secret_client().api_client is api_client
+
+
+def test_resource_apis_are_created_on_first_use(configuration):
+    client = OrkesMetadataClient(configuration)
+    assert "metadataResourceApi" not in vars(client)
+
+    metadata_api = client.metadataResourceApi
+
+    assert isinstance(metadata_api, MetadataResourceApi)
+    assert metadata_api.api_client is client.api_client
+    assert client.metadataResourceApi is metadata_api
+    assert "taskResourceApi" not in vars(client)
@@ -1,5 +1,6 @@
 import json
 import logging
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -8,6 +9,7 @@ from conductor.client.http.api import SchedulerResourceApi
 from conductor.client.http.models.save_schedule_request import SaveScheduleRequestAdapter as SaveScheduleRequest
 from conductor.client.http.models.search_result_workflow_schedule_execution_model import SearchResultWorkflowScheduleExecutionModelAdapter as SearchResultWorkflowScheduleExecutionModel
 from conductor.client.http.models.workflow_schedule import WorkflowScheduleAdapter as WorkflowSchedule
+from conductor.client.http.models.workflow_schedule_execution_model import WorkflowScheduleExecutionModel
 from conductor.client.codegen.rest import ApiException
 from conductor.client.orkes.models.metadata_tag import MetadataTag
 from conductor.client.orkes.orkes_scheduler_client import OrkesSchedulerClient
@@ -204,3 +206,16 @@ def test_delete_scheduler_tags(mocker, scheduler_client):
     tags = [tag1, tag2]
     scheduler_client.delete_scheduler_tags(tags, SCHEDULE_NAME)
     mock.assert_called_with(tags, SCHEDULE_NAME)
+
+
+def test_iter_search_schedule_executions(mocker, scheduler_client):
+    page = {"results": [{"scheduleName": SCHEDULE_NAME, "workflowName": WORKFLOW_NAME}]}
+    mock = mocker.patch.object(SchedulerResourceApi, "search_v2")
+    mock.return_value = MagicMock(resp=MagicMock(content=json.dumps(page).encode()))
+    executions = list(scheduler_client.iter_search_schedule_executions(query=f"workflowName={WORKFLOW_NAME}"))
+    assert len(executions) == 1
+    assert isinstance(executions[0], WorkflowScheduleExecutionModel)
+    assert executions[0].schedule_name == SCHEDULE_NAME
+    mock.assert_called_once_with(
+        _preload_content=False, start=0, size=100, free_text="*", query=f"workflowName={WORKFLOW_NAME}"
+    )
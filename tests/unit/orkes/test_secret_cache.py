@@ -0,0 +1,162 @@
+import threading
+
+import pytest
+
+from conductor.client.codegen.rest import ApiException
+from conductor.client.orkes import secret_cache
+from conductor.client.orkes.secret_cache import SecretCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Loader:
+    def __init__(self):
+        self.calls = []
+        self.error = None
+
+    def __call__(self, key):
+        self.calls.append(key)
+        if self.error is not None:
+            raise self.error
+        return f"{key}-{len(self.calls)}"
+
+
+@pytest.fixture
+def clock(mocker):
+    clock = Clock()
+    mocker.patch.object(secret_cache.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def load():
+    return Loader()
+
+
+def wait_for_refresh(cache, key):
+    future = cache._loading.get(key)
+    if future is not None:
+        future.result(timeout=5)
+
+
+def test_value_is_cached_until_it_expires(clock, load):
+    cache = SecretCache(load, ttl_seconds=10, refresh_ratio=1)
+    assert cache.get("db") == "db-1"
+    clock.now += 9
+    assert cache.get("db") == "db-1"
+    clock.now += 1
+    assert cache.get("db") == "db-2"
+
+
+def test_ttl_can_be_set_per_key(clock, load):
+    cache = SecretCache(load, ttl_seconds=10, refresh_ratio=1)
+    cache.get("db", ttl_seconds=100)
+    clock.now += 50
+    assert cache.get("db") == "db-1"
+
+
+def test_value_read_near_expiry_is_refreshed_in_background(clock, load):
+    cache = SecretCache(load, ttl_seconds=10, refresh_ratio=0.5)
+    cache.get("db")
+    clock.now += 6
+    assert cache.get("db") == "db-1"
+    wait_for_refresh(cache, "db")
+    assert cache.get("db") == "db-2"
+    assert load.calls == ["db", "db"]
+
+
+def test_concurrent_misses_load_once():
+    release = threading.Event()
+    calls = []
+
+    def load(key):
+        calls.append(key)
+        release.wait(5)
+        return "value"
+
+    cache = SecretCache(load, ttl_seconds=10)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("db"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert results == ["value"] * 8
+    assert calls == ["db"]
+
+
+@pytest.mark.parametrize("error", [ApiException(status=503), ApiException(status=0), ConnectionError()])
+def test_expired_value_is_used_when_server_is_unavailable(clock, load, error):
+    cache = SecretCache(load, ttl_seconds=10, refresh_ratio=1, stale_if_error_seconds=10)
+    cache.get("db")
+    load.error = error
+    clock.now += 15
+    assert cache.get("db") == "db-1"
+    clock.now += 5
+    with pytest.raises(type(error)):
+        cache.get("db")
+
+
+@pytest.mark.parametrize("status", [403, 404])
+def test_value_is_dropped_when_secret_is_no_longer_readable(clock, load, status):
+    cache = SecretCache(load, ttl_seconds=10, refresh_ratio=1, stale_if_error_seconds=10)
+    cache.get("db")
+    load.error = ApiException(status=status)
+    clock.now += 15
+    with pytest.raises(ApiException):
+        cache.get("db")
+    assert len(cache) == 0
+
+
+def test_failed_refresh_is_not_retried_right_away(clock, load):
+    cache = SecretCache(load, ttl_seconds=100, refresh_ratio=0.5)
+    cache.get("db")
+    load.error = ApiException(status=503)
+    clock.now += 60
+    assert cache.get("db") == "db-1"
+    wait_for_refresh(cache, "db")
+    assert cache.get("db") == "db-1"
+    assert len(load.calls) == 2
+    clock.now += secret_cache.REFRESH_BACKOFF_SECONDS
+    cache.get("db")
+    wait_for_refresh(cache, "db")
+    assert len(load.calls) == 3
+
+
+def test_load_interrupted_by_base_exception_does_not_block_later_reads(load):
+    cache = SecretCache(load, ttl_seconds=10)
+    load.error = KeyboardInterrupt()
+    with pytest.raises(KeyboardInterrupt):
+        cache.get("db")
+    load.error = None
+    assert cache.get("db") == "db-2"
+
+
+def test_invalidate_drops_value(load):
+    cache = SecretCache(load, ttl_seconds=10)
+    cache.get("db")
+    cache.invalidate("db")
+    assert len(cache) == 0
+    assert cache.get("db") == "db-2"
+
+
+def test_least_recently_used_value_is_dropped(load):
+    cache = SecretCache(load, ttl_seconds=10, max_size=2)
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+    assert set(cache._entries) == {"a", "c"}
+
+
+def test_values_are_not_shown(load):
+    cache = SecretCache(load, ttl_seconds=10)
+    cache.get("db")
+    assert "db-1" not in repr(cache._entries)
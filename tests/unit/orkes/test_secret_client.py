@@ -44,6 +44,19 @@ def test_get_secret(mocker, secret_client):
     assert secret == SECRET_VALUE
 
 
+def test_get_secret_with_secret_cache(mocker):
+    configuration = Configuration("http://localhost:8080/api", secret_cache_ttl_seconds=60)
+    secret_client = OrkesSecretClient(configuration)
+    get_secret = mocker.patch.object(SecretResourceApi, "get_secret", return_value=SECRET_VALUE)
+    mocker.patch.object(SecretResourceApi, "put_secret")
+    assert secret_client.get_secret(SECRET_KEY) == SECRET_VALUE
+    assert secret_client.get_secret(SECRET_KEY) == SECRET_VALUE
+    assert get_secret.call_count == 1
+    secret_client.put_secret(SECRET_KEY, "new_value")
+    secret_client.get_secret(SECRET_KEY)
+    assert get_secret.call_count == 2
+
+
 def test_list_all_secret_names(mocker, secret_client):
     mock = mocker.patch.object(SecretResourceApi, "list_all_secret_names")
     secret_list = ["TEST_SECRET_1", "TEST_SECRET_2"]
@@ -1,5 +1,6 @@
 import json
 import logging
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -8,10 +9,12 @@ from conductor.client.http.api.task_resource_api import TaskResourceApi
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_summary import TaskSummary
 from conductor.shared.http.enums import TaskResultStatus
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.codegen.rest import ApiException
 from conductor.client.orkes.orkes_task_client import OrkesTaskClient
+from conductor.client.task_client import TaskClient
 from conductor.client.workflow.task.task_type import TaskType
 
 TASK_NAME = "ut_task"
@@ -213,3 +216,35 @@ def test_get_task_logs(mocker, task_client):
     logs = task_client.get_task_logs(TASK_ID)
     mock.assert_called_with(TASK_ID)
     assert len(logs) == expected_log_len
+
+
+def get_search_page(results, total_hits):
+    page = {"totalHits": total_hits, "results": results}
+    return MagicMock(resp=MagicMock(content=json.dumps(page).encode()))
+
+
+def test_iter_search(mocker, task_client):
+    mock = mocker.patch.object(TaskResourceApi, "search1")
+    mock.side_effect = [
+        get_search_page([{"taskId": "task_1"}, {"taskId": "task_2"}], 3),
+        get_search_page([{"taskId": "task_3"}], 3),
+    ]
+    tasks = list(task_client.iter_search(query="status = FAILED", page_size=2))
+    assert [task.task_id for task in tasks] == ["task_1", "task_2", "task_3"]
+    assert all(isinstance(task, TaskSummary) for task in tasks)
+    assert mock.call_count == 2
+    mock.assert_called_with(_preload_content=False, start=2, size=2, free_text="*", query="status = FAILED")
+
+
+def test_iter_search_v2(mocker, task_client):
+    mock = mocker.patch.object(TaskResourceApi, "search_v21")
+    mock.return_value = get_search_page([{"taskId": TASK_ID, "taskType": TASK_NAME}], 1)
+    tasks = list(task_client.iter_search_v2(free_text=TASK_NAME))
+    assert len(tasks) == 1
+    assert isinstance(tasks[0], Task)
+    assert tasks[0].task_id == TASK_ID
+    mock.assert_called_once_with(_preload_content=False, start=0, size=100, free_text=TASK_NAME)
+
+
+def test_iter_search_is_optional_for_task_clients():
+    assert not {"iter_search", "iter_search_v2"} & TaskClient.__abstractmethods__
@@ -1,19 +1,24 @@
 import json
 import logging
+from unittest.mock import MagicMock
 
 import pytest
 
 from conductor.client.configuration.configuration import Configuration
-from conductor.client.http.api import WorkflowResourceApi
+from conductor.client.http.api import WorkflowBulkResourceApi, WorkflowResourceApi
+from conductor.client.http.models.bulk_response import BulkResponse
 from conductor.client.http.models.skip_task_request import SkipTaskRequestAdapter as SkipTaskRequest
 from conductor.client.http.models.rerun_workflow_request import RerunWorkflowRequestAdapter as RerunWorkflowRequest
 from conductor.client.http.models.start_workflow_request import StartWorkflowRequestAdapter as StartWorkflowRequest
 from conductor.client.http.models.workflow import WorkflowAdapter as Workflow
 from conductor.client.http.models.workflow_def import WorkflowDefAdapter as WorkflowDef
 from conductor.client.http.models.workflow_run import WorkflowRunAdapter as WorkflowRun
+from conductor.client.http.models.workflow_status import WorkflowStatus
+from conductor.client.http.models.workflow_summary import WorkflowSummaryAdapter as WorkflowSummary
 from conductor.client.http.models.workflow_test_request import WorkflowTestRequestAdapter as WorkflowTestRequest
 from conductor.client.codegen.rest import ApiException
 from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
+from conductor.client.workflow_client import WorkflowClient
 
 WORKFLOW_NAME = "ut_wf"
 WORKFLOW_UUID = "ut_wf_uuid"
@@ -229,3 +234,60 @@ def test_test_workflow(mocker, workflow_client):
     workflow = workflow_client.test_workflow(test_request)
     mock.assert_called_with(test_request)
     assert workflow.workflow_id == WORKFLOW_UUID
+
+
+def test_iter_search(mocker, workflow_client):
+    def search(**kwargs):
+        start = kwargs["start"]
+        results = [{"workflowId": f"wf_{i}"} for i in range(start, min(start + kwargs["size"], 3))]
+        page = {"totalHits": 3, "results": results}
+        return MagicMock(resp=MagicMock(content=json.dumps(page).encode()))
+
+    mock = mocker.patch.object(WorkflowResourceApi, "search", side_effect=search)
+    workflows = list(workflow_client.iter_search(query="status IN (RUNNING)", page_size=2))
+    assert [workflow.workflow_id for workflow in workflows] == ["wf_0", "wf_1", "wf_2"]
+    assert all(isinstance(workflow, WorkflowSummary) for workflow in workflows)
+    mock.assert_called_with(
+        _preload_content=False, start=2, size=2, free_text="*", query="status IN (RUNNING)", skip_cache=False
+    )
+
+
+def test_bulk_terminate_workflows(mocker, workflow_client):
+    mock = mocker.patch.object(WorkflowBulkResourceApi, "terminate")
+    mock.side_effect = lambda chunk, **kwargs: BulkResponse(bulk_successful_results=list(chunk))
+    workflow_ids = [f"wf_{i}" for i in range(5)]
+    response = workflow_client.bulk_terminate_workflows(workflow_ids, reason="cleanup", chunk_size=2)
+    assert mock.call_count == 3
+    mock.assert_any_call(["wf_4"], reason="cleanup")
+    assert sorted(response.bulk_successful_results) == workflow_ids
+    assert response.bulk_error_results == {}
+
+
+def test_bulk_remove_workflows_reports_failed_ids(mocker, workflow_client):
+    mock = mocker.patch.object(WorkflowBulkResourceApi, "delete")
+    mock.side_effect = [
+        BulkResponse(bulk_successful_results=["wf_1"], bulk_error_results={"wf_2": "not found"}),
+    ]
+    response = workflow_client.bulk_remove_workflows(["wf_1", "wf_2"], retries=1)
+    mock.assert_called_once_with(["wf_1", "wf_2"])
+    assert response.bulk_successful_results == ["wf_1"]
+    assert response.bulk_error_results == {"wf_2": "not found"}
+
+
+def test_bulk_operations_are_optional_for_workflow_clients():
+    assert not {name for name in WorkflowClient.__abstractmethods__ if name.startswith("bulk_")}
+
+
+def test_wait_for_workflows_only_needs_workflow_status():
+    assert "wait_for_workflows" not in WorkflowClient.__abstractmethods__
+
+
+def test_wait_for_workflows(mocker, workflow_client):
+    mocker.patch.object(
+        WorkflowResourceApi, "get_workflow_status_summary",
+        side_effect=lambda workflow_id, **kwargs: WorkflowStatus(workflow_id=workflow_id, status="COMPLETED")
+    )
+    statuses = workflow_client.wait_for_workflows(["wf1", "wf2"], timeout=5)
+    assert {workflow_id: status.status for workflow_id, status in statuses.items()} == {
+        "wf1": "COMPLETED", "wf2": "COMPLETED"
+    }
@@ -0,0 +1,126 @@
+import logging
+from concurrent.futures import TimeoutError
+from unittest.mock import MagicMock
+
+import pytest
+
+from conductor.client.codegen.rest import ApiException
+from conductor.client.http.models.workflow_status import WorkflowStatus
+from conductor.client.orkes.workflow_waiter import WorkflowWaiter
+
+WORKFLOW_UUID = "ut_wf_uuid"
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def create_waiter(get_workflow_status):
+    workflow_client = MagicMock()
+    workflow_client.get_workflow_status.side_effect = get_workflow_status
+    return WorkflowWaiter(workflow_client, min_poll_interval=0.01, max_poll_interval=0.05)
+
+
+def test_wait_for_resolves_when_workflow_is_terminal():
+    statuses = iter(["RUNNING", "RUNNING", "COMPLETED"])
+    waiter = create_waiter(
+        lambda workflow_id, include_output: WorkflowStatus(workflow_id=workflow_id, status=next(statuses))
+    )
+    with waiter:
+        status = waiter.wait_for(WORKFLOW_UUID).result(timeout=5)
+    assert status.workflow_id == WORKFLOW_UUID
+    assert status.status == "COMPLETED"
+    assert waiter.workflow_client.get_workflow_status.call_count == 3
+
+
+def test_wait_for_returns_same_future_for_same_workflow():
+    waiter = create_waiter(
+        lambda workflow_id, include_output: WorkflowStatus(workflow_id=workflow_id, status="RUNNING")
+    )
+    with waiter:
+        assert waiter.wait_for(WORKFLOW_UUID) is waiter.wait_for(WORKFLOW_UUID)
+
+
+def test_wait_for_all():
+    polls = {}
+
+    def get_workflow_status(workflow_id, include_output):
+        polls[workflow_id] = polls.get(workflow_id, 0) + 1
+        # Workflow i completes on its i-th poll
+        done = polls[workflow_id] >= int(workflow_id)
+        return WorkflowStatus(workflow_id=workflow_id, status="FAILED" if done else "RUNNING")
+
+    workflow_ids = [str(i) for i in range(1, 6)]
+    with create_waiter(get_workflow_status) as waiter:
+        statuses = waiter.wait_for_all(workflow_ids, timeout=5)
+    assert list(statuses) == workflow_ids
+    assert all(status.status == "FAILED" for status in statuses.values())
+    assert polls == {workflow_id: int(workflow_id) for workflow_id in workflow_ids}
+
+
+def test_wait_for_all_times_out():
+    waiter = create_waiter(
+        lambda workflow_id, include_output: WorkflowStatus(workflow_id=workflow_id, status="RUNNING")
+    )
+    with waiter:
+        with pytest.raises(TimeoutError):
+            waiter.wait_for_all([WORKFLOW_UUID], timeout=0.1)
+        future = waiter.wait_for(WORKFLOW_UUID)
+    assert future.cancelled()
+
+
+def test_wait_for_retries_errors_and_fails_missing_workflows():
+    statuses = iter([Exception("unavailable"), WorkflowStatus(workflow_id=WORKFLOW_UUID, status="TERMINATED")])
+
+    def get_workflow_status(workflow_id, include_output):
+        if workflow_id != WORKFLOW_UUID:
+            raise ApiException(status=404, reason="Not Found")
+        status = next(statuses)
+        if isinstance(status, Exception):
+            raise status
+        return status
+
+    with create_waiter(get_workflow_status) as waiter:
+        missing = waiter.wait_for("missing")
+        assert waiter.wait_for(WORKFLOW_UUID).result(timeout=5).status == "TERMINATED"
+        with pytest.raises(ApiException):
+            missing.result(timeout=5)
+
+
+def test_future_cancelled_while_polled_does_not_stop_waiter():
+    futures = {}
+
+    def get_workflow_status(workflow_id, include_output):
+        if workflow_id == "cancelled":
+            # Cancelled after the waiter checked it, before it is resolved
+            futures["cancelled"].cancel()
+            futures["cancelled"].done = lambda: False
+        return WorkflowStatus(workflow_id=workflow_id, status="COMPLETED")
+
+    with create_waiter(get_workflow_status) as waiter:
+        futures["cancelled"] = waiter.wait_for("cancelled")
+        assert waiter.wait_for(WORKFLOW_UUID).result(timeout=5).status == "COMPLETED"
+        assert waiter.wait_for("later").result(timeout=5).status == "COMPLETED"
+    assert futures["cancelled"].cancelled()
+
+
+def test_unexpected_error_fails_waiting_futures(mocker):
+    waiter = create_waiter(
+        lambda workflow_id, include_output: WorkflowStatus(workflow_id=workflow_id, status="RUNNING")
+    )
+    mocker.patch.object(waiter, "_WorkflowWaiter__pop_due", side_effect=RuntimeError("broken"))
+    with waiter:
+        with pytest.raises(RuntimeError):
+            waiter.wait_for(WORKFLOW_UUID).result(timeout=5)
+
+
+@pytest.mark.parametrize("age, interval", [(0, 1), (50, 5), (1000, 30)])
+def test_poll_interval_grows_with_age(mocker, age, interval):
+    mocker.patch("conductor.client.orkes.workflow_waiter.time.monotonic", return_value=age)
+    waiter = WorkflowWaiter(MagicMock(), min_poll_interval=1, max_poll_interval=30, poll_interval_ratio=0.1)
+    waiter._waiting[WORKFLOW_UUID] = (MagicMock(), 0.0)
+    waiter._WorkflowWaiter__update(WORKFLOW_UUID, WorkflowStatus(workflow_id=WORKFLOW_UUID, status="RUNNING"))
+    assert waiter._schedule[0][0] == age + interval
@@ -108,6 +108,19 @@ async def test_increment_task_poll(metrics_collector, mock_counter):
         mock_counter.labels.return_value.inc.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_increment_task_poll_empty(metrics_collector, mock_counter):
+    with patch.object(metrics_collector, '_AsyncMetricsCollector__get_counter', return_value=mock_counter):
+        await metrics_collector.increment_task_poll_empty("test_task")
+        
+        call_args = metrics_collector._AsyncMetricsCollector__get_counter.call_args
+        assert call_args[1]['name'] == MetricName.TASK_POLL_EMPTY
+        assert call_args[1]['documentation'] == MetricDocumentation.TASK_POLL_EMPTY
+        assert list(call_args[1]['labelnames']) == [MetricLabel.TASK_TYPE]
+        mock_counter.labels.assert_called_once_with("test_task")
+        mock_counter.labels.return_value.inc.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_increment_task_execution_queue_full(metrics_collector, mock_counter):
     with patch.object(metrics_collector, '_AsyncMetricsCollector__get_counter', return_value=mock_counter):
@@ -272,6 +285,19 @@ async def test_record_task_poll_time(metrics_collector, mock_gauge):
         mock_gauge.labels.return_value.set.assert_called_once_with(1.5)
 
 
+@pytest.mark.asyncio
+async def test_record_task_poll_backoff(metrics_collector, mock_gauge):
+    with patch.object(metrics_collector, '_AsyncMetricsCollector__get_gauge', return_value=mock_gauge):
+        await metrics_collector.record_task_poll_backoff("test_task", 0.4)
+        
+        call_args = metrics_collector._AsyncMetricsCollector__get_gauge.call_args
+        assert call_args[1]['name'] == MetricName.TASK_POLL_BACKOFF
+        assert call_args[1]['documentation'] == MetricDocumentation.TASK_POLL_BACKOFF
+        assert list(call_args[1]['labelnames']) == [MetricLabel.TASK_TYPE]
+        mock_gauge.labels.assert_called_once_with("test_task")
+        mock_gauge.labels.return_value.set.assert_called_once_with(0.4)
+
+
 @pytest.mark.asyncio
 async def test_record_task_execute_time(metrics_collector, mock_gauge):
     with patch.object(metrics_collector, '_AsyncMetricsCollector__get_gauge', return_value=mock_gauge):
@@ -508,3 +508,23 @@ def test_execute_with_parameter_annotation_typing():
 
     assert result.status == TaskResultStatus.COMPLETED
     assert result.output_data == {"result": "value1_test_string_another_string"}
+
+
+def test_execute_does_not_inspect_signature_per_task(worker, mock_task):
+    with patch("inspect.signature") as signature:
+        worker.execute(mock_task)
+        result = worker.execute(mock_task)
+
+    signature.assert_not_called()
+    assert result.status == TaskResultStatus.COMPLETED
+    assert result.output_data == {"result": "value1_42"}
+
+
+def test_api_client_is_created_on_first_use(simple_execute_function):
+    with patch("conductor.client.worker.worker.ApiClient") as api_client_class:
+        worker = Worker("test_task", simple_execute_function)
+        api_client_class.assert_not_called()
+
+        assert worker.api_client is api_client_class.return_value
+        assert worker.api_client is api_client_class.return_value
+        api_client_class.assert_called_once_with()
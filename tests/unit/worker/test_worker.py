@@ -332,3 +332,39 @@ def test_execute_with_task_result_returning_function(mock_task):
     assert result.workflow_instance_id == "test_workflow_id"
     assert result.status == TaskResultStatus.IN_PROGRESS
     assert result.output_data == {"custom_result": "value1_42"}
+
+
+@pytest.mark.asyncio
+async def test_execute_coroutine_function(mock_task):
+    async def func(param1: str, param2: int = 10):
+        return f"{param1}_{param2}"
+
+    worker = Worker("test_task", func)
+
+    assert worker.is_coroutine()
+    result = await worker.execute(mock_task)
+
+    assert result.status == TaskResultStatus.COMPLETED
+    assert result.output_data == {"result": "value1_42"}
+
+
+@pytest.mark.asyncio
+async def test_execute_coroutine_function_non_retryable_exception(mock_task):
+    async def func(param1: str):
+        raise NonRetryableException("terminal")
+
+    worker = Worker("test_task", func)
+    result = await worker.execute(mock_task)
+
+    assert result.status == TaskResultStatus.FAILED_WITH_TERMINAL_ERROR
+    assert result.reason_for_incompletion == "terminal"
+
+
+def test_execute_does_not_inspect_signature_per_task(worker, mock_task):
+    with patch("inspect.signature") as signature:
+        worker.execute(mock_task)
+        result = worker.execute(mock_task)
+
+    signature.assert_not_called()
+    assert result.status == TaskResultStatus.COMPLETED
+    assert result.output_data == {"result": {"result": "value1_42"}}
@@ -9,6 +9,8 @@ from conductor.asyncio_client.adapters.models.workflow_run_adapter import Workfl
 from conductor.asyncio_client.adapters.models.workflow_task_adapter import WorkflowTaskAdapter
 from conductor.asyncio_client.workflow.conductor_workflow import AsyncConductorWorkflow, InlineSubWorkflowTask
 from conductor.asyncio_client.workflow.executor.workflow_executor import AsyncWorkflowExecutor
+from conductor.asyncio_client.workflow.task.do_while_task import DoWhileTask
+from conductor.asyncio_client.workflow.task.simple_task import SimpleTask
 from conductor.asyncio_client.workflow.task.task import TaskInterface
 from conductor.shared.http.enums import IdempotencyStrategy
 from conductor.shared.workflow.enums import TaskType, TimeoutPolicy
@@ -640,4 +642,69 @@ def test_inline_sub_workflow_task_to_workflow_task():
             call_args = mock_params_class.call_args
             assert call_args[1]["name"] == "test_workflow"
             assert call_args[1]["version"] == 1
-            assert result is not None 
\ No newline at end of file
+            assert result is not None 
+
+def test_to_workflow_def_is_reused_until_workflow_changes(conductor_workflow):
+    conductor_workflow.add(SimpleTask("task_def", "task_ref"))
+    workflow_def = conductor_workflow.to_workflow_def()
+    assert conductor_workflow.to_workflow_def() is workflow_def
+
+    conductor_workflow.output_parameter("result", "${task_ref.output}")
+    changed_def = conductor_workflow.to_workflow_def()
+    assert changed_def is not workflow_def
+    assert changed_def.output_parameters == {"result": "${task_ref.output}"}
+
+    conductor_workflow.timeout_seconds(120)
+    assert conductor_workflow.to_workflow_def().timeout_seconds == 120
+
+    conductor_workflow.add(SimpleTask("task_def", "task_ref_2"))
+    assert [task.task_reference_name for task in conductor_workflow.to_workflow_def().tasks] == [
+        "task_ref",
+        "task_ref_2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_register_once_registers_only_changed_definitions(conductor_workflow, mock_executor):
+    mock_executor.start_workflow.return_value = "workflow_id_123"
+    conductor_workflow.register_once().add(SimpleTask("task_def", "task_ref"))
+
+    await conductor_workflow.start_workflow_with_input({"param1": "value1"})
+    await conductor_workflow.start_workflow_with_input({"param1": "value2"})
+    assert mock_executor.register_workflow.call_count == 1
+    request = mock_executor.start_workflow.call_args[0][0]
+    assert request.workflow_def is None
+    assert request.name == "test_workflow"
+    assert request.version == 1
+    assert request.input == {"param1": "value2"}
+
+    conductor_workflow.description = "Changed"
+    await conductor_workflow.start_workflow_with_input()
+    assert mock_executor.register_workflow.call_count == 2
+    assert mock_executor.register_workflow.call_args[1]["overwrite"] is True
+
+
+@pytest.mark.asyncio
+async def test_register_once_registers_tasks_changed_in_place_without_copies(conductor_workflow, mock_executor):
+    task = SimpleTask("task_def", "task_ref")
+    conductor_workflow.copy_tasks(False).register_once().add(task)
+
+    await conductor_workflow.start_workflow_with_input()
+    await conductor_workflow.start_workflow_with_input()
+    task.input_parameter("key", "changed")
+    await conductor_workflow.start_workflow_with_input()
+    assert mock_executor.register_workflow.call_count == 2
+
+
+def test_copy_tasks(conductor_workflow):
+    task = SimpleTask("task_def", "task_ref")
+    conductor_workflow.add(task)
+    assert conductor_workflow._tasks[0] is not task
+    conductor_workflow.copy_tasks(False).add(task)
+    assert conductor_workflow._tasks[1] is task
+
+
+def test_loop_tasks_are_copied_unless_disabled():
+    task = SimpleTask("task_def", "task_ref")
+    assert DoWhileTask("loop_ref", "true", [task])._loop_over[0] is not task
+    assert DoWhileTask("loop_ref", "true", [task], copy_tasks=False)._loop_over[0] is task
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -132,6 +133,48 @@ async def test_start_workflows(workflow_executor, mock_workflow_client, start_wo
     assert result == ["id1", "id2"]
 
 
+@pytest.mark.asyncio
+async def test_start_workflows_stops_at_first_error(workflow_executor, mock_workflow_client):
+    mock_workflow_client.start_workflow.side_effect = ["id1", ValueError("invalid input"), "id3"]
+
+    with pytest.raises(ValueError, match="invalid input"):
+        await workflow_executor.start_workflows(
+            StartWorkflowRequestAdapter(name="workflow1"),
+            StartWorkflowRequestAdapter(name="workflow2"),
+            StartWorkflowRequestAdapter(name="workflow3"),
+        )
+    assert mock_workflow_client.start_workflow.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_start_workflows_in_bulk(workflow_executor, mock_workflow_client):
+    requests = [StartWorkflowRequestAdapter(name=f"workflow_{i}") for i in range(20)]
+    in_flight = []
+    max_in_flight = []
+
+    async def start_workflow(start_workflow_request):
+        in_flight.append(start_workflow_request)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.remove(start_workflow_request)
+        if start_workflow_request.name == "workflow_3":
+            raise Exception("no such workflow")
+        return start_workflow_request.name + "_id"
+
+    mock_workflow_client.start_workflow.side_effect = start_workflow
+    workflow_executor.metrics_collector = AsyncMock()
+
+    results = await workflow_executor.start_workflows_in_bulk(iter(requests), max_concurrency=5)
+
+    assert [result.request for result in results] == requests
+    assert results[0].workflow_id == "workflow_0_id"
+    assert not results[3].succeeded
+    assert str(results[3].error) == "no such workflow"
+    assert max(max_in_flight) == 5
+    workflow_executor.metrics_collector.increment_workflow_start_error.assert_awaited_once()
+    workflow_executor.metrics_collector.record_workflow_start_throughput.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_execute_workflow(workflow_executor, mock_workflow_client, start_workflow_request):
     mock_workflow_run = MagicMock(spec=WorkflowRunAdapter)
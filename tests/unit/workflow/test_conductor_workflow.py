@@ -0,0 +1,150 @@
+import logging
+from copy import deepcopy
+from unittest.mock import MagicMock
+
+import pytest
+
+from conductor.client.http.models.start_workflow_request import StartWorkflowRequest
+from conductor.client.workflow.conductor_workflow import ConductorWorkflow
+from conductor.client.workflow.executor.workflow_executor import WorkflowExecutor
+from conductor.client.workflow.task.do_while_task import DoWhileTask
+from conductor.client.workflow.task.fork_task import ForkTask
+from conductor.client.workflow.task.simple_task import SimpleTask
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def mock_executor():
+    executor = MagicMock(spec=WorkflowExecutor)
+    executor.start_workflow.return_value = "workflow_id"
+    return executor
+
+
+@pytest.fixture
+def conductor_workflow(mock_executor):
+    workflow = ConductorWorkflow(mock_executor, "test_workflow", 1, "Test workflow")
+    return workflow.add(SimpleTask("task_def", "task_ref"))
+
+
+def test_to_workflow_def_is_reused_until_workflow_changes(conductor_workflow):
+    workflow_def = conductor_workflow.to_workflow_def()
+    assert conductor_workflow.to_workflow_def() is workflow_def
+
+    conductor_workflow.output_parameter("result", "${task_ref.output}")
+    changed_def = conductor_workflow.to_workflow_def()
+    assert changed_def is not workflow_def
+    assert changed_def.output_parameters == {"result": "${task_ref.output}"}
+
+    conductor_workflow.version = 2
+    assert conductor_workflow.to_workflow_def().version == 2
+
+    conductor_workflow >> SimpleTask("task_def", "task_ref_2")
+    assert [task.task_reference_name for task in conductor_workflow.to_workflow_def().tasks] == [
+        "task_ref", "task_ref_2"
+    ]
+
+
+def test_start_workflow_inlines_definition(conductor_workflow, mock_executor):
+    conductor_workflow.start_workflow_with_input({"param1": "value1"})
+    conductor_workflow.start_workflow(StartWorkflowRequest())
+    mock_executor.register_workflow.assert_not_called()
+    for call in mock_executor.start_workflow.call_args_list:
+        assert call[0][0].workflow_def is conductor_workflow.to_workflow_def()
+
+
+def test_register_once_registers_only_changed_definitions(conductor_workflow, mock_executor):
+    conductor_workflow.register_once()
+    conductor_workflow.start_workflow_with_input({"param1": "value1"})
+    conductor_workflow.start_workflow_with_input({"param1": "value2"})
+    mock_executor.register_workflow.assert_called_once_with(
+        overwrite=True, workflow=conductor_workflow.to_workflow_def()
+    )
+    request = mock_executor.start_workflow.call_args[0][0]
+    assert request.workflow_def is None
+    assert request.name == "test_workflow"
+    assert request.version == 1
+    assert request.input == {"param1": "value2"}
+
+    conductor_workflow.timeout_seconds(120)
+    conductor_workflow.execute({"param1": "value3"})
+    assert mock_executor.register_workflow.call_count == 2
+    request = mock_executor.execute_workflow.call_args[0][0]
+    assert request.workflow_def is None
+    assert request.version == 1
+
+
+def test_register_once_does_not_register_unchanged_definition_again(conductor_workflow, mock_executor):
+    conductor_workflow.register_once()
+    conductor_workflow.start_workflow_with_input()
+    # Rebuilt, but with the same content
+    conductor_workflow.description = "Test workflow"
+    conductor_workflow.start_workflow_with_input()
+    mock_executor.register_workflow.assert_called_once()
+
+
+def test_register_once_registers_tasks_changed_in_place_without_copies(mock_executor):
+    task = SimpleTask("task_def", "task_ref").input_parameter("key", "value")
+    workflow = ConductorWorkflow(mock_executor, "test_workflow").copy_tasks(False).register_once()
+    workflow.add(task)
+    workflow.start_workflow_with_input()
+    workflow.start_workflow_with_input()
+    task.input_parameter("key", "changed")
+    workflow.start_workflow_with_input()
+    assert mock_executor.register_workflow.call_count == 2
+    registered = mock_executor.register_workflow.call_args[1]["workflow"]
+    assert registered.tasks[0].input_parameters == {"key": "changed"}
+
+
+def test_added_tasks_are_copied(conductor_workflow):
+    task = SimpleTask("task_def", "task_ref_2").input_parameter("key", "value")
+    conductor_workflow.add(task)
+    task.input_parameter("key", "changed")
+    assert conductor_workflow._tasks[-1] is not task
+    assert conductor_workflow.to_workflow_def().tasks[-1].input_parameters == {"key": "value"}
+
+
+def test_copied_task_shares_immutable_attributes():
+    task = SimpleTask("task_def", "task_ref").input_parameter("key", {"nested": "value"})
+    copied = deepcopy(task)
+    assert copied.task_reference_name is task.task_reference_name
+    assert copied.input_parameters == task.input_parameters
+    assert copied.input_parameters["key"] is not task.input_parameters["key"]
+
+
+def test_copy_tasks_disabled_adds_tasks_themselves(mock_executor):
+    task = SimpleTask("task_def", "task_ref")
+    fork_branch = [SimpleTask("task_def", "fork_ref")]
+    workflow = ConductorWorkflow(mock_executor, "test_workflow").copy_tasks(False)
+    workflow >> task >> [fork_branch]
+    assert workflow._tasks[0] is task
+    assert workflow._tasks[1]._forked_tasks[0][0] is fork_branch[0]
+
+
+def test_copy_tasks_disabled_builds_each_task_once(mocker, mock_executor):
+    to_workflow_task = mocker.spy(SimpleTask, "to_workflow_task")
+    copy = mocker.patch("conductor.client.workflow.conductor_workflow.deepcopy", side_effect=deepcopy)
+    workflow = ConductorWorkflow(mock_executor, "test_workflow").copy_tasks(False)
+    copy.reset_mock()
+    for i in range(100):
+        workflow.add(SimpleTask("task_def", f"task_ref_{i}"))
+    assert len(workflow.to_workflow_def().tasks) == 100
+    assert to_workflow_task.call_count == 100
+    copy.assert_not_called()
+
+
+def test_nested_tasks_are_copied_unless_disabled():
+    task = SimpleTask("task_def", "task_ref").input_parameter("key", "value")
+    loop = DoWhileTask("loop_ref", "true", [task])
+    fork = ForkTask("fork_ref", [[task]])
+    task.input_parameter("key", "changed")
+    assert loop.to_workflow_task().loop_over[0].input_parameters == {"key": "value"}
+    assert fork._forked_tasks[0][0].input_parameters == {"key": "value"}
+
+    assert DoWhileTask("loop_ref", "true", [task], copy_tasks=False)._loop_over[0] is task
+    assert ForkTask("fork_ref", [[task]], copy_tasks=False)._forked_tasks[0][0] is task
@@ -0,0 +1,93 @@
+import logging
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models.start_workflow_request import StartWorkflowRequest
+from conductor.client.workflow.executor.workflow_executor import WorkflowExecutor
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def workflow_executor():
+    executor = WorkflowExecutor(Configuration())
+    executor.workflow_client = MagicMock()
+    return executor
+
+
+def test_start_workflows_in_bulk_returns_results_in_request_order(workflow_executor):
+    requests = [StartWorkflowRequest(name=f"workflow_{i}") for i in range(50)]
+
+    def start_workflow(start_workflow_request):
+        if start_workflow_request.name == "workflow_7":
+            raise Exception("no such workflow")
+        return start_workflow_request.name + "_id"
+
+    workflow_executor.workflow_client.start_workflow.side_effect = start_workflow
+
+    results = workflow_executor.start_workflows_in_bulk(iter(requests), max_concurrency=8)
+
+    assert [result.request for result in results] == requests
+    assert [result.workflow_id for result in results if result.succeeded] == [
+        f"workflow_{i}_id" for i in range(50) if i != 7
+    ]
+    assert not results[7].succeeded
+    assert str(results[7].error) == "no such workflow"
+
+
+def test_start_workflows_in_bulk_starts_workflows_concurrently(workflow_executor):
+    all_started = threading.Barrier(4, timeout=5)
+
+    def start_workflow(start_workflow_request):
+        all_started.wait()
+        return start_workflow_request.name
+
+    workflow_executor.workflow_client.start_workflow.side_effect = start_workflow
+
+    requests = [StartWorkflowRequest(name=f"workflow_{i}") for i in range(4)]
+    results = workflow_executor.start_workflows_in_bulk(requests, max_concurrency=4)
+
+    assert all(result.succeeded for result in results)
+
+
+def test_start_workflows_in_bulk_records_metrics(workflow_executor):
+    workflow_executor.metrics_collector = MagicMock()
+    workflow_executor.workflow_client.start_workflow.side_effect = ["id", Exception("failed")]
+
+    workflow_executor.start_workflows_in_bulk(
+        [StartWorkflowRequest(name="workflow"), StartWorkflowRequest(name="other")], max_concurrency=1
+    )
+
+    workflow_executor.metrics_collector.increment_workflow_start_error.assert_called_once()
+    assert workflow_executor.metrics_collector.increment_workflow_start_error.call_args[0][0] == "other"
+    workflow_executor.metrics_collector.record_workflow_start_throughput.assert_called_once()
+
+
+def test_start_workflows_stops_at_first_error(workflow_executor):
+    workflow_executor.workflow_client.start_workflow.side_effect = ["id1", ValueError("invalid input"), "id3"]
+
+    with pytest.raises(ValueError, match="invalid input"):
+        workflow_executor.start_workflows(
+            StartWorkflowRequest(name="first"), StartWorkflowRequest(name="second"), StartWorkflowRequest(name="third")
+        )
+    assert workflow_executor.workflow_client.start_workflow.call_count == 2
+
+
+def test_start_workflows_returns_workflow_ids(workflow_executor):
+    workflow_executor.workflow_client.start_workflow.side_effect = lambda start_workflow_request: (
+        start_workflow_request.name + "_id"
+    )
+
+    workflow_ids = workflow_executor.start_workflows(
+        StartWorkflowRequest(name="first"), StartWorkflowRequest(name="second")
+    )
+
+    assert workflow_ids == ["first_id", "second_id"]